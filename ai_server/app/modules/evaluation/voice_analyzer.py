@@ -7,6 +7,8 @@ import numpy as np
 import librosa
 import logging
 
+from modules.common.audio_utils import load_audio
+
 logger = logging.getLogger(__name__)
 
 class AdvancedVoiceAnalyzer:
@@ -15,11 +17,15 @@ class AdvancedVoiceAnalyzer:
     def __init__(self, sample_rate=16000):
         self.sample_rate = sample_rate
         
-    def analyze_voice_comprehensive(self, audio_path):
-        """종합적인 음성 분석"""
+    def analyze_voice_comprehensive(self, audio, sample_rate=None):
+        """종합적인 음성 분석 (파일 경로 또는 디코딩된 PCM 버퍼)"""
         try:
-            # 오디오 로드
-            y, sr = librosa.load(audio_path, sr=self.sample_rate)
+            # 오디오 로드 (이미 디코딩된 버퍼는 그대로 사용)
+            y, sr = load_audio(audio, sample_rate or self.sample_rate)
+            # 무음 제거 버퍼(VoicedAudio)면 침묵 통계는 원본 기준 변환표에서 가져옴
+            timeline = getattr(audio, "timeline", None)
+            if timeline is not None:
+                y = y.view(np.ndarray)
             
             # 기본 특징
             basic_features = self._extract_basic_features(y, sr)
@@ -31,7 +37,7 @@ class AdvancedVoiceAnalyzer:
             emotion_features = self._extract_emotion_features(y, sr)
             
             # 말하기 패턴
-            speech_patterns = self._analyze_speech_patterns(y, sr)
+            speech_patterns = self._analyze_speech_patterns(y, sr, timeline)
             
             return {
                 **basic_features,
@@ -118,13 +124,23 @@ class AdvancedVoiceAnalyzer:
             "emotional_intensity": amplitude_variation * harmonic_ratio
         }
     
-    def _analyze_speech_patterns(self, y, sr):
-        """말하기 패턴 분석"""
+    def _analyze_speech_patterns(self, y, sr, timeline=None):
+        """말하기 패턴 분석 (변환표가 있으면 침묵 통계는 VAD 발화 구간에서 계산)"""
         # 음성 활동 감지 (VAD)
         energy = librosa.feature.rms(y=y)[0]
         threshold = np.mean(energy) * 0.5
         speech_frames = energy > threshold
         
+        if timeline is not None:
+            pauses = timeline.pause_stats()
+            return {
+                "speech_ratio": pauses["speech_ratio"],
+                "avg_silence_length": pauses["avg_pause_length"],
+                "silence_variation": pauses["pause_variation"],
+                "speaking_rate_variation": np.std(energy[speech_frames]) if any(speech_frames) else 0,
+                "pause_frequency": pauses["pause_count"] / pauses["total_duration"] if pauses["total_duration"] > 0 else 0
+            }
+        
         # 발화 구간과 침묵 구간 분석
         speech_ratio = np.sum(speech_frames) / len(speech_frames)
         
@@ -0,0 +1,170 @@
+"""
+OpenFace FeatureExtraction 작업자 풀
+프레임마다 FeatureExtraction 프로세스를 띄우는 대신, 장기 실행 작업자가 프레임 묶음을
+이미지 디렉토리로 받아 한 번의 실행(-fdir)으로 처리하고 프레임별 AU/시선/자세 값을 반환
+
+- 작업자마다 전용 작업 디렉토리를 재사용 (요청마다 임시 디렉토리 생성 없음)
+- 모델 로딩과 프로세스 시작 비용은 프레임이 아닌 묶음 단위로 발생
+- 필요한 특징(-aus -gaze -pose)만 계산하도록 출력 제한
+"""
+import os
+import glob
+import queue
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from modules.common.frame_sampling import OPENFACE_FEATURE_FLAGS
+from modules.common.openface_csv import load_openface_csv, successful_frames
+
+logger = logging.getLogger(__name__)
+
+# 작업자 수와 묶음 처리 타임아웃 (초)
+OPENFACE_WORKERS = int(os.environ.get("OPENFACE_WORKERS", 2))
+OPENFACE_BATCH_TIMEOUT = float(os.environ.get("OPENFACE_BATCH_TIMEOUT", 120))
+
+class OpenFaceWorkerPool:
+    """OpenFace FeatureExtraction 작업자 풀"""
+
+    def __init__(self, openface_path: str, num_workers: Optional[int] = None,
+                 work_dir: Optional[str] = None):
+        """
+        작업자 풀 초기화
+
+        Args:
+            openface_path: FeatureExtraction 실행 파일 경로
+            num_workers: 작업자 수 (기본값: 환경 변수 OPENFACE_WORKERS 또는 2)
+            work_dir: 작업자 디렉토리 상위 경로 (기본값: 시스템 임시 디렉토리)
+        """
+        self.openface_path = openface_path
+        self.num_workers = num_workers or OPENFACE_WORKERS
+        self.work_dir = work_dir or os.path.join(tempfile.gettempdir(), "openface_workers")
+        self.batches = queue.Queue()
+        self.threads = []
+        self.running = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """작업자 스레드 시작"""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            for index in range(self.num_workers):
+                thread = threading.Thread(target=self._worker_loop, args=(index,),
+                                          name=f"openface-{index}", daemon=True)
+                thread.start()
+                self.threads.append(thread)
+        logger.info(f"OpenFace 작업자 풀 시작 - 작업자 수: {self.num_workers}")
+
+    def stop(self):
+        """작업자 스레드 종료"""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            for _ in self.threads:
+                self.batches.put(None)
+            self.threads = []
+        logger.info("OpenFace 작업자 풀 종료")
+
+    def submit(self, frames: List[Any]) -> Future:
+        """
+        프레임 묶음 분석 요청
+
+        Args:
+            frames: BGR 프레임(np.ndarray) 목록
+
+        Returns:
+            Future: 열 기반 특징(Dict[str, np.ndarray])을 결과로 갖는 Future
+        """
+        if not self.running:
+            self.start()
+        future = Future()
+        self.batches.put((list(frames), future))
+        return future
+
+    def analyze_frames(self, frames: List[Any], timeout: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        프레임 묶음 분석 (완료까지 대기)
+
+        Args:
+            frames: BGR 프레임 목록
+            timeout: 대기 시간 (기본값: 환경 변수 OPENFACE_BATCH_TIMEOUT)
+
+        Returns:
+            Dict[str, np.ndarray]: 얼굴 검출에 성공한 프레임의 열 이름 → 값 배열
+        """
+        if not frames:
+            return {}
+        return self.submit(frames).result(timeout=timeout or OPENFACE_BATCH_TIMEOUT)
+
+    def _worker_loop(self, index: int):
+        """작업자 루프 - 전용 디렉토리에서 묶음을 하나씩 처리"""
+        frames_dir = os.path.join(self.work_dir, f"worker_{os.getpid()}_{index}", "frames")
+        output_dir = os.path.join(self.work_dir, f"worker_{os.getpid()}_{index}", "output")
+
+        while True:
+            item = self.batches.get()
+            if item is None:
+                break
+
+            frames, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self._run_batch(frames, frames_dir, output_dir))
+            except Exception as e:
+                logger.error(f"OpenFace 묶음 처리 오류: {str(e)}")
+                future.set_exception(e)
+
+        shutil.rmtree(os.path.dirname(frames_dir), ignore_errors=True)
+
+    def _run_batch(self, frames: List[Any], frames_dir: str, output_dir: str) -> Dict[str, np.ndarray]:
+        """프레임 묶음을 이미지 디렉토리로 저장하고 FeatureExtraction 1회 실행"""
+        for directory in (frames_dir, output_dir):
+            shutil.rmtree(directory, ignore_errors=True)
+            os.makedirs(directory)
+
+        # 파일명 순서가 프레임 순서가 되도록 0 채움
+        for i, frame in enumerate(frames):
+            cv2.imwrite(os.path.join(frames_dir, f"frame_{i:06d}.jpg"), frame)
+
+        command = [self.openface_path, "-fdir", frames_dir, "-out_dir", output_dir] + OPENFACE_FEATURE_FLAGS + ["-q"]
+        subprocess.run(command, capture_output=True, text=True, check=True,
+                       timeout=OPENFACE_BATCH_TIMEOUT)
+
+        csv_files = glob.glob(os.path.join(output_dir, "*.csv"))
+        if not csv_files:
+            logger.warning("OpenFace 결과 CSV가 생성되지 않았습니다.")
+            return {}
+        return successful_frames(load_openface_csv(csv_files[0]))
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_openface_pool(openface_path: str) -> OpenFaceWorkerPool:
+    """
+    실행 파일 경로별 공용 작업자 풀 반환 (최초 호출 시 생성 및 시작)
+
+    Args:
+        openface_path: FeatureExtraction 실행 파일 경로
+
+    Returns:
+        OpenFaceWorkerPool: 공용 작업자 풀
+    """
+    with _pools_lock:
+        pool = _pools.get(openface_path)
+        if pool is None:
+            pool = OpenFaceWorkerPool(openface_path)
+            pool.start()
+            _pools[openface_path] = pool
+        return pool
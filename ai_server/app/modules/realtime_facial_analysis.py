@@ -6,6 +6,10 @@ import logging
 import numpy as np
 import librosa
 
+from modules.common.openface_csv import frame_count, column
+from modules.common.tracing import traced
+from .openface_worker import get_openface_pool
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -111,6 +115,17 @@ class RealtimeFacialAnalysis:
             if os.path.exists(output_csv):
                 os.remove(output_csv)
 
+    def _is_openface_ready(self):
+        """OpenFace 실행 파일과 필요한 DLL 존재 여부 확인"""
+        if not os.path.exists(self.openface_path):
+            return False
+        if os.name != "nt":
+            return True
+        openface_dir = os.path.dirname(self.openface_path)
+        return all(os.path.exists(os.path.join(openface_dir, dll))
+                   for dll in ("openblas.dll", "opencv_world410.dll"))
+
+    @traced("facial")
     def analyze_video(self, video_path):
         """영상 얼굴 분석 - 테스트 모드에서도 동작"""
         try:
@@ -137,42 +152,29 @@ class RealtimeFacialAnalysis:
                     "AU02_r": 0.8,
                 }
             
-            results = []
-            frame_count = 0
+            # 최대 30프레임을 모아서 작업자 풀에 한 번에 전달
+            frames = []
             max_frames = 30
             
-            while cap.isOpened() and frame_count < max_frames:
+            while cap.isOpened() and len(frames) < max_frames:
                 ret, frame = cap.read()
                 if not ret:
                     break
-                # 파일 처리 개선: try-finally로 리소스 관리
-                temp_path = None
-                try:
-                    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False, dir=self.output_dir) as temp_file:
-                        temp_path = temp_file.name
-                    # 파일 핸들 닫힌 후에 쓰기 작업 수행
-                    cv2.imwrite(temp_path, frame)
-                    result = self.analyze_image(temp_path)
-                    if result:
-                        results.append(result)
-                finally:
-                    # 항상 임시 파일 삭제 시도
-                    if temp_path and os.path.exists(temp_path):
-                        try:
-                            os.remove(temp_path)
-                        except Exception as e:
-                            logger.warning(f"임시 파일 삭제 실패: {e}")
-                frame_count += 1
+                frames.append(frame)
             
             cap.release()
             
-            if results:
+            results = {}
+            if frames and self._is_openface_ready():
+                try:
+                    results = get_openface_pool(self.openface_path).analyze_frames(frames)
+                except Exception as e:
+                    logger.error(f"OpenFace 프레임 묶음 분석 실패: {str(e)}")
+            
+            if frame_count(results):
                 avg_result = {
-                    "confidence": np.mean([r["confidence"] for r in results]),
-                    "gaze_angle_x": np.mean([r["gaze_angle_x"] for r in results]),
-                    "gaze_angle_y": np.mean([r["gaze_angle_y"] for r in results]),
-                    "AU01_r": np.mean([r["AU01_r"] for r in results]),
-                    "AU02_r": np.mean([r["AU02_r"] for r in results]),
+                    name: float(column(results, name).mean())
+                    for name in ("confidence", "gaze_angle_x", "gaze_angle_y", "AU01_r", "AU02_r")
                 }
                 return avg_result
             
@@ -195,6 +197,7 @@ class RealtimeFacialAnalysis:
                 "AU02_r": 0.8,
             }
 
+    @traced("audio_features")
     def analyze_audio(self, audio_path, sample_rate=16000):
         """Librosa로 음성 특징 분석 - 테스트 모드에서도 동작"""
         try:
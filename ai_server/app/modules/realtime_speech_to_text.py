@@ -7,6 +7,10 @@ import os
 import tempfile
 import gc
 
+from modules.common.audio_utils import decode_audio_from_video
+from modules.asr_backend import create_asr_backend
+from modules.common.model_registry import TTS_MODEL, acquire_model, list_tts_models
+
 # TTS 기능 활성화
 try:
     from TTS.api import TTS
@@ -31,7 +35,8 @@ logger = logging.getLogger(__name__)
 class RealtimeSpeechToText:
     def __init__(self, model="tiny", sample_rate=16000):
         try:
-            self.model = whisper.load_model(model)
+            # 음성 인식 백엔드 (엔진: 환경 변수 ASR_BACKEND)
+            self.model = create_asr_backend(model)
         except Exception as e:
             logger.error(f"Whisper 모델 로드 실패: {str(e)}")
             logger.warning("테스트 모드로 진행합니다. 실제 음성 인식 대신 고정 텍스트를 반환합니다.")
@@ -45,7 +50,7 @@ class RealtimeSpeechToText:
         if TTS_AVAILABLE:
             try:
                 # 모델 리스트 출력
-                available_models = TTS().list_models()
+                available_models = list_tts_models()
                 logger.info(f"Available TTS models: {available_models}")
                 
                 # 모델 선택 - 한국어 지원 모델 우선
@@ -67,7 +72,7 @@ class RealtimeSpeechToText:
                     ko_model = available_models[0]
                 
                 if ko_model:
-                    self.tts = TTS(ko_model)
+                    self.tts = acquire_model(TTS_MODEL, ko_model)
                     logger.info(f"TTS 모델 로드 성공: {ko_model}")
                 else:
                     logger.error("TTS 모델을 찾을 수 없습니다.")
@@ -98,31 +103,26 @@ class RealtimeSpeechToText:
         finally:
             gc.collect()
 
-    def transcribe_video(self, video_path):
-        """비디오 파일에서 오디오를 추출하여 텍스트로 변환"""
-        temp_audio = None
-        audio_path = None
+    def transcribe_video(self, video_path, audio=None):
+        """비디오 파일에서 오디오를 추출하여 텍스트로 변환
         
+        이미 디코딩된 16kHz PCM 버퍼(audio)가 있으면 비디오를 다시 디코딩하지 않음
+        """
         try:
-            if self.model is None or not os.path.exists(video_path):
+            if self.model is None or (audio is None and not os.path.exists(video_path)):
                 # 테스트 모드: 고정 텍스트 반환
                 return "테스트 비디오 텍스트입니다. 인공지능은 인간의 삶에 많은 도움을 줄 수 있습니다."
             
-            # 임시 파일 경로 생성 - 고유한 이름 사용
-            timestamp = str(int(os.path.getmtime(video_path)))
-            audio_path = os.path.join(tempfile.gettempdir(), f"audio_{os.path.basename(video_path)}_{timestamp}.wav")
-            
-            try:
-                # librosa로 오디오 추출
-                audio, sr = librosa.load(video_path, sr=self.sample_rate)
-                sf.write(audio_path, audio, sr)
-            except Exception as e:
-                logger.error(f"오디오 추출 오류: {str(e)}")
+            # ffmpeg stdout으로 한 번만 디코딩 (임시 WAV 파일 없음)
+            if audio is None:
+                audio = decode_audio_from_video(video_path, self.sample_rate)
+            if audio is None:
+                logger.error("오디오 추출 오류: 디코딩된 오디오가 없습니다.")
                 return "테스트 비디오 텍스트입니다. 인공지능은 인간의 삶에 많은 도움을 줄 수 있습니다."
             
             # Whisper로 텍스트 변환
             try:
-                result = self.model.transcribe(audio_path, language="ko")
+                result = self.model.transcribe(audio, language="ko")
                 text = result["text"].strip()
                 if text:
                     logger.info(f"영상에서 인식된 텍스트: {text}")
@@ -137,14 +137,6 @@ class RealtimeSpeechToText:
             # 테스트 모드: 고정 텍스트 반환
             return "테스트 비디오 텍스트입니다. 인공지능은 인간의 삶에 많은 도움을 줄 수 있습니다."
         finally:
-            # 임시 파일 정리
-            try:
-                if audio_path and os.path.exists(audio_path):
-                    os.remove(audio_path)
-                    logger.info(f"임시 오디오 파일 삭제됨: {audio_path}")
-            except Exception as e:
-                logger.warning(f"임시 파일 삭제 실패: {str(e)}")
-            
             # 메모리 정리
             gc.collect()
 
@@ -0,0 +1,4 @@
+"""
+성능 측정(벤치마크) 스크립트 패키지
+AI 서버 루트에서 `python -m benchmarks.<이름>`으로 실행하며 결과는 JSON으로 저장 가능
+"""
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 인식 백엔드 벤치마크
+같은 오디오를 백엔드(openai-whisper, whisper-int8, faster-whisper)별로 전사하여
+실시간 배율(RTF = 처리 시간 / 오디오 길이), 모델 로드 시간, 오류율(WER/CER)을 비교
+
+- 정답 텍스트가 있으면(--manifest) 정답 기준 오류율, 없으면 첫 번째 백엔드 결과 기준 일치율을 계산
+- 모델 로드와 첫 추론(초기화) 시간은 RTF에서 제외
+
+사용 예 (AI 서버 루트에서 실행):
+    python -m benchmarks.asr_backends --audio answer1.mp4 answer2.wav
+    python -m benchmarks.asr_backends --manifest samples.jsonl --backends openai-whisper whisper-int8 faster-whisper
+    python -m benchmarks.asr_backends --manifest samples.jsonl --output asr_benchmark.json
+
+manifest 형식 (JSON Lines): {"audio": "경로", "text": "정답 텍스트"}
+"""
+
+import os
+import sys
+import json
+import time
+import string
+import logging
+import argparse
+import platform
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from modules.asr_backend import ASR_BACKENDS, OPENAI_WHISPER, WHISPER_INT8, create_asr_backend, resolve_asr_backend_name
+from modules.common.audio_utils import AUDIO_SAMPLE_RATE, decode_audio_from_video
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = str.maketrans("", "", string.punctuation + "…“”‘’·")
+
+def normalize_text(text: str) -> str:
+    """비교용 텍스트 정규화 (소문자, 문장부호 제거, 공백 정리)"""
+    return " ".join(text.lower().translate(_PUNCTUATION).split())
+
+def edit_distance(reference: List[str], hypothesis: List[str]) -> int:
+    """두 토큰 목록의 편집 거리 (Levenshtein)"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_token in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_token in enumerate(hypothesis, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_token != hyp_token))
+        previous = current
+    return previous[-1]
+
+def error_rates(reference: str, hypothesis: str) -> Dict[str, Any]:
+    """
+    단어 오류율(WER)과 문자 오류율(CER) 계산
+    한국어는 띄어쓰기 차이가 커서 CER(공백 제외 문자 기준)을 함께 보고
+
+    Returns:
+        Dict[str, Any]: 오류 수와 기준 길이 (여러 파일 합산용) 및 오류율
+    """
+    ref_words, hyp_words = normalize_text(reference).split(), normalize_text(hypothesis).split()
+    ref_chars, hyp_chars = list("".join(ref_words)), list("".join(hyp_words))
+    word_errors, char_errors = edit_distance(ref_words, hyp_words), edit_distance(ref_chars, hyp_chars)
+    return {
+        "word_errors": word_errors, "words": len(ref_words),
+        "char_errors": char_errors, "chars": len(ref_chars),
+        "wer": round(word_errors / max(1, len(ref_words)), 4),
+        "cer": round(char_errors / max(1, len(ref_chars)), 4)
+    }
+
+def load_samples(manifest: Optional[str], audio_paths: List[str]) -> List[Dict[str, Any]]:
+    """벤치마크 입력 (오디오 디코딩 포함, 정답 텍스트는 manifest에 있을 때만)"""
+    entries = []
+    if manifest:
+        base_dir = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    entries.append({"audio": os.path.join(base_dir, entry["audio"]), "reference": entry.get("text")})
+    entries.extend({"audio": path, "reference": None} for path in audio_paths)
+
+    samples = []
+    for entry in entries:
+        audio = decode_audio_from_video(entry["audio"])
+        if audio is None or len(audio) == 0:
+            print(f"⏭️  디코딩 실패, 건너뜀: {entry['audio']}")
+            continue
+        samples.append(dict(entry, pcm=audio, duration=len(audio) / AUDIO_SAMPLE_RATE))
+    return samples
+
+def benchmark_backend(name: str, model_size: str, samples: List[Dict[str, Any]], language: Optional[str],
+                      repeat: int, word_timestamps: bool) -> Dict[str, Any]:
+    """백엔드 1개 측정 (로드 + 초기 추론 후 파일별 repeat회 전사, 최소 시간 사용)"""
+    backend = create_asr_backend(model_size, name)
+    try:
+        start = time.perf_counter()
+        backend.load()
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        backend.transcribe(np.zeros(AUDIO_SAMPLE_RATE, dtype=np.float32), language=language)
+        warmup_seconds = time.perf_counter() - start
+
+        files = []
+        for sample in samples:
+            timings = []
+            result = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = backend.transcribe(sample["pcm"], language=language, word_timestamps=word_timestamps)
+                timings.append(time.perf_counter() - start)
+            files.append({
+                "audio": sample["audio"],
+                "duration": round(sample["duration"], 2),
+                "seconds": round(min(timings), 3),
+                "rtf": round(min(timings) / sample["duration"], 4),
+                "text": result["text"].strip(),
+                "segments": len(result.get("segments", [])),
+                "avg_logprob": round(float(np.mean([s["avg_logprob"] for s in result["segments"]])), 3)
+                if result.get("segments") else None
+            })
+
+        total_seconds = sum(f["seconds"] for f in files)
+        total_duration = sum(f["duration"] for f in files)
+        return {
+            "backend": name,
+            "info": backend.info(),
+            "load_seconds": round(load_seconds, 2),
+            "warmup_seconds": round(warmup_seconds, 2),
+            "transcribe_seconds": round(total_seconds, 3),
+            "audio_seconds": round(total_duration, 2),
+            "rtf": round(total_seconds / total_duration, 4) if total_duration else None,
+            "files": files
+        }
+    finally:
+        backend.release()
+
+def attach_error_rates(report: Dict[str, Any], samples: List[Dict[str, Any]], baseline_name: str):
+    """파일별/백엔드별 오류율 추가 (정답 텍스트가 없으면 기준 백엔드 결과와 비교)"""
+    baseline = next((b for b in report["backends"] if b["backend"] == baseline_name), None)
+    if baseline is not None and "error" in baseline:
+        # 기준 백엔드 측정이 실패했으면 정답 텍스트가 있는 파일만 비교
+        baseline = None
+    for backend in report["backends"]:
+        totals = {"word_errors": 0, "words": 0, "char_errors": 0, "chars": 0}
+        for index, file_result in enumerate(backend["files"]):
+            reference = samples[index]["reference"]
+            source = "reference"
+            if reference is None:
+                if baseline is None or backend is baseline:
+                    continue
+                reference = baseline["files"][index]["text"]
+                source = baseline_name
+            rates = error_rates(reference, file_result["text"])
+            file_result.update(wer=rates["wer"], cer=rates["cer"], compared_to=source)
+            for key in totals:
+                totals[key] += rates[key]
+        if totals["words"] or totals["chars"]:
+            backend["wer"] = round(totals["word_errors"] / max(1, totals["words"]), 4)
+            backend["cer"] = round(totals["char_errors"] / max(1, totals["chars"]), 4)
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 인식 백엔드 벤치마크 (RTF, WER/CER)")
+    parser.add_argument("--manifest", default=None, help="정답 텍스트가 있는 입력 목록 (JSON Lines)")
+    parser.add_argument("--audio", nargs="*", default=[], help="정답 없이 측정할 오디오/영상 파일")
+    parser.add_argument("--backends", nargs="+", choices=list(ASR_BACKENDS),
+                        default=[OPENAI_WHISPER, WHISPER_INT8], help="비교할 백엔드 (첫 번째가 비교 기준)")
+    parser.add_argument("--model-size", default="base", help="모델 크기 (기본값: base)")
+    parser.add_argument("--language", default="ko", help="언어 코드 (auto: 자동 감지)")
+    parser.add_argument("--repeat", type=int, default=1, help="파일별 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--word-timestamps", action="store_true", help="단어 단위 타임스탬프 포함")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    samples = load_samples(args.manifest, args.audio)
+    if not samples:
+        parser.error("측정할 오디오가 없습니다 (--manifest 또는 --audio 지정)")
+    language = None if args.language == "auto" else args.language
+
+    # 설치되지 않아 대체되는 백엔드는 한 번만 측정
+    names = []
+    for name in args.backends:
+        resolved = resolve_asr_backend_name(name)
+        if resolved != name:
+            print(f"⚠️ {name} 사용 불가 → {resolved}로 대체")
+        if resolved not in names:
+            names.append(resolved)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {"python": platform.python_version(), "machine": platform.machine(),
+                        "cpu_count": os.cpu_count()},
+        "model_size": args.model_size,
+        "language": args.language,
+        "samples": len(samples),
+        "backends": []
+    }
+    for name in names:
+        print(f"▶ {name} 측정 중...")
+        try:
+            report["backends"].append(benchmark_backend(name, args.model_size, samples, language,
+                                                        args.repeat, args.word_timestamps))
+        except Exception as e:
+            print(f"❌ {name} 측정 실패: {str(e)}")
+            report["backends"].append({"backend": name, "error": str(e), "files": []})
+    attach_error_rates(report, samples, names[0])
+
+    print("=" * 72)
+    print(f"{'백엔드':<16} {'로드(s)':>8} {'RTF':>8} {'WER':>8} {'CER':>8}  기준")
+    for backend in report["backends"]:
+        if "error" in backend:
+            print(f"{backend['backend']:<16} 실패: {backend['error']}")
+            continue
+        compared = "정답" if any(s["reference"] for s in samples) else names[0]
+        print(f"{backend['backend']:<16} {backend['load_seconds']:>8.2f} {backend['rtf']:>8.3f} "
+              f"{backend.get('wer', float('nan')):>8.3f} {backend.get('cer', float('nan')):>8.3f}  {compared}")
+    print("=" * 72)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    return 1 if any("error" in backend for backend in report["backends"]) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 답변 영상 생성
+시드가 고정된 발화 형태의 오디오(기본 주파수 + 배음, 음절 단위 진폭 변화, 발화 사이 무음)와
+ffmpeg 테스트 패턴 영상을 합쳐 길이별 mp4를 만들고, 같은 설정이면 기존 파일을 재사용
+
+사용 예 (AI 서버 루트에서 실행):
+    python -m benchmarks.fixtures --durations 15 45 90
+"""
+
+import os
+import sys
+import wave
+import hashlib
+import argparse
+import subprocess
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# 기본 영상 길이 (초) - 짧은 답변, 보통 답변, 긴 답변
+DEFAULT_DURATIONS = [15, 45, 90]
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_SAMPLE_RATE = 16000
+FIXTURE_FPS = 25
+
+def synthesize_speech_like_audio(duration: float, sample_rate: int = FIXTURE_SAMPLE_RATE,
+                                 seed: int = 0) -> np.ndarray:
+    """
+    발화와 비슷한 합성 오디오 생성 (VAD/Librosa가 실제 답변과 비슷한 구간 구조를 보도록)
+
+    - 0.6~2.5초 발화 구간: 100~220Hz 기본 주파수와 배음, 초당 약 4음절의 진폭 변화
+    - 발화 사이 0.2~1.2초 무음 (일부는 2.5초 긴 무음), 약한 배경 잡음
+
+    Args:
+        duration: 길이 (초)
+        sample_rate: 샘플링 레이트
+        seed: 난수 시드
+
+    Returns:
+        np.ndarray: float32 PCM (-1~1)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration * sample_rate)
+    audio = rng.normal(0.0, 0.002, total).astype(np.float32)
+
+    t = 0.3
+    while t < duration - 0.6:
+        length = min(rng.uniform(0.6, 2.5), duration - 0.3 - t)
+        start, count = int(t * sample_rate), int(length * sample_rate)
+        tt = np.arange(count) / sample_rate
+
+        f0 = rng.uniform(100, 220) * (1 + 0.03 * np.sin(2 * np.pi * rng.uniform(3, 6) * tt))
+        phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+        voiced = sum(np.sin(k * phase + rng.uniform(0, 2 * np.pi)) / k for k in range(1, 7))
+        syllables = 0.5 * (1 - np.cos(2 * np.pi * rng.uniform(3.5, 5.0) * tt))
+        fade = np.minimum(1.0, np.minimum(tt, length - tt) / 0.05)
+        audio[start:start + count] += (0.25 * voiced * syllables * fade).astype(np.float32)
+
+        pause = 2.5 if rng.random() < 0.1 else rng.uniform(0.2, 1.2)
+        t += length + pause
+
+    return np.clip(audio, -1.0, 1.0)
+
+def _write_wav(path: str, audio: np.ndarray, sample_rate: int):
+    """16비트 모노 WAV 저장"""
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((audio * 32767).astype(np.int16).tobytes())
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_fixture(duration: float, fixtures_dir: str = DEFAULT_FIXTURES_DIR, seed: int = 0,
+                  size: str = "640x480") -> str:
+    """
+    합성 답변 영상 1개 생성 (이미 있으면 재사용)
+
+    Args:
+        duration: 길이 (초)
+        fixtures_dir: 저장 디렉토리
+        seed: 오디오 난수 시드
+        size: 영상 해상도
+
+    Returns:
+        str: mp4 경로
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    name = f"answer_{int(duration)}s_seed{seed}_{size}"
+    video_path = os.path.join(fixtures_dir, f"{name}.mp4")
+    if os.path.exists(video_path):
+        return video_path
+
+    wav_path = os.path.join(fixtures_dir, f"{name}.wav")
+    _write_wav(wav_path, synthesize_speech_like_audio(duration, seed=seed), FIXTURE_SAMPLE_RATE)
+    command = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={size}:rate={FIXTURE_FPS}",
+        "-i", wav_path,
+        "-t", str(duration),
+        "-c:v", "mpeg4", "-q:v", "5",
+        "-c:a", "aac", "-b:a", "96k",
+        "-shortest",
+        # 같은 ffmpeg 버전이면 같은 바이트가 나오도록 인코더 메타데이터 제외
+        "-fflags", "+bitexact", "-flags:v", "+bitexact", "-flags:a", "+bitexact", "-map_metadata", "-1",
+        video_path + ".part.mp4"
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=600)
+        os.replace(video_path + ".part.mp4", video_path)
+    finally:
+        for path in (wav_path, video_path + ".part.mp4"):
+            if os.path.exists(path):
+                os.remove(path)
+    return video_path
+
+def ensure_fixtures(durations: Optional[List[float]] = None, fixtures_dir: str = DEFAULT_FIXTURES_DIR,
+                    seed: int = 0, extra_videos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    벤치마크 입력 영상 목록 (합성 영상 생성 + 추가 영상)
+
+    Returns:
+        List[Dict[str, Any]]: name, path, duration, bytes, sha256
+    """
+    fixtures = []
+    for duration in (DEFAULT_DURATIONS if durations is None else durations):
+        path = build_fixture(duration, fixtures_dir, seed)
+        fixtures.append({"name": f"synthetic_{int(duration)}s", "path": path, "duration": float(duration)})
+    for path in extra_videos or []:
+        fixtures.append({"name": os.path.splitext(os.path.basename(path))[0], "path": path,
+                         "duration": probe_duration(path)})
+    for fixture in fixtures:
+        fixture["bytes"] = os.path.getsize(fixture["path"])
+        fixture["sha256"] = _sha256(fixture["path"])
+    return fixtures
+
+def probe_duration(path: str) -> Optional[float]:
+    """ffprobe로 영상 길이 조회 (실패 시 None)"""
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+            check=True, capture_output=True, text=True, timeout=30
+        )
+        return round(float(result.stdout.strip()), 2)
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 답변 영상 생성")
+    parser.add_argument("--durations", nargs="+", type=float, default=DEFAULT_DURATIONS, help="영상 길이 (초)")
+    parser.add_argument("--fixtures-dir", default=DEFAULT_FIXTURES_DIR, help="저장 디렉토리")
+    parser.add_argument("--seed", type=int, default=0, help="오디오 난수 시드")
+    args = parser.parse_args()
+
+    for fixture in ensure_fixtures(args.durations, args.fixtures_dir, args.seed):
+        print(f"{fixture['path']}  {fixture['duration']:.0f}초  {fixture['bytes'] / 1024:.0f}KB  {fixture['sha256'][:12]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
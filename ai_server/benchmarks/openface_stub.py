@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OpenFace FeatureExtraction 대체 실행 파일 (벤치마크용)
+OpenFace 바이너리가 없는 환경에서 같은 명령행 인자(-f/-fdir, -out_dir, -of)를 받아
+프레임 수만큼 AU/시선/자세 열을 가진 CSV를 만들고, 시작 비용과 프레임당 처리 비용을 sleep으로 흉내 냄
+
+- OPENFACE_STUB_STARTUP_MS: 모델 로드 비용 (기본값: 300ms)
+- OPENFACE_STUB_FRAME_MS: 프레임당 처리 비용 (기본값: 4ms)
+
+사용 예:
+    OPENFACE_PATH=benchmarks/openface_stub.py python main_server.py
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+import numpy as np
+
+FPS = 25
+AU_INTENSITY = ["AU01", "AU02", "AU04", "AU05", "AU06", "AU07", "AU09", "AU10", "AU12", "AU14",
+                "AU15", "AU17", "AU20", "AU23", "AU25", "AU26", "AU45"]
+AU_PRESENCE = AU_INTENSITY[:-1] + ["AU28", "AU45"]
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+def _option(args, name, default=None):
+    return args[args.index(name) + 1] if name in args and args.index(name) + 1 < len(args) else default
+
+def _frame_count(args) -> int:
+    """입력 프레임 수 (-fdir이면 이미지 수, -f이면 영상 길이 × FPS)"""
+    frames_dir = _option(args, "-fdir")
+    if frames_dir:
+        return len([name for name in os.listdir(frames_dir) if name.lower().endswith(IMAGE_EXTENSIONS)])
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", _option(args, "-f")],
+            check=True, capture_output=True, text=True, timeout=30
+        )
+        return max(1, int(float(result.stdout.strip()) * FPS))
+    except Exception:
+        return 10 * FPS
+
+def main():
+    args = sys.argv[1:]
+    if "-help" in args:
+        print("OpenFace FeatureExtraction stub (benchmark)")
+        return 0
+
+    startup_ms = float(os.environ.get("OPENFACE_STUB_STARTUP_MS", 300))
+    frame_ms = float(os.environ.get("OPENFACE_STUB_FRAME_MS", 4))
+    out_dir = _option(args, "-out_dir", ".")
+    out_name = _option(args, "-of", "features.csv")
+    frames = _frame_count(args)
+
+    time.sleep((startup_ms + frame_ms * frames) / 1000.0)
+
+    # 프레임 수로 시드를 정해 같은 입력이면 같은 값
+    rng = np.random.default_rng(frames)
+    index = np.arange(frames)
+    columns = {
+        "frame": index + 1,
+        "face_id": np.zeros(frames),
+        "timestamp": index / FPS,
+        "confidence": np.clip(rng.normal(0.93, 0.04, frames), 0, 1),
+        "success": np.ones(frames),
+        "gaze_0_x": rng.normal(0.0, 0.08, frames),
+        "gaze_0_y": rng.normal(0.1, 0.06, frames),
+        "gaze_0_z": -np.ones(frames),
+        "gaze_angle_x": rng.normal(0.0, 0.1, frames),
+        "gaze_angle_y": rng.normal(0.1, 0.08, frames),
+        "pose_Tx": rng.normal(0, 5, frames),
+        "pose_Ty": rng.normal(0, 5, frames),
+        "pose_Tz": rng.normal(600, 10, frames),
+        "pose_Rx": rng.normal(0.05, 0.05, frames),
+        "pose_Ry": rng.normal(0.0, 0.08, frames),
+        "pose_Rz": rng.normal(0.0, 0.03, frames),
+    }
+    for au in AU_INTENSITY:
+        columns[f"{au}_r"] = np.clip(rng.gamma(1.2, 0.5, frames), 0, 5)
+    for au in AU_PRESENCE:
+        columns[f"{au}_c"] = (rng.random(frames) < 0.3).astype(float)
+
+    os.makedirs(out_dir, exist_ok=True)
+    data = np.column_stack(list(columns.values()))
+    # OpenFace와 같은 ", " 구분 헤더
+    np.savetxt(os.path.join(out_dir, out_name), data, delimiter=", ", fmt="%.4f",
+               header=", ".join(columns), comments="")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
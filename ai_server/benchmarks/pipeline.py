@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+답변 영상 분석 파이프라인 벤치마크 (오프라인)
+합성 답변 영상(길이별)으로 단계별 지연 시간, 동시 요청 처리량, 최대 메모리(RSS)를 측정하고
+결과를 JSON으로 저장하여 이전 결과와 비교 (성능 회귀 확인)
+
+- 단계별 지연: decode(오디오 디코딩), vad(무음 제거), asr(Whisper), audio_features(Librosa),
+  openface(얼굴 분석), scoring(점수/피드백), json(응답 직렬화), end_to_end(병렬 분석 + 점수 + 직렬화)
+- OpenFace는 benchmarks/openface_stub.py로 대체 (실제 바이너리 측정은 --openface-path 지정)
+- 처리량: 서버를 같은 프로세스에서 띄우고(또는 --url) 동시 요청 수를 늘려 가며 답변 영상 API 호출
+- 분석 결과 캐시는 기본적으로 끔 (같은 영상 반복 요청이 캐시 적중으로 측정되지 않도록)
+
+사용 예 (AI 서버 루트에서 실행, ffmpeg 필요):
+    python -m benchmarks.pipeline
+    python -m benchmarks.pipeline --durations 15 45 --repeat 5 --concurrency 1 2 4 8 16
+    python -m benchmarks.pipeline --skip-asr --skip-throughput
+    python -m benchmarks.pipeline --baseline benchmarks/results/pipeline_abc1234.json --max-regression 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.fixtures import DEFAULT_DURATIONS, DEFAULT_FIXTURES_DIR, ensure_fixtures
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_ROOT = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+OPENFACE_STUB_PATH = os.path.join(BENCHMARK_DIR, "openface_stub.py")
+
+STAGES = ["decode", "vad", "asr", "audio_features", "openface", "scoring", "json", "end_to_end"]
+# 결과에 기록하는 성능 관련 환경 변수
+RECORDED_ENV = ["ASR_BACKEND", "ASR_COMPUTE_TYPE", "ASR_CPU_THREADS", "VAD_TRIM", "ANALYSIS_MAX_WORKERS",
+                "WHISPER_BATCHING", "WHISPER_BATCH_MAX_SIZE", "OPENFACE_SAMPLING_MODE", "OPENFACE_SAMPLE_FPS",
+                "OPENFACE_STUB_STARTUP_MS", "OPENFACE_STUB_FRAME_MS", "ANALYSIS_CACHE_ENABLED"]
+
+logger = logging.getLogger(__name__)
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    현재까지의 최대 RSS (MB)
+    자식 프로세스(RUSAGE_CHILDREN)는 fork 시점의 부모 메모리까지 포함되어 의미가 없으므로 서버 프로세스만 측정
+    """
+    if resource is None:
+        return None
+    # Linux는 KB, macOS는 바이트 단위
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit, 1)
+
+def summarize_times(values: List[float]) -> Dict[str, Any]:
+    """반복 측정값 요약 (ms)"""
+    if not values:
+        return {"runs": 0}
+    ms = np.asarray(values) * 1000
+    return {
+        "runs": len(values),
+        "median_ms": round(float(np.median(ms)), 2),
+        "min_ms": round(float(ms.min()), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2)
+    }
+
+def git_revision() -> Dict[str, Any]:
+    """측정한 코드의 커밋 (작업 트리 변경 여부 포함)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=SERVER_ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except Exception:
+        return {"commit": None, "dirty": None}
+
+def load_server(args) -> Any:
+    """
+    메인 서버 모듈 로드 및 벤치마크용 설정
+    모듈 임포트 시점에 읽는 환경 변수(캐시 사용 여부 등)를 먼저 설정해야 하므로 여기서 임포트
+    """
+    if not args.with_cache:
+        os.environ["ANALYSIS_CACHE_ENABLED"] = "false"
+    os.environ["AI_SERVER_STARTUP_MODE"] = "eager"
+
+    import main_server
+    from interview_features.debate.openface_integration import OpenFaceDebateIntegration
+
+    # LLM/TTS/AIStudios는 측정 대상이 아니므로 초기화하지 않고 분석에 쓰는 모듈만 설정
+    main_server.openface_integration = OpenFaceDebateIntegration(
+        openface_path=args.openface_path, output_dir=os.path.join(args.work_dir, "facial_output")
+    )
+    main_server.OPENFACE_INTEGRATION_AVAILABLE = main_server.openface_integration.is_available
+    if args.skip_asr:
+        main_server.WHISPER_AVAILABLE = False
+    elif main_server.WHISPER_AVAILABLE:
+        main_server.whisper_model = main_server.create_asr_backend(args.model_size)
+    return main_server
+
+def warm_up(server) -> Dict[str, Any]:
+    """모델 로드와 초기 추론 시간 (단계별 지연 측정에서 제외)"""
+    startup = {}
+    for name, func, enabled in (("whisper", server.warm_up_whisper, server.whisper_model is not None),
+                                ("librosa", server.warm_up_librosa, server.LIBROSA_AVAILABLE)):
+        if not enabled:
+            continue
+        start = time.perf_counter()
+        func()
+        startup[f"{name}_seconds"] = round(time.perf_counter() - start, 2)
+    return startup
+
+def build_response(server, kind: str, transcription: Dict, audio: Dict, facial: Dict) -> Dict[str, Any]:
+    """API 엔드포인트와 같은 점수 계산 및 응답 구성"""
+    if kind == "debate":
+        scores = server.calculate_debate_scores(transcription, audio, facial)
+        return {"user_opening_text": transcription.get("text", ""),
+                "emotion": facial.get("emotion", "중립 (안정적)"), **scores}
+    return {
+        "answer_text": transcription.get("text", ""),
+        "content_score": server.calculate_content_score(transcription.get("text", "")),
+        "voice_score": audio.get("voice_stability", 0.8) * 5,
+        "action_score": facial.get("confidence", 0.8) * 5,
+        "feedback": server.generate_interview_feedback(transcription, audio, facial)
+    }
+
+def measure_stages(server, fixture: Dict[str, Any], kind: str, repeat: int) -> Dict[str, Any]:
+    """답변 영상 1개의 단계별 지연 시간 (repeat회 반복)"""
+    from modules.common.audio_utils import decode_audio_from_video
+    from modules.common.vad import VAD_TRIM_ENABLED, trim_silence
+
+    path = fixture["path"]
+    fallback_text = "답변 내용이 인식되었습니다."
+    times = {stage: [] for stage in STAGES}
+    status = {}
+
+    def timed(stage: str, func: Callable, *func_args):
+        start = time.perf_counter()
+        result = func(*func_args)
+        times[stage].append(time.perf_counter() - start)
+        return result
+
+    for _ in range(repeat):
+        audio = timed("decode", decode_audio_from_video, path)
+        if audio is None:
+            raise RuntimeError(f"오디오 디코딩 실패 (ffmpeg 설치 확인): {path}")
+
+        voiced = timed("vad", trim_silence, audio) if VAD_TRIM_ENABLED else None
+        source = voiced if voiced is not None else audio
+
+        if server.WHISPER_AVAILABLE and server.whisper_model is not None:
+            transcription = timed("asr", server.transcribe_with_whisper, source.view(np.ndarray))
+            status["asr"] = "error" if "error" in transcription else "success"
+        else:
+            transcription = {"text": fallback_text, "confidence": 0.85}
+            status["asr"] = "skipped"
+
+        if server.LIBROSA_AVAILABLE:
+            audio_analysis = timed("audio_features", server.process_audio_with_librosa, source)
+            status["audio_features"] = "error" if "error" in audio_analysis else "success"
+        else:
+            audio_analysis = {}
+            status["audio_features"] = "skipped"
+
+        if server.OPENFACE_INTEGRATION_AVAILABLE:
+            facial = timed("openface", server.openface_integration.analyze_video, path)
+            fallback = facial.get("raw_features", {}).get("participant_id") == "fallback_analysis"
+            status["openface"] = "fallback" if fallback else "success"
+        else:
+            facial = {}
+            status["openface"] = "skipped"
+
+        response = timed("scoring", build_response, server, kind, transcription, audio_analysis, facial)
+        timed("json", server.app.json.dumps, response)
+
+        start = time.perf_counter()
+        analysis = server.run_multimodal_analysis(path, fallback_text)
+        server.app.json.dumps(build_response(server, kind, analysis["transcription"], analysis["audio"],
+                                             analysis["facial"]))
+        times["end_to_end"].append(time.perf_counter() - start)
+        status["end_to_end"] = analysis.get("status", {})
+
+    return {
+        "fixture": fixture["name"],
+        "duration": fixture["duration"],
+        "stages": {stage: summarize_times(values) for stage, values in times.items() if values},
+        "rtf": round(float(np.median(times["end_to_end"])) / fixture["duration"], 4) if fixture["duration"] else None,
+        "status": status,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+def start_local_server(server) -> Any:
+    """같은 프로세스에서 Flask 앱을 임의 포트로 실행 (다중 스레드)"""
+    from werkzeug.serving import make_server
+
+    http_server = make_server("127.0.0.1", 0, server.app, threaded=True)
+    threading.Thread(target=http_server.serve_forever, name="benchmark-server", daemon=True).start()
+    return http_server
+
+def measure_throughput(base_url: str, fixture: Dict[str, Any], kind: str, levels: List[int],
+                       requests_per_worker: int, timeout: float) -> List[Dict[str, Any]]:
+    """동시 요청 수별 처리량 (요청마다 다른 ID를 사용해 임시 파일이 겹치지 않도록 함)"""
+    import requests
+
+    with open(fixture["path"], "rb") as f:
+        payload = f.read()
+    counter = iter(range(1, 10 ** 9))
+    counter_lock = threading.Lock()
+
+    def post_once() -> Dict[str, Any]:
+        with counter_lock:
+            request_id = 900000 + next(counter)
+        if kind == "debate":
+            url = f"{base_url}/ai/debate/{request_id}/opening-video"
+        else:
+            url = f"{base_url}/ai/interview/{request_id}/INTRO/answer-video"
+        start = time.perf_counter()
+        try:
+            response = requests.post(url, files={"file": ("answer.mp4", payload, "video/mp4")}, timeout=timeout)
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        return {"seconds": time.perf_counter() - start, "ok": ok}
+
+    results = []
+    for level in levels:
+        total = level * requests_per_worker
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            outcomes = list(executor.map(lambda _: post_once(), range(total)))
+        wall = time.perf_counter() - start
+        latencies = np.asarray([o["seconds"] for o in outcomes]) * 1000
+        errors = sum(1 for o in outcomes if not o["ok"])
+        results.append({
+            "concurrency": level,
+            "requests": total,
+            "errors": errors,
+            "wall_seconds": round(wall, 2),
+            "rps": round((total - errors) / wall, 3),
+            "latency_p50_ms": round(float(np.median(latencies)), 1),
+            "latency_p95_ms": round(float(np.percentile(latencies, 95)), 1),
+            "latency_max_ms": round(float(latencies.max()), 1),
+            "peak_rss_mb": peak_rss_mb()
+        })
+        print(f"  동시 {level:>3}: {results[-1]['rps']:.2f} req/s, p95 {results[-1]['latency_p95_ms']:.0f}ms, "
+              f"오류 {errors}/{total}")
+    return results
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float,
+                          min_ms: float) -> List[str]:
+    """
+    기준 결과 대비 회귀 목록
+    단계 지연 중앙값/처리량 p95 지연/최대 RSS는 증가, 처리량(rps)은 감소를 회귀로 판단
+    (기준값이 min_ms보다 작은 단계는 측정 잡음이 커서 제외)
+    """
+    failures = []
+    baseline_fixtures = {f["fixture"]: f for f in baseline.get("fixtures", [])}
+    for fixture in report["fixtures"]:
+        previous = baseline_fixtures.get(fixture["fixture"])
+        if previous is None:
+            continue
+        for stage, current in fixture["stages"].items():
+            before = previous["stages"].get(stage, {}).get("median_ms")
+            if before is None or before < min_ms:
+                continue
+            if current["median_ms"] > before * (1 + max_regression):
+                failures.append(f"{fixture['fixture']} {stage}: {current['median_ms']}ms > 기준 {before}ms "
+                                f"+ {max_regression:.0%}")
+
+    baseline_levels = {t["concurrency"]: t for t in baseline.get("throughput", [])}
+    for current in report.get("throughput", []):
+        previous = baseline_levels.get(current["concurrency"])
+        if previous is None:
+            continue
+        if current["rps"] < previous["rps"] * (1 - max_regression):
+            failures.append(f"동시 {current['concurrency']} 처리량: {current['rps']} req/s < 기준 {previous['rps']} "
+                            f"- {max_regression:.0%}")
+        if current["latency_p95_ms"] > previous["latency_p95_ms"] * (1 + max_regression):
+            failures.append(f"동시 {current['concurrency']} p95 지연: {current['latency_p95_ms']}ms > "
+                            f"기준 {previous['latency_p95_ms']}ms + {max_regression:.0%}")
+
+    before, after = baseline.get("peak_rss_mb"), report["peak_rss_mb"]
+    if before and after and after > before * (1 + max_regression):
+        failures.append(f"최대 RSS: {after}MB > 기준 {before}MB + {max_regression:.0%}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="답변 영상 분석 파이프라인 벤치마크 (지연/처리량/메모리)")
+    parser.add_argument("--durations", nargs="+", type=float, default=DEFAULT_DURATIONS, help="합성 영상 길이 (초)")
+    parser.add_argument("--video", nargs="*", default=[], help="추가로 측정할 실제 답변 영상")
+    parser.add_argument("--fixtures-dir", default=DEFAULT_FIXTURES_DIR, help="합성 영상 저장 디렉토리")
+    parser.add_argument("--kind", choices=["interview", "debate"], default="interview", help="점수 계산/API 종류")
+    parser.add_argument("--repeat", type=int, default=3, help="영상별 단계 측정 반복 횟수")
+    parser.add_argument("--model-size", default="base", help="Whisper 모델 크기 (백엔드: 환경 변수 ASR_BACKEND)")
+    parser.add_argument("--skip-asr", action="store_true", help="음성 인식 제외 (대체 텍스트 사용)")
+    parser.add_argument("--openface-path", default=OPENFACE_STUB_PATH, help="OpenFace 실행 파일 (기본값: 대체 실행 파일)")
+    parser.add_argument("--with-cache", action="store_true", help="분석 결과 캐시 사용")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4, 8], help="처리량 측정 동시 요청 수")
+    parser.add_argument("--requests-per-worker", type=int, default=2, help="동시 요청 수당 요청 횟수")
+    parser.add_argument("--throughput-fixture", default=None, help="처리량 측정 영상 이름 (기본값: 가장 짧은 영상)")
+    parser.add_argument("--skip-throughput", action="store_true", help="처리량 측정 제외")
+    parser.add_argument("--url", default=None, help="이미 실행 중인 서버 주소 (없으면 같은 프로세스에서 실행)")
+    parser.add_argument("--request-timeout", type=float, default=600, help="요청 타임아웃 (초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본값: benchmarks/results/pipeline_<커밋>.json)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="기준 대비 허용 변화율 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="회귀 비교에서 제외할 짧은 단계 기준 (ms)")
+    parser.add_argument("--work-dir", default=os.path.join(DEFAULT_RESULTS_DIR, "work"), help="OpenFace 출력 등 작업 디렉토리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    os.makedirs(args.work_dir, exist_ok=True)
+
+    print("▶ 합성 답변 영상 준비 중...")
+    fixtures = ensure_fixtures(args.durations, args.fixtures_dir, extra_videos=args.video)
+    server = load_server(args)
+    # 서버 모듈이 로깅 설정을 덮어쓰므로 벤치마크 중에는 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    revision = git_revision()
+    report = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "revision": revision,
+        "environment": {"python": platform.python_version(), "machine": platform.machine(),
+                        "cpu_count": os.cpu_count(),
+                        "settings": {name: os.environ[name] for name in RECORDED_ENV if name in os.environ}},
+        "config": {"kind": args.kind, "repeat": args.repeat, "model_size": args.model_size,
+                   "asr_backend": None if args.skip_asr else server.resolve_asr_backend_name(),
+                   "openface_path": args.openface_path,
+                   "modules": {"whisper": server.whisper_model is not None, "librosa": server.LIBROSA_AVAILABLE,
+                               "openface": server.OPENFACE_INTEGRATION_AVAILABLE}},
+        "inputs": fixtures
+    }
+
+    print("▶ 모델 준비 중...")
+    report["startup"] = warm_up(server)
+    report["startup"]["peak_rss_mb"] = peak_rss_mb()
+
+    report["fixtures"] = []
+    for fixture in fixtures:
+        print(f"▶ 단계별 지연 측정: {fixture['name']} ({fixture['duration']}초)")
+        result = measure_stages(server, fixture, args.kind, args.repeat)
+        report["fixtures"].append(result)
+        for stage, summary in result["stages"].items():
+            print(f"  {stage:<15} {summary['median_ms']:>10.1f}ms (최소 {summary['min_ms']:.1f}, p95 {summary['p95_ms']:.1f})")
+
+    if not args.skip_throughput:
+        fixture = min(fixtures, key=lambda f: f["duration"] or 0)
+        if args.throughput_fixture:
+            fixture = next(f for f in fixtures if f["name"] == args.throughput_fixture)
+        http_server = None
+        base_url = args.url
+        if base_url is None:
+            http_server = start_local_server(server)
+            base_url = f"http://127.0.0.1:{http_server.server_port}"
+        print(f"▶ 처리량 측정: {fixture['name']} → {base_url}")
+        try:
+            report["throughput_fixture"] = fixture["name"]
+            report["throughput"] = measure_throughput(base_url.rstrip("/"), fixture, args.kind, args.concurrency,
+                                                      args.requests_per_worker, args.request_timeout)
+        finally:
+            if http_server is not None:
+                http_server.shutdown()
+
+    report["peak_rss_mb"] = peak_rss_mb()
+    print(f"최대 RSS: {report['peak_rss_mb']}MB")
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["baseline"] = {"path": args.baseline, "revision": baseline.get("revision")}
+        failures = compare_with_baseline(report, baseline, args.max_regression, args.min_ms)
+        report["regressions"] = failures
+
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, f"pipeline_{revision['commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
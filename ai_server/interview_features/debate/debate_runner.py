@@ -14,6 +14,11 @@ import asyncio
 from .openface_integration import DebateOpenFaceIntegration
 from .llm_module import DebateLLMModule
 
+# 공통 모듈 임포트
+from modules.analysis import get_orchestrator
+from modules.common.audio_utils import AUDIO_SAMPLE_RATE, decode_audio_from_video
+from modules.common.session_store import SessionStore
+
 # 기존 모듈 임포트 (테스트 환경과 공유)
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'test_features', 'debate'))
@@ -32,7 +37,7 @@ class DebateRunner:
         # 각 모듈 초기화
         self.openface_integration = DebateOpenFaceIntegration()
         self.librosa_module = LibrosaTestModule()
-        self.whisper_module = WhisperTestModule(model="base")  # 더 정확한 모델 사용
+        self.whisper_module = WhisperTestModule(model_size="base")  # 더 정확한 모델 사용
         self.tts_module = TTSTestModule()
         self.llm_module = DebateLLMModule(
             llm_provider=llm_provider,
@@ -40,8 +45,11 @@ class DebateRunner:
             model="gpt-4" if llm_provider == "openai" else "claude-3-sonnet-20240229"
         )
         
-        # 토론 상태 관리
-        self.debate_sessions = {}
+        # 멀티모달 분석 오케스트레이터 (Whisper/Librosa/OpenFace 병렬 실행)
+        self.orchestrator = get_orchestrator()
+        
+        # 토론 상태 관리 (LRU 메모리 캐시 + 영구 저장, 어느 작업자 프로세스에서든 세션 이어서 처리)
+        self.debate_sessions = SessionStore("debate_runner")
         
         logger.info("토론면접 실행기 초기화 완료")
 
@@ -53,11 +61,11 @@ class DebateRunner:
             # AI 입장 결정 (사용자 반대)
             ai_position = "CON" if user_position == "PRO" else "PRO"
             
-            # LLM 컨텍스트 초기화
-            self.llm_module.initialize_debate_context(topic, ai_position)
+            # LLM 컨텍스트 초기화 (세션별)
+            self.llm_module.initialize_debate_context(topic, ai_position, session_id=debate_id)
             
             # 세션 상태 초기화
-            self.debate_sessions[debate_id] = {
+            self.debate_sessions.put(debate_id, {
                 "topic": topic,
                 "user_position": user_position,
                 "ai_position": ai_position,
@@ -66,10 +74,10 @@ class DebateRunner:
                 "start_time": time.time(),
                 "status": "active",
                 "performance_data": {}
-            }
+            })
             
             # AI 입론 생성
-            ai_opening_result = self.llm_module.generate_ai_opening(topic, ai_position)
+            ai_opening_result = self.llm_module.generate_ai_opening(topic, ai_position, session_id=debate_id)
             
             # TTS로 AI 입론 음성 생성
             ai_audio_path = None
@@ -101,27 +109,35 @@ class DebateRunner:
         """사용자 응답 처리 및 AI 반응 생성"""
         logger.info(f"사용자 응답 처리 시작 - 토론 ID: {debate_id}, 단계: {phase}")
         
-        if debate_id not in self.debate_sessions:
+        session = self.debate_sessions.get(debate_id)
+        if session is None:
             return {"error": "존재하지 않는 토론 세션", "debate_id": debate_id}
         
         try:
-            session = self.debate_sessions[debate_id]
-            
-            # 1단계: 음성 인식 (Whisper)
-            transcription_result = self._transcribe_user_video(video_path)
-            
-            # 2단계: 얼굴 분석 (OpenFace)
-            facial_analysis = self._analyze_user_facial_behavior(video_path, phase)
-            
-            # 3단계: 음성 분석 (Librosa)
-            audio_analysis = self._analyze_user_audio(video_path)
+            # 1~3단계: 음성 인식(Whisper), 얼굴 분석(OpenFace), 음성 분석(Librosa) 병렬 실행
+            analysis = self.orchestrator.analyze(
+                video_path,
+                extract_audio=decode_audio_from_video,
+                transcribe=self._transcribe_user_audio,
+                analyze_audio=self._analyze_user_audio,
+                analyze_face=lambda path: self._analyze_user_facial_behavior(path, phase),
+                fallbacks={
+                    "transcription": self.whisper_module._get_default_transcription("video"),
+                    "audio": self.librosa_module._get_default_result(),
+                    "facial": self.openface_integration._get_default_debate_analysis(phase)
+                }
+            )
+            transcription_result = analysis["transcription"]
+            facial_analysis = analysis["facial"]
+            audio_analysis = analysis["audio"]
             
             # 4단계: LLM 분석 및 응답 생성
             llm_result = self.llm_module.analyze_user_response_and_generate_rebuttal(
                 transcription_result["text"],
                 facial_analysis,
                 audio_analysis,
-                phase
+                phase,
+                session_id=debate_id
             )
             
             # 5단계: AI 응답 TTS 변환
@@ -148,15 +164,20 @@ class DebateRunner:
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
             }
             
-            # 세션 상태 업데이트
-            session["phase_history"].append(result)
-            session["current_phase"] = result["next_phase"]
-            session["performance_data"][phase] = {
-                "transcription": transcription_result,
-                "facial_analysis": facial_analysis,
-                "audio_analysis": audio_analysis,
-                "llm_insights": llm_result
-            }
+            # 세션 상태 업데이트 (분석 원본 대신 피드백 계산에 쓰는 요약만 보관)
+            def record_phase(state):
+                state["phase_history"].append(result)
+                state["current_phase"] = result["next_phase"]
+                state["performance_data"][phase] = {
+                    "transcription": {
+                        "text": transcription_result["text"],
+                        "confidence": transcription_result.get("confidence", 0.0)
+                    },
+                    "facial_analysis": {"phase_analysis": facial_analysis.get("phase_analysis", {})},
+                    "audio_analysis": result["audio_analysis_summary"],
+                    "llm_insights": {"performance_feedback": llm_result.get("performance_feedback", {})}
+                }
+            self.debate_sessions.update(debate_id, record_phase)
             
             logger.info(f"사용자 응답 처리 완료 - 토론 ID: {debate_id}, 단계: {phase}")
             return result
@@ -169,12 +190,11 @@ class DebateRunner:
         """최종 종합 피드백 생성"""
         logger.info(f"최종 피드백 생성 시작 - 토론 ID: {debate_id}")
         
-        if debate_id not in self.debate_sessions:
+        session = self.debate_sessions.get(debate_id)
+        if session is None:
             return {"error": "존재하지 않는 토론 세션", "debate_id": debate_id}
         
         try:
-            session = self.debate_sessions[debate_id]
-            
             # 토론 전체 데이터 수집
             debate_summary = {
                 "topic": session["topic"],
@@ -184,7 +204,7 @@ class DebateRunner:
             }
             
             # LLM을 통한 종합 피드백 생성
-            comprehensive_feedback = self.llm_module.generate_comprehensive_feedback(debate_summary)
+            comprehensive_feedback = self.llm_module.generate_comprehensive_feedback(debate_summary, session_id=debate_id)
             
             # 정량적 분석 추가
             quantitative_analysis = self._calculate_quantitative_metrics(session)
@@ -205,8 +225,10 @@ class DebateRunner:
             }
             
             # 세션 완료 처리
-            session["status"] = "completed"
-            session["final_result"] = result
+            def complete(state):
+                state["status"] = "completed"
+                state["final_result"] = result
+            self.debate_sessions.update(debate_id, complete)
             
             logger.info(f"최종 피드백 생성 완료 - 토론 ID: {debate_id}")
             return result
@@ -215,10 +237,10 @@ class DebateRunner:
             logger.error(f"최종 피드백 생성 오류: {str(e)}")
             return {"error": str(e), "debate_id": debate_id}
 
-    def _transcribe_user_video(self, video_path: str) -> Dict[str, Any]:
-        """사용자 비디오 음성 인식"""
+    def _transcribe_user_audio(self, audio) -> Dict[str, Any]:
+        """사용자 답변 오디오(디코딩된 PCM 버퍼) 음성 인식"""
         if self.whisper_module.is_available:
-            return self.whisper_module.transcribe_video_file(video_path)
+            return self.whisper_module.transcribe_audio_data(audio)
         else:
             return {
                 "text": "음성 인식을 사용할 수 없어 기본 텍스트를 반환합니다.",
@@ -233,10 +255,10 @@ class DebateRunner:
         else:
             return self.openface_integration._get_default_debate_analysis(phase)
 
-    def _analyze_user_audio(self, video_path: str) -> Dict[str, Any]:
-        """사용자 음성 분석"""
+    def _analyze_user_audio(self, audio) -> Dict[str, Any]:
+        """사용자 음성 분석 (디코딩된 PCM 버퍼)"""
         if self.librosa_module.is_available:
-            return self.librosa_module.analyze_video_audio(video_path)
+            return self.librosa_module.analyze_audio_data(audio, AUDIO_SAMPLE_RATE)
         else:
             return self.librosa_module._get_default_result()
 
@@ -342,11 +364,10 @@ class DebateRunner:
 
     def get_debate_status(self, debate_id: int) -> Dict[str, Any]:
         """토론 상태 조회"""
-        if debate_id not in self.debate_sessions:
+        session = self.debate_sessions.get(debate_id)
+        if session is None:
             return {"error": "존재하지 않는 토론 세션", "debate_id": debate_id}
         
-        session = self.debate_sessions[debate_id]
-        
         return {
             "debate_id": debate_id,
             "status": session["status"],
@@ -360,8 +381,8 @@ class DebateRunner:
     def cleanup_session(self, debate_id: int) -> bool:
         """세션 정리"""
         try:
-            if debate_id in self.debate_sessions:
-                session = self.debate_sessions[debate_id]
+            session = self.debate_sessions.get(debate_id)
+            if session is not None:
                 
                 # 생성된 오디오 파일들 정리
                 for phase_data in session.get("phase_history", []):
@@ -370,7 +391,8 @@ class DebateRunner:
                         os.remove(ai_audio)
                 
                 # 세션 데이터 삭제
-                del self.debate_sessions[debate_id]
+                self.debate_sessions.delete(debate_id)
+                self.llm_module.clear_session_context(debate_id)
                 
                 logger.info(f"토론 세션 정리 완료 - ID: {debate_id}")
                 return True
@@ -382,10 +404,11 @@ class DebateRunner:
 
     def get_system_status(self) -> Dict[str, Any]:
         """시스템 전체 상태 반환"""
+        session_stats = self.debate_sessions.stats()
         return {
             "debate_runner": "active",
-            "active_sessions": len([s for s in self.debate_sessions.values() if s["status"] == "active"]),
-            "total_sessions": len(self.debate_sessions),
+            "total_sessions": session_stats["stored"],
+            "session_store": session_stats,
             "modules": {
                 "openface": self.openface_integration.is_available,
                 "librosa": self.librosa_module.is_available,  
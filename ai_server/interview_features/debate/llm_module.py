@@ -5,9 +5,13 @@ OpenFace 및 Librosa 분석 결과를 활용하여 LLM과 상호작용
 import logging
 import json
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Generator
 import asyncio
 
+from modules.common.llm_stream import stream_openai, stream_anthropic, stream_ollama
+from modules.common.session_store import SessionStore
+from modules.common.tracing import traced
+
 # LLM 클라이언트 임포트 (예시 - 실제 사용할 LLM에 따라 변경)
 try:
     import openai
@@ -34,14 +38,11 @@ class DebateLLMModule:
         
         self._initialize_llm_client()
         
-        # 토론 컨텍스트 관리
-        self.debate_context = {
-            "topic": "",
-            "position": "",
-            "phase_history": [],
-            "participant_profile": {},
-            "performance_tracking": {}
-        }
+        # 토론 컨텍스트 관리 (session_id 없이 호출할 때 사용하는 기본 컨텍스트)
+        self.debate_context = self._new_debate_context("", "")
+        
+        # 세션별 토론 컨텍스트 (동시에 진행되는 토론끼리 주제/입장/이력이 섞이지 않도록 분리)
+        self.session_contexts = SessionStore("debate_llm_context")
         
         logger.info(f"토론 LLM 모듈 초기화 - 제공자: {self.llm_provider}, 사용 가능: {self.is_available}")
 
@@ -60,6 +61,11 @@ class DebateLLMModule:
                     self.client = anthropic.Anthropic(api_key=self.api_key)
                     self.is_available = True
                     logger.info("Anthropic 클라이언트 초기화 완료")
+
+            elif self.llm_provider == "ollama":
+                # Ollama는 로컬 HTTP API 사용 (별도 클라이언트 불필요)
+                self.is_available = True
+                logger.info("Ollama 클라이언트 초기화 완료")
                 
             else:
                 logger.warning(f"지원되지 않는 LLM 제공자 또는 라이브러리 없음: {self.llm_provider}")
@@ -69,9 +75,10 @@ class DebateLLMModule:
             logger.error(f"LLM 클라이언트 초기화 실패: {str(e)}")
             self.is_available = False
 
-    def initialize_debate_context(self, topic: str, position: str = "PRO", participant_info: Dict = None):
-        """토론 컨텍스트 초기화"""
-        self.debate_context = {
+    @staticmethod
+    def _new_debate_context(topic: str, position: str, participant_info: Dict = None) -> Dict[str, Any]:
+        """빈 토론 컨텍스트 생성"""
+        return {
             "topic": topic,
             "position": position,
             "phase_history": [],
@@ -82,9 +89,50 @@ class DebateLLMModule:
                 "improvement_areas": []
             }
         }
-        logger.info(f"토론 컨텍스트 초기화 - 주제: {topic}, 입장: {position}")
 
-    def generate_ai_opening(self, topic: str, position: str = "CON", context: Dict = None) -> Dict[str, Any]:
+    def initialize_debate_context(self, topic: str, position: str = "PRO", participant_info: Dict = None,
+                                  session_id: Any = None):
+        """토론 컨텍스트 초기화 (session_id가 있으면 해당 세션 컨텍스트만 초기화)"""
+        context = self._new_debate_context(topic, position, participant_info)
+        self._save_context(session_id, context)
+        logger.info(f"토론 컨텍스트 초기화 - 세션: {session_id}, 주제: {topic}, 입장: {position}")
+
+    def _load_context(self, session_id: Any = None, topic: str = "", position: str = "") -> Dict[str, Any]:
+        """세션 컨텍스트 조회 (없으면 새로 생성, session_id가 없으면 기본 컨텍스트)"""
+        if session_id is None:
+            return self.debate_context
+        return self.session_contexts.get(session_id) or self._new_debate_context(topic, position)
+
+    def _save_context(self, session_id: Any, context: Dict[str, Any]):
+        """세션 컨텍스트 저장"""
+        if session_id is None:
+            self.debate_context = context
+        else:
+            self.session_contexts.put(session_id, context)
+
+    def _update_context(self, session_id: Any, mutate, topic: str = "", position: str = ""):
+        """세션 컨텍스트 조회 → 수정 → 저장 (동시 갱신 시 최신 컨텍스트에 다시 적용)"""
+        if session_id is None:
+            mutate(self.debate_context)
+        else:
+            self.session_contexts.update(session_id, mutate,
+                                         default=lambda: self._new_debate_context(topic, position))
+
+    def clear_session_context(self, session_id: Any) -> bool:
+        """세션 컨텍스트 삭제"""
+        return self.session_contexts.delete(session_id)
+
+    @staticmethod
+    def _compact_phase_record(result: Dict[str, Any]) -> Dict[str, Any]:
+        """컨텍스트 이력에는 단계/응답만 보관 (분석 원본은 호출자에게만 반환)"""
+        return {
+            "phase": result.get("phase"),
+            "ai_response": result.get("ai_response", ""),
+            "timestamp": result.get("timestamp")
+        }
+
+    def generate_ai_opening(self, topic: str, position: str = "CON", context: Dict = None,
+                            session_id: Any = None) -> Dict[str, Any]:
         """AI 입론 생성"""
         if not self.is_available:
             return self._get_fallback_response("opening", topic)
@@ -103,7 +151,13 @@ class DebateLLMModule:
             }
             
             # 컨텍스트 업데이트
-            self.debate_context["phase_history"].append(result)
+            def record_opening(debate_context):
+                if debate_context["topic"] != topic:
+                    # 같은 세션에서 새 주제로 토론을 시작한 경우
+                    debate_context.clear()
+                    debate_context.update(self._new_debate_context(topic, position))
+                debate_context["phase_history"].append(self._compact_phase_record(result))
+            self._update_context(session_id, record_opening, topic, position)
             
             logger.info(f"AI 입론 생성 완료 - 길이: {len(response)}")
             return result
@@ -115,7 +169,8 @@ class DebateLLMModule:
     def analyze_user_response_and_generate_rebuttal(self, user_transcription: str, 
                                                    facial_analysis: Dict, 
                                                    audio_analysis: Dict,
-                                                   debate_phase: str = "rebuttal") -> Dict[str, Any]:
+                                                   debate_phase: str = "rebuttal",
+                                                   session_id: Any = None) -> Dict[str, Any]:
         """사용자 응답 분석 및 반박 생성"""
         if not self.is_available:
             return self._get_fallback_response(debate_phase, "")
@@ -149,8 +204,10 @@ class DebateLLMModule:
             }
             
             # 컨텍스트 업데이트
-            self.debate_context["phase_history"].append(result)
-            self._update_performance_tracking(integrated_analysis)
+            def record_rebuttal(debate_context):
+                debate_context["phase_history"].append(self._compact_phase_record(result))
+                self._update_performance_tracking(debate_context, integrated_analysis)
+            self._update_context(session_id, record_rebuttal)
             
             logger.info(f"사용자 응답 분석 및 {debate_phase} 생성 완료")
             return result
@@ -159,14 +216,15 @@ class DebateLLMModule:
             logger.error(f"사용자 응답 분석 오류: {str(e)}")
             return self._get_fallback_response(debate_phase, user_transcription)
 
-    def generate_comprehensive_feedback(self, debate_summary: Dict) -> Dict[str, Any]:
+    def generate_comprehensive_feedback(self, debate_summary: Dict, session_id: Any = None) -> Dict[str, Any]:
         """종합적인 토론 피드백 생성"""
         if not self.is_available:
             return self._get_fallback_feedback()
         
         try:
             # 전체 토론 데이터 집계
-            comprehensive_data = self._aggregate_debate_data()
+            debate_context = self._load_context(session_id)
+            comprehensive_data = self._aggregate_debate_data(debate_context)
             
             # 피드백 생성 프롬프트
             prompt = self._create_feedback_prompt(comprehensive_data, debate_summary)
@@ -181,7 +239,7 @@ class DebateLLMModule:
                 "strengths": self._extract_strengths(feedback_response),
                 "improvement_areas": self._extract_improvements(feedback_response),
                 "specific_recommendations": self._extract_recommendations(feedback_response),
-                "phase_by_phase_analysis": self._analyze_phase_progression(),
+                "phase_by_phase_analysis": self._analyze_phase_progression(debate_context),
                 "nonverbal_communication_insights": self._summarize_nonverbal_insights(),
                 "debate_strategy_evaluation": self._evaluate_debate_strategy(),
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
@@ -288,9 +346,41 @@ class DebateLLMModule:
 피드백은 격려적이면서도 정확한 평가가 되도록 해주세요.
 """
 
+    def stream_response(self, prompt: str, max_tokens: int = 500) -> Generator[str, None, None]:
+        """
+        LLM 응답 스트리밍 - 제공자 스트리밍 API에서 받은 텍스트 조각을 즉시 반환
+
+        Args:
+            prompt: 프롬프트
+            max_tokens: 최대 토큰 수
+
+        Yields:
+            str: 생성된 텍스트 조각
+        """
+        if self.llm_provider == "openai":
+            yield from stream_openai(self.client, self.model, [
+                {"role": "system", "content": "당신은 전문적인 토론 코치이자 면접관입니다."},
+                {"role": "user", "content": prompt}
+            ], max_tokens=max_tokens)
+
+        elif self.llm_provider == "anthropic":
+            yield from stream_anthropic(self.client, self.model, [
+                {"role": "user", "content": prompt}
+            ], max_tokens=max_tokens)
+
+        elif self.llm_provider == "ollama":
+            yield from stream_ollama(prompt, self.model, max_tokens=max_tokens)
+
+        else:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {self.llm_provider}")
+
+    @traced("llm")
     def _call_llm(self, prompt: str, max_tokens: int = 500) -> str:
         """LLM 호출"""
         try:
+            if self.llm_provider == "ollama":
+                return "".join(self.stream_response(prompt, max_tokens)).strip()
+
             if self.llm_provider == "openai":
                 response = self.client.chat.completions.create(
                     model=self.model,
@@ -397,29 +487,30 @@ class DebateLLMModule:
             "overall_coherence": "우수" if analysis["overall_coherence"] > 0.7 else "보통"
         }
 
-    def _update_performance_tracking(self, analysis: Dict):
+    def _update_performance_tracking(self, debate_context: Dict, analysis: Dict):
         """성과 추적 업데이트"""
-        phase_count = len(self.debate_context["phase_history"])
+        phase_count = len(debate_context["phase_history"])
         
-        self.debate_context["performance_tracking"]["phase_performances"][phase_count] = {
+        # JSON 저장 시 키가 문자열이 되므로 처음부터 문자열 키 사용
+        debate_context["performance_tracking"]["phase_performances"][str(phase_count)] = {
             "confidence": analysis["delivery_analysis"]["confidence_level"],
             "engagement": analysis["delivery_analysis"]["engagement_score"],
             "coherence": analysis["overall_coherence"]
         }
 
-    def _aggregate_debate_data(self) -> Dict:
+    def _aggregate_debate_data(self, debate_context: Dict) -> Dict:
         """토론 데이터 집계"""
         return {
-            "total_phases": len(self.debate_context["phase_history"]),
-            "topic": self.debate_context["topic"],
-            "position": self.debate_context["position"],
-            "performance_trend": self.debate_context["performance_tracking"]["phase_performances"],
-            "average_metrics": self._calculate_average_metrics()
+            "total_phases": len(debate_context["phase_history"]),
+            "topic": debate_context["topic"],
+            "position": debate_context["position"],
+            "performance_trend": debate_context["performance_tracking"]["phase_performances"],
+            "average_metrics": self._calculate_average_metrics(debate_context)
         }
 
-    def _calculate_average_metrics(self) -> Dict:
+    def _calculate_average_metrics(self, debate_context: Dict) -> Dict:
         """평균 메트릭 계산"""
-        performances = self.debate_context["performance_tracking"]["phase_performances"]
+        performances = debate_context["performance_tracking"]["phase_performances"]
         if not performances:
             return {"confidence": 0.5, "engagement": 2.5, "coherence": 0.5}
         
@@ -494,9 +585,9 @@ class DebateLLMModule:
         
         return recommendations[:5]
 
-    def _analyze_phase_progression(self) -> Dict:
+    def _analyze_phase_progression(self, debate_context: Dict) -> Dict:
         """단계별 진행 분석"""
-        phases = self.debate_context["phase_history"]
+        phases = debate_context["phase_history"]
         if len(phases) < 2:
             return {"trend": "insufficient_data"}
         
@@ -571,5 +662,6 @@ class DebateLLMModule:
             "current_context": {
                 "topic": self.debate_context["topic"],
                 "phases_completed": len(self.debate_context["phase_history"])
-            }
+            },
+            "session_contexts": self.session_contexts.stats()
         }
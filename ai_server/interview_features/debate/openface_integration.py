@@ -6,24 +6,29 @@ import os
 import logging
 import subprocess
 import tempfile
-import csv
+import shutil
 import numpy as np
 import time
+import uuid
 from typing import Dict, Any, List, Optional
 import json
 
+from modules.common.frame_sampling import OPENFACE_FEATURE_FLAGS, resolve_openface_input
+from modules.common.tracing import traced
+from modules.common.openface_csv import load_openface_csv, frame_count, column, au_intensity_columns
+
 logger = logging.getLogger(__name__)
 
 class OpenFaceDebateIntegration:
     def __init__(self, openface_path: Optional[str] = None, output_dir: Optional[str] = None):
         """OpenFace 토론면접 통합 모듈 초기화"""
         
-        # OpenFace 실행 파일 경로 설정
+        # OpenFace 실행 파일 경로 설정 (환경 변수 OPENFACE_PATH 우선)
         if openface_path is None:
-            openface_path = os.path.join(
+            openface_path = os.getenv("OPENFACE_PATH", os.path.join(
                 os.path.dirname(os.path.abspath(__file__)), 
                 "..", "..", "tools", "FeatureExtraction.exe"
-            )
+            ))
         
         # 출력 디렉터리 설정
         if output_dir is None:
@@ -41,6 +46,7 @@ class OpenFaceDebateIntegration:
         if not self.is_available:
             logger.warning(f"OpenFace 실행 파일을 찾을 수 없습니다: {self.openface_path}")
 
+    @traced("facial")
     def analyze_video(self, video_path: str, participant_id: Optional[str] = None) -> Dict[str, Any]:
         """비디오 파일의 얼굴 분석 및 토론 참여자 평가"""
         
@@ -55,34 +61,35 @@ class OpenFaceDebateIntegration:
         try:
             logger.info(f"OpenFace 비디오 분석 시작: {video_path}")
             
-            # 분석 결과 파일 경로 생성
+            # 분석 결과 파일 경로 생성 (동시 요청끼리 출력 파일이 겹치지 않도록 고유 접미사 추가)
             timestamp = int(time.time())
-            participant_id = participant_id or f"participant_{timestamp}"
+            participant_id = participant_id or f"participant_{timestamp}_{uuid.uuid4().hex[:8]}"
             output_csv = os.path.join(self.output_dir, f"{participant_id}_features.csv")
             
-            # OpenFace 실행 명령어 구성
+            # 설정된 샘플링 모드로 프레임을 미리 솎아서 전달
+            frames_dir = os.path.join(self.output_dir, f"{participant_id}_frames")
+            input_flag, input_path = resolve_openface_input(video_path, frames_dir)
+            
+            # OpenFace 실행 명령어 구성 (통계에서 사용하는 AU/시선/자세만 계산)
             command = [
                 self.openface_path,
-                "-f", video_path,
+                input_flag, input_path,
                 "-out_dir", self.output_dir,
                 "-of", f"{participant_id}_features.csv",
-                "-2Dfp",  # 2D 얼굴 랜드마크
-                "-3Dfp",  # 3D 얼굴 랜드마크  
-                "-pdmparams",  # PDM 파라미터
-                "-pose",  # 머리 자세
-                "-aus",   # Action Units
-                "-gaze"   # 시선 방향
-            ]
+            ] + OPENFACE_FEATURE_FLAGS
             
             # OpenFace 실행
             logger.info("OpenFace 실행 중...")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=300  # 5분 타임아웃
-            )
+            try:
+                result = subprocess.run(
+                    command,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=300  # 5분 타임아웃
+                )
+            finally:
+                shutil.rmtree(frames_dir, ignore_errors=True)
             
             logger.info("OpenFace 분석 완료")
             
@@ -114,57 +121,34 @@ class OpenFaceDebateIntegration:
         """OpenFace CSV 출력 파일 파싱"""
         
         try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                rows = list(reader)
+            columns = load_openface_csv(csv_path)
+            total_frames = frame_count(columns)
             
-            if not rows:
+            if not total_frames:
                 logger.warning("OpenFace CSV 파일이 비어있습니다")
                 return self._get_fallback_analysis()
             
-            logger.info(f"OpenFace 데이터 로드 완료: {len(rows)}개 프레임")
+            logger.info(f"OpenFace 데이터 로드 완료: {total_frames}개 프레임")
             
-            # 주요 특징 추출
+            # 주요 특징 추출 (응답용 원본 시계열)
             features = {
                 "participant_id": participant_id,
-                "total_frames": len(rows),
-                "confidence_scores": [],
-                "gaze_directions": {"x": [], "y": []},
-                "head_poses": {"pitch": [], "yaw": [], "roll": []},
-                "action_units": {},
-                "facial_landmarks": {"2d": [], "3d": []}
+                "total_frames": total_frames,
+                "confidence_scores": column(columns, "confidence").tolist(),
+                "gaze_directions": {
+                    "x": column(columns, "gaze_0_x").tolist(),
+                    "y": column(columns, "gaze_0_y").tolist()
+                },
+                "head_poses": {
+                    "pitch": column(columns, "pose_Rx").tolist(),
+                    "yaw": column(columns, "pose_Ry").tolist(),
+                    "roll": column(columns, "pose_Rz").tolist()
+                },
+                "action_units": {name: columns[name].tolist() for name in au_intensity_columns(columns)}
             }
             
-            # 각 프레임 데이터 처리
-            for row in rows:
-                # 신뢰도 점수
-                confidence = float(row.get('confidence', 0.0))
-                features["confidence_scores"].append(confidence)
-                
-                # 시선 방향
-                gaze_x = float(row.get('gaze_0_x', 0.0))
-                gaze_y = float(row.get('gaze_0_y', 0.0))
-                features["gaze_directions"]["x"].append(gaze_x)
-                features["gaze_directions"]["y"].append(gaze_y)
-                
-                # 머리 자세
-                pose_rx = float(row.get('pose_Rx', 0.0))
-                pose_ry = float(row.get('pose_Ry', 0.0))
-                pose_rz = float(row.get('pose_Rz', 0.0))
-                features["head_poses"]["pitch"].append(pose_rx)
-                features["head_poses"]["yaw"].append(pose_ry)
-                features["head_poses"]["roll"].append(pose_rz)
-                
-                # Action Units (표정 관련)
-                for i in range(1, 29):  # AU01 ~ AU28
-                    au_key = f'AU{i:02d}_r'
-                    if au_key in row:
-                        if au_key not in features["action_units"]:
-                            features["action_units"][au_key] = []
-                        features["action_units"][au_key].append(float(row.get(au_key, 0.0)))
-            
-            # 통계 계산
-            statistics = self._calculate_feature_statistics(features)
+            # 통계 계산 (열 배열에 대한 벡터 연산)
+            statistics = self._calculate_feature_statistics(columns)
             
             # 최종 결과 구성
             result = {
@@ -173,7 +157,7 @@ class OpenFaceDebateIntegration:
                 "analysis_metadata": {
                     "participant_id": participant_id,
                     "csv_path": csv_path,
-                    "total_frames": len(rows),
+                    "total_frames": total_frames,
                     "analysis_timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
                 }
             }
@@ -184,55 +168,54 @@ class OpenFaceDebateIntegration:
             logger.error(f"OpenFace CSV 파싱 오류: {str(e)}")
             return self._get_fallback_analysis()
 
-    def _calculate_feature_statistics(self, features: Dict) -> Dict[str, Any]:
+    def _calculate_feature_statistics(self, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """OpenFace 특징들의 통계 계산"""
         
         stats = {}
         
         try:
+            if not frame_count(columns):
+                return stats
+            
             # 신뢰도 통계
-            confidence_scores = features["confidence_scores"]
-            if confidence_scores:
-                stats["confidence"] = {
-                    "mean": np.mean(confidence_scores),
-                    "std": np.std(confidence_scores),
-                    "min": np.min(confidence_scores),
-                    "max": np.max(confidence_scores),
-                    "frames_high_confidence": sum(1 for c in confidence_scores if c > 0.8)
-                }
+            confidence_scores = column(columns, "confidence")
+            stats["confidence"] = {
+                "mean": float(confidence_scores.mean()),
+                "std": float(confidence_scores.std()),
+                "min": float(confidence_scores.min()),
+                "max": float(confidence_scores.max()),
+                "frames_high_confidence": int(np.count_nonzero(confidence_scores > 0.8)),
+                "frames_total": int(confidence_scores.size)
+            }
             
             # 시선 안정성 통계
-            gaze_x = features["gaze_directions"]["x"]
-            gaze_y = features["gaze_directions"]["y"]
-            if gaze_x and gaze_y:
-                stats["gaze_stability"] = {
-                    "x_variance": np.var(gaze_x),
-                    "y_variance": np.var(gaze_y),
-                    "total_variance": np.var(gaze_x) + np.var(gaze_y),
-                    "mean_deviation": np.mean([abs(x) + abs(y) for x, y in zip(gaze_x, gaze_y)])
-                }
+            gaze_x = column(columns, "gaze_0_x")
+            gaze_y = column(columns, "gaze_0_y")
+            stats["gaze_stability"] = {
+                "x_variance": float(gaze_x.var()),
+                "y_variance": float(gaze_y.var()),
+                "total_variance": float(gaze_x.var() + gaze_y.var()),
+                "mean_deviation": float((np.abs(gaze_x) + np.abs(gaze_y)).mean())
+            }
             
             # 머리 자세 안정성
-            head_poses = features["head_poses"]
-            if head_poses["pitch"]:
-                stats["head_stability"] = {
-                    "pitch_variance": np.var(head_poses["pitch"]),
-                    "yaw_variance": np.var(head_poses["yaw"]),
-                    "roll_variance": np.var(head_poses["roll"]),
-                    "total_movement": (np.var(head_poses["pitch"]) + 
-                                     np.var(head_poses["yaw"]) + 
-                                     np.var(head_poses["roll"]))
-                }
+            pose_variances = [float(column(columns, name).var()) for name in ("pose_Rx", "pose_Ry", "pose_Rz")]
+            stats["head_stability"] = {
+                "pitch_variance": pose_variances[0],
+                "yaw_variance": pose_variances[1],
+                "roll_variance": pose_variances[2],
+                "total_movement": sum(pose_variances)
+            }
             
             # Action Units 통계 (표정 분석)
             au_stats = {}
-            for au_name, au_values in features["action_units"].items():
-                if au_values:
-                    au_stats[au_name] = {
-                        "mean": np.mean(au_values),
-                        "max": np.max(au_values),
-                        "activation_rate": sum(1 for v in au_values if v > 1.0) / len(au_values)
-                    }
+            for au_name in au_intensity_columns(columns):
+                au_values = columns[au_name]
+                au_stats[au_name] = {
+                    "mean": float(au_values.mean()),
+                    "max": float(au_values.max()),
+                    "activation_rate": float(np.count_nonzero(au_values > 1.0) / au_values.size)
+                }
             stats["action_units"] = au_stats
             
         except Exception as e:
@@ -15,6 +15,27 @@ import logging
 import time
 import json
 from typing import Dict, Any, Optional
+import numpy as np
+
+from modules.analysis import get_orchestrator, save_upload_with_hash
+from modules.common.audio_utils import (
+    AUDIO_SAMPLE_RATE, decode_audio_from_video, load_audio, speech_metrics_from_timeline
+)
+from modules.common.vad import VAD_TRIM_ENABLED
+from modules.common.frame_sampling import (
+    DEFAULT_SAMPLING_MODE, DEFAULT_SAMPLE_FPS, DEFAULT_MOTION_THRESHOLD, OPENFACE_FEATURE_FLAGS
+)
+from modules.common.llm_stream import pop_sentences
+from modules.common.media_cache import get_media_cache_metrics
+from modules.asr_backend import create_asr_backend, is_asr_backend_available, resolve_asr_backend_name
+from modules.common.model_registry import TTS_MODEL, acquire_model, get_model_registry
+from modules.common.lazy_import import is_module_available, lazy_import
+from modules.common.warmup import (
+    AI_SERVER_STARTUP_MODE, get_warmup_manager, requires_warm, setup_readiness_routes
+)
+from modules.common.tracing import setup_metrics_routes, traced
+from modules.text_to_speech.pipeline import TTS_MODEL_LOCK, TTSPipeline, synthesize_wav_bytes
+from modules.workers import start_worker_pool, setup_job_routes
 
 # 실제 AI 모듈 임포트
 try:
@@ -34,21 +55,15 @@ try:
     from modules.aistudios.video_manager import VideoManager
     from modules.aistudios.routes import setup_aistudios_routes
     from modules.aistudios.interview_routes import setup_interview_routes
+    from modules.render_jobs import setup_render_job_routes
     AISTUDIOS_AVAILABLE = True
     print("✅ AIStudios 모듈 로드 성공: 영상 생성 기능 사용 가능")
 except ImportError as e:
     print(f"❌ AIStudios 모듈 로드 실패: {e}")
     AISTUDIOS_AVAILABLE = False
 
-# 백업 모듈 임포트 (실제 모듈이 없을 경우)
-try:
-    from test_features.debate.main import DebateTestMain
-    from test_features.personal_interview.main import PersonalInterviewTestMain
-    BACKUP_MODULES_AVAILABLE = True
-    print("✅ 백업 모듈 로드 성공: 테스트 기능 사용 가능")
-except ImportError as e:
-    print(f"⚠️ 백업 모듈 로드 실패: {e}")
-    BACKUP_MODULES_AVAILABLE = False
+# 백업 모듈 (실제 모듈이 없을 경우) - Whisper/TTS/Librosa를 임포트하므로 백그라운드 준비 단계에서 로드
+BACKUP_MODULES_AVAILABLE = is_module_available("test_features.debate.main")
 
 # 공통 모듈 임포트
 try:
@@ -61,43 +76,31 @@ except ImportError as e:
     JOB_RECOMMENDATION_AVAILABLE = False
     job_recommendation_module = None
 
-# TF-IDF 공고추천 모듈 임포트
-try:
-    from modules.tfidf_job_recommendation_module import TFIDFJobRecommendationModule
-    tfidf_recommendation_module = TFIDFJobRecommendationModule()
-    TFIDF_RECOMMENDATION_AVAILABLE = True
-    print("✅ TF-IDF 공고추천 모듈 로드 성공")
-except ImportError as e:
-    print(f"⚠️ TF-IDF 공고추천 모듈 로드 실패: {e}")
-    TFIDF_RECOMMENDATION_AVAILABLE = False
-    tfidf_recommendation_module = None
-
-# 개별 모듈 임포트
-try:
-    import whisper
-    import librosa
-    import soundfile as sf
-    WHISPER_AVAILABLE = True
-    LIBROSA_AVAILABLE = True
-    print("✅ Whisper 및 Librosa 모듈 로드 성공")
-except ImportError as e:
-    print(f"⚠️ 음성 분석 모듈 일부 제한: {e}")
-    WHISPER_AVAILABLE = False
-    LIBROSA_AVAILABLE = False
+# TF-IDF 공고추천 모듈 (scikit-learn 임포트와 백엔드 공고 동기화는 백그라운드 준비 단계에서 수행)
+TFIDF_RECOMMENDATION_AVAILABLE = is_module_available("sklearn") and is_module_available("scipy")
+tfidf_recommendation_module = None
 
-# TTS 모듈 임포트
-try:
-    from TTS.api import TTS
-    TTS_AVAILABLE = True
-    print("✅ TTS 모듈 로드 성공")
-except ImportError as e:
-    print(f"⚠️ TTS 모듈 로드 실패: {e}")
-    TTS_AVAILABLE = False
+# 개별 모듈 (설치 여부만 확인하고 실제 임포트는 첫 사용 또는 백그라운드 준비 시점에 수행)
+WHISPER_AVAILABLE = is_asr_backend_available()  # 음성 인식 엔진: 환경 변수 ASR_BACKEND
+LIBROSA_AVAILABLE = is_module_available("librosa") and is_module_available("soundfile")
+TTS_AVAILABLE = is_module_available("TTS")
+librosa = lazy_import("librosa")
+print(f"{'✅' if WHISPER_AVAILABLE else '⚠️'} Whisper 설치 여부: {WHISPER_AVAILABLE}, "
+      f"Librosa: {LIBROSA_AVAILABLE}, TTS: {TTS_AVAILABLE}")
 
 # Flask 앱 초기화
 app = Flask(__name__)
 CORS(app)
 
+# 작업 큐 API 라우트 (작업자 풀은 서버 시작 시 initialize_worker_pool()로 시작)
+setup_job_routes(app)
+
+# 준비 상태 라우트 (/ai/live, /ai/ready)
+setup_readiness_routes(app)
+
+# 단계별 처리 시간 지표 라우트 (/ai/metrics)
+setup_metrics_routes(app)
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -110,6 +113,10 @@ personal_interview_test_system = None
 whisper_model = None
 tts_model = None
 
+# Whisper 모델 크기 (분석 결과 캐시 키에도 사용)
+WHISPER_MODEL_NAME = "base"
+TTS_MODEL_NAME = "tts_models/en/ljspeech/tacotron2-DDC"
+
 # AIStudios 전역 변수 (새로 추가)
 aistudios_client = None
 video_manager = None
@@ -132,6 +139,9 @@ def setup_aistudios_integration():
                 video_manager
             )
             
+            # 비동기 렌더링 작업 라우트 설정 (작업 ID 즉시 반환 + 상태 조회)
+            setup_render_job_routes(app, studio_client=aistudios_client)
+            
             logger.info("✅ AIStudios 라우트 통합 완료")
         except Exception as e:
             logger.error(f"❌ AIStudios 라우트 설정 실패: {str(e)}")
@@ -154,23 +164,14 @@ def initialize_ai_systems():
             openface_integration = OpenFaceDebateIntegration()
             logger.info("OpenFace 통합 모듈 초기화 완료")
         
-        # 백업 모듈 초기화 (실제 모듈이 없을 경우)
-        if BACKUP_MODULES_AVAILABLE:
-            if not LLM_MODULE_AVAILABLE:
-                debate_test_system = DebateTestMain()
-                logger.info("토론면접 백업 시스템 초기화 완료")
-            
-            personal_interview_test_system = PersonalInterviewTestMain()
-            logger.info("개인면접 시스템 초기화 완료")
-        
-        # Whisper 모델 초기화
+        # Whisper 모델 초기화 (공용 모델 레지스트리 핸들, 실제 로드는 첫 사용 시, 엔진: 환경 변수 ASR_BACKEND)
         if WHISPER_AVAILABLE:
-            whisper_model = whisper.load_model("base")
+            whisper_model = create_asr_backend(WHISPER_MODEL_NAME)
             logger.info("Whisper 모델 초기화 완료")
         
         # TTS 모델 초기화
         if TTS_AVAILABLE:
-            tts_model = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC")
+            tts_model = acquire_model(TTS_MODEL, TTS_MODEL_NAME)
             logger.info("TTS 모델 초기화 완료")
 
         # AIStudios 모듈 초기화 (새로 추가)
@@ -201,13 +202,86 @@ def initialize_ai_systems():
     except Exception as e:
         logger.error(f"AI 시스템 초기화 실패: {str(e)}")
 
-def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
-    """Librosa를 사용한 오디오 분석"""
+def initialize_worker_pool():
+    """Whisper/OpenFace 작업자 프로세스 풀 시작"""
+    try:
+        pool = start_worker_pool()
+        logger.info(f"작업자 풀 시작 완료 - 프로세스 수: {pool.num_workers}, 큐 크기: {pool.max_queue_size}")
+    except Exception as e:
+        logger.error(f"작업자 풀 시작 실패: {str(e)}")
+
+def initialize_backup_systems():
+    """백업 모듈 초기화 (실제 모듈이 없을 경우, 백그라운드 준비 단계에서 실행)"""
+    global debate_test_system, personal_interview_test_system
+    
+    if not BACKUP_MODULES_AVAILABLE:
+        return
+    
+    from test_features.debate.main import DebateTestMain
+    from test_features.personal_interview.main import PersonalInterviewTestMain
+    
+    if not LLM_MODULE_AVAILABLE:
+        debate_test_system = DebateTestMain()
+        logger.info("토론면접 백업 시스템 초기화 완료")
+    
+    personal_interview_test_system = PersonalInterviewTestMain()
+    logger.info("개인면접 시스템 초기화 완료")
+
+def initialize_tfidf_recommendation():
+    """TF-IDF 공고추천 모듈 초기화 (저장된 인덱스 로드 + 백엔드 변경분 동기화, 백그라운드 준비 단계에서 실행)"""
+    global tfidf_recommendation_module
+    
+    from modules.tfidf_job_recommendation_module import TFIDFJobRecommendationModule
+    tfidf_recommendation_module = TFIDFJobRecommendationModule()
+    # 시작 시 백엔드에 연결하지 못했어도 토큰화기(scikit-learn)는 미리 준비
+    tfidf_recommendation_module.posting_index.analyzer("")
+    logger.info("TF-IDF 공고추천 모듈 초기화 완료")
+
+def warm_up_whisper():
+    """Whisper 모델 로드 후 1초 무음으로 초기 추론 (첫 요청의 지연 제거)"""
+    if whisper_model is not None:
+        whisper_model.transcribe(np.zeros(AUDIO_SAMPLE_RATE, dtype=np.float32), language="ko")
+
+def warm_up_tts():
+    """TTS 모델 로드"""
+    if tts_model is not None:
+        tts_model.get()
+
+def warm_up_librosa():
+    """Librosa 임포트 및 특징 추출 함수 초기 실행 (numba 컴파일)"""
+    if LIBROSA_AVAILABLE:
+        process_audio_with_librosa(np.random.default_rng(0).standard_normal(AUDIO_SAMPLE_RATE).astype(np.float32))
+
+def start_model_warmup():
+    """
+    모델 준비 작업 등록 및 실행
+    AI_SERVER_STARTUP_MODE가 background면 백그라운드에서 실행하고 바로 반환 (서버가 먼저 포트를 염)
+    """
+    manager = get_warmup_manager()
+    if WHISPER_AVAILABLE:
+        manager.register("whisper", warm_up_whisper)
+    if TTS_AVAILABLE:
+        manager.register("tts", warm_up_tts)
+    if LIBROSA_AVAILABLE:
+        manager.register("librosa", warm_up_librosa)
+    if TFIDF_RECOMMENDATION_AVAILABLE:
+        manager.register("tfidf_recommendation", initialize_tfidf_recommendation, required=False)
+    if BACKUP_MODULES_AVAILABLE:
+        manager.register("backup_modules", initialize_backup_systems, required=False)
+    manager.start(background=AI_SERVER_STARTUP_MODE != "eager")
+
+@traced("audio_features")
+def process_audio_with_librosa(audio, sample_rate: int = AUDIO_SAMPLE_RATE) -> Dict[str, Any]:
+    """Librosa를 사용한 오디오 분석 (파일 경로 또는 디코딩된 PCM 버퍼)"""
     if not LIBROSA_AVAILABLE:
         return {"error": "Librosa 모듈을 사용할 수 없습니다."}
     
     try:
-        y, sr = librosa.load(audio_path)
+        y, sr = load_audio(audio, sample_rate)
+        # 무음 제거 버퍼(VoicedAudio)면 발화 구간 통계를 원본 기준 변환표에서 가져옴
+        timeline = getattr(audio, "timeline", None)
+        if timeline is not None:
+            y = y.view(np.ndarray)
         
         # 기본 음성 특성 추출
         mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
@@ -224,11 +298,15 @@ def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
             "duration": float(len(y) / sr),
             "sample_rate": int(sr),
             "voice_stability": min(1.0, max(0.0, 1.0 - abs(spectral_centroids.std() / spectral_centroids.mean()))),
-            "speaking_rate_wpm": estimate_speaking_rate(y, sr),
-            "volume_consistency": calculate_volume_consistency(y),
-            "fluency_score": calculate_fluency_score(y, sr)
+            "volume_consistency": calculate_volume_consistency(y)
         }
         
+        if timeline is None:
+            analysis_result["speaking_rate_wpm"] = estimate_speaking_rate(y, sr)
+            analysis_result["fluency_score"] = calculate_fluency_score(y, sr)
+        else:
+            analysis_result.update(speech_metrics_from_timeline(timeline))
+        
         return analysis_result
         
     except Exception as e:
@@ -293,13 +371,14 @@ def calculate_fluency_score(audio_data, sample_rate):
     except Exception:
         return 0.5  # 기본값
 
-def transcribe_with_whisper(audio_path: str) -> Dict[str, Any]:
-    """Whisper를 사용한 음성 인식"""
+def transcribe_with_whisper(audio) -> Dict[str, Any]:
+    """Whisper를 사용한 음성 인식 (파일 경로 또는 16kHz float32 PCM 버퍼)"""
     if not WHISPER_AVAILABLE or whisper_model is None:
         return {"error": "Whisper 모델을 사용할 수 없습니다."}
     
     try:
-        result = whisper_model.transcribe(audio_path, language="ko")
+        # 동시 요청은 배치 추론 서버에서 함께 디코딩
+        result = whisper_model.transcribe(audio, language="ko", batched=True)
         
         return {
             "text": result["text"],
@@ -335,6 +414,7 @@ def calculate_transcription_confidence(whisper_result):
     except Exception:
         return 0.75
 
+@traced("tts")
 def synthesize_with_tts(text: str, output_path: str) -> Optional[str]:
     """TTS를 사용한 음성 합성"""
     if not TTS_AVAILABLE or tts_model is None:
@@ -346,7 +426,9 @@ def synthesize_with_tts(text: str, output_path: str) -> Optional[str]:
         if len(text) > 500:
             text = text[:500] + "..."
         
-        tts_model.tts_to_file(text=text, file_path=output_path)
+        # 스트리밍 TTS 파이프라인과 모델을 공유하므로 호출 직렬화
+        with TTS_MODEL_LOCK:
+            tts_model.tts_to_file(text=text, file_path=output_path)
         
         if os.path.exists(output_path):
             return output_path
@@ -357,30 +439,41 @@ def synthesize_with_tts(text: str, output_path: str) -> Optional[str]:
         logger.error(f"TTS 음성 합성 오류: {str(e)}")
         return None
 
-def extract_audio_from_video(video_path: str) -> Optional[str]:
-    """비디오에서 오디오 추출"""
-    try:
-        import subprocess
-        
-        # 임시 오디오 파일 경로
-        audio_path = video_path.replace('.mp4', '_audio.wav').replace('.webm', '_audio.wav')
-        
-        # FFmpeg를 사용한 오디오 추출
-        command = [
-            'ffmpeg', '-i', video_path, '-acodec', 'pcm_s16le', 
-            '-ac', '1', '-ar', '16000', audio_path, '-y'
-        ]
-        
-        subprocess.run(command, check=True, capture_output=True)
-        
-        if os.path.exists(audio_path):
-            return audio_path
-        else:
-            return None
-            
-    except Exception as e:
-        logger.error(f"오디오 추출 오류: {str(e)}")
-        return None
+def analysis_cache_params() -> Dict[str, Dict[str, Any]]:
+    """분석 계층별 결과 캐시 키 파라미터 (값이 바뀌면 해당 계층만 다시 분석)"""
+    return {
+        "transcription": {"model": WHISPER_MODEL_NAME, "backend": resolve_asr_backend_name(), "language": "ko",
+                          "sample_rate": AUDIO_SAMPLE_RATE, "vad_trim": VAD_TRIM_ENABLED},
+        "audio": {"sample_rate": AUDIO_SAMPLE_RATE, "vad_trim": VAD_TRIM_ENABLED},
+        "facial": {
+            "sampling_mode": DEFAULT_SAMPLING_MODE,
+            "sample_fps": DEFAULT_SAMPLE_FPS,
+            "motion_threshold": DEFAULT_MOTION_THRESHOLD,
+            "features": OPENFACE_FEATURE_FLAGS
+        }
+    }
+
+def run_multimodal_analysis(video_path: str, fallback_text: str, media_hash: Optional[str] = None) -> Dict[str, Any]:
+    """Whisper, Librosa, OpenFace 분석을 병렬로 실행하고 결과 취합 (영상 해시가 있으면 캐시 사용)"""
+    analyze_face = None
+    if OPENFACE_INTEGRATION_AVAILABLE and openface_integration:
+        analyze_face = openface_integration.analyze_video
+    
+    # 엔드포인트(requires_warm)가 모델 준비를 잠시 기다린 뒤에도 준비되지 않은 분석은 대체 결과 사용
+    manager = get_warmup_manager()
+    whisper_ready = WHISPER_AVAILABLE and manager.is_ready("whisper")
+    librosa_ready = LIBROSA_AVAILABLE and manager.is_ready("librosa")
+    
+    return get_orchestrator().analyze(
+        video_path,
+        extract_audio=decode_audio_from_video,
+        transcribe=transcribe_with_whisper if whisper_ready else None,
+        analyze_audio=process_audio_with_librosa if librosa_ready else None,
+        analyze_face=analyze_face,
+        fallbacks={"transcription": {"text": fallback_text, "confidence": 0.85}},
+        media_hash=media_hash,
+        cache_params=analysis_cache_params()
+    )
 
 # ==================== API 엔드포인트 ====================
 
@@ -449,8 +542,16 @@ def test_connection():
                 "tfidf_recommend": "/ai/jobs/recommend-tfidf",
                 "rare_skills": "/ai/jobs/rare-skills",
                 "tfidf_posting": "/ai/recruitment/posting-tfidf"
+            },
+            "analysis_jobs": {
+                "submit": "/ai/jobs",
+                "status": "/ai/jobs/<job_id>",
+                "events": "/ai/jobs/<job_id>/events",
+                "workers": "/ai/jobs/workers/status"
             }
         },
+        "media_caches": get_media_cache_metrics(),
+        "models": get_model_registry().stats(),
         "mode": "실제 AI 모듈 + AIStudios 영상 생성 통합"
     }
     
@@ -460,6 +561,7 @@ def test_connection():
 # ==================== 공고추천 API 엔드포인트 ====================
 
 @app.route('/ai/recruitment/posting', methods=['POST'])
+@requires_warm("tfidf_recommendation", degrade=True)
 def recruitment_posting():
     """백엔드 연동용 공고추천 엔드포인트 (RecruitmentRequest 형식 지원)"""
     if not JOB_RECOMMENDATION_AVAILABLE and not TFIDF_RECOMMENDATION_AVAILABLE:
@@ -473,8 +575,8 @@ def recruitment_posting():
         user_id = data.get('user_id')
         category = data.get('category', 'ICT')
         
-        # TF-IDF 추천을 우선 시도
-        if TFIDF_RECOMMENDATION_AVAILABLE:
+        # TF-IDF 추천을 우선 시도 (준비 전이면 기본 추천 사용)
+        if TFIDF_RECOMMENDATION_AVAILABLE and tfidf_recommendation_module is not None:
             try:
                 # TF-IDF용 프로필 생성
                 tech_stacks = []
@@ -639,9 +741,10 @@ def get_job_statistics():
 # ==================== TF-IDF 공고추천 API 엔드포인트 ====================
 
 @app.route('/ai/jobs/recommend-tfidf', methods=['POST'])
+@requires_warm("tfidf_recommendation")
 def recommend_jobs_tfidf():
     """TF-IDF 기반 공고 추천 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -673,9 +776,10 @@ def recommend_jobs_tfidf():
         return jsonify({"error": error_msg}), 500
 
 @app.route('/ai/jobs/rare-skills', methods=['GET'])
+@requires_warm("tfidf_recommendation")
 def get_rare_skills():
     """희소 기술 정보 조회 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -688,9 +792,10 @@ def get_rare_skills():
         return jsonify({"error": error_msg}), 500
 
 @app.route('/ai/recruitment/posting-tfidf', methods=['POST'])
+@requires_warm("tfidf_recommendation")
 def recruitment_posting_tfidf():
     """백엔드 연동용 TF-IDF 공고추천 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -732,9 +837,10 @@ def recruitment_posting_tfidf():
         return jsonify({"error": error_msg}), 500
 
 @app.route('/ai/jobs/crawl-trigger', methods=['POST'])
+@requires_warm("tfidf_recommendation")
 def trigger_job_crawling():
     """채용공고 크롤링 트리거 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -802,13 +908,13 @@ def generate_followup_question(interview_id):
         file.save(temp_path)
         
         try:
-            # 오디오 추출
-            audio_path = extract_audio_from_video(temp_path)
+            # 오디오 디코딩 (임시 WAV 없이 PCM 버퍼로)
+            audio = decode_audio_from_video(temp_path)
             
             # Whisper 음성 인식
             transcription_result = {"text": "답변 내용이 인식되었습니다.", "confidence": 0.85}
-            if audio_path and WHISPER_AVAILABLE:
-                transcription_result = transcribe_with_whisper(audio_path)
+            if audio is not None and WHISPER_AVAILABLE:
+                transcription_result = transcribe_with_whisper(audio)
             
             # 후속 질문 생성 (실제 LLM 구현 시 대체)
             transcript = transcription_result.get("text", "")
@@ -825,7 +931,7 @@ def generate_followup_question(interview_id):
                 followup_question = "그 기술을 어떻게 습득하셨고, 실무에 어떻게 적용하셨나요?"
             
             # 임시 파일 정리
-            cleanup_temp_files([temp_path, audio_path])
+            cleanup_temp_files([temp_path])
             
             response = {
                 "interview_id": interview_id,
@@ -892,6 +998,7 @@ def get_interview_question(interview_id):
         return jsonify({"error": f"질문 생성 중 오류: {str(e)}"}), 500
 
 @app.route('/ai/interview/<int:interview_id>/<string:question_type>/answer-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_interview_answer_with_type(interview_id, question_type):
     """개인면접 답변 영상 처리 (question_type 포함)"""
     try:
@@ -902,29 +1009,14 @@ def process_interview_answer_with_type(interview_id, question_type):
         
         # 임시 파일 저장
         temp_path = f"temp_interview_{interview_id}_{question_type}_{int(time.time())}.mp4"
-        file.save(temp_path)
+        media_hash = save_upload_with_hash(file, temp_path)
         
         try:
-            # 오디오 추출
-            audio_path = extract_audio_from_video(temp_path)
-            
-            # Whisper 음성 인식
-            transcription_result = {"text": f"{question_type} 질문에 대한 답변 내용입니다.", "confidence": 0.85}
-            if audio_path and WHISPER_AVAILABLE:
-                transcription_result = transcribe_with_whisper(audio_path)
-            
-            # Librosa 오디오 분석
-            audio_analysis = {"voice_stability": 0.8, "fluency_score": 0.85}
-            if audio_path and LIBROSA_AVAILABLE:
-                audio_analysis = process_audio_with_librosa(audio_path)
-            
-            # OpenFace 얼굴 분석 (사용 가능한 경우)
-            facial_analysis = {"confidence": 0.8, "emotion": "중립"}
-            if OPENFACE_INTEGRATION_AVAILABLE and openface_integration:
-                try:
-                    facial_analysis = openface_integration.analyze_video(temp_path)
-                except Exception as e:
-                    logger.warning(f"OpenFace 분석 실패: {str(e)}")
+            # Whisper 음성 인식, Librosa 오디오 분석, OpenFace 얼굴 분석 병렬 실행
+            analysis = run_multimodal_analysis(temp_path, f"{question_type} 질문에 대한 답변 내용입니다.", media_hash)
+            transcription_result = analysis["transcription"]
+            audio_analysis = analysis["audio"]
+            facial_analysis = analysis["facial"]
             
             # 종합 분석 결과
             content_score = calculate_content_score(transcription_result.get("text", ""))
@@ -949,7 +1041,7 @@ def process_interview_answer_with_type(interview_id, question_type):
             }
             
             # 임시 파일 정리
-            cleanup_temp_files([temp_path, audio_path])
+            cleanup_temp_files([temp_path])
             
             return jsonify(result)
             
@@ -961,6 +1053,7 @@ def process_interview_answer_with_type(interview_id, question_type):
         return jsonify({"error": f"답변 처리 중 오류: {str(e)}"}), 500
 
 @app.route('/ai/interview/<int:interview_id>/answer-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_interview_answer(interview_id):
     """개인면접 답변 영상 처리 (이전 버전 호환용)"""
     try:
@@ -971,29 +1064,14 @@ def process_interview_answer(interview_id):
         
         # 임시 파일 저장
         temp_path = f"temp_interview_{interview_id}_{int(time.time())}.mp4"
-        file.save(temp_path)
+        media_hash = save_upload_with_hash(file, temp_path)
         
         try:
-            # 오디오 추출
-            audio_path = extract_audio_from_video(temp_path)
-            
-            # Whisper 음성 인식
-            transcription_result = {"text": "답변 내용이 인식되었습니다.", "confidence": 0.85}
-            if audio_path and WHISPER_AVAILABLE:
-                transcription_result = transcribe_with_whisper(audio_path)
-            
-            # Librosa 오디오 분석
-            audio_analysis = {"voice_stability": 0.8, "fluency_score": 0.85}
-            if audio_path and LIBROSA_AVAILABLE:
-                audio_analysis = process_audio_with_librosa(audio_path)
-            
-            # OpenFace 얼굴 분석 (사용 가능한 경우)
-            facial_analysis = {"confidence": 0.8, "emotion": "중립"}
-            if OPENFACE_INTEGRATION_AVAILABLE and openface_integration:
-                try:
-                    facial_analysis = openface_integration.analyze_video(temp_path)
-                except Exception as e:
-                    logger.warning(f"OpenFace 분석 실패: {str(e)}")
+            # Whisper 음성 인식, Librosa 오디오 분석, OpenFace 얼굴 분석 병렬 실행
+            analysis = run_multimodal_analysis(temp_path, "답변 내용이 인식되었습니다.", media_hash)
+            transcription_result = analysis["transcription"]
+            audio_analysis = analysis["audio"]
+            facial_analysis = analysis["facial"]
             
             # 종합 분석 결과
             result = {
@@ -1017,7 +1095,7 @@ def process_interview_answer(interview_id):
             }
             
             # 임시 파일 정리
-            cleanup_temp_files([temp_path, audio_path])
+            cleanup_temp_files([temp_path])
             
             return jsonify(result)
             
@@ -1114,36 +1192,47 @@ def stream_ai_response(debate_id):
                     sentence_buffer = ""
                     full_text = ""
                     
-                    # LLM이 토큰을 생성한다고 가정 (실제 구현에 맞게 수정 필요)
-                    for token in generate_llm_tokens(prompt):
-                        sentence_buffer += token
-                        full_text += token
-                        
-                        # 문장이 완성되면 TTS 처리
-                        if token in '.!?':
-                            # TTS 변환
-                            if TTS_AVAILABLE and tts_model:
-                                temp_audio = f"temp_stream_{debate_id}_{int(time.time())}.wav"
-                                try:
-                                    tts_model.tts_to_file(text=sentence_buffer, file_path=temp_audio)
-                                    
-                                    # 오디오 파일을 base64로 인코딩
-                                    with open(temp_audio, 'rb') as audio_file:
-                                        import base64
-                                        audio_base64 = base64.b64encode(audio_file.read()).decode('utf-8')
-                                    
-                                    # 오디오 청크 전송
-                                    yield f"data: {json.dumps({'type': 'audio', 'data': audio_base64})}\n\n"
-                                    
-                                    # 임시 파일 삭제
-                                    os.remove(temp_audio)
-                                except Exception as e:
-                                    logger.error(f"TTS 변환 오류: {str(e)}")
+                    # 문장 단위 TTS는 별도 작업자에서 합성 (토큰 스트리밍은 멈추지 않음)
+                    tts_pipeline = None
+                    # TTS 모델 준비 전에는 텍스트만 스트리밍
+                    if TTS_AVAILABLE and tts_model and get_warmup_manager().is_ready("tts"):
+                        tts_pipeline = TTSPipeline(lambda sentence: synthesize_wav_bytes(tts_model, sentence))
+                    
+                    def send_sentence(sentence):
+                        index = tts_pipeline.submit(sentence) if tts_pipeline else None
+                        # 텍스트도 전송 (자막용, 합성을 기다리지 않음)
+                        yield f"data: {json.dumps({'type': 'text', 'data': sentence, 'index': index})}\n\n"
+                    
+                    def send_ready_audio(audio_chunks):
+                        # 합성이 끝난 오디오 청크를 순서대로 전송
+                        for index, audio_base64 in audio_chunks:
+                            if audio_base64:
+                                yield f"data: {json.dumps({'type': 'audio', 'data': audio_base64, 'index': index})}\n\n"
+                    
+                    try:
+                        # LLM 스트리밍 API에서 받은 토큰 조각을 즉시 전달
+                        for token in generate_llm_tokens(prompt):
+                            sentence_buffer += token
+                            full_text += token
+                            yield f"data: {json.dumps({'type': 'token', 'data': token})}\n\n"
                             
-                            # 텍스트도 전송 (자막용)
-                            yield f"data: {json.dumps({'type': 'text', 'data': sentence_buffer})}\n\n"
+                            # 문장이 완성되면 TTS 작업자에 합성 요청
+                            sentences, sentence_buffer = pop_sentences(sentence_buffer)
+                            for sentence in sentences:
+                                yield from send_sentence(sentence)
                             
-                            sentence_buffer = ""
+                            if tts_pipeline:
+                                yield from send_ready_audio(tts_pipeline.ready())
+                        
+                        # 마지막 문장 처리
+                        if sentence_buffer.strip():
+                            yield from send_sentence(sentence_buffer)
+                        
+                        if tts_pipeline:
+                            yield from send_ready_audio(tts_pipeline.drain())
+                    finally:
+                        if tts_pipeline:
+                            tts_pipeline.close()
                     
                     # 최종 완료 신호
                     yield f"data: {json.dumps({'type': 'complete', 'full_text': full_text})}\n\n"
@@ -1188,13 +1277,17 @@ def stream_ai_response(debate_id):
         return jsonify({"error": f"스트리밍 응답 생성 중 오류: {str(e)}"}), 500
 
 def generate_llm_tokens(prompt: str):
-    """LLM 토큰 생성 (실제 구현 필요)"""
-    # 여기에 실제 LLM 토큰 스트리밍 로직 구현
-    # 예시로 단어 단위 생성
-    response = "인공지능의 발전은 우리 사회에 큰 영향을 미칠 것입니다. 신중한 접근이 필요합니다."
-    for word in response.split():
-        yield word + " "
-        time.sleep(0.1)
+    """LLM 토큰 생성 (제공자 스트리밍 API의 delta를 도착 즉시 반환)"""
+    received = False
+    try:
+        for delta in llm_module.stream_response(prompt):
+            received = True
+            yield delta
+    except Exception as e:
+        logger.error(f"LLM 토큰 스트리밍 오류: {str(e)}")
+        # 첫 토큰 전에 실패한 경우에만 폴백 응답 사용
+        if not received:
+            yield "인공지능의 발전은 우리 사회에 큰 영향을 미칠 것입니다. 신중한 접근이 필요합니다."
 
 # ==================== 토론면접 API 엔드포인트 ====================
 
@@ -1211,7 +1304,7 @@ def ai_opening(debate_id):
         # LLM을 사용한 입론 생성 (사용 가능한 경우)
         if LLM_MODULE_AVAILABLE and llm_module:
             try:
-                llm_result = llm_module.generate_ai_opening(topic, position, data)
+                llm_result = llm_module.generate_ai_opening(topic, position, data, session_id=debate_id)
                 ai_response = llm_result.get("ai_response", "")
                 
                 # TTS 변환 (선택적)
@@ -1248,21 +1341,25 @@ def ai_opening(debate_id):
         return jsonify({"error": f"AI 입론 생성 중 오류: {str(e)}"}), 500
 
 @app.route('/ai/debate/<int:debate_id>/opening-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_opening_video(debate_id):
     """사용자 입론 영상 처리"""
     return process_debate_video_generic(debate_id, "opening", "rebuttal")
 
 @app.route('/ai/debate/<int:debate_id>/rebuttal-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_rebuttal_video(debate_id):
     """사용자 반론 영상 처리"""
     return process_debate_video_generic(debate_id, "rebuttal", "counter_rebuttal")
 
 @app.route('/ai/debate/<int:debate_id>/counter-rebuttal-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_counter_rebuttal_video(debate_id):
     """사용자 재반론 영상 처리"""
     return process_debate_video_generic(debate_id, "counter_rebuttal", "closing")
 
 @app.route('/ai/debate/<int:debate_id>/closing-video', methods=['POST'])
+@requires_warm("whisper", "librosa", degrade=True)
 def process_closing_video(debate_id):
     """사용자 최종 변론 영상 처리"""
     return process_debate_video_generic(debate_id, "closing", None)
@@ -1278,29 +1375,14 @@ def process_debate_video_generic(debate_id, current_stage, next_ai_stage):
     
     try:
         temp_path = f"temp_{current_stage}_{debate_id}_{int(time.time())}.mp4"
-        file.save(temp_path)
-        
-        # 오디오 추출
-        audio_path = extract_audio_from_video(temp_path)
-        
-        # Whisper 음성 인식
-        transcription_result = {"text": f"사용자의 {current_stage} 발언입니다.", "confidence": 0.85}
-        if audio_path and WHISPER_AVAILABLE:
-            transcription_result = transcribe_with_whisper(audio_path)
-        
-        # Librosa 오디오 분석
-        audio_analysis = {"voice_stability": 0.8, "fluency_score": 0.85}
-        if audio_path and LIBROSA_AVAILABLE:
-            audio_analysis = process_audio_with_librosa(audio_path)
-        
-        # OpenFace 얼굴 분석
-        facial_analysis = {"confidence": 0.8, "emotion": "중립"}
-        if OPENFACE_INTEGRATION_AVAILABLE and openface_integration:
-            try:
-                facial_analysis = openface_integration.analyze_video(temp_path)
-            except Exception as e:
-                logger.warning(f"OpenFace 분석 실패: {str(e)}")
+        media_hash = save_upload_with_hash(file, temp_path)
         
+        # Whisper 음성 인식, Librosa 오디오 분석, OpenFace 얼굴 분석 병렬 실행
+        analysis = run_multimodal_analysis(temp_path, f"사용자의 {current_stage} 발언입니다.", media_hash)
+        transcription_result = analysis["transcription"]
+        audio_analysis = analysis["audio"]
+        facial_analysis = analysis["facial"]
+
         # 종합 점수 계산
         scores = calculate_debate_scores(transcription_result, audio_analysis, facial_analysis)
         
@@ -1320,7 +1402,7 @@ def process_debate_video_generic(debate_id, current_stage, next_ai_stage):
                 try:
                     # LLM을 사용한 응답 생성
                     llm_result = llm_module.analyze_user_response_and_generate_rebuttal(
-                        user_text, facial_analysis, audio_analysis, next_ai_stage
+                        user_text, facial_analysis, audio_analysis, next_ai_stage, session_id=debate_id
                     )
                     ai_response = llm_result.get("ai_response", "")
                     result[f"ai_{next_ai_stage}_text"] = ai_response
@@ -1335,7 +1417,7 @@ def process_debate_video_generic(debate_id, current_stage, next_ai_stage):
                 result[f"ai_{next_ai_stage}_text"] = get_fallback_ai_response(next_ai_stage, topic, user_text)
         
         # 임시 파일 정리
-        cleanup_temp_files([temp_path, audio_path])
+        cleanup_temp_files([temp_path])
         
         return jsonify(result)
         
@@ -1521,12 +1603,25 @@ def modules_status():
     })
 
 if __name__ == "__main__":
-    # 시작 시 AI 시스템 초기화
+    # debug 모드에서는 리로더가 감시 프로세스와 실제 서버 프로세스(WERKZEUG_RUN_MAIN=true)를 따로 실행
+    debug = True
+    serving_process = not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+
+    # 시작 시 AI 시스템 초기화 (모델은 핸들만 만들고 실제 로드는 준비 단계에서 수행)
     initialize_ai_systems()
 
     # AIStudios 라우트 통합 (새로 추가)
     setup_aistudios_integration()
     
+    # 모델 준비 (background 모드에서는 서버가 포트를 연 뒤에도 계속 진행, 상태: /ai/ready)
+    # debug 리로더의 감시 프로세스에서는 모델을 로드하지 않음
+    if serving_process:
+        start_model_warmup()
+    
+    # 작업자 프로세스 풀 시작 (debug 리로더의 감시 프로세스에서는 시작하지 않음)
+    if serving_process:
+        initialize_worker_pool()
+    
     print("🚀 VeriView AI 메인 서버 (AIStudios 통합) 시작...")
     print("📍 서버 주소: http://localhost:5000")
     print("🔍 테스트 엔드포인트: http://localhost:5000/ai/test")
@@ -1538,6 +1633,7 @@ if __name__ == "__main__":
     print("💼 공고추천 API: http://localhost:5000/ai/jobs/recommend")
     print("🔍 TF-IDF 공고추천 API: http://localhost:5000/ai/jobs/recommend-tfidf")
     print("💎 희소기술 정보 API: http://localhost:5000/ai/jobs/rare-skills")
+    print("🧵 분석 작업 큐 API: POST http://localhost:5000/ai/jobs, GET http://localhost:5000/ai/jobs/<job_id>")
     print("=" * 80)
     print("🔧 포함된 AI 모듈:")
     print(f"  - LLM: {'✅' if LLM_MODULE_AVAILABLE else '❌'}")
@@ -1572,4 +1668,4 @@ if __name__ == "__main__":
         
         print("=" * 80)
     
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    app.run(host="0.0.0.0", port=5000, debug=debug)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VeriView 영상 캐시 키 재색인 스크립트
+캐시 키 규칙이 바뀐 뒤 D-ID/AIStudios 캐시 디렉토리의 기존 영상을 새 키로 다시 등록
+
+사용 예:
+    python migrate_cache_keys.py --dry-run               # 변경 없이 결과만 확인
+    python migrate_cache_keys.py                         # 재색인 (새 키를 만들 수 없는 항목은 보고만 함)
+    python migrate_cache_keys.py --purge-unmapped        # 새 키를 만들 수 없는 영상까지 삭제
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+from modules.cache_key_migration import migrate_d_id_cache, migrate_aistudios_cache
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description="VeriView 영상 캐시 키 재색인")
+    parser.add_argument("--provider", nargs="+", choices=["d_id", "aistudios"], default=["d_id", "aistudios"],
+                        help="재색인할 제공자 캐시")
+    parser.add_argument("--videos-dir", default=os.environ.get('D_ID_CACHE_DIR', './videos'),
+                        help="D-ID 영상 디렉토리 (기본값: D_ID_CACHE_DIR 또는 ./videos)")
+    parser.add_argument("--aistudios-cache-dir", default=None,
+                        help="AIStudios 캐시 디렉토리 (기본값: 클라이언트 기본 캐시 디렉토리)")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 결과만 집계")
+    parser.add_argument("--purge-unmapped", action="store_true",
+                        help="원본 값이 없어 새 키를 만들 수 없는 영상 삭제")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("VeriView 영상 캐시 키 재색인" + (" (dry-run)" if args.dry_run else ""))
+    print("=" * 60)
+
+    results = {}
+    try:
+        if "d_id" in args.provider:
+            if os.path.isdir(args.videos_dir):
+                from modules.d_id.video_manager import VideoManager
+                results["d_id"] = migrate_d_id_cache(VideoManager(base_dir=args.videos_dir),
+                                                     dry_run=args.dry_run, purge_unmapped=args.purge_unmapped)
+            else:
+                print(f"⏭️  D-ID 영상 디렉토리 없음: {args.videos_dir}")
+
+        if "aistudios" in args.provider:
+            from modules.aistudios.client import AIStudiosClient
+            client = AIStudiosClient(cache_dir=args.aistudios_cache_dir)
+            results["aistudios"] = migrate_aistudios_cache(str(client.cache_dir), client._generate_cache_key,
+                                                           dry_run=args.dry_run,
+                                                           purge_unmapped=args.purge_unmapped)
+    except Exception as e:
+        print(f"❌ 재색인 실패: {e}")
+        return 1
+
+    for provider, summary in results.items():
+        print(f"\n[{provider}]")
+        print(json.dumps({k: v for k, v in summary.items() if k != "unmapped_items"}, ensure_ascii=False, indent=2))
+        for item in summary["unmapped_items"]:
+            print(f"⚠️  재계산 불가: {item['path']}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,15 @@
 import os
 import json
 import time
-import requests
 import logging
 import tempfile
 from pathlib import Path
 from .api_key_manager import api_key_manager
+from modules.common.media_cache import MediaCache
+from modules.common.http_utils import create_pooled_session, poll_delays
+from modules.common.single_flight import SingleFlight
+from modules.common.cache_keys import CACHE_KEY_VERSION, video_cache_key
+from modules.common.tracing import traced
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -52,6 +56,19 @@ class AIStudiosClient:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"AIStudios 캐시 디렉토리: {self.cache_dir}")
         
+        # 영상 캐시 (용량/기간 제한, 백그라운드 정리)
+        self.video_cache = MediaCache(
+            "aistudios",
+            directory=str(self.cache_dir),
+            max_bytes=2 * 1024 * 1024 * 1024,
+            max_age_seconds=7 * 86400,
+            pattern="*.mp4",
+            on_evict=lambda key, path: self._remove_metadata(path)
+        )
+        
+        # 같은 텍스트/아바타에 대한 동시 생성 요청은 한 번만 렌더링 (작업자 프로세스 간 포함)
+        self._render_flight = SingleFlight("aistudios")
+        
         # API 엔드포인트 및 기본 헤더 설정
         self.base_url = "https://app.aistudios.com/api"
         self.headers = {
@@ -59,6 +76,9 @@ class AIStudiosClient:
             "Content-Type": "application/json"
         }
         
+        # 연결 풀 세션 (인증 헤더는 set_api_key로 바뀔 수 있어 요청마다 전달)
+        self.session = create_pooled_session()
+        
         # 아바타 ID 설정 (기본값)
         self.default_avatar_id = "default_avatar_id"  # 실제 AIStudios에서 사용할 아바타 ID로 변경 필요
         
@@ -122,12 +142,11 @@ class AIStudiosClient:
         Returns:
             str: 캐시 키
         """
-        # 간단한 해시 생성 (실제 구현에서는 더 강력한 해시 함수 사용 권장)
         if avatar_id is None:
             avatar_id = self.default_avatar_id
-            
-        key = f"{avatar_id}_{hash(text)}"
-        return key
+        
+        # 프로세스/재시작과 무관한 sha256 키 (언어 설정도 결과에 영향을 주므로 포함)
+        return video_cache_key("aistudios", text, avatar=avatar_id, language="ko")
     
     def _get_cached_video(self, cache_key):
         """
@@ -139,24 +158,24 @@ class AIStudiosClient:
         Returns:
             str or None: 캐시된 영상 파일 경로 또는 None (캐시 미스)
         """
-        # 캐시 파일 경로 생성
-        cache_file = self.cache_dir / f"{cache_key}.mp4"
+        # 캐시 파일 조회 (만료된 파일은 삭제됨)
+        cache_file = self.video_cache.get(f"{cache_key}.mp4")
         
-        # 캐시 파일이 존재하는지 확인
-        if cache_file.exists():
+        if cache_file:
             logger.info(f"캐시 히트: {cache_key}")
-            return str(cache_file)
+            return cache_file
         
         logger.info(f"캐시 미스: {cache_key}")
         return None
     
-    def _save_to_cache(self, cache_key, video_data):
+    def _save_to_cache(self, cache_key, video_data, metadata=None):
         """
         영상 데이터를 캐시에 저장
         
         Args:
             cache_key (str): 캐시 키
             video_data (bytes): 영상 데이터
+            metadata (dict, optional): 키를 만든 원본 값 (text, avatar_id) - 키 규칙 변경 시 재색인에 사용
             
         Returns:
             str: 저장된 캐시 파일 경로
@@ -168,9 +187,22 @@ class AIStudiosClient:
         with open(cache_file, 'wb') as f:
             f.write(video_data)
         
+        if metadata:
+            with open(cache_file.with_suffix('.json'), 'w', encoding='utf-8') as f:
+                json.dump({**metadata, "key_version": CACHE_KEY_VERSION}, f, ensure_ascii=False)
+        
+        # 캐시 등록 (용량 초과 시 오래 사용하지 않은 영상부터 삭제)
+        self.video_cache.put(cache_file.name)
+        
         logger.info(f"영상 캐싱 완료: {cache_file}")
         return str(cache_file)
     
+    def _remove_metadata(self, video_path):
+        """캐시 정리로 삭제된 영상의 메타데이터 파일 삭제"""
+        metadata_file = Path(video_path).with_suffix('.json') if video_path else None
+        if metadata_file and metadata_file.exists():
+            metadata_file.unlink()
+    
     def generate_avatar_video(self, text, avatar_id=None, use_cache=True):
         """
         아바타 영상 생성
@@ -202,66 +234,13 @@ class AIStudiosClient:
                 return cached_video
         
         try:
-            # AIStudios API 요청 데이터 준비
-            request_data = {
-                "avatarId": avatar_id,
-                "text": text,
-                "language": "ko",  # 기본 언어 한국어 설정
-                "callback": None   # 콜백이 필요하면 URL 설정
-            }
-            
-            # 실제 AIStudios API 구현에 맞게 조정 필요
-            # 아래는 예상되는 API 흐름을 시뮬레이션한 코드입니다
-            
-            # 1. 영상 생성 요청
-            logger.info(f"아바타 영상 생성 요청: avatar_id={avatar_id}, text={text[:20]}...")
-            response = requests.post(
-                f"{self.base_url}/generate",
-                headers=self.headers,
-                json=request_data
+            # 진행 중인 같은 렌더링이 있으면 그 결과를 공유
+            video_path, _ = self._render_flight.do(
+                cache_key,
+                lambda: self._render_avatar_video(text, avatar_id, cache_key),
+                check=(lambda: self._get_cached_video(cache_key)) if use_cache else None
             )
-            response.raise_for_status()
-            
-            # 2. 응답 확인
-            result = response.json()
-            if result.get("success") is False:
-                raise Exception(f"영상 생성 요청 실패: {result.get('message')}")
-            
-            task_id = result.get("taskId")
-            logger.info(f"영상 생성 작업 ID: {task_id}")
-            
-            # 3. 작업 완료 대기
-            max_retries = 30  # 최대 30번 재시도 (약 5분)
-            retry_interval = 10  # 10초 간격으로 확인
-            
-            for i in range(max_retries):
-                time.sleep(retry_interval)
-                
-                # 작업 상태 확인
-                status_response = requests.get(
-                    f"{self.base_url}/tasks/{task_id}",
-                    headers=self.headers
-                )
-                status_response.raise_for_status()
-                
-                status = status_response.json()
-                if status.get("status") == "completed":
-                    video_url = status.get("videoUrl")
-                    logger.info(f"영상 생성 완료: {video_url}")
-                    break
-                elif status.get("status") == "failed":
-                    raise Exception(f"영상 생성 실패: {status.get('message')}")
-                
-                logger.info(f"영상 생성 대기 중... ({i+1}/{max_retries})")
-            else:
-                raise Exception("영상 생성 시간 초과")
-            
-            # 4. 영상 다운로드
-            video_response = requests.get(video_url)
-            video_response.raise_for_status()
-            
-            # 5. 영상 캐싱 및 경로 반환
-            return self._save_to_cache(cache_key, video_response.content)
+            return video_path
             
         except Exception as e:
             logger.error(f"아바타 영상 생성 중 오류 발생: {str(e)}")
@@ -277,6 +256,126 @@ class AIStudiosClient:
             
             return temp_file.name
     
+    @traced("avatar_render")
+    def _render_avatar_video(self, text, avatar_id, cache_key, max_wait_time=300):
+        """
+        AIStudios API로 영상을 렌더링하고 캐시에 저장
+        
+        Args:
+            text (str): 아바타가 말할 텍스트
+            avatar_id (str): 사용할 아바타 ID
+            cache_key (str): 캐시 키
+            max_wait_time (int, optional): 최대 대기 시간 (초)
+            
+        Returns:
+            str: 캐시에 저장된 영상 파일 경로
+        """
+        # 1. 영상 생성 요청
+        task_id = self.start_render(text, avatar_id)
+        
+        # 2. 작업 완료 대기 (확인 간격을 점점 늘리는 지수 백오프)
+        start_time = time.time()
+        for delay in poll_delays():
+            remaining = max_wait_time - (time.time() - start_time)
+            if remaining <= 0:
+                raise Exception("영상 생성 시간 초과")
+            time.sleep(min(delay, remaining))
+            
+            state, value = self.check_render(task_id)
+            if state == "done":
+                video_url = value
+                break
+            elif state == "failed":
+                raise Exception(f"영상 생성 실패: {value}")
+            
+            logger.info(f"영상 생성 대기 중... (경과: {int(time.time() - start_time)}초)")
+        
+        # 3. 영상 다운로드 및 캐싱
+        return self.download_render(video_url, cache_key, {"text": text, "avatar_id": avatar_id})
+    
+    def start_render(self, text, avatar_id=None, callback_url=None):
+        """
+        영상 생성 요청만 보내고 바로 반환 (완료 여부는 check_render로 확인)
+        
+        Args:
+            text (str): 아바타가 말할 텍스트
+            avatar_id (str, optional): 사용할 아바타 ID
+            callback_url (str, optional): 생성 완료 시 AIStudios가 호출할 URL
+            
+        Returns:
+            str: AIStudios 작업 ID
+        """
+        if avatar_id is None:
+            avatar_id = self.default_avatar_id
+        
+        # AIStudios API 요청 데이터 준비
+        request_data = {
+            "avatarId": avatar_id,
+            "text": text,
+            "language": "ko",  # 기본 언어 한국어 설정
+            "callback": callback_url   # 콜백이 필요하면 URL 설정
+        }
+        
+        # 실제 AIStudios API 구현에 맞게 조정 필요
+        # 아래는 예상되는 API 흐름을 시뮬레이션한 코드입니다
+        logger.info(f"아바타 영상 생성 요청: avatar_id={avatar_id}, text={text[:20]}...")
+        response = self.session.post(
+            f"{self.base_url}/generate",
+            headers=self.headers,
+            json=request_data,
+            timeout=30
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        if result.get("success") is False:
+            raise Exception(f"영상 생성 요청 실패: {result.get('message')}")
+        
+        task_id = result.get("taskId")
+        logger.info(f"영상 생성 작업 ID: {task_id}")
+        return task_id
+    
+    def check_render(self, task_id):
+        """
+        영상 생성 상태 한 번 확인
+        
+        Args:
+            task_id (str): AIStudios 작업 ID
+            
+        Returns:
+            tuple: ('done', 영상 URL), ('failed', 오류 메시지), ('pending', 작업 상태)
+        """
+        status_response = self.session.get(
+            f"{self.base_url}/tasks/{task_id}",
+            headers=self.headers,
+            timeout=10
+        )
+        status_response.raise_for_status()
+        
+        status = status_response.json()
+        if status.get("status") == "completed":
+            logger.info(f"영상 생성 완료: {status.get('videoUrl')}")
+            return "done", status.get("videoUrl")
+        elif status.get("status") == "failed":
+            return "failed", status.get("message")
+        return "pending", status.get("status")
+    
+    def download_render(self, video_url, cache_key, metadata=None):
+        """
+        완료된 영상을 다운로드하여 캐시에 저장
+        
+        Args:
+            video_url (str): 영상 다운로드 URL
+            cache_key (str): 캐시 키
+            metadata (dict, optional): 키를 만든 원본 값 (text, avatar_id)
+            
+        Returns:
+            str: 캐시에 저장된 영상 파일 경로
+        """
+        video_response = self.session.get(video_url, timeout=120)
+        video_response.raise_for_status()
+        return self._save_to_cache(cache_key, video_response.content, metadata)
+    
     def get_available_avatars(self):
         """
         사용 가능한 아바타 목록 조회
@@ -285,7 +384,7 @@ class AIStudiosClient:
             list: 사용 가능한 아바타 목록
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/avatars",
                 headers=self.headers
             )
@@ -304,14 +403,7 @@ class AIStudiosClient:
             older_than (int, optional): 지정된 시간(초) 이전의 캐시만 삭제. None이면 모든 캐시 삭제.
         """
         try:
-            count = 0
-            now = time.time()
-            
-            for cache_file in self.cache_dir.glob("*.mp4"):
-                if older_than is None or (now - cache_file.stat().st_mtime > older_than):
-                    cache_file.unlink()
-                    count += 1
-            
+            count = self.video_cache.clear(older_than)
             logger.info(f"{count}개의 캐시 파일 삭제됨")
         except Exception as e:
             logger.error(f"캐시 정리 중 오류 발생: {str(e)}")
@@ -1,10 +1,11 @@
 import os
 import logging
 import tempfile
-import time
 from pathlib import Path
 from datetime import datetime
 
+from modules.common.media_cache import MediaCache
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,16 @@ class VideoManager:
             dir_path.mkdir(exist_ok=True)
         
         self.cache_expiry = cache_expiry
+        
+        # 단계별 디렉토리의 영상 캐시 (만료/용량 제한, 백그라운드 정리)
+        self.video_cache = MediaCache(
+            "aistudios_videos",
+            directory=str(self.base_dir),
+            max_bytes=5 * 1024 * 1024 * 1024,
+            max_age_seconds=cache_expiry,
+            pattern=[f"{name}/*.mp4" for name in self.debate_dirs],
+            recursive=True
+        )
         logger.info(f"영상 관리자 초기화 완료: {self.base_dir}")
     
     def get_video_path(self, debate_id, phase, is_ai=True):
@@ -112,6 +123,7 @@ class VideoManager:
             
             import shutil
             shutil.copy2(source_path, target_path)
+            self.video_cache.put(self.video_cache.key_for(str(target_path)))
             logger.info(f"영상 저장 완료: {target_path}")
             
             return str(target_path)
@@ -128,18 +140,9 @@ class VideoManager:
         Returns:
             int: 삭제된 파일 수
         """
-        count = 0
-        now = time.time()
-        
-        for dir_path in self.debate_dirs.values():
-            for video_file in dir_path.glob("*.mp4"):
-                if now - video_file.stat().st_mtime > self.cache_expiry:
-                    try:
-                        video_file.unlink()
-                        count += 1
-                        logger.info(f"만료된 영상 삭제: {video_file}")
-                    except Exception as e:
-                        logger.error(f"영상 삭제 중 오류 발생: {str(e)}")
+        count = self.video_cache.sweep()["expired"]
+        if count:
+            logger.info(f"만료된 영상 {count}개 삭제")
         
         return count
     
@@ -167,10 +170,8 @@ class VideoManager:
             else:
                 return None
             
-            if target_path.exists():
-                return str(target_path)
-            
-            return None
+            # 만료된 영상은 삭제 후 None
+            return self.video_cache.get(self.video_cache.key_for(str(target_path)))
         except Exception as e:
             logger.error(f"영상 확인 중 오류 발생: {str(e)}")
             return None
@@ -0,0 +1,8 @@
+"""
+답변 영상 분석 모듈 패키지
+Whisper, Librosa, OpenFace 분석기를 병렬로 실행하는 오케스트레이터와
+영상 해시 기반 계층별 분석 결과 캐시 제공
+"""
+
+from .orchestrator import MultimodalAnalysisOrchestrator, get_orchestrator
+from .result_cache import AnalysisResultCache, get_result_cache, hash_file, save_upload_with_hash
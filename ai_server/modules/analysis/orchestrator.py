@@ -0,0 +1,293 @@
+"""
+멀티모달 분석 오케스트레이터
+답변 영상에 대한 Whisper(음성 인식), Librosa(음성 분석), OpenFace(얼굴 분석)를
+공유 스레드 풀에서 병렬로 실행하고 결과를 모아서 반환
+
+- OpenFace는 비디오만 필요하므로 오디오 추출과 동시에 시작
+- Whisper와 Librosa는 오디오 추출이 끝나는 즉시 함께 시작
+- 분석기별 타임아웃을 두고, 실패/타임아웃 시 지정된 폴백 결과 사용
+- 영상 해시가 주어지면 계층별 결과 캐시를 먼저 조회하고 캐시된 분석기는 건너뜀
+- 디코딩된 PCM 버퍼는 VAD로 무음을 잘라낸 뒤 Whisper/Librosa에 전달하고,
+  인식 세그먼트 시각은 변환표로 원본 기준으로 되돌림
+"""
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Callable
+
+import numpy as np
+
+from modules.common.tracing import bind_context, get_metrics_registry
+from modules.common.vad import VAD_TRIM_ENABLED, trim_silence
+from .result_cache import AnalysisResultCache, get_result_cache
+
+logger = logging.getLogger(__name__)
+
+# 분석기 이름
+TRANSCRIPTION = "transcription"
+AUDIO = "audio"
+FACIAL = "facial"
+
+# 분석기별 기본 타임아웃 (초)
+DEFAULT_TIMEOUTS = {
+    TRANSCRIPTION: float(os.environ.get("ANALYSIS_TIMEOUT_WHISPER", 120)),
+    AUDIO: float(os.environ.get("ANALYSIS_TIMEOUT_LIBROSA", 60)),
+    FACIAL: float(os.environ.get("ANALYSIS_TIMEOUT_OPENFACE", 180)),
+}
+
+# 분석기별 기본 폴백 결과
+DEFAULT_FALLBACKS = {
+    TRANSCRIPTION: {"text": "", "confidence": 0.0},
+    AUDIO: {"voice_stability": 0.8, "fluency_score": 0.85},
+    FACIAL: {"confidence": 0.8, "emotion": "중립"},
+}
+
+class MultimodalAnalysisOrchestrator:
+    """답변 영상 분석기 병렬 실행기"""
+
+    def __init__(self, max_workers: Optional[int] = None, timeouts: Optional[Dict[str, float]] = None,
+                 result_cache: Optional[AnalysisResultCache] = None):
+        """
+        오케스트레이터 초기화
+
+        Args:
+            max_workers: 스레드 풀 최대 작업자 수 (기본값: 환경 변수 ANALYSIS_MAX_WORKERS 또는 6)
+            timeouts: 분석기별 타임아웃 (초)
+            result_cache: 계층별 분석 결과 캐시 (None이면 캐시 사용 안 함)
+        """
+        if max_workers is None:
+            max_workers = int(os.environ.get("ANALYSIS_MAX_WORKERS", 6))
+
+        self.max_workers = max_workers
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.result_cache = result_cache
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis")
+        self._queued = 0
+        self._running = 0
+        self._stats_lock = threading.Lock()
+        logger.info(f"멀티모달 분석 오케스트레이터 초기화 - 작업자 수: {max_workers}")
+
+    def analyze(self,
+                video_path: str,
+                extract_audio: Optional[Callable[[str], Any]] = None,
+                transcribe: Optional[Callable[[Any], Dict[str, Any]]] = None,
+                analyze_audio: Optional[Callable[[Any], Dict[str, Any]]] = None,
+                analyze_face: Optional[Callable[[str], Dict[str, Any]]] = None,
+                fallbacks: Optional[Dict[str, Dict[str, Any]]] = None,
+                media_hash: Optional[str] = None,
+                cache_params: Optional[Dict[str, Dict[str, Any]]] = None,
+                trim_silence_audio: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        답변 영상 멀티모달 분석
+
+        Args:
+            video_path: 비디오 파일 경로
+            extract_audio: 비디오에서 오디오를 추출하는 함수 (결과는 transcribe/analyze_audio 입력)
+            transcribe: 음성 인식 함수 (None이면 폴백 사용)
+            analyze_audio: 음성 분석 함수 (None이면 폴백 사용)
+            analyze_face: 얼굴 분석 함수, 비디오 경로를 입력으로 받음 (None이면 폴백 사용)
+            fallbacks: 분석기별 폴백 결과
+            media_hash: 영상 바이트 해시 (주어지면 계층별 결과 캐시 사용)
+            cache_params: 분석기별 캐시 키 파라미터 (모델, 샘플링 설정 등)
+            trim_silence_audio: 무음 제거 사용 여부 (기본값: 환경 변수 VAD_TRIM)
+
+        Returns:
+            Dict[str, Any]: transcription, audio, facial 분석 결과와
+                            audio_source, speech_timeline, timings, status 정보
+        """
+        fallback_results = dict(DEFAULT_FALLBACKS)
+        if fallbacks:
+            fallback_results.update(fallbacks)
+
+        start_time = time.time()
+        futures = {}
+        started_at = {}
+        finished_at = {}
+
+        # 0. 캐시된 계층은 분석기를 실행하지 않음
+        cache = self.result_cache if media_hash else None
+        cache_params = cache_params or {}
+        cached = {}
+        if cache:
+            for name, func in ((FACIAL, analyze_face), (TRANSCRIPTION, transcribe), (AUDIO, analyze_audio)):
+                if func:
+                    hit = cache.get(media_hash, name, cache_params.get(name))
+                    if hit is not None:
+                        cached[name] = hit
+            if FACIAL in cached:
+                analyze_face = None
+            if TRANSCRIPTION in cached:
+                transcribe = None
+            if AUDIO in cached:
+                analyze_audio = None
+
+        def submit(name, func, arg):
+            started_at[name] = time.time()
+            # 요청 컨텍스트를 넘겨 분석기 스레드의 처리 시간도 요청별 처리 시간에 포함
+            futures[name] = self.executor.submit(self._counted(bind_context(func)), arg)
+            futures[name].add_done_callback(lambda _: finished_at.setdefault(name, time.time()))
+            futures[name].add_done_callback(self._discard_cancelled)
+
+        # 1. 얼굴 분석은 비디오만 있으면 되므로 가장 먼저 시작
+        if analyze_face:
+            submit(FACIAL, analyze_face, video_path)
+
+        # 2. 오디오 추출 (호출 스레드에서 실행, 그 동안 얼굴 분석 진행)
+        audio_source = None
+        if extract_audio and (transcribe or analyze_audio):
+            try:
+                audio_source = extract_audio(video_path)
+            except Exception as e:
+                logger.error(f"오디오 추출 오류: {str(e)}")
+        extract_time = time.time() - start_time
+
+        # 3. 발화 구간만 남긴 버퍼 생성 (한 번만 계산하여 두 분석기가 공유)
+        if trim_silence_audio is None:
+            trim_silence_audio = VAD_TRIM_ENABLED
+        voiced = None
+        vad_start = time.time()
+        if trim_silence_audio and isinstance(audio_source, np.ndarray) and (transcribe or analyze_audio):
+            try:
+                voiced = trim_silence(audio_source)
+            except Exception as e:
+                logger.warning(f"무음 제거 실패 - 원본 오디오 사용: {str(e)}")
+        vad_time = time.time() - vad_start
+
+        # 4. 오디오가 준비되면 음성 인식과 음성 분석 동시 시작
+        if audio_source is not None:
+            if transcribe:
+                if voiced is not None:
+                    submit(TRANSCRIPTION, _remapped(transcribe, voiced.timeline), voiced.view(np.ndarray))
+                else:
+                    submit(TRANSCRIPTION, transcribe, audio_source)
+            if analyze_audio:
+                submit(AUDIO, analyze_audio, voiced if voiced is not None else audio_source)
+
+        # 5. 결과 수집 (분석기별 타임아웃 적용)
+        results = {}
+        timings = {"audio_extraction": round(extract_time, 3)}
+        if voiced is not None:
+            timings["vad"] = round(vad_time, 3)
+        status = {}
+
+        for name in (FACIAL, TRANSCRIPTION, AUDIO):
+            if name in cached:
+                results[name] = cached[name]
+                status[name] = "cached"
+                timings[name] = 0.0
+                continue
+
+            future = futures.get(name)
+            if future is None:
+                results[name] = dict(fallback_results[name])
+                status[name] = "fallback"
+                continue
+
+            remaining = self.timeouts.get(name, 60) - (time.time() - started_at[name])
+            try:
+                result = future.result(timeout=max(0.0, remaining))
+                if not isinstance(result, dict) or "error" in result:
+                    logger.warning(f"{name} 분석 결과 오류 - 폴백 사용: {result}")
+                    results[name] = dict(fallback_results[name])
+                    status[name] = "fallback"
+                else:
+                    results[name] = result
+                    status[name] = "success"
+                    if cache:
+                        cache.put(media_hash, name, cache_params.get(name), result)
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(f"{name} 분석 타임아웃 ({self.timeouts.get(name)}초) - 폴백 사용")
+                results[name] = dict(fallback_results[name])
+                status[name] = "timeout"
+            except Exception as e:
+                logger.warning(f"{name} 분석 실패 - 폴백 사용: {str(e)}")
+                results[name] = dict(fallback_results[name])
+                status[name] = "error"
+
+            timings[name] = round(finished_at.get(name, time.time()) - started_at[name], 3)
+
+        timings["total"] = round(time.time() - start_time, 3)
+        logger.info(f"멀티모달 분석 완료 - 소요 시간: {timings}, 상태: {status}")
+
+        return {
+            TRANSCRIPTION: results[TRANSCRIPTION],
+            AUDIO: results[AUDIO],
+            FACIAL: results[FACIAL],
+            "audio_source": audio_source,
+            "speech_timeline": voiced.timeline.to_dict() if voiced is not None else None,
+            "timings": timings,
+            "status": status
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """대기/실행 중인 분석기 수"""
+        with self._stats_lock:
+            return {"queued": self._queued, "running": self._running, "max_workers": self.max_workers}
+
+    def _counted(self, func: Callable[[Any], Dict[str, Any]]) -> Callable[[Any], Dict[str, Any]]:
+        """대기/실행 중인 분석기 수를 세는 래퍼"""
+        with self._stats_lock:
+            self._queued += 1
+
+        def run(arg):
+            with self._stats_lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return func(arg)
+            finally:
+                with self._stats_lock:
+                    self._running -= 1
+        return run
+
+    def _discard_cancelled(self, future):
+        """시작 전에 취소된 분석기는 대기 수에서 제외"""
+        if future.cancelled():
+            with self._stats_lock:
+                self._queued -= 1
+
+    def shutdown(self, wait: bool = False):
+        """스레드 풀 종료"""
+        self.executor.shutdown(wait=wait)
+
+def _remapped(transcribe: Callable[[Any], Dict[str, Any]], timeline) -> Callable[[Any], Dict[str, Any]]:
+    """무음 제거 오디오의 인식 결과 세그먼트 시각을 원본 기준으로 되돌리는 래퍼"""
+    def run(audio):
+        result = transcribe(audio)
+        if isinstance(result, dict) and result.get("segments"):
+            timeline.remap_segments(result["segments"])
+        return result
+    return run
+
+_default_orchestrator = None
+_default_orchestrator_lock = threading.Lock()
+
+def get_orchestrator() -> MultimodalAnalysisOrchestrator:
+    """
+    프로세스 공용 오케스트레이터 반환 (최초 호출 시 생성)
+
+    Returns:
+        MultimodalAnalysisOrchestrator: 공용 오케스트레이터
+    """
+    global _default_orchestrator
+
+    if _default_orchestrator is None:
+        with _default_orchestrator_lock:
+            if _default_orchestrator is None:
+                _default_orchestrator = MultimodalAnalysisOrchestrator(result_cache=get_result_cache())
+                get_metrics_registry().register_collector(_collect_orchestrator_metrics)
+    return _default_orchestrator
+
+def _collect_orchestrator_metrics():
+    """분석기 스레드 풀 대기/실행 수 (/ai/metrics)"""
+    stats = _default_orchestrator.stats()
+    return [
+        ("ai_queue_depth", "gauge", "대기 중인 작업 수", {"queue": "analysis"}, stats["queued"]),
+        ("ai_jobs_running", "gauge", "실행 중인 작업 수", {"queue": "analysis"}, stats["running"]),
+    ]
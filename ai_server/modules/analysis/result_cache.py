@@ -0,0 +1,292 @@
+"""
+답변 영상 분석 결과 캐시
+업로드된 영상 바이트의 해시(sha256)와 분석기 버전/파라미터를 키로 하여
+분석 계층(음성 인식, 음성 특징, 얼굴 요약)별 결과를 따로 저장
+
+- 클라이언트/백엔드 재시도로 같은 영상이 다시 올라오면 Whisper/Librosa/OpenFace를 건너뜀
+- 계층별 키가 분리되어 있어 한 분석기의 파라미터가 바뀌면 해당 계층만 무효화
+- 메모리(항목 수 기준)와 디스크(용량 기준) 모두 LRU로 크기 제한
+"""
+import os
+import json
+import uuid
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정 (환경 변수로 조정 가능)
+ANALYSIS_CACHE_ENABLED = os.environ.get("ANALYSIS_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ANALYSIS_CACHE_DIR = os.environ.get(
+    "ANALYSIS_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "cache", "analysis")
+)
+ANALYSIS_CACHE_MEMORY_ENTRIES = int(os.environ.get("ANALYSIS_CACHE_MEMORY_ENTRIES", 256))
+ANALYSIS_CACHE_DISK_BYTES = int(os.environ.get("ANALYSIS_CACHE_DISK_MB", 512)) * 1024 * 1024
+
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 분석기 구현 버전 - 분석 코드가 결과를 바꾸도록 수정되면 해당 계층 버전을 올림
+ANALYZER_VERSIONS = {
+    "transcription": "whisper-2",
+    "audio": "librosa-2",
+    "facial": "openface-2",
+}
+
+def hash_file(file_path: str) -> str:
+    """
+    파일 내용의 sha256 해시 (청크 단위 스트리밍)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def save_upload_with_hash(file_storage, dest_path: str) -> str:
+    """
+    업로드 파일을 디스크에 저장하면서 동시에 해시 계산 (한 번만 읽음)
+
+    Args:
+        file_storage: Flask 업로드 파일 (werkzeug FileStorage)
+        dest_path: 저장 경로
+
+    Returns:
+        str: 저장된 내용의 sha256 해시
+    """
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    with open(dest_path, "wb") as f:
+        for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+def layer_key(media_hash: str, layer: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    계층별 캐시 키 (영상 해시 + 계층 + 분석기 버전 + 파라미터)
+
+    Args:
+        media_hash: 영상 바이트 해시
+        layer: 분석 계층 (transcription, audio, facial)
+        params: 결과에 영향을 주는 분석 파라미터
+
+    Returns:
+        str: sha256 캐시 키
+    """
+    payload = json.dumps({
+        "media": media_hash,
+        "layer": layer,
+        "version": ANALYZER_VERSIONS.get(layer),
+        "params": params or {}
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _to_builtin(value: Any) -> Any:
+    """numpy 스칼라/배열을 JSON 직렬화 가능한 값으로 변환"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+class AnalysisResultCache:
+    """계층별 분석 결과 캐시 (메모리 LRU + 디스크 LRU)"""
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_memory_entries: Optional[int] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        캐시 초기화
+
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (기본값: 환경 변수 ANALYSIS_CACHE_DIR)
+            max_memory_entries: 메모리 캐시 최대 항목 수
+            max_disk_bytes: 디스크 캐시 최대 용량 (바이트)
+        """
+        self.cache_dir = cache_dir or ANALYSIS_CACHE_DIR
+        self.max_memory_entries = max_memory_entries if max_memory_entries is not None else ANALYSIS_CACHE_MEMORY_ENTRIES
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else ANALYSIS_CACHE_DISK_BYTES
+
+        # 키 → 직렬화된 결과 (호출자가 결과를 수정해도 캐시에 영향 없도록 문자열로 보관)
+        self._memory = OrderedDict()
+        self._disk_bytes = None
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, media_hash: str, layer: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 계층 결과 조회
+
+        Args:
+            media_hash: 영상 바이트 해시
+            layer: 분석 계층
+            params: 분석 파라미터
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시된 결과 (없으면 None)
+        """
+        key = layer_key(media_hash, layer, params)
+
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return json.loads(payload)
+
+        path = self._disk_path(layer, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = f.read()
+            # 수정 시각을 최근 사용 시각으로 사용 (디스크 LRU)
+            os.utime(path, None)
+        except FileNotFoundError:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        except OSError as e:
+            logger.warning(f"분석 캐시 읽기 실패: {path} - {str(e)}")
+            return None
+
+        with self._lock:
+            self._remember(key, payload)
+            self._stats["disk_hits"] += 1
+        return json.loads(payload)
+
+    def put(self, media_hash: str, layer: str, params: Optional[Dict[str, Any]], result: Dict[str, Any]):
+        """
+        계층 결과 저장
+
+        Args:
+            media_hash: 영상 바이트 해시
+            layer: 분석 계층
+            params: 분석 파라미터
+            result: 분석 결과 (JSON 직렬화 가능해야 함)
+        """
+        key = layer_key(media_hash, layer, params)
+        try:
+            payload = json.dumps(result, ensure_ascii=False, default=_to_builtin)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"분석 결과 직렬화 실패 ({layer}): {str(e)}")
+            return
+
+        with self._lock:
+            self._remember(key, payload)
+            self._stats["stores"] += 1
+
+        path = self._disk_path(layer, key)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            existing = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"분석 캐시 저장 실패: {path} - {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_usage()
+            else:
+                self._disk_bytes += size - existing
+            over_limit = self._disk_bytes > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_usage()
+            return {
+                **self._stats,
+                "memory_entries": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes
+            }
+
+    def _remember(self, key: str, payload: str):
+        """메모리 LRU에 저장 (잠금 상태에서 호출)"""
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, layer: str, key: str) -> str:
+        """계층별 디렉토리 아래 키 앞 2자리로 분산 저장"""
+        return os.path.join(self.cache_dir, layer, key[:2], f"{key}.json")
+
+    def _cache_files(self):
+        """디스크 캐시 파일 목록 (경로, 크기, 최근 사용 시각)"""
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _scan_disk_usage(self) -> int:
+        """디스크 캐시 사용량 계산"""
+        return sum(size for _, size, _ in self._cache_files())
+
+    def _evict_disk(self):
+        """오래 사용되지 않은 파일부터 삭제하여 용량 한도의 90% 이하로 줄임"""
+        files = sorted(self._cache_files(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+
+        for path, size, _ in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                evicted += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._disk_bytes = total
+            self._stats["evictions"] += evicted
+        logger.info(f"분석 캐시 정리 - 삭제: {evicted}개, 사용량: {total / (1024 * 1024):.1f}MB")
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_result_cache() -> Optional[AnalysisResultCache]:
+    """
+    프로세스 공용 분석 결과 캐시 반환 (ANALYSIS_CACHE_ENABLED가 꺼져 있으면 None)
+
+    Returns:
+        Optional[AnalysisResultCache]: 공용 캐시
+    """
+    global _default_cache
+
+    if not ANALYSIS_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = AnalysisResultCache()
+    return _default_cache
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 인식(ASR) 백엔드
+WhisperModule 등 음성 인식 호출부가 엔진과 무관하게 같은 결과 형식을 받도록 하는 백엔드 인터페이스
+
+- openai-whisper: 기존 PyTorch fp32 엔진 (기본값, 마이크로 배치 추론 지원)
+- whisper-int8: openai-whisper 모델의 Linear 계층을 int8 동적 양자화한 CPU 엔진 (배치 추론 지원)
+- faster-whisper: CTranslate2 int8 CPU 엔진 (faster-whisper 패키지 필요, 없으면 whisper-int8로 대체)
+
+결과 형식은 whisper.transcribe()와 같음
+(text, language, segments[id, start, end, text, tokens, avg_logprob, no_speech_prob, compression_ratio, words])
+"""
+import os
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from modules.common.lazy_import import is_module_available
+from modules.common.model_registry import FASTER_WHISPER, WHISPER, acquire_model
+from modules.common.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# 백엔드 설정 (환경 변수로 조정 가능)
+ASR_BACKEND = os.environ.get("ASR_BACKEND", "openai-whisper")  # openai-whisper, whisper-int8, faster-whisper
+# faster-whisper 연산 정밀도 (int8, int8_float32, float32)
+ASR_COMPUTE_TYPE = os.environ.get("ASR_COMPUTE_TYPE", "int8")
+
+OPENAI_WHISPER = "openai-whisper"
+WHISPER_INT8 = "whisper-int8"
+FASTER_WHISPER_BACKEND = "faster-whisper"
+
+# faster-whisper transcribe()가 받는 whisper.transcribe() 공통 옵션
+_FASTER_WHISPER_OPTIONS = ("beam_size", "best_of", "temperature", "initial_prompt", "condition_on_previous_text",
+                           "compression_ratio_threshold", "no_speech_threshold")
+
+class ASRBackend:
+    """음성 인식 백엔드 인터페이스"""
+
+    name = "base"
+
+    def __init__(self, model_size: str = "base"):
+        """
+        백엔드 초기화 (모델은 공용 모델 레지스트리에서 첫 사용 시 로드)
+
+        Args:
+            model_size: 모델 크기 (tiny, base, small, medium, large)
+        """
+        self.model_size = model_size
+        self.model = None
+
+    def transcribe(self, audio, language: Optional[str] = None, word_timestamps: bool = False,
+                   batched: bool = False, **options) -> Dict[str, Any]:
+        """
+        음성 인식
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz float32 PCM 버퍼
+            language: 언어 코드 (None이면 자동 감지)
+            word_timestamps: 단어 단위 타임스탬프 포함 여부
+            batched: 동시에 들어온 요청을 배치 추론 서버로 모아 실행할지 여부 (지원하는 백엔드만)
+            options: 엔진별 추가 옵션
+
+        Returns:
+            Dict[str, Any]: whisper.transcribe()와 같은 형식의 결과
+        """
+        with span("asr"):
+            return self._transcribe(audio, language=language, word_timestamps=word_timestamps,
+                                    batched=batched, **options)
+
+    def _transcribe(self, audio, language: Optional[str] = None, word_timestamps: bool = False,
+                    batched: bool = False, **options) -> Dict[str, Any]:
+        """엔진별 음성 인식 구현"""
+        raise NotImplementedError
+
+    def batcher(self):
+        """마이크로 배치 추론 서버 (지원하지 않으면 None)"""
+        return None
+
+    def load(self):
+        """모델을 미리 로드 (준비 단계에서 사용)"""
+        return self.model.get()
+
+    def release(self):
+        """공용 모델 레지스트리 핸들 반납"""
+        if self.model is not None:
+            self.model.release()
+
+    def info(self) -> Dict[str, Any]:
+        """백엔드 정보"""
+        family, name, device, dtype = self.model.key
+        return {"backend": self.name, "model_size": name, "device": device or "auto",
+                "dtype": dtype or "float32", "loaded": self.model.loaded}
+
+class OpenAIWhisperBackend(ASRBackend):
+    """openai-whisper PyTorch 엔진"""
+
+    name = OPENAI_WHISPER
+    dtype = None
+
+    def __init__(self, model_size: str = "base"):
+        super().__init__(model_size)
+        self.model = acquire_model(WHISPER, model_size, dtype=self.dtype)
+
+    def batcher(self):
+        from modules.whisper_batcher import get_whisper_batcher
+        return get_whisper_batcher(self.model)
+
+    def _transcribe(self, audio, language: Optional[str] = None, word_timestamps: bool = False,
+                    batched: bool = False, **options) -> Dict[str, Any]:
+        # 배치 추론은 30초 고정 구간을 사용하므로 단어 단위 타임스탬프가 필요하면 단독 실행
+        if batched and not word_timestamps:
+            batcher = self.batcher()
+            if batcher is not None:
+                try:
+                    return batcher.transcribe(audio, language=language)
+                except Exception as e:
+                    logger.warning(f"Whisper 배치 전사 실패, 단건 전사로 대체: {str(e)}")
+        return self.model.transcribe(audio, language=language, word_timestamps=word_timestamps, **options)
+
+class Int8WhisperBackend(OpenAIWhisperBackend):
+    """openai-whisper int8 동적 양자화 CPU 엔진"""
+
+    name = WHISPER_INT8
+    dtype = "int8"
+
+    def _transcribe(self, audio, language: Optional[str] = None, word_timestamps: bool = False,
+                    batched: bool = False, **options) -> Dict[str, Any]:
+        # CPU 실행이므로 fp16 경고 없이 fp32 활성값 사용
+        options.setdefault("fp16", False)
+        return super()._transcribe(audio, language=language, word_timestamps=word_timestamps,
+                                   batched=batched, **options)
+
+class FasterWhisperBackend(ASRBackend):
+    """faster-whisper(CTranslate2) int8 CPU 엔진"""
+
+    name = FASTER_WHISPER_BACKEND
+
+    def __init__(self, model_size: str = "base", compute_type: Optional[str] = None):
+        super().__init__(model_size)
+        self.model = acquire_model(FASTER_WHISPER, model_size, device="cpu", dtype=compute_type or ASR_COMPUTE_TYPE)
+
+    def _transcribe(self, audio, language: Optional[str] = None, word_timestamps: bool = False,
+                    batched: bool = False, **options) -> Dict[str, Any]:
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32, copy=False)
+        engine_options = {key: options[key] for key in _FASTER_WHISPER_OPTIONS if key in options}
+        # 세그먼트는 생성기로 반환되며 순회하는 동안 디코딩됨
+        segments, info = self.model.transcribe(audio, language=language, word_timestamps=word_timestamps,
+                                               **engine_options)
+        segments = [_segment_to_dict(index, segment) for index, segment in enumerate(segments)]
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "language": info.language,
+            "segments": segments
+        }
+
+def _segment_to_dict(index: int, segment) -> Dict[str, Any]:
+    """faster-whisper 세그먼트를 whisper.transcribe() 세그먼트 형식으로 변환"""
+    result = {
+        "id": getattr(segment, "id", index),
+        "seek": getattr(segment, "seek", 0),
+        "start": float(segment.start),
+        "end": float(segment.end),
+        "text": segment.text,
+        "tokens": list(getattr(segment, "tokens", None) or []),
+        "temperature": getattr(segment, "temperature", 0.0),
+        "avg_logprob": float(segment.avg_logprob),
+        "compression_ratio": float(getattr(segment, "compression_ratio", 0.0)),
+        "no_speech_prob": float(segment.no_speech_prob)
+    }
+    if getattr(segment, "words", None):
+        result["words"] = [
+            {"word": word.word, "start": float(word.start), "end": float(word.end),
+             "probability": float(word.probability)}
+            for word in segment.words
+        ]
+    return result
+
+ASR_BACKENDS = {
+    OPENAI_WHISPER: OpenAIWhisperBackend,
+    WHISPER_INT8: Int8WhisperBackend,
+    FASTER_WHISPER_BACKEND: FasterWhisperBackend,
+}
+
+_fallback_warned = False
+
+def resolve_asr_backend_name(name: Optional[str] = None) -> str:
+    """
+    실제 사용할 백엔드 이름 (faster-whisper가 설치되어 있지 않으면 whisper-int8)
+
+    Args:
+        name: 백엔드 이름 (기본값: 환경 변수 ASR_BACKEND)
+
+    Returns:
+        str: 백엔드 이름
+    """
+    global _fallback_warned
+
+    name = (name or ASR_BACKEND).lower()
+    if name not in ASR_BACKENDS:
+        raise ValueError(f"지원하지 않는 음성 인식 백엔드: {name} (사용 가능: {', '.join(ASR_BACKENDS)})")
+    if name == FASTER_WHISPER_BACKEND and not is_module_available("faster_whisper"):
+        if not _fallback_warned:
+            _fallback_warned = True
+            logger.warning("faster-whisper가 설치되지 않아 whisper-int8 백엔드를 사용합니다.")
+        return WHISPER_INT8
+    return name
+
+def is_asr_backend_available(name: Optional[str] = None) -> bool:
+    """백엔드 엔진 설치 여부 (모듈을 실제로 임포트하지 않음)"""
+    name = resolve_asr_backend_name(name)
+    if name == FASTER_WHISPER_BACKEND:
+        return is_module_available("faster_whisper")
+    return is_module_available("whisper")
+
+def create_asr_backend(model_size: str = "base", backend: Optional[str] = None) -> ASRBackend:
+    """
+    음성 인식 백엔드 생성
+
+    Args:
+        model_size: 모델 크기
+        backend: 백엔드 이름 (기본값: 환경 변수 ASR_BACKEND)
+
+    Returns:
+        ASRBackend: 음성 인식 백엔드
+    """
+    return ASR_BACKENDS[resolve_asr_backend_name(backend)](model_size)
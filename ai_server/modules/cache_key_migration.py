@@ -0,0 +1,159 @@
+"""
+영상 캐시 키 재색인 모듈
+캐시 키 규칙(modules/common/cache_keys.py)이 바뀐 뒤 기존 캐시 디렉토리의 영상을 새 키로 다시 등록
+
+- D-ID: SQLite 저장소의 원본 스크립트/매개변수로 새 키를 다시 계산하여 항목 키 변경
+- AIStudios: 영상 옆 메타데이터 파일({키}.json)의 원본 값으로 새 키를 계산하여 파일 이름 변경
+- 원본 값이 없는 항목(이전 hash() 기반 키)은 새 키를 만들 수 없으므로 보고만 하거나 삭제
+"""
+import os
+import json
+import glob
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from modules.common.cache_keys import CACHE_KEY_VERSION, video_cache_key
+
+logger = logging.getLogger(__name__)
+
+# D-ID 영상 관리자가 영상을 저장하는 하위 디렉토리
+D_ID_VIDEO_DIRS = ["cache", "interviews", "debates"]
+
+def _new_summary() -> Dict[str, Any]:
+    return {"scanned": 0, "rekeyed": 0, "unchanged": 0, "unmapped": 0, "orphaned": 0,
+            "purged": 0, "unmapped_items": []}
+
+def _remove(path: Optional[str]) -> bool:
+    """파일 삭제 (없으면 무시)"""
+    if path and os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
+
+def migrate_d_id_cache(video_manager, dry_run: bool = False, purge_unmapped: bool = False) -> Dict[str, Any]:
+    """
+    D-ID 영상 캐시 재색인
+
+    Args:
+        video_manager: D-ID 영상 관리자 (VideoManager)
+        dry_run: True면 변경 없이 결과만 집계
+        purge_unmapped: 새 키를 만들 수 없는 항목과 저장소에 없는 영상 파일 삭제
+
+    Returns:
+        Dict[str, Any]: 결과 요약
+    """
+    summary = _new_summary()
+    store = video_manager.store
+    referenced = set()
+
+    for entry in store.entries():
+        summary["scanned"] += 1
+        old_key, file_path = entry["cache_key"], entry["file_path"]
+
+        if not entry.get("content"):
+            # 라우트의 이전 hash() 키 항목 - 원본 스크립트가 저장되지 않아 재계산 불가
+            summary["unmapped"] += 1
+            summary["unmapped_items"].append({"provider": "d_id", "key": old_key, "path": file_path})
+            if purge_unmapped and not dry_run:
+                _remove(store.delete(old_key))
+                summary["purged"] += 1
+            else:
+                referenced.add(os.path.abspath(file_path))
+            continue
+
+        referenced.add(os.path.abspath(file_path))
+        new_key = video_cache_key("d_id", entry["content"], entry.get("video_type"), **entry["params"])
+        if new_key == old_key:
+            summary["unchanged"] += 1
+            continue
+
+        summary["rekeyed"] += 1
+        if not dry_run:
+            # 같은 새 키 항목이 이미 있으면 기존 항목을 유지하고 중복 영상 삭제
+            dropped = store.rekey(old_key, new_key)
+            if dropped:
+                referenced.discard(os.path.abspath(dropped))
+                _remove(dropped)
+
+    # 저장소에서 참조하지 않는 영상 파일 (메타데이터 없이 남은 파일)
+    for sub_dir in D_ID_VIDEO_DIRS:
+        for video_path in glob.glob(os.path.join(video_manager.base_dir, sub_dir, "*.mp4")):
+            if os.path.abspath(video_path) in referenced:
+                continue
+            summary["orphaned"] += 1
+            summary["unmapped_items"].append({"provider": "d_id", "key": None, "path": video_path})
+            if purge_unmapped and not dry_run:
+                _remove(video_path)
+                summary["purged"] += 1
+
+    return summary
+
+def migrate_aistudios_cache(cache_dir: str, key_for: Callable[[str, Optional[str]], str],
+                            dry_run: bool = False, purge_unmapped: bool = False) -> Dict[str, Any]:
+    """
+    AIStudios 영상 캐시 재색인
+
+    Args:
+        cache_dir: AIStudios 캐시 디렉토리
+        key_for: (text, avatar_id) → 캐시 키 함수 (AIStudiosClient._generate_cache_key)
+        dry_run: True면 변경 없이 결과만 집계
+        purge_unmapped: 메타데이터 파일이 없는 영상과 영상이 없는 메타데이터 파일 삭제
+
+    Returns:
+        Dict[str, Any]: 결과 요약
+    """
+    summary = _new_summary()
+
+    for video_path in sorted(glob.glob(os.path.join(cache_dir, "*.mp4"))):
+        summary["scanned"] += 1
+        old_key = os.path.splitext(os.path.basename(video_path))[0]
+        metadata_path = os.path.splitext(video_path)[0] + ".json"
+
+        metadata = None
+        if os.path.exists(metadata_path):
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"메타데이터 읽기 실패: {metadata_path} - {str(e)}")
+
+        if not metadata or not metadata.get("text"):
+            # 이전 {아바타}_{hash()} 파일 - 원본 텍스트가 없어 재계산 불가
+            summary["unmapped"] += 1
+            summary["unmapped_items"].append({"provider": "aistudios", "key": old_key, "path": video_path})
+            if purge_unmapped and not dry_run:
+                _remove(video_path)
+                _remove(metadata_path)
+                summary["purged"] += 1
+            continue
+
+        new_key = key_for(metadata["text"], metadata.get("avatar_id"))
+        if new_key == old_key:
+            summary["unchanged"] += 1
+            continue
+
+        summary["rekeyed"] += 1
+        if dry_run:
+            continue
+
+        new_video_path = os.path.join(cache_dir, f"{new_key}.mp4")
+        if os.path.exists(new_video_path):
+            # 같은 영상이 이미 새 키로 캐시되어 있으면 이전 파일 삭제
+            _remove(video_path)
+            _remove(metadata_path)
+            continue
+        os.replace(video_path, new_video_path)
+        with open(os.path.join(cache_dir, f"{new_key}.json"), "w", encoding="utf-8") as f:
+            json.dump({**metadata, "key_version": CACHE_KEY_VERSION}, f, ensure_ascii=False)
+        _remove(metadata_path)
+
+    # 영상이 없는 메타데이터 파일 (캐시 전체 삭제 등으로 남은 파일)
+    for metadata_path in glob.glob(os.path.join(cache_dir, "*.json")):
+        if os.path.exists(os.path.splitext(metadata_path)[0] + ".mp4"):
+            continue
+        summary["orphaned"] += 1
+        if not dry_run:
+            _remove(metadata_path)
+            summary["purged"] += 1
+
+    return summary
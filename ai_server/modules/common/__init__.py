@@ -3,5 +3,6 @@
 여러 모듈에서 공통으로 사용하는 유틸리티 함수 제공
 """
 
-from .audio_utils import extract_audio_from_video, process_audio_with_librosa
+from .audio_utils import extract_audio_from_video, decode_audio_from_video, process_audio_with_librosa
 from .file_utils import cleanup_temp_files
+from .frame_sampling import sample_video_frames, resolve_openface_input
@@ -4,10 +4,72 @@
 """
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
+
+from .tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# 모든 분석기가 공유하는 PCM 버퍼의 샘플링 레이트 (Whisper 입력 규격)
+AUDIO_SAMPLE_RATE = 16000
+
+@traced("decode")
+def decode_audio_from_video(video_path: str, sample_rate: int = AUDIO_SAMPLE_RATE) -> Optional[Any]:
+    """
+    비디오의 오디오를 한 번만 디코딩하여 모노 float32 PCM 버퍼로 반환
+    ffmpeg 표준 출력으로 직접 받으므로 임시 WAV 파일을 만들지 않음
+    
+    Args:
+        video_path: 비디오 파일 경로
+        sample_rate: 샘플링 레이트 (기본값: 16000)
+        
+    Returns:
+        Optional[np.ndarray]: float32 PCM 버퍼 또는 None
+    """
+    try:
+        import subprocess
+        import numpy as np
+        
+        # FFmpeg로 디코딩 후 리샘플링된 float32 PCM을 stdout으로 출력
+        command = [
+            'ffmpeg', '-nostdin', '-threads', '0', '-i', video_path,
+            '-vn', '-f', 'f32le', '-acodec', 'pcm_f32le',
+            '-ac', '1', '-ar', str(sample_rate), '-'
+        ]
+        
+        process = subprocess.run(command, check=True, capture_output=True)
+        audio = np.frombuffer(process.stdout, dtype=np.float32).copy()
+        
+        if audio.size == 0:
+            logger.warning(f"디코딩된 오디오가 없습니다: {video_path}")
+            return None
+        
+        logger.debug(f"오디오 디코딩 완료 - 길이: {audio.size / sample_rate:.2f}초")
+        return audio
+        
+    except Exception as e:
+        logger.error(f"오디오 디코딩 오류: {str(e)}")
+        return None
+
+def load_audio(audio: Union[str, Any], sample_rate: int = AUDIO_SAMPLE_RATE) -> Tuple[Any, int]:
+    """
+    오디오 파일 경로 또는 디코딩된 PCM 버퍼를 (y, sr) 형태로 반환
+    이미 디코딩된 버퍼는 다시 읽거나 리샘플링하지 않음
+    
+    Args:
+        audio: 오디오 파일 경로 또는 float32 PCM 버퍼
+        sample_rate: 샘플링 레이트 (버퍼인 경우 버퍼의 샘플링 레이트)
+        
+    Returns:
+        Tuple[np.ndarray, int]: 오디오 데이터와 샘플링 레이트
+    """
+    if isinstance(audio, (str, os.PathLike)):
+        import librosa
+        return librosa.load(audio, sr=sample_rate)
+    
+    return audio, sample_rate
+
+@traced("decode")
 def extract_audio_from_video(video_path: str) -> Optional[str]:
     """
     비디오에서 오디오 추출
@@ -41,12 +103,14 @@ def extract_audio_from_video(video_path: str) -> Optional[str]:
         logger.error(f"오디오 추출 오류: {str(e)}")
         return None
 
-def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
+@traced("audio_features")
+def process_audio_with_librosa(audio, sample_rate: int = AUDIO_SAMPLE_RATE) -> Dict[str, Any]:
     """
     Librosa를 사용한 오디오 분석
     
     Args:
-        audio_path: 오디오 파일 경로
+        audio: 오디오 파일 경로 또는 디코딩된 float32 PCM 버퍼
+        sample_rate: 샘플링 레이트 (기본값: 16000)
         
     Returns:
         Dict[str, Any]: 분석 결과
@@ -54,7 +118,12 @@ def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
     try:
         import librosa
         
-        y, sr = librosa.load(audio_path)
+        y, sr = load_audio(audio, sample_rate)
+        # 무음 제거 버퍼(VoicedAudio)면 발화 구간 통계를 원본 기준 변환표에서 가져옴
+        timeline = getattr(audio, "timeline", None)
+        if timeline is not None:
+            import numpy as np
+            y = y.view(np.ndarray)
         
         # 기본 음성 특성 추출
         mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
@@ -71,11 +140,15 @@ def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
             "duration": float(len(y) / sr),
             "sample_rate": int(sr),
             "voice_stability": min(1.0, max(0.0, 1.0 - abs(spectral_centroids.std() / spectral_centroids.mean()))),
-            "speaking_rate_wpm": estimate_speaking_rate(y, sr),
-            "volume_consistency": calculate_volume_consistency(y),
-            "fluency_score": calculate_fluency_score(y, sr)
+            "volume_consistency": calculate_volume_consistency(y)
         }
         
+        if timeline is None:
+            analysis_result["speaking_rate_wpm"] = estimate_speaking_rate(y, sr)
+            analysis_result["fluency_score"] = calculate_fluency_score(y, sr)
+        else:
+            analysis_result.update(speech_metrics_from_timeline(timeline))
+        
         return analysis_result
         
     except ImportError:
@@ -85,6 +158,27 @@ def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
         logger.error(f"Librosa 오디오 분석 오류: {str(e)}")
         return {"error": f"오디오 분석 실패: {str(e)}"}
 
+def speech_metrics_from_timeline(timeline) -> Dict[str, Any]:
+    """
+    VAD 변환표 기반 길이/발화 속도/유창성 지표
+    무음을 잘라낸 버퍼에서는 무음 비율을 잴 수 없으므로 원본 기준 발화 구간 통계로 계산 (추가 연산 없음)
+    
+    Args:
+        timeline: 무음 제거 버퍼의 변환표 (modules.common.vad.SpeechTimeline)
+        
+    Returns:
+        Dict[str, Any]: duration, speaking_rate_wpm, fluency_score 및 무음 통계
+    """
+    pauses = timeline.pause_stats()
+    return {
+        "duration": pauses["total_duration"],
+        "speaking_rate_wpm": max(60, min(200, (pauses["speech_duration"] / 60) * 150)),
+        "fluency_score": max(0.0, 1.0 - min(1.0, (1.0 - pauses["speech_ratio"]) * 2)),
+        "speech_ratio": pauses["speech_ratio"],
+        "pause_count": pauses["pause_count"],
+        "long_pause_count": pauses["long_pause_count"]
+    }
+
 def estimate_speaking_rate(audio_data, sample_rate):
     """
     말하기 속도 추정 (단위: WPM)
@@ -175,25 +269,33 @@ def calculate_fluency_score(audio_data, sample_rate):
     except Exception:
         return 0.5  # 기본값
 
-def transcribe_with_whisper(audio_path: str, language: str = "ko") -> Dict[str, Any]:
+_whisper_model = None
+
+def _get_whisper_model():
+    """transcribe_with_whisper용 음성 인식 백엔드 (최초 호출 시 한 번만 생성, 엔진: 환경 변수 ASR_BACKEND)"""
+    global _whisper_model
+    if _whisper_model is None:
+        from modules.asr_backend import create_asr_backend
+        _whisper_model = create_asr_backend("base")
+    return _whisper_model
+
+def transcribe_with_whisper(audio, language: str = "ko") -> Dict[str, Any]:
     """
     Whisper를 사용한 음성 인식
     
     Args:
-        audio_path: 오디오 파일 경로
+        audio: 오디오 파일 경로 또는 16kHz float32 PCM 버퍼
         language: 언어 코드 (기본값: "ko")
         
     Returns:
         Dict[str, Any]: 인식 결과
     """
     try:
-        import whisper
-        
-        # Whisper 모델 로드
-        model = whisper.load_model("base")
+        # 공용 모델 레지스트리의 Whisper 모델 (호출마다 다시 로드하지 않음)
+        model = _get_whisper_model()
         
         # 음성 인식
-        result = model.transcribe(audio_path, language=language)
+        result = model.transcribe(audio, language=language)
         
         return {
             "text": result["text"],
@@ -0,0 +1,54 @@
+"""
+영상 캐시 키 모듈
+스크립트 텍스트, 음성, 아바타, 제공자 파라미터로부터 프로세스/재시작과 무관하게 항상 같은 캐시 키 생성
+(내장 hash()는 프로세스마다 값이 달라 재시작이나 작업자 추가 시 캐시 전체가 무효화됨)
+
+- 스크립트는 유니코드 정규화(NFC)와 공백 정리 후 사용 → 표기만 다른 같은 문장은 같은 키
+- 키 규칙이 바뀌면 CACHE_KEY_VERSION을 올리고 migrate_cache_keys.py로 기존 캐시를 재색인
+"""
+import re
+import json
+import hashlib
+import unicodedata
+from typing import Any, Optional
+
+# 캐시 키 규칙 버전
+CACHE_KEY_VERSION = 1
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_script(text: Optional[str]) -> str:
+    """
+    캐시 키용 스크립트 정규화 (NFC + 연속 공백 하나로 + 앞뒤 공백 제거)
+
+    Args:
+        text: 스크립트 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    if not text:
+        return ""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+def video_cache_key(provider: str, script: str, video_type: Optional[str] = None, **params: Any) -> str:
+    """
+    영상 캐시 키 생성
+
+    Args:
+        provider: 영상 생성 제공자 (d_id, aistudios)
+        script: 영상 스크립트
+        video_type: 영상 유형 (interview, debate 등)
+        **params: 결과에 영향을 주는 값 (gender, phase, avatar, voice 등, None 값은 무시)
+
+    Returns:
+        str: sha256 캐시 키 (64자리 16진수)
+    """
+    payload = json.dumps({
+        "version": CACHE_KEY_VERSION,
+        "provider": provider,
+        "script": normalize_script(script),
+        "video_type": video_type,
+        "params": {name: value for name, value in params.items() if value is not None}
+    }, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,58 @@
+"""
+HTTP 유틸리티 모듈
+외부 영상 생성 API(D-ID, AIStudios) 호출에 공통으로 쓰는 연결 풀 세션과 폴링 간격 계산
+"""
+import os
+import logging
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 연결 풀 크기와 폴링 간격 (환경 변수로 조정 가능)
+HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", 16))
+RENDER_POLL_INITIAL_SECONDS = float(os.environ.get("RENDER_POLL_INITIAL_SECONDS", 2))
+RENDER_POLL_MAX_SECONDS = float(os.environ.get("RENDER_POLL_MAX_SECONDS", 15))
+RENDER_POLL_BACKOFF = float(os.environ.get("RENDER_POLL_BACKOFF", 1.5))
+
+def create_pooled_session(headers: Optional[dict] = None, pool_size: Optional[int] = None) -> requests.Session:
+    """
+    연결을 재사용하는 requests 세션 생성 (요청마다 TCP/TLS 연결을 새로 맺지 않음)
+
+    Args:
+        headers: 모든 요청에 붙일 기본 헤더
+        pool_size: 호스트별 최대 연결 수 (기본값: 환경 변수 HTTP_POOL_SIZE)
+
+    Returns:
+        requests.Session: 연결 풀 세션
+    """
+    pool_size = pool_size or HTTP_POOL_SIZE
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+def poll_delays(initial: Optional[float] = None, maximum: Optional[float] = None,
+                factor: Optional[float] = None) -> Iterator[float]:
+    """
+    렌더링 상태 확인 간격 (지수 백오프, 최대값에서 고정)
+
+    Args:
+        initial: 첫 확인까지의 대기 시간 (초)
+        maximum: 최대 대기 시간 (초)
+        factor: 증가 배수
+
+    Yields:
+        float: 다음 확인까지 대기할 시간 (초)
+    """
+    delay = initial or RENDER_POLL_INITIAL_SECONDS
+    maximum = maximum or RENDER_POLL_MAX_SECONDS
+    factor = factor or RENDER_POLL_BACKOFF
+    while True:
+        yield min(delay, maximum)
+        delay *= factor
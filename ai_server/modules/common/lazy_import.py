@@ -0,0 +1,68 @@
+"""
+지연 임포트 유틸리티
+torch, whisper, librosa, TTS 처럼 임포트만으로 수 초가 걸리는 모듈을 서버 시작 시점이 아니라
+처음 사용하는 시점에 임포트하여 HTTP 서버가 바로 포트를 열 수 있도록 함
+"""
+import sys
+import importlib
+import importlib.util
+import threading
+from typing import Any
+
+def is_module_available(name: str) -> bool:
+    """
+    모듈 설치 여부 확인 (모듈을 실제로 임포트하지 않음)
+
+    Args:
+        name: 모듈 이름 (예: "whisper", "TTS.api")
+
+    Returns:
+        bool: 설치 여부
+    """
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # 상위 패키지가 없거나 임포트 중 오류
+        return False
+
+class LazyModule:
+    """첫 속성 접근 시 실제 모듈을 임포트하는 대리 객체"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        """실제 모듈이 임포트되었는지 여부"""
+        return self._module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__") or attr in ("_name", "_module", "_lock"):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return f"<LazyModule {self._name} loaded={self.is_loaded}>"
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    지연 임포트 모듈 생성
+
+    Args:
+        name: 모듈 이름
+
+    Returns:
+        LazyModule: 첫 사용 시 임포트되는 모듈 대리 객체
+    """
+    return LazyModule(name)
@@ -0,0 +1,146 @@
+"""
+LLM 스트리밍 유틸리티
+OpenAI, Anthropic, Ollama 스트리밍 API에서 생성되는 텍스트 조각(delta)을
+도착하는 즉시 반환하는 제너레이터와 문장 단위 분리 함수 제공
+"""
+import os
+import re
+import json
+import logging
+from typing import Dict, Any, Generator, List, Optional, Tuple
+
+from .tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# Ollama 서버 주소
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+
+# 스트리밍 요청 타임아웃 (초) - 첫 토큰까지 대기 시간 기준
+LLM_STREAM_TIMEOUT = float(os.environ.get("LLM_STREAM_TIMEOUT", 60))
+
+# 문장 종료 부호 뒤의 공백 (문장 경계)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+@traced("llm_stream")
+def stream_openai(client, model: str, messages: List[Dict[str, str]],
+                  max_tokens: int = 500, temperature: float = 0.7) -> Generator[str, None, None]:
+    """
+    OpenAI Chat Completions 스트리밍
+
+    Args:
+        client: openai 모듈 또는 OpenAI 클라이언트
+        model: 모델명
+        messages: 대화 메시지 목록
+        max_tokens: 최대 토큰 수
+        temperature: 샘플링 온도
+
+    Yields:
+        str: 생성된 텍스트 조각
+    """
+    # openai>=1.0 (chat.completions) 과 이전 버전 (ChatCompletion) 모두 지원
+    if hasattr(client, "chat"):
+        create = client.chat.completions.create
+    else:
+        create = client.ChatCompletion.create
+
+    stream = create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=True
+    )
+
+    for chunk in stream:
+        if isinstance(chunk, dict):
+            choices = chunk.get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+        else:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+@traced("llm_stream")
+def stream_anthropic(client, model: str, messages: List[Dict[str, str]],
+                     max_tokens: int = 500, system: Optional[str] = None) -> Generator[str, None, None]:
+    """
+    Anthropic Messages 스트리밍
+
+    Args:
+        client: anthropic.Anthropic 클라이언트
+        model: 모델명
+        messages: 대화 메시지 목록
+        max_tokens: 최대 토큰 수
+        system: 시스템 프롬프트
+
+    Yields:
+        str: 생성된 텍스트 조각
+    """
+    kwargs = {"model": model, "max_tokens": max_tokens, "messages": messages}
+    if system:
+        kwargs["system"] = system
+
+    with client.messages.stream(**kwargs) as stream:
+        for text in stream.text_stream:
+            if text:
+                yield text
+
+@traced("llm_stream")
+def stream_ollama(prompt: str, model: str, max_tokens: int = 500,
+                  options: Optional[Dict[str, Any]] = None,
+                  host: Optional[str] = None, session=None) -> Generator[str, None, None]:
+    """
+    Ollama /api/generate 스트리밍 (NDJSON 응답을 줄 단위로 파싱)
+
+    Args:
+        prompt: 프롬프트
+        model: 모델명
+        max_tokens: 최대 생성 토큰 수
+        options: 추가 생성 옵션 (temperature, top_k 등)
+        host: Ollama 서버 주소 (기본값: 환경 변수 OLLAMA_HOST)
+        session: 재사용할 requests.Session (없으면 requests 모듈 사용)
+
+    Yields:
+        str: 생성된 텍스트 조각
+    """
+    import requests
+
+    generate_options = {"temperature": 0.7, "num_predict": max_tokens}
+    if options:
+        generate_options.update(options)
+
+    http = session or requests
+    response = http.post(
+        f"{host or OLLAMA_HOST}/api/generate",
+        json={"model": model, "prompt": prompt, "stream": True, "options": generate_options},
+        stream=True,
+        timeout=LLM_STREAM_TIMEOUT
+    )
+    try:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("error"):
+                raise RuntimeError(f"Ollama 오류: {chunk['error']}")
+            if chunk.get("response"):
+                yield chunk["response"]
+            if chunk.get("done"):
+                break
+    finally:
+        response.close()
+
+def pop_sentences(buffer: str) -> Tuple[List[str], str]:
+    """
+    버퍼에서 완성된 문장을 분리
+
+    Args:
+        buffer: 누적된 텍스트
+
+    Returns:
+        Tuple[List[str], str]: (완성된 문장 목록, 아직 끝나지 않은 나머지 텍스트)
+    """
+    parts = _SENTENCE_BOUNDARY.split(buffer)
+    return [part for part in parts[:-1] if part.strip()], parts[-1]
@@ -0,0 +1,462 @@
+"""
+미디어 캐시 공통 엔진
+아바타 영상, TTS 음성, 응답 캐시 등이 같은 규칙으로 용량/기간을 제한하도록 하는 캐시 엔진
+
+- 디렉토리 캐시: 키는 디렉토리 기준 상대 경로, 값은 파일 경로 (다른 프로세스가 만든 파일도 스윕 시 편입)
+- 메모리 캐시: 키 → 값, 크기는 sizeof 함수로 계산
+- 용량(바이트)/항목 수 한도를 넘으면 LRU 또는 LFU 순서로 제거, 보관 기간이 지나면 만료
+- 백그라운드 스위퍼 스레드 하나가 등록된 모든 캐시를 주기적으로 정리
+- 캐시별 hit/miss/eviction/expiration 지표 제공
+
+캐시별 설정은 환경 변수로 덮어쓸 수 있음 (NAME은 캐시 이름 대문자):
+MEDIA_CACHE_<NAME>_MAX_MB, MEDIA_CACHE_<NAME>_MAX_AGE_HOURS, MEDIA_CACHE_<NAME>_POLICY
+"""
+import os
+import time
+import fnmatch
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+EVICTION_POLICIES = ("lru", "lfu")
+
+# 스위퍼 실행 주기 (초)
+MEDIA_CACHE_SWEEP_INTERVAL = float(os.environ.get("MEDIA_CACHE_SWEEP_INTERVAL", 300))
+
+def _env_override(name: str, suffix: str) -> Optional[str]:
+    """캐시별 환경 변수 값 (예: MEDIA_CACHE_TTS_MAX_MB)"""
+    return os.environ.get(f"MEDIA_CACHE_{name.upper()}_{suffix}")
+
+def _default_sizeof(value: Any) -> int:
+    """메모리 캐시 값의 크기 추정"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return 1
+
+class _Entry:
+    """캐시 항목"""
+    __slots__ = ("key", "size", "created_at", "last_access", "hits", "value", "path")
+
+    def __init__(self, key: str, size: int, created_at: float, last_access: float,
+                 value: Any = None, path: Optional[str] = None):
+        self.key = key
+        self.size = size
+        self.created_at = created_at
+        self.last_access = last_access
+        self.hits = 0
+        self.value = value
+        self.path = path
+
+class MediaCache:
+    """용량/기간 제한 캐시 엔진"""
+
+    def __init__(self, name: str, directory: Optional[str] = None,
+                 max_bytes: Optional[int] = None, max_age_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, policy: str = "lru",
+                 pattern: Union[str, Sequence[str]] = "*", recursive: bool = False,
+                 sizeof: Optional[Callable[[Any], int]] = None,
+                 on_evict: Optional[Callable[[str, Optional[str]], None]] = None):
+        """
+        캐시 초기화
+
+        Args:
+            name: 캐시 이름 (지표 및 환경 변수 이름에 사용)
+            directory: 디렉토리 캐시 경로 (None이면 메모리 캐시)
+            max_bytes: 최대 용량 (바이트, None이면 제한 없음)
+            max_age_seconds: 최대 보관 기간 (초, None이면 제한 없음)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+            policy: 제거 정책 ('lru' 또는 'lfu')
+            pattern: 디렉토리 캐시에서 관리할 상대 경로 패턴 또는 패턴 목록 (예: '*.mp4', 'debates/*.mp4')
+            recursive: 하위 디렉토리까지 관리할지 여부
+            sizeof: 메모리 캐시 값의 크기 계산 함수
+            on_evict: 항목이 제거/만료될 때 호출되는 함수 (키, 파일 경로)
+        """
+        env_max_mb = _env_override(name, "MAX_MB")
+        env_max_age = _env_override(name, "MAX_AGE_HOURS")
+        policy = (_env_override(name, "POLICY") or policy).lower()
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"지원하지 않는 캐시 제거 정책: {policy}")
+
+        self.name = name
+        self.directory = os.path.abspath(directory) if directory else None
+        self.max_bytes = int(float(env_max_mb) * 1024 * 1024) if env_max_mb else max_bytes
+        self.max_age_seconds = float(env_max_age) * 3600 if env_max_age else max_age_seconds
+        self.max_entries = max_entries
+        self.policy = policy
+        self.patterns = (pattern,) if isinstance(pattern, str) else tuple(pattern)
+        self.recursive = recursive
+        self.sizeof = sizeof or _default_sizeof
+        self.on_evict = on_evict
+
+        self._entries: Dict[str, _Entry] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._metrics = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0,
+                         "expirations": 0, "evicted_bytes": 0}
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._scan_directory()
+
+        register_media_cache(self)
+
+    # ---------- 조회/저장 ----------
+
+    def path_for(self, key: str) -> str:
+        """디렉토리 캐시 키의 파일 경로"""
+        return os.path.join(self.directory, key)
+
+    def key_for(self, path: str) -> Optional[str]:
+        """파일 경로의 캐시 키 (캐시 디렉토리 밖이면 None)"""
+        if not self.directory:
+            return None
+        path = os.path.abspath(path)
+        try:
+            if os.path.commonpath([path, self.directory]) != self.directory:
+                return None
+        except ValueError:
+            # 드라이브가 다른 경로 (Windows)
+            return None
+        return os.path.relpath(path, self.directory)
+
+    def get(self, key: str) -> Any:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            디렉토리 캐시는 파일 경로, 메모리 캐시는 값 (없거나 만료되면 None)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.directory:
+                # 다른 프로세스가 저장한 파일
+                entry = self._adopt(key)
+
+            if entry is not None and self._is_expired(entry, now):
+                self._drop(entry, "expirations")
+                entry = None
+            elif entry is not None and entry.path and not os.path.exists(entry.path):
+                self._forget(entry)
+                entry = None
+
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+
+            self._record_hit(entry, now)
+            return entry.path if self.directory else entry.value
+
+    def touch(self, key: str) -> bool:
+        """
+        외부에서 조회한 항목의 사용 기록 (조회 결과는 반환하지 않음)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bool: 항목 존재 여부
+        """
+        return self.get(key) is not None
+
+    def put(self, key: str, value: Any = None, size: Optional[int] = None) -> Any:
+        """
+        캐시 저장 (디렉토리 캐시는 파일을 먼저 path_for(key)에 써 둔 뒤 호출)
+
+        Args:
+            key: 캐시 키
+            value: 메모리 캐시 값 (디렉토리 캐시는 무시)
+            size: 항목 크기 (기본값: 파일 크기 또는 sizeof(value))
+
+        Returns:
+            디렉토리 캐시는 파일 경로, 메모리 캐시는 값
+        """
+        now = time.time()
+        path = None
+        if self.directory:
+            path = self.path_for(key)
+            if size is None:
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    logger.warning(f"[{self.name}] 캐시 파일이 없어 저장하지 않음: {path}")
+                    return None
+            value = None
+        elif size is None:
+            size = self.sizeof(value)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = _Entry(key, size, now, now, value=value, path=path)
+            self._bytes += size
+            self._metrics["stores"] += 1
+            self._enforce_limits(protect=key)
+
+        return path if self.directory else value
+
+    def discard(self, key: str) -> bool:
+        """
+        항목 삭제 (디렉토리 캐시는 파일도 삭제)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bool: 삭제 여부
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._forget(entry)
+            self._delete_file(entry)
+            return True
+
+    def clear(self, older_than: Optional[float] = None) -> int:
+        """
+        항목 일괄 삭제
+
+        Args:
+            older_than: 지정한 시간(초)보다 오래된 항목만 삭제 (None이면 전체)
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        now = time.time()
+        with self._lock:
+            if self.directory:
+                self._scan_directory()
+            targets = [entry for entry in self._entries.values()
+                       if older_than is None or now - entry.created_at > older_than]
+            for entry in targets:
+                self._forget(entry)
+                self._delete_file(entry)
+        logger.info(f"[{self.name}] 캐시 {len(targets)}개 삭제")
+        return len(targets)
+
+    # ---------- 정리 ----------
+
+    def sweep(self) -> Dict[str, int]:
+        """
+        만료 항목 제거 및 용량 한도 적용 (디렉토리 캐시는 파일 목록 재확인)
+
+        Returns:
+            Dict[str, int]: expired, evicted 건수
+        """
+        now = time.time()
+        with self._lock:
+            if self.directory:
+                self._scan_directory()
+
+            expirations_before = self._metrics["expirations"]
+            evictions_before = self._metrics["evictions"]
+
+            for entry in [e for e in self._entries.values() if self._is_expired(e, now)]:
+                self._drop(entry, "expirations")
+            self._enforce_limits()
+
+            return {
+                "expired": self._metrics["expirations"] - expirations_before,
+                "evicted": self._metrics["evictions"] - evictions_before
+            }
+
+    def metrics(self) -> Dict[str, Any]:
+        """캐시 지표 (hit/miss/eviction 등)"""
+        with self._lock:
+            lookups = self._metrics["hits"] + self._metrics["misses"]
+            return {
+                **self._metrics,
+                "hit_ratio": round(self._metrics["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_age_seconds": self.max_age_seconds,
+                "policy": self.policy,
+                "directory": self.directory
+            }
+
+    def _is_expired(self, entry: _Entry, now: float) -> bool:
+        return self.max_age_seconds is not None and now - entry.created_at > self.max_age_seconds
+
+    def _record_hit(self, entry: _Entry, now: float):
+        entry.hits += 1
+        entry.last_access = now
+        self._metrics["hits"] += 1
+        if entry.path:
+            # 최근 사용 시각을 atime에 기록하여 재시작/다른 프로세스에서도 LRU 유지 (생성 시각인 mtime은 유지)
+            try:
+                os.utime(entry.path, (now, entry.created_at))
+            except OSError:
+                pass
+
+    def _enforce_limits(self, protect: Optional[str] = None):
+        """용량/항목 수 한도를 넘으면 정책 순서대로 제거 (잠금 상태에서 호출)"""
+        def over_limit():
+            return ((self.max_bytes is not None and self._bytes > self.max_bytes) or
+                    (self.max_entries is not None and len(self._entries) > self.max_entries))
+
+        if not over_limit():
+            return
+
+        if self.policy == "lfu":
+            order = sorted(self._entries.values(), key=lambda e: (e.hits, e.last_access))
+        else:
+            order = sorted(self._entries.values(), key=lambda e: e.last_access)
+
+        for entry in order:
+            if not over_limit():
+                break
+            if entry.key == protect:
+                continue
+            self._drop(entry, "evictions")
+
+    def _drop(self, entry: _Entry, reason: str):
+        """제거/만료 처리 (잠금 상태에서 호출)"""
+        self._forget(entry)
+        self._delete_file(entry)
+        self._metrics[reason] += 1
+        if reason == "evictions":
+            self._metrics["evicted_bytes"] += entry.size
+        if self.on_evict:
+            try:
+                self.on_evict(entry.key, entry.path)
+            except Exception as e:
+                logger.warning(f"[{self.name}] 캐시 제거 콜백 오류: {str(e)}")
+
+    def _forget(self, entry: _Entry):
+        """항목 기록만 삭제 (잠금 상태에서 호출)"""
+        if self._entries.pop(entry.key, None) is not None:
+            self._bytes -= entry.size
+
+    def _delete_file(self, entry: _Entry):
+        if entry.path and os.path.exists(entry.path):
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                logger.warning(f"[{self.name}] 캐시 파일 삭제 실패: {entry.path} - {str(e)}")
+
+    # ---------- 디렉토리 스캔 ----------
+
+    def _matches(self, key: str) -> bool:
+        """관리 대상 파일인지 확인 (상대 경로를 / 구분자로 비교)"""
+        relative = key.replace(os.sep, "/")
+        return any(fnmatch.fnmatchcase(relative, pattern) for pattern in self.patterns)
+
+    def _adopt(self, key: str) -> Optional[_Entry]:
+        """디스크에 있지만 기록되지 않은 파일을 항목으로 등록 (잠금 상태에서 호출)"""
+        path = self.path_for(key)
+        if not self._matches(key):
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entry = _Entry(key, stat.st_size, stat.st_mtime, max(stat.st_atime, stat.st_mtime), path=path)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        return entry
+
+    def _scan_directory(self):
+        """디렉토리 파일 목록과 기록 동기화 (잠금 상태 또는 초기화 중 호출)"""
+        found = set()
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                key = os.path.relpath(os.path.join(root, filename), self.directory)
+                if not self._matches(key):
+                    continue
+                found.add(key)
+                if key not in self._entries:
+                    self._adopt(key)
+            if not self.recursive:
+                break
+
+        for key in [k for k in self._entries if k not in found]:
+            self._forget(self._entries[key])
+
+# ---------- 공용 스위퍼 ----------
+
+_registry = weakref.WeakSet()
+_registry_lock = threading.Lock()
+_sweeper_thread = None
+_sweeper_stop = threading.Event()
+
+def register_media_cache(cache: MediaCache):
+    """캐시를 공용 스위퍼에 등록하고 스위퍼가 없으면 시작"""
+    with _registry_lock:
+        _registry.add(cache)
+    start_media_cache_sweeper()
+
+def _sweep_loop(interval: float):
+    while not _sweeper_stop.wait(interval):
+        sweep_all_media_caches()
+
+def sweep_all_media_caches() -> Dict[str, Dict[str, int]]:
+    """
+    등록된 모든 캐시 정리
+
+    Returns:
+        Dict[str, Dict[str, int]]: 캐시 이름 → expired/evicted 건수
+    """
+    with _registry_lock:
+        caches = list(_registry)
+
+    results = {}
+    for cache in caches:
+        try:
+            results[cache.name] = cache.sweep()
+        except Exception as e:
+            logger.error(f"[{cache.name}] 캐시 정리 오류: {str(e)}")
+    if any(r["expired"] or r["evicted"] for r in results.values()):
+        logger.info(f"미디어 캐시 정리 완료: {results}")
+    return results
+
+def start_media_cache_sweeper(interval: Optional[float] = None):
+    """
+    백그라운드 스위퍼 스레드 시작 (이미 실행 중이면 무시)
+
+    Args:
+        interval: 정리 주기 (초, 기본값: 환경 변수 MEDIA_CACHE_SWEEP_INTERVAL)
+    """
+    global _sweeper_thread
+
+    with _registry_lock:
+        if _sweeper_thread is not None and _sweeper_thread.is_alive():
+            return
+        _sweeper_stop.clear()
+        _sweeper_thread = threading.Thread(target=_sweep_loop, args=(interval or MEDIA_CACHE_SWEEP_INTERVAL,),
+                                           name="media-cache-sweeper", daemon=True)
+        _sweeper_thread.start()
+
+def stop_media_cache_sweeper():
+    """백그라운드 스위퍼 스레드 종료"""
+    _sweeper_stop.set()
+
+def get_media_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    등록된 모든 캐시의 지표
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 캐시 이름 → 지표 (같은 이름이 여러 개면 #번호 추가)
+    """
+    with _registry_lock:
+        caches = list(_registry)
+
+    metrics = {}
+    for cache in caches:
+        name = cache.name
+        suffix = 2
+        while name in metrics:
+            name = f"{cache.name}#{suffix}"
+            suffix += 1
+        metrics[name] = cache.metrics()
+    return metrics
@@ -0,0 +1,367 @@
+"""
+프로세스 공용 모델 레지스트리
+Whisper, Coqui TTS 등 큰 모델을 (모델 계열, 크기/이름, 장치, 정밀도) 키마다 한 번만 로드하여
+여러 모듈이 공유하도록 관리
+
+- acquire()는 참조 카운트가 있는 핸들을 즉시 반환하고, 실제 로드는 첫 사용 시점에 수행
+- 핸들은 모델 속성/메서드 접근을 그대로 전달하므로 기존 model.transcribe() 호출 코드를 바꿀 필요 없음
+- 마지막 핸들이 반납되거나 일정 시간(MODEL_IDLE_UNLOAD_SECONDS) 사용되지 않은 모델은 메모리에서 해제
+  (해제 후 다시 사용하면 자동으로 다시 로드)
+"""
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 마지막 사용 후 모델을 해제하기까지의 시간 (초, 0이면 해제하지 않음)
+MODEL_IDLE_UNLOAD_SECONDS = float(os.environ.get("MODEL_IDLE_UNLOAD_SECONDS", 1800))
+# Whisper 모델 장치 (비우면 CUDA 사용 가능 여부로 자동 선택)
+WHISPER_DEVICE = os.environ.get("WHISPER_DEVICE") or None
+
+# faster-whisper(CTranslate2) CPU 스레드 수 (0이면 라이브러리 기본값)
+ASR_CPU_THREADS = int(os.environ.get("ASR_CPU_THREADS", 0))
+
+# 모델 계열
+WHISPER = "whisper"
+FASTER_WHISPER = "faster_whisper"
+TTS_MODEL = "tts"
+
+ModelKey = Tuple[str, str, Optional[str], Optional[str]]
+
+def _load_whisper(size: str, device: Optional[str], dtype: Optional[str]):
+    """openai-whisper 모델 로드 (dtype이 int8이면 CPU에서 Linear 계층을 동적 양자화)"""
+    import whisper
+    if dtype == "int8":
+        return _quantize_whisper_int8(whisper.load_model(size, device="cpu"))
+    model = whisper.load_model(size, device=device)
+    if dtype == "float16":
+        model = model.half()
+    return model
+
+def _quantize_whisper_int8(model):
+    """
+    Whisper 모델의 Linear 계층을 int8 동적 양자화 (가중치 int8, 활성값은 추론 시 양자화)
+    whisper.model.Linear는 nn.Linear 하위 클래스라 quantize_dynamic이 건너뛰므로 nn.Linear로 바꾼 뒤 양자화
+    (하위 클래스는 fp16 실행을 위한 dtype 변환만 추가하므로 CPU fp32 실행에는 차이 없음)
+    """
+    import torch
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+    return torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+
+def _load_faster_whisper(size: str, device: Optional[str], dtype: Optional[str]):
+    """faster-whisper(CTranslate2) 모델 로드 (기본값: CPU int8)"""
+    from faster_whisper import WhisperModel
+    return WhisperModel(size, device=device or "cpu", compute_type=dtype or "int8", cpu_threads=ASR_CPU_THREADS)
+
+def _load_tts(model_name: str, device: Optional[str], dtype: Optional[str]):
+    """Coqui TTS 모델 로드"""
+    from TTS.api import TTS
+    model = TTS(model_name)
+    if device:
+        model = model.to(device)
+    return model
+
+class _Entry:
+    """레지스트리 항목 (로드된 모델, 참조 카운트, 마지막 사용 시각)"""
+    __slots__ = ("model", "refs", "last_used", "load_seconds", "loads", "lock")
+
+    def __init__(self):
+        self.model = None
+        self.refs = 0
+        self.last_used = time.monotonic()
+        self.load_seconds = 0.0
+        self.loads = 0
+        # 같은 모델을 동시에 두 번 로드하지 않도록 항목별 로드 잠금
+        self.lock = threading.Lock()
+
+class ModelHandle:
+    """공유 모델 참조 (첫 사용 시 로드, release()로 반납)"""
+
+    def __init__(self, registry: "ModelRegistry", key: ModelKey):
+        self._registry = registry
+        self._key = key
+        self._released = False
+
+    @property
+    def key(self) -> ModelKey:
+        return self._key
+
+    @property
+    def loaded(self) -> bool:
+        """모델이 현재 메모리에 로드되어 있는지 여부"""
+        return self._registry.is_loaded(self._key)
+
+    def get(self):
+        """실제 모델 객체 반환 (로드되지 않았으면 로드)"""
+        if self._released:
+            raise RuntimeError(f"반납된 모델 핸들입니다: {self._key}")
+        return self._registry._get_model(self._key)
+
+    def release(self):
+        """핸들 반납 (같은 핸들을 여러 번 반납해도 한 번만 반영)"""
+        if not self._released:
+            self._released = True
+            self._registry._release(self._key)
+
+    def __getattr__(self, name: str):
+        # 핸들에 없는 속성은 모델로 전달 (첫 접근 시 모델 로드)
+        if name.startswith("__") or name in ("_registry", "_key", "_released"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def __repr__(self):
+        family, name, device, dtype = self._key
+        return f"<ModelHandle {family}:{name} device={device} dtype={dtype} loaded={self.loaded}>"
+
+class ModelRegistry:
+    """(모델 계열, 크기/이름, 장치, 정밀도) 키별 공유 모델 관리자"""
+
+    def __init__(self, idle_unload_seconds: Optional[float] = None):
+        """
+        레지스트리 초기화
+
+        Args:
+            idle_unload_seconds: 마지막 사용 후 모델을 해제하기까지의 시간 (기본값: 환경 변수 MODEL_IDLE_UNLOAD_SECONDS)
+        """
+        self.idle_unload_seconds = MODEL_IDLE_UNLOAD_SECONDS if idle_unload_seconds is None else idle_unload_seconds
+        self._loaders: Dict[str, Callable[[str, Optional[str], Optional[str]], Any]] = {
+            WHISPER: _load_whisper,
+            FASTER_WHISPER: _load_faster_whisper,
+            TTS_MODEL: _load_tts,
+        }
+        self._unload_listeners: List[Callable[[ModelKey, Any], None]] = []
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    def register_loader(self, family: str, loader: Callable[[str, Optional[str], Optional[str]], Any]):
+        """
+        모델 계열 로더 등록
+
+        Args:
+            family: 모델 계열 이름
+            loader: (크기/이름, 장치, 정밀도) → 모델 객체
+        """
+        self._loaders[family] = loader
+
+    def add_unload_listener(self, listener: Callable[[ModelKey, Any], None]):
+        """모델 해제 시 호출할 함수 등록 (모델을 참조하는 부가 객체 정리용)"""
+        self._unload_listeners.append(listener)
+
+    def acquire(self, family: str, name: str, device: Optional[str] = None,
+                dtype: Optional[str] = None) -> ModelHandle:
+        """
+        공유 모델 핸들 획득 (모델은 첫 사용 시 로드)
+
+        Args:
+            family: 모델 계열 (whisper, tts 등)
+            name: 모델 크기 또는 이름 (예: "base", "tts_models/...")
+            device: 장치 (None이면 로더 기본값)
+            dtype: 정밀도 (None이면 로더 기본값)
+
+        Returns:
+            ModelHandle: 공유 모델 핸들
+        """
+        if family not in self._loaders:
+            raise ValueError(f"등록되지 않은 모델 계열: {family}")
+
+        if family == WHISPER and device is None:
+            # int8 양자화 모델은 CPU 전용
+            device = "cpu" if dtype == "int8" else WHISPER_DEVICE
+        key = (family, str(name), device, dtype)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            entry.refs += 1
+            entry.last_used = time.monotonic()
+        self._start_reaper()
+        return ModelHandle(self, key)
+
+    def is_loaded(self, key: ModelKey) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.model is not None
+
+    def unload_idle(self, idle_seconds: Optional[float] = None) -> int:
+        """
+        일정 시간 사용되지 않은 모델 해제 (핸들은 유지되어 다음 사용 시 다시 로드)
+
+        Args:
+            idle_seconds: 기준 시간 (기본값: 레지스트리 설정값)
+
+        Returns:
+            int: 해제한 모델 수
+        """
+        idle_seconds = self.idle_unload_seconds if idle_seconds is None else idle_seconds
+        now = time.monotonic()
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if entry.model is not None and now - entry.last_used >= idle_seconds]
+        return sum(1 for key in keys if self._unload(key, idle_seconds))
+
+    def stats(self) -> Dict[str, Any]:
+        """로드된 모델과 참조 수, 로드 시간 통계"""
+        now = time.monotonic()
+        with self._lock:
+            models = [
+                {
+                    "family": key[0], "name": key[1], "device": key[2], "dtype": key[3],
+                    "loaded": entry.model is not None,
+                    "refs": entry.refs,
+                    "loads": entry.loads,
+                    "load_seconds": round(entry.load_seconds, 2),
+                    "idle_seconds": round(now - entry.last_used, 1)
+                }
+                for key, entry in self._entries.items()
+            ]
+        return {
+            "loaded": sum(1 for m in models if m["loaded"]),
+            "idle_unload_seconds": self.idle_unload_seconds,
+            "models": models
+        }
+
+    def _get_model(self, key: ModelKey):
+        """모델 반환 (로드되지 않았으면 로드, 같은 모델의 동시 로드는 한 번만 실행)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # 마지막 참조 반납과 동시에 사용된 경우 - 항목 복원
+                entry = self._entries[key] = _Entry()
+            entry.last_used = time.monotonic()
+            model = entry.model
+        if model is not None:
+            return model
+
+        with entry.lock:
+            if entry.model is None:
+                family, name, device, dtype = key
+                start = time.monotonic()
+                logger.info(f"모델 로드 시작: {family}:{name} (장치: {device or '자동'}, 정밀도: {dtype or '기본'})")
+                entry.model = self._loaders[family](name, device, dtype)
+                entry.load_seconds = time.monotonic() - start
+                entry.loads += 1
+                logger.info(f"모델 로드 완료: {family}:{name} ({entry.load_seconds:.1f}초)")
+            entry.last_used = time.monotonic()
+            return entry.model
+
+    def _release(self, key: ModelKey):
+        """참조 반납 (마지막 참조가 반납되면 모델 해제)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs = max(0, entry.refs - 1)
+            if entry.refs > 0:
+                return
+            del self._entries[key]
+            model = entry.model
+        if model is not None:
+            self._notify_unload(key, model)
+
+    def _unload(self, key: ModelKey, idle_seconds: float) -> bool:
+        """유휴 모델 해제 (해제 직전에 다시 사용되었으면 유지)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.model is None or time.monotonic() - entry.last_used < idle_seconds:
+                return False
+            model, entry.model = entry.model, None
+        self._notify_unload(key, model)
+        return True
+
+    def _notify_unload(self, key: ModelKey, model: Any):
+        """해제 알림 (진행 중인 추론은 모델 참조를 들고 있으므로 끝난 뒤 메모리가 회수됨)"""
+        logger.info(f"모델 해제: {key[0]}:{key[1]}")
+        for listener in self._unload_listeners:
+            try:
+                listener(key, model)
+            except Exception as e:
+                logger.warning(f"모델 해제 후처리 실패: {str(e)}")
+
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def _start_reaper(self):
+        """유휴 모델 정리 스레드 시작 (최초 1회)"""
+        if self._reaper is not None or self.idle_unload_seconds <= 0:
+            return
+        with self._lock:
+            if self._reaper is not None:
+                return
+            interval = min(60.0, max(1.0, self.idle_unload_seconds / 2))
+
+            def run():
+                while True:
+                    time.sleep(interval)
+                    try:
+                        self.unload_idle()
+                    except Exception as e:
+                        logger.warning(f"유휴 모델 정리 실패: {str(e)}")
+
+            self._reaper = threading.Thread(target=run, name="model-reaper", daemon=True)
+            self._reaper.start()
+
+def unwrap_model(model: Any) -> Any:
+    """핸들이면 실제 모델 객체, 아니면 그대로 반환"""
+    if isinstance(model, ModelHandle):
+        return model.get()
+    return model
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """
+    프로세스 공용 모델 레지스트리 반환 (최초 호출 시 생성)
+
+    Returns:
+        ModelRegistry: 공용 레지스트리
+    """
+    global _default_registry
+
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = ModelRegistry()
+    return _default_registry
+
+def acquire_model(family: str, name: str, device: Optional[str] = None, dtype: Optional[str] = None) -> ModelHandle:
+    """공용 레지스트리에서 모델 핸들 획득"""
+    return get_model_registry().acquire(family, name, device, dtype)
+
+_tts_catalog = None
+_tts_catalog_lock = threading.Lock()
+
+def list_tts_models() -> List[str]:
+    """
+    Coqui TTS 모델 이름 목록 (프로세스에서 한 번만 조회)
+
+    Returns:
+        List[str]: 모델 이름 목록
+    """
+    global _tts_catalog
+
+    with _tts_catalog_lock:
+        if _tts_catalog is None:
+            from TTS.api import TTS
+            models = TTS().list_models()
+            # 버전에 따라 ModelManager 객체를 반환하는 경우
+            if hasattr(models, "list_models"):
+                models = models.list_models()
+            _tts_catalog = list(models)
+        return list(_tts_catalog)
@@ -0,0 +1,82 @@
+"""
+OpenFace CSV 로더
+FeatureExtraction 출력 CSV를 열 이름 → float32 배열 형태의 열 기반 구조로 읽어
+프레임별 딕셔너리를 만들지 않고 벡터 연산으로 통계를 계산할 수 있도록 함
+"""
+import re
+import logging
+import warnings
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# AU 강도 열 이름 (예: AU01_r)
+_AU_INTENSITY_COLUMN = re.compile(r'^AU\d{2}_r$')
+
+def load_openface_csv(csv_path: str) -> Dict[str, np.ndarray]:
+    """
+    OpenFace CSV를 열 기반 구조로 읽기
+
+    Args:
+        csv_path: FeatureExtraction 출력 CSV 경로
+
+    Returns:
+        Dict[str, np.ndarray]: 열 이름 → float32 배열 (프레임 수 길이)
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        # OpenFace 헤더는 ", " 구분이라 공백 제거 필요
+        header = [name.strip() for name in f.readline().split(',')]
+        with warnings.catch_warnings():
+            # 헤더만 있는 CSV (얼굴 미검출) 경고 무시
+            warnings.simplefilter("ignore", UserWarning)
+            data = np.loadtxt(f, delimiter=',', dtype=np.float32, ndmin=2)
+
+    if data.size == 0:
+        return {name: np.zeros(0, dtype=np.float32) for name in header if name}
+
+    # 열 단위 접근이 빠르도록 전치 후 연속 메모리로 복사
+    data = np.ascontiguousarray(data.T)
+    return {name: data[i] for i, name in enumerate(header) if name}
+
+def frame_count(columns: Dict[str, np.ndarray]) -> int:
+    """프레임 수"""
+    return len(next(iter(columns.values()))) if columns else 0
+
+def column(columns: Dict[str, np.ndarray], name: str) -> np.ndarray:
+    """열 조회 (없는 열은 0으로 채운 배열 반환)"""
+    values = columns.get(name)
+    if values is None:
+        return np.zeros(frame_count(columns), dtype=np.float32)
+    return values
+
+def select_frames(columns: Dict[str, np.ndarray], mask: np.ndarray) -> Dict[str, np.ndarray]:
+    """마스크에 해당하는 프레임만 선택"""
+    return {name: values[mask] for name, values in columns.items()}
+
+def successful_frames(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """얼굴 검출에 성공한 프레임만 선택 (success 열이 없으면 전체)"""
+    if "success" not in columns:
+        return columns
+    return select_frames(columns, columns["success"] >= 1.0)
+
+def au_intensity_columns(columns: Dict[str, np.ndarray]) -> List[str]:
+    """AU 강도 열 이름 목록 (AU01_r ~ AU45_r)"""
+    return sorted(name for name in columns if _AU_INTENSITY_COLUMN.match(name))
+
+def mean_frame_change(columns: Dict[str, np.ndarray], names: List[str]) -> float:
+    """
+    연속 프레임 간 변화량(유클리드 거리)의 평균
+
+    Args:
+        columns: 열 기반 데이터
+        names: 하나의 벡터를 이루는 열 이름 목록 (예: gaze_0_x, gaze_0_y, gaze_0_z)
+
+    Returns:
+        float: 평균 변화량 (프레임이 2개 미만이면 0.0)
+    """
+    if frame_count(columns) < 2:
+        return 0.0
+    vectors = np.stack([column(columns, name) for name in names], axis=1)
+    return float(np.linalg.norm(np.diff(vectors, axis=0), axis=1).mean())
@@ -0,0 +1,402 @@
+"""
+세션 상태 저장소
+토론/면접 세션 상태를 프로세스 메모리 밖에 보관하여 여러 작업자 프로세스 중 어느 곳에서든 세션을 이어서 처리
+
+- 메모리: 최근 사용 세션만 LRU로 보관 (열린 세션이 수천 개여도 메모리 사용량 고정)
+- 영구 저장: 로컬 SQLite(WAL 모드) 백엔드, 세션 상태는 JSON으로 저장
+- 다른 프로세스가 갱신한 세션은 버전 비교로 감지하여 다시 읽음
+- update()는 읽은 버전과 같을 때만 저장(compare-and-set)하고, 다른 작업자가 먼저 갱신했으면 다시 읽어 재시도
+- 마지막 갱신 후 유효 기간이 지난 세션은 주기적으로 삭제
+"""
+import os
+import copy
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 저장소 설정 (환경 변수로 조정 가능)
+SESSION_STORE_BACKEND = os.environ.get("SESSION_STORE_BACKEND", "sqlite")  # sqlite, memory
+SESSION_STORE_PATH = os.environ.get(
+    "SESSION_STORE_PATH", os.path.join(tempfile.gettempdir(), "veriview_sessions", "sessions.db")
+)
+SESSION_CACHE_SIZE = int(os.environ.get("SESSION_CACHE_SIZE", 256))
+SESSION_TTL_SECONDS = float(os.environ.get("SESSION_TTL_SECONDS", 24 * 3600))
+# 만료 세션 정리 주기 (초)
+SESSION_PRUNE_INTERVAL = 300
+# update() 버전 충돌 시 최대 시도 횟수
+SESSION_UPDATE_RETRIES = int(os.environ.get("SESSION_UPDATE_RETRIES", 5))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    namespace TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (namespace, updated_at);
+"""
+
+class SessionConflictError(Exception):
+    """다른 작업자가 먼저 세션을 갱신하여 버전 비교 저장이 실패한 경우 발생"""
+    pass
+
+def _json_default(value: Any) -> Any:
+    """JSON으로 바로 바꿀 수 없는 값 변환 (numpy 스칼라/배열 등)"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+class SQLiteSessionBackend:
+    """SQLite 기반 세션 저장 백엔드 (같은 파일을 여러 프로세스가 공유)"""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        백엔드 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로 (기본값: 환경 변수 SESSION_STORE_PATH)
+        """
+        self.db_path = db_path or SESSION_STORE_PATH
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (최초 호출 시 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def version(self, namespace: str, session_id: str) -> Optional[int]:
+        """저장된 세션 버전 (없으면 None)"""
+        row = self._connect().execute(
+            "SELECT version FROM sessions WHERE namespace = ? AND session_id = ?", (namespace, session_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def load(self, namespace: str, session_id: str) -> Optional[Tuple[int, str, float]]:
+        """저장된 세션 (버전, JSON 데이터, 갱신 시각) 조회"""
+        return self._connect().execute(
+            "SELECT version, data, updated_at FROM sessions WHERE namespace = ? AND session_id = ?",
+            (namespace, session_id)
+        ).fetchone()
+
+    def save(self, namespace: str, session_id: str, data: str,
+             expected_version: Optional[int] = None) -> Optional[int]:
+        """
+        세션 저장 후 새 버전 반환
+
+        Args:
+            namespace: 저장소 이름
+            session_id: 세션 ID
+            data: JSON 데이터
+            expected_version: 저장된 버전이 이 값일 때만 저장 (0이면 세션이 없을 때만, None이면 무조건 upsert)
+
+        Returns:
+            Optional[int]: 새 버전 (저장된 버전이 expected_version과 달라 저장하지 않았으면 None)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            if expected_version is None:
+                conn.execute(
+                    """
+                    INSERT INTO sessions (namespace, session_id, data, version, updated_at)
+                    VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT (namespace, session_id) DO UPDATE SET
+                        data = excluded.data,
+                        version = sessions.version + 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    (namespace, session_id, data, now)
+                )
+            elif expected_version == 0:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO sessions (namespace, session_id, data, version, updated_at)
+                    VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT (namespace, session_id) DO NOTHING
+                    """,
+                    (namespace, session_id, data, now)
+                )
+                if cursor.rowcount == 0:
+                    return None
+            else:
+                cursor = conn.execute(
+                    """
+                    UPDATE sessions SET data = ?, version = version + 1, updated_at = ?
+                    WHERE namespace = ? AND session_id = ? AND version = ?
+                    """,
+                    (data, now, namespace, session_id, expected_version)
+                )
+                if cursor.rowcount == 0:
+                    return None
+            row = conn.execute("SELECT version FROM sessions WHERE namespace = ? AND session_id = ?",
+                               (namespace, session_id)).fetchone()
+        return row[0]
+
+    def delete(self, namespace: str, session_id: str) -> bool:
+        """세션 삭제"""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM sessions WHERE namespace = ? AND session_id = ?",
+                                  (namespace, session_id))
+        return cursor.rowcount > 0
+
+    def count(self, namespace: str) -> int:
+        """저장된 세션 수"""
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM sessions WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+
+    def prune(self, namespace: str, updated_before: float) -> int:
+        """지정 시각 이전에 마지막으로 갱신된 세션 삭제"""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM sessions WHERE namespace = ? AND updated_at < ?",
+                                  (namespace, updated_before))
+        return cursor.rowcount
+
+class SessionStore:
+    """LRU 메모리 캐시 + 영구 저장 백엔드로 구성된 세션 저장소"""
+
+    def __init__(self, name: str, backend: Any = "default", max_cached: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        """
+        세션 저장소 초기화
+
+        Args:
+            name: 저장소 이름 (백엔드 안의 네임스페이스)
+            backend: 영구 저장 백엔드 (None이면 메모리 전용, 기본값: 환경 변수 SESSION_STORE_BACKEND)
+            max_cached: 메모리에 보관할 최대 세션 수
+            ttl_seconds: 마지막 갱신 후 세션 유효 기간 (초)
+        """
+        if backend == "default":
+            backend = get_default_session_backend()
+
+        self.name = name
+        self.backend = backend
+        self.max_cached = max_cached or SESSION_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds or SESSION_TTL_SECONDS
+
+        # 세션 ID → (버전, 상태, 갱신 시각)
+        self._cache: "OrderedDict[str, Tuple[int, Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._last_prune = 0.0
+        self._stats = {"hits": 0, "loads": 0, "misses": 0, "evictions": 0, "conflicts": 0}
+
+    def get(self, session_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        세션 상태 조회
+        반환된 상태를 수정한 뒤에는 put()으로 저장해야 다른 작업자에도 반영됨
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 세션 상태 (없거나 만료되면 None)
+        """
+        with self._lock:
+            return self._entry(str(session_id))[1]
+
+    def put(self, session_id: Any, state: Dict[str, Any]):
+        """
+        세션 상태 저장 (영구 저장 후 메모리 캐시 갱신, 다른 작업자의 갱신 여부와 무관하게 덮어씀)
+
+        Args:
+            session_id: 세션 ID
+            state: 세션 상태 (JSON으로 저장 가능한 값)
+        """
+        with self._lock:
+            self._save(str(session_id), state)
+
+    def update(self, session_id: Any, mutate: Callable[[Dict[str, Any]], Any],
+               default: Optional[Callable[[], Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        세션 상태 조회 → 수정 → 저장
+        읽은 버전이 그대로일 때만 저장하고, 그 사이 다른 작업자가 갱신했으면 최신 상태를 다시 읽어 mutate를 다시 적용
+
+        Args:
+            session_id: 세션 ID
+            mutate: 상태를 직접 수정하는 함수 (충돌 시 여러 번 호출될 수 있음)
+            default: 세션이 없을 때 초기 상태를 만드는 함수 (None이면 세션이 없을 때 아무것도 하지 않음)
+
+        Returns:
+            Optional[Dict[str, Any]]: 수정된 상태 (세션이 없고 default도 없으면 None)
+
+        Raises:
+            SessionConflictError: SESSION_UPDATE_RETRIES번 모두 버전 충돌한 경우
+        """
+        session_id = str(session_id)
+        with self._lock:
+            for _ in range(SESSION_UPDATE_RETRIES):
+                version, state = self._entry(session_id)
+                if state is None:
+                    if default is None:
+                        return None
+                    state = default()
+                else:
+                    # 저장이 충돌하면 캐시된 상태가 바뀌지 않도록 복사본을 수정
+                    state = copy.deepcopy(state)
+                mutate(state)
+                try:
+                    self._save(session_id, state, expected_version=version)
+                    return state
+                except SessionConflictError:
+                    self._cache.pop(session_id, None)
+                    self._stats["conflicts"] += 1
+                    logger.info(f"세션 '{self.name}/{session_id}' 동시 갱신 감지 - 다시 읽어 재시도")
+            raise SessionConflictError(f"세션 '{self.name}/{session_id}' 갱신 충돌이 {SESSION_UPDATE_RETRIES}회 반복되었습니다.")
+
+    def delete(self, session_id: Any) -> bool:
+        """
+        세션 삭제
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            bool: 삭제 여부
+        """
+        session_id = str(session_id)
+        with self._lock:
+            removed = self._cache.pop(session_id, None) is not None
+            if self.backend is not None:
+                removed = self.backend.delete(self.name, session_id) or removed
+            return removed
+
+    def __contains__(self, session_id: Any) -> bool:
+        return self.get(session_id) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 상태 (메모리/영구 저장 세션 수, 캐시 적중 통계)"""
+        with self._lock:
+            cached = len(self._cache)
+            stats = dict(self._stats)
+        return {
+            "name": self.name,
+            "backend": self.backend.name if self.backend is not None else "memory",
+            "cached": cached,
+            "max_cached": self.max_cached,
+            "stored": self.backend.count(self.name) if self.backend is not None else cached,
+            **stats
+        }
+
+    def _entry(self, session_id: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        세션 (버전, 상태) 조회 - 캐시가 최신이 아니면 백엔드에서 다시 읽음
+
+        Returns:
+            Tuple[int, Optional[Dict]]: 저장된 버전(없으면 0)과 상태(없거나 만료되면 None)
+        """
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            if self.backend is None or self.backend.version(self.name, session_id) == cached[0]:
+                if time.time() - cached[2] <= self.ttl_seconds:
+                    self._cache.move_to_end(session_id)
+                    self._stats["hits"] += 1
+                    return cached[0], cached[1]
+            del self._cache[session_id]
+
+        if self.backend is None:
+            self._stats["misses"] += 1
+            return 0, None
+
+        row = self.backend.load(self.name, session_id)
+        if row is None or time.time() - row[2] > self.ttl_seconds:
+            self._stats["misses"] += 1
+            # 만료된 세션도 같은 행을 덮어쓰도록 저장된 버전은 반환
+            return (row[0] if row else 0), None
+
+        state = json.loads(row[1])
+        self._stats["loads"] += 1
+        self._remember(session_id, row[0], state, row[2])
+        return row[0], state
+
+    def _save(self, session_id: str, state: Dict[str, Any], expected_version: Optional[int] = None):
+        """영구 저장 후 메모리 캐시 갱신 (expected_version이 있으면 버전 비교 저장)"""
+        version = 0
+        if self.backend is not None:
+            data = json.dumps(state, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+            version = self.backend.save(self.name, session_id, data, expected_version)
+            if version is None:
+                raise SessionConflictError(f"세션 '{self.name}/{session_id}'을 다른 작업자가 먼저 갱신했습니다.")
+        self._remember(session_id, version, state, time.time())
+        self._maybe_prune()
+
+    def _remember(self, session_id: str, version: int, state: Dict[str, Any], updated_at: float):
+        """메모리 캐시에 추가 (최대 개수 초과 시 가장 오래 사용하지 않은 세션 제거)"""
+        self._cache[session_id] = (version, state, updated_at)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.max_cached:
+            evicted_id, _ = self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+            if self.backend is None:
+                logger.warning(f"세션 저장소 '{self.name}' 용량 초과로 세션 삭제: {evicted_id}")
+
+    def _maybe_prune(self):
+        """유효 기간이 지난 세션 정리 (SESSION_PRUNE_INTERVAL마다 한 번)"""
+        now = time.time()
+        if now - self._last_prune < SESSION_PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+
+        expired = [sid for sid, (_, _, updated_at) in self._cache.items() if now - updated_at > self.ttl_seconds]
+        for sid in expired:
+            del self._cache[sid]
+        if self.backend is not None:
+            try:
+                self.backend.prune(self.name, now - self.ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning(f"만료 세션 정리 실패: {str(e)}")
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+def get_default_session_backend():
+    """
+    기본 세션 백엔드 반환 (프로세스 내에서 하나만 생성)
+
+    Returns:
+        SQLiteSessionBackend 또는 None (메모리 전용)
+    """
+    global _default_backend
+    if SESSION_STORE_BACKEND == "memory":
+        return None
+    with _default_backend_lock:
+        if _default_backend is None:
+            try:
+                _default_backend = SQLiteSessionBackend()
+                logger.info(f"세션 저장소 백엔드: SQLite ({_default_backend.db_path})")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"세션 저장소 백엔드 초기화 실패, 메모리 전용으로 동작: {str(e)}")
+                return None
+        return _default_backend
@@ -0,0 +1,206 @@
+"""
+단일 실행(single-flight) 유틸리티
+같은 키에 대한 동시 요청이 비싼 작업(아바타 영상 렌더링 등)을 한 번만 실행하고 결과를 공유하도록 함
+
+- 같은 프로세스: 진행 중 요청 테이블에서 첫 요청(리더)의 완료를 기다린 뒤 같은 결과 반환
+- 여러 작업자 프로세스: 키별 잠금 파일(O_CREAT | O_EXCL)로 리더를 정하고,
+  나머지 프로세스는 잠금이 풀리면 check 함수(캐시 조회 등)로 리더의 결과를 가져옴
+- 리더는 주기적으로 잠금 파일 수정 시각을 갱신하며, 갱신이 멈춘 잠금(프로세스 비정상 종료)은 회수
+"""
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 잠금 파일 디렉토리와 대기 설정 (환경 변수로 조정 가능)
+SINGLE_FLIGHT_LOCK_DIR = os.environ.get(
+    "SINGLE_FLIGHT_LOCK_DIR", os.path.join(tempfile.gettempdir(), "veriview_single_flight")
+)
+SINGLE_FLIGHT_STALE_SECONDS = float(os.environ.get("SINGLE_FLIGHT_STALE_SECONDS", 60))
+SINGLE_FLIGHT_POLL_INTERVAL = float(os.environ.get("SINGLE_FLIGHT_POLL_INTERVAL", 0.5))
+
+def flight_key(*parts: Any) -> str:
+    """
+    프로세스 간에 동일한 단일 실행 키 생성 (내장 hash()는 프로세스마다 달라 사용 불가)
+
+    Args:
+        *parts: 결과를 결정하는 값들 (스크립트, 음성, 아바타 등)
+
+    Returns:
+        str: sha256 키
+    """
+    payload = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class _Call:
+    """진행 중인 호출"""
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """키별 단일 실행 그룹"""
+
+    def __init__(self, name: str, lock_dir: Optional[str] = None,
+                 stale_seconds: Optional[float] = None, poll_interval: Optional[float] = None):
+        """
+        단일 실행 그룹 초기화
+
+        Args:
+            name: 그룹 이름 (잠금 파일 하위 디렉토리)
+            lock_dir: 잠금 파일 디렉토리 (기본값: 환경 변수 SINGLE_FLIGHT_LOCK_DIR)
+            stale_seconds: 이 시간 동안 갱신되지 않은 잠금은 회수 (초)
+            poll_interval: 다른 프로세스의 잠금 해제 확인 주기 (초)
+        """
+        self.name = name
+        self.lock_dir = os.path.join(lock_dir or SINGLE_FLIGHT_LOCK_DIR, name)
+        self.stale_seconds = stale_seconds or SINGLE_FLIGHT_STALE_SECONDS
+        self.poll_interval = poll_interval or SINGLE_FLIGHT_POLL_INTERVAL
+
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "shared_local": 0, "shared_remote": 0}
+
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+    def do(self, key: str, fn: Callable[[], Any], check: Optional[Callable[[], Any]] = None,
+           timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        키별 단일 실행
+
+        Args:
+            key: 단일 실행 키 (flight_key()로 생성 권장)
+            fn: 실제 작업 (리더만 실행)
+            check: 다른 프로세스가 만든 결과 조회 함수 (결과가 없으면 None 반환)
+            timeout: 다른 요청의 완료를 기다리는 최대 시간 (초, None이면 제한 없음)
+
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        # 같은 프로세스 안에 진행 중인 요청이 있으면 그 결과를 기다림
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"[{self.name}] 진행 중인 작업 대기 시간 초과: {key[:12]}")
+            with self._lock:
+                self._stats["shared_local"] += 1
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result, shared = self._run_across_processes(key, fn, check, timeout)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        if call.waiters:
+            logger.info(f"[{self.name}] 동시 요청 {call.waiters}건이 같은 결과 공유: {key[:12]}")
+        return call.result, shared
+
+    def stats(self) -> Dict[str, int]:
+        """리더 실행/공유 횟수와 진행 중인 작업 수"""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+    def _run_across_processes(self, key: str, fn: Callable[[], Any],
+                              check: Optional[Callable[[], Any]], timeout: Optional[float]) -> Tuple[Any, bool]:
+        """잠금 파일로 프로세스 간 리더를 정해 실행"""
+        lock_path = os.path.join(self.lock_dir, f"{key}.lock")
+        deadline = time.time() + timeout if timeout else None
+        waited = False
+
+        while True:
+            if self._try_acquire(lock_path):
+                break
+
+            waited = True
+            if deadline and time.time() > deadline:
+                raise TimeoutError(f"[{self.name}] 다른 프로세스 작업 대기 시간 초과: {key[:12]}")
+            self._reclaim_if_stale(lock_path)
+            time.sleep(self.poll_interval)
+
+            # 잠금이 풀렸으면 다른 프로세스가 만든 결과 확인
+            if check and not os.path.exists(lock_path):
+                result = check()
+                if result is not None:
+                    with self._lock:
+                        self._stats["shared_remote"] += 1
+                    logger.info(f"[{self.name}] 다른 프로세스의 결과 공유: {key[:12]}")
+                    return result, True
+
+        try:
+            # 잠금을 얻는 사이에 다른 프로세스가 결과를 만들었을 수 있음
+            if waited and check:
+                result = check()
+                if result is not None:
+                    with self._lock:
+                        self._stats["shared_remote"] += 1
+                    return result, True
+
+            with self._lock:
+                self._stats["leaders"] += 1
+            heartbeat_stop = threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(lock_path, heartbeat_stop),
+                                         name=f"single-flight-{self.name}", daemon=True)
+            heartbeat.start()
+            try:
+                return fn(), False
+            finally:
+                heartbeat_stop.set()
+        finally:
+            self._release(lock_path)
+
+    def _try_acquire(self, lock_path: str) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{os.getpid()} {time.time()}")
+        return True
+
+    def _release(self, lock_path: str):
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+    def _heartbeat(self, lock_path: str, stop: threading.Event):
+        """리더가 살아 있는 동안 잠금 파일 수정 시각 갱신"""
+        while not stop.wait(self.stale_seconds / 3):
+            try:
+                os.utime(lock_path, None)
+            except OSError:
+                return
+
+    def _reclaim_if_stale(self, lock_path: str):
+        """갱신이 멈춘 잠금 파일 삭제 (리더 프로세스 비정상 종료)"""
+        try:
+            if time.time() - os.path.getmtime(lock_path) > self.stale_seconds:
+                logger.warning(f"[{self.name}] 응답 없는 작업 잠금 회수: {lock_path}")
+                os.remove(lock_path)
+        except OSError:
+            pass
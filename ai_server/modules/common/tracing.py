@@ -0,0 +1,399 @@
+"""
+단계별 처리 시간 추적과 지표 엔드포인트
+디코딩, 음성 인식, 음성 특징, 얼굴 분석, LLM, TTS, 아바타 렌더링 등 단계를 span()/traced()로 감싸
+처리 시간을 히스토그램에 누적하고, 큐 길이와 캐시 적중률과 함께 /ai/metrics에서 Prometheus 텍스트 형식으로 제공
+
+- 추적 사용 여부(TRACING_ENABLED): false면 span()이 시간을 재지 않음
+- 요청별 처리 시간 헤더(TRACE_TIMING_HEADER): true면 모든 응답에, false면 요청 헤더 X-Debug-Timing: 1이 있을 때만
+  Server-Timing 헤더(decode;dur=12.3, asr;dur=850.1, ...)를 추가
+- 히스토그램 버킷(TRACE_BUCKETS): 쉼표로 구분한 초 단위 상한값
+- 분석기 스레드 풀 등 다른 스레드에서 실행되는 단계는 bind_context()로 요청 컨텍스트를 넘겨야 요청별 헤더에 포함됨
+"""
+import os
+import sys
+import time
+import bisect
+import inspect
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 추적 설정 (환경 변수로 조정 가능)
+TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "true").lower() in ("1", "true", "yes")
+TRACE_TIMING_HEADER = os.environ.get("TRACE_TIMING_HEADER", "false").lower() in ("1", "true", "yes")
+TRACE_BUCKETS = tuple(sorted(
+    float(value) for value in
+    os.environ.get("TRACE_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10,30,60,120,300").split(",")
+    if value.strip()
+))
+
+# 요청별 처리 시간 헤더를 요청하는 요청 헤더
+TIMING_REQUEST_HEADER = "X-Debug-Timing"
+
+STAGE_DURATION = "ai_stage_duration_seconds"
+STAGE_ERRORS = "ai_stage_errors_total"
+REQUEST_DURATION = "ai_request_duration_seconds"
+REQUESTS_TOTAL = "ai_requests_total"
+
+_HELP = {
+    STAGE_DURATION: ("histogram", "단계별 처리 시간 (초)"),
+    STAGE_ERRORS: ("counter", "단계별 예외 발생 횟수"),
+    REQUEST_DURATION: ("histogram", "엔드포인트별 요청 처리 시간 (초)"),
+    REQUESTS_TOTAL: ("counter", "엔드포인트별 요청 수"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+# 수집 함수가 반환하는 값: (지표 이름, 유형, 설명, 레이블, 값)
+Sample = Tuple[str, str, str, Dict[str, Any], float]
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Iterable[float] = TRACE_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """버킷별 누적 개수(+Inf 포함), 합계, 개수"""
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative = []
+        running = 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return cumulative, total, count
+
+class MetricsRegistry:
+    """프로세스 공용 지표 저장소 (히스토그램, 카운터, 수집 시점에 값을 읽는 수집 함수)"""
+
+    def __init__(self, buckets: Iterable[float] = TRACE_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._collectors: List[Callable[[], List[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 추가"""
+        key = (name, _label_key(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def increment(self, name: str, amount: float = 1, **labels):
+        """카운터 증가"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def register_collector(self, collector: Callable[[], List[Sample]]):
+        """
+        수집 함수 등록 (지표 요청마다 호출하여 큐 길이, 캐시 통계 등 현재 값을 읽음)
+
+        Args:
+            collector: (지표 이름, 유형, 설명, 레이블, 값) 목록을 반환하는 함수
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            collectors = list(self._collectors)
+
+        families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+        def family(name: str, kind: str, help_text: str) -> List[str]:
+            if name not in families:
+                families[name] = (kind, help_text, [])
+            return families[name][2]
+
+        for (name, labels), histogram in histograms:
+            kind, help_text = _HELP.get(name, ("histogram", name))
+            lines = family(name, kind, help_text)
+            cumulative, total, count = histogram.snapshot()
+            for bound, value in zip(self.buckets + (float("inf"),), cumulative):
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {value}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        for (name, labels), value in counters:
+            kind, help_text = _HELP.get(name, ("counter", name))
+            family(name, kind, help_text).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for collector in collectors:
+            try:
+                samples = collector()
+            except Exception as e:
+                logger.warning(f"지표 수집 실패 ({getattr(collector, '__name__', collector)}): {str(e)}")
+                continue
+            for name, kind, help_text, labels, value in samples:
+                if value is None:
+                    continue
+                family(name, kind, help_text).append(
+                    f"{name}{_format_labels(_label_key(labels))} {_format_value(value)}"
+                )
+
+        output = []
+        for name, (kind, help_text, lines) in families.items():
+            output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(lines)
+        return "\n".join(output) + "\n"
+
+def _label_key(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class RequestTrace:
+    """요청 1건의 단계별 처리 시간 (Server-Timing 헤더용)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._stages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float):
+        # 같은 단계가 여러 번 실행되면 합산 (처음 실행된 순서 유지)
+        with self._lock:
+            self._stages[name] = self._stages.get(name, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (ms, 마지막은 요청 전체 시간)"""
+        with self._lock:
+            stages = list(self._stages.items())
+        stages.append(("total", time.perf_counter() - self.started))
+        return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in stages)
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("request_trace", default=None)
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    프로세스 공용 지표 저장소 반환 (최초 호출 시 생성)
+
+    Returns:
+        MetricsRegistry: 공용 지표 저장소
+    """
+    global _default_registry
+
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = MetricsRegistry()
+                _default_registry.register_collector(_collect_runtime_metrics)
+    return _default_registry
+
+def record_span(name: str, seconds: float, error: bool = False):
+    """
+    단계 처리 시간 기록 (히스토그램 + 현재 요청의 처리 시간 목록)
+
+    Args:
+        name: 단계 이름
+        seconds: 처리 시간 (초)
+        error: 예외로 끝났는지 여부
+    """
+    registry = get_metrics_registry()
+    registry.observe(STAGE_DURATION, seconds, stage=name)
+    if error:
+        registry.increment(STAGE_ERRORS, stage=name)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, seconds)
+
+@contextmanager
+def span(name: str):
+    """
+    단계 처리 시간 측정 컨텍스트 관리자
+
+    사용 예:
+        with span("decode"):
+            audio = decode_audio_from_video(path)
+    """
+    if not TRACING_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        record_span(name, time.perf_counter() - start, error)
+
+def traced(name: str):
+    """
+    함수 처리 시간을 span으로 측정하는 데코레이터
+    제너레이터 함수는 첫 값 요청부터 모두 소비(또는 중단)될 때까지를 측정
+
+    Args:
+        name: 단계 이름
+    """
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                with span(name):
+                    yield from func(*args, **kwargs)
+            return generator_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def bind_context(func: Callable) -> Callable:
+    """현재 요청 컨텍스트에서 실행되도록 감싼 함수 (스레드 풀에 제출하는 작업용)"""
+    context = contextvars.copy_context()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+    return wrapper
+
+def _collect_runtime_metrics() -> List[Sample]:
+    """큐 길이, 캐시 적중률, 로드된 모델 수 (지표 요청 시점 값)"""
+    samples: List[Sample] = []
+
+    from modules.common.media_cache import get_media_cache_metrics
+    for cache_name, metrics in get_media_cache_metrics().items():
+        samples.extend(_cache_samples(cache_name, metrics["hits"], metrics["misses"],
+                                      metrics["entries"], metrics["bytes"]))
+
+    from modules.analysis.result_cache import get_result_cache
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        stats = result_cache.stats()
+        samples.extend(_cache_samples("analysis_result", stats["memory_hits"] + stats["disk_hits"], stats["misses"],
+                                      stats["memory_entries"], stats["disk_bytes"]))
+
+    # 배처 모듈은 torch를 함께 불러오므로, 이미 로드된 경우에만 통계 수집
+    batcher_module = sys.modules.get("modules.whisper_batcher")
+    if batcher_module is not None:
+        for batcher_name, stats in batcher_module.get_batching_stats().items():
+            samples.append(("ai_queue_depth", "gauge", "대기 중인 작업 수", {"queue": f"whisper_batch:{batcher_name}"},
+                            stats["queued_windows"]))
+
+    from modules.workers.worker_pool import get_worker_pool
+    pool = get_worker_pool()
+    if pool is not None:
+        stats = pool.get_stats()
+        samples.append(("ai_queue_depth", "gauge", "대기 중인 작업 수", {"queue": "analysis_jobs"}, stats["queued_jobs"]))
+        samples.append(("ai_jobs_running", "gauge", "실행 중인 작업 수", {"queue": "analysis_jobs"}, stats["running_jobs"]))
+
+    from modules.common.model_registry import get_model_registry
+    samples.append(("ai_models_loaded", "gauge", "메모리에 로드된 모델 수", {}, get_model_registry().stats()["loaded"]))
+    return samples
+
+def _cache_samples(cache: str, hits: int, misses: int, entries: Optional[int], size: Optional[int]) -> List[Sample]:
+    lookups = hits + misses
+    return [
+        ("ai_cache_hits_total", "counter", "캐시 적중 횟수", {"cache": cache}, hits),
+        ("ai_cache_misses_total", "counter", "캐시 미스 횟수", {"cache": cache}, misses),
+        ("ai_cache_hit_ratio", "gauge", "캐시 적중률 (시작 이후 누적)", {"cache": cache},
+         round(hits / lookups, 4) if lookups else 0.0),
+        ("ai_cache_entries", "gauge", "캐시 항목 수", {"cache": cache}, entries),
+        ("ai_cache_bytes", "gauge", "캐시 사용량 (바이트)", {"cache": cache}, size),
+    ]
+
+def setup_metrics_routes(app, registry: Optional[MetricsRegistry] = None):
+    """
+    지표 라우트와 요청 추적 훅 등록
+
+    - GET /ai/metrics: Prometheus 텍스트 형식 지표
+    - 모든 요청: 엔드포인트별 처리 시간 히스토그램, 설정에 따라 Server-Timing 헤더 추가
+
+    Args:
+        app: Flask 앱
+        registry: 지표 저장소 (기본값: 공용 지표 저장소)
+    """
+    from flask import Response, g, request
+
+    registry = registry or get_metrics_registry()
+    in_flight = {"count": 0}
+    in_flight_lock = threading.Lock()
+
+    def collect_in_flight() -> List[Sample]:
+        return [("ai_requests_in_flight", "gauge", "처리 중인 HTTP 요청 수", {}, in_flight["count"])]
+
+    registry.register_collector(collect_in_flight)
+
+    @app.before_request
+    def _start_request_trace():
+        with in_flight_lock:
+            in_flight["count"] += 1
+        g._request_trace_token = _current_trace.set(RequestTrace())
+
+    @app.after_request
+    def _finish_request_trace(response):
+        trace = _current_trace.get()
+        if trace is None:
+            return response
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        registry.observe(REQUEST_DURATION, time.perf_counter() - trace.started, endpoint=endpoint,
+                         method=request.method)
+        registry.increment(REQUESTS_TOTAL, endpoint=endpoint, method=request.method, status=response.status_code)
+        if TRACE_TIMING_HEADER or request.headers.get(TIMING_REQUEST_HEADER, "").lower() in ("1", "true", "yes"):
+            response.headers["Server-Timing"] = trace.server_timing()
+        return response
+
+    @app.teardown_request
+    def _end_request_trace(exc):
+        token = g.pop("_request_trace_token", None)
+        if token is None:
+            return
+        with in_flight_lock:
+            in_flight["count"] -= 1
+        try:
+            _current_trace.reset(token)
+        except ValueError:
+            # 스트리밍 응답은 다른 컨텍스트에서 정리됨
+            pass
+
+    @app.route('/ai/metrics', methods=['GET'])
+    def metrics():
+        return Response(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
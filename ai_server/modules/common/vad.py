@@ -0,0 +1,315 @@
+"""
+음성 활동 감지(VAD) 유틸리티
+디코딩된 PCM 버퍼에서 RMS 에너지 기반으로 발화 구간을 찾고,
+Whisper 입력용 윈도우(최대 30초)로 묶는 기능 제공
+
+- SpeechTimeline: 발화 구간, 무음 통계, (무음 제거 오디오 시각 → 원본 시각) 변환표
+- VoicedAudio: 발화 구간만 이어 붙인 버퍼 (timeline 속성으로 변환표를 함께 전달)
+"""
+import os
+import bisect
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .audio_utils import AUDIO_SAMPLE_RATE
+from .tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# estimate_speaking_rate와 동일한 프레임 설정 (25ms 프레임, 10ms 홉)
+FRAME_SECONDS = 0.025
+HOP_SECONDS = 0.01
+
+# 평균 에너지 대비 발화 판정 임계값 비율
+ENERGY_THRESHOLD_RATIO = 0.3
+
+# 분석 전 무음 제거 사용 여부
+VAD_TRIM_ENABLED = os.environ.get("VAD_TRIM", "true").lower() in ("1", "true", "yes")
+
+# 발화 구간 앞뒤 여유 (초) - 자음 시작/끝이 잘리지 않도록
+SPEECH_PADDING_SECONDS = 0.15
+
+# 이어 붙인 발화 구간 사이에 넣는 무음 길이 (초) - 인식기가 문장 경계를 알 수 있도록
+JOIN_GAP_SECONDS = 0.2
+
+# 무음 통계 기준 (초)
+PAUSE_SECONDS = 0.5
+LONG_PAUSE_SECONDS = 2.0
+
+def frame_rms(audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE) -> np.ndarray:
+    """
+    프레임별 RMS 에너지 계산 (librosa.feature.rms와 같은 center 패딩 방식)
+
+    Args:
+        audio: float32 PCM 버퍼
+        sample_rate: 샘플링 레이트
+
+    Returns:
+        np.ndarray: 프레임별 RMS 에너지
+    """
+    frame_length = int(FRAME_SECONDS * sample_rate)
+    hop_length = int(HOP_SECONDS * sample_rate)
+
+    padded = np.pad(np.asarray(audio, dtype=np.float32), frame_length // 2)
+    if len(padded) < frame_length:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(padded, frame_length)[::hop_length]
+    return np.sqrt(np.mean(frames ** 2, axis=1))
+
+def detect_speech_intervals(audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE,
+                            min_silence_seconds: float = 0.3,
+                            min_speech_seconds: float = 0.1) -> List[Tuple[float, float]]:
+    """
+    발화 구간 감지
+
+    Args:
+        audio: float32 PCM 버퍼
+        sample_rate: 샘플링 레이트
+        min_silence_seconds: 이보다 짧은 무음은 발화 구간에 포함
+        min_speech_seconds: 이보다 짧은 발화 구간은 제외
+
+    Returns:
+        List[Tuple[float, float]]: (시작 초, 끝 초) 발화 구간 목록
+    """
+    energy = frame_rms(audio, sample_rate)
+    if energy.size == 0:
+        return []
+
+    voiced = energy > energy.mean() * ENERGY_THRESHOLD_RATIO
+    if not voiced.any():
+        return []
+
+    # 발화 프레임의 시작/끝 경계 찾기
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    duration = len(audio) / sample_rate
+    intervals = []
+    for start, end in zip(starts * HOP_SECONDS, ends * HOP_SECONDS):
+        end = min(end, duration)
+        if intervals and start - intervals[-1][1] < min_silence_seconds:
+            intervals[-1] = (intervals[-1][0], end)
+        else:
+            intervals.append((start, end))
+
+    return [(round(float(s), 3), round(float(e), 3)) for s, e in intervals if e - s >= min_speech_seconds]
+
+def group_into_windows(intervals: List[Tuple[float, float]],
+                       max_window_seconds: float = 30.0) -> List[Tuple[float, float]]:
+    """
+    발화 구간을 Whisper 입력 크기(최대 30초) 윈도우로 묶기
+    윈도우 경계는 항상 무음 구간에 위치하므로 단어가 잘리지 않음
+    (단일 발화 구간이 최대 길이를 넘는 경우에만 강제로 분할)
+
+    Args:
+        intervals: detect_speech_intervals 결과
+        max_window_seconds: 윈도우 최대 길이 (초)
+
+    Returns:
+        List[Tuple[float, float]]: (시작 초, 끝 초) 윈도우 목록
+    """
+    windows = []
+    for start, end in intervals:
+        # 너무 긴 단일 구간은 강제 분할
+        while end - start > max_window_seconds:
+            windows.append((start, start + max_window_seconds))
+            start += max_window_seconds
+
+        if windows and end - windows[-1][0] <= max_window_seconds:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+
+    return windows
+
+class SpeechTimeline:
+    """발화 구간과 무음 제거 오디오의 원본 시각 변환표"""
+
+    def __init__(self, speech_intervals: List[Tuple[float, float]], duration: float,
+                 sample_rate: int = AUDIO_SAMPLE_RATE, padding_seconds: float = SPEECH_PADDING_SECONDS,
+                 gap_seconds: float = JOIN_GAP_SECONDS):
+        """
+        변환표 생성
+
+        Args:
+            speech_intervals: detect_speech_intervals 결과 (원본 기준 초)
+            duration: 원본 오디오 길이 (초)
+            sample_rate: 샘플링 레이트
+            padding_seconds: 잘라낼 때 발화 구간 앞뒤에 남길 여유
+            gap_seconds: 이어 붙인 구간 사이에 넣을 무음 길이
+        """
+        self.speech_intervals = list(speech_intervals)
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.gap_seconds = gap_seconds
+
+        # 여유를 붙인 잘라낼 구간 (겹치면 병합)
+        self.intervals: List[Tuple[float, float]] = []
+        for start, end in self.speech_intervals:
+            start, end = max(0.0, start - padding_seconds), min(duration, end + padding_seconds)
+            if self.intervals and start <= self.intervals[-1][1]:
+                self.intervals[-1] = (self.intervals[-1][0], end)
+            else:
+                self.intervals.append((start, end))
+
+        # 구간별 무음 제거 오디오 시작 시각
+        self._voiced_starts: List[float] = []
+        offset = 0.0
+        for start, end in self.intervals:
+            self._voiced_starts.append(offset)
+            offset += (end - start) + gap_seconds
+        self.voiced_duration = max(0.0, offset - gap_seconds)
+
+    @classmethod
+    def from_audio(cls, audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE, **kwargs) -> "SpeechTimeline":
+        """
+        PCM 버퍼에서 발화 구간을 감지하여 변환표 생성
+
+        Args:
+            audio: float32 PCM 버퍼
+            sample_rate: 샘플링 레이트
+
+        Returns:
+            SpeechTimeline: 변환표
+        """
+        intervals = detect_speech_intervals(audio, sample_rate)
+        return cls(intervals, len(audio) / sample_rate, sample_rate, **kwargs)
+
+    def extract(self, audio: np.ndarray) -> "VoicedAudio":
+        """
+        발화 구간만 이어 붙인 버퍼 생성
+
+        Args:
+            audio: 원본 float32 PCM 버퍼
+
+        Returns:
+            VoicedAudio: 무음 제거 버퍼 (발화가 없으면 빈 버퍼)
+        """
+        gap = np.zeros(int(self.gap_seconds * self.sample_rate), dtype=np.float32)
+        pieces = []
+        for start, end in self.intervals:
+            if pieces:
+                pieces.append(gap)
+            pieces.append(audio[int(start * self.sample_rate):int(end * self.sample_rate)])
+        samples = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+        return VoicedAudio(samples, self)
+
+    def to_original(self, voiced_time: float) -> float:
+        """
+        무음 제거 오디오 시각을 원본 시각으로 변환
+
+        Args:
+            voiced_time: 무음 제거 오디오 기준 시각 (초)
+
+        Returns:
+            float: 원본 기준 시각 (초)
+        """
+        if not self.intervals:
+            return voiced_time
+        index = max(0, bisect.bisect_right(self._voiced_starts, voiced_time) - 1)
+        start, end = self.intervals[index]
+        # 구간 사이에 넣은 무음은 해당 구간 끝으로 변환
+        return round(min(start + max(0.0, voiced_time - self._voiced_starts[index]), end), 3)
+
+    def remap_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        인식 세그먼트(와 단어)의 시각을 원본 기준으로 변환 (제자리 수정)
+
+        Args:
+            segments: start/end 키를 가진 세그먼트 목록
+
+        Returns:
+            List[Dict[str, Any]]: 같은 목록
+        """
+        for segment in segments or []:
+            for item in [segment] + list(segment.get("words") or []):
+                for key in ("start", "end"):
+                    if isinstance(item.get(key), (int, float)):
+                        item[key] = self.to_original(item[key])
+        return segments
+
+    def pause_stats(self, min_pause_seconds: float = PAUSE_SECONDS,
+                    long_pause_seconds: float = LONG_PAUSE_SECONDS) -> Dict[str, Any]:
+        """
+        무음 통계 (발화 구간에서 바로 계산하므로 추가 분석 비용 없음)
+
+        Returns:
+            Dict[str, Any]: 발화/무음 시간, 발화 비율, 앞뒤 무음, 발화 중간 멈춤 통계
+        """
+        speech_duration = sum(end - start for start, end in self.speech_intervals)
+        pauses = [
+            next_start - end
+            for (_, end), (next_start, _) in zip(self.speech_intervals, self.speech_intervals[1:])
+            if next_start - end >= min_pause_seconds
+        ]
+        leading = self.speech_intervals[0][0] if self.speech_intervals else self.duration
+        trailing = self.duration - self.speech_intervals[-1][1] if self.speech_intervals else 0.0
+
+        return {
+            "total_duration": round(self.duration, 3),
+            "speech_duration": round(speech_duration, 3),
+            "speech_ratio": round(speech_duration / self.duration, 3) if self.duration > 0 else 0.0,
+            "leading_silence": round(leading, 3),
+            "trailing_silence": round(max(0.0, trailing), 3),
+            "pause_count": len(pauses),
+            "long_pause_count": sum(1 for pause in pauses if pause >= long_pause_seconds),
+            "avg_pause_length": round(float(np.mean(pauses)), 3) if pauses else 0.0,
+            "pause_variation": round(float(np.std(pauses)), 3) if pauses else 0.0,
+            "max_pause_length": round(max(pauses), 3) if pauses else 0.0,
+            "pause_frequency": round(len(pauses) / speech_duration, 3) if speech_duration > 0 else 0.0
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """변환표 요약 (분석 결과에 포함)"""
+        return {
+            "speech_intervals": [[round(s, 3), round(e, 3)] for s, e in self.speech_intervals],
+            "voiced_duration": round(self.voiced_duration, 3),
+            "trimmed_seconds": round(max(0.0, self.duration - self.voiced_duration), 3),
+            **self.pause_stats()
+        }
+
+class VoicedAudio(np.ndarray):
+    """발화 구간만 이어 붙인 float32 PCM 버퍼 (timeline 속성으로 원본 시각 변환표 전달)"""
+
+    def __new__(cls, samples: np.ndarray, timeline: SpeechTimeline):
+        obj = np.asarray(samples, dtype=np.float32).view(cls)
+        obj.timeline = timeline
+        return obj
+
+    def __array_finalize__(self, obj):
+        self.timeline = getattr(obj, "timeline", None)
+
+def get_timeline(audio: Any) -> Optional[SpeechTimeline]:
+    """
+    버퍼에 연결된 변환표 반환
+
+    Args:
+        audio: PCM 버퍼 또는 파일 경로
+
+    Returns:
+        Optional[SpeechTimeline]: 무음 제거 버퍼가 아니면 None
+    """
+    return getattr(audio, "timeline", None)
+
+@traced("vad")
+def trim_silence(audio: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE) -> Optional[VoicedAudio]:
+    """
+    분석 전 무음 제거 (앞뒤 무음과 긴 멈춤 제거, 변환표 포함)
+
+    Args:
+        audio: 원본 float32 PCM 버퍼
+        sample_rate: 샘플링 레이트
+
+    Returns:
+        Optional[VoicedAudio]: 무음 제거 버퍼 (발화를 찾지 못하면 None → 원본 그대로 사용)
+    """
+    timeline = SpeechTimeline.from_audio(audio, sample_rate)
+    if not timeline.intervals:
+        return None
+    voiced = timeline.extract(audio)
+    logger.debug(f"무음 제거: {timeline.duration:.2f}초 → {timeline.voiced_duration:.2f}초")
+    return voiced
@@ -0,0 +1,246 @@
+"""
+모델 백그라운드 준비(warm-up) 관리
+HTTP 서버가 먼저 포트를 연 뒤 모델 로드/초기 추론을 백그라운드 스레드에서 우선순위 순서대로 실행하고,
+모델별 준비 상태를 준비 상태 엔드포인트(/ai/ready)로 제공
+
+- 시작 방식(AI_SERVER_STARTUP_MODE): background(포트를 먼저 열고 백그라운드 준비), eager(모두 준비한 뒤 포트 열기)
+- 준비 순서(MODEL_WARMUP_ORDER): 쉼표로 구분한 작업 이름, 목록에 없는 작업은 등록 순서대로 마지막에 실행
+- 엔드포인트는 requires_warm()으로 필요한 모델이 준비될 때까지 잠시 대기한 뒤
+  거절(503 + Retry-After)하거나 모델 없이 대체 응답으로 처리
+"""
+import os
+import time
+import logging
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from flask import jsonify
+
+logger = logging.getLogger(__name__)
+
+# 시작/준비 설정 (환경 변수로 조정 가능)
+AI_SERVER_STARTUP_MODE = os.environ.get("AI_SERVER_STARTUP_MODE", "background")  # background, eager
+MODEL_WARMUP_ORDER = [
+    name.strip() for name in os.environ.get("MODEL_WARMUP_ORDER", "whisper,analyzers,tts,librosa").split(",")
+    if name.strip()
+]
+# 요청이 모델 준비를 기다리는 최대 시간 (초)
+WARMUP_REQUEST_WAIT_SECONDS = float(os.environ.get("WARMUP_REQUEST_WAIT_SECONDS", 20))
+
+# 준비 상태
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+class _Task:
+    """준비 작업 1건"""
+    __slots__ = ("name", "func", "required", "state", "error", "started_at", "seconds", "done")
+
+    def __init__(self, name: str, func: Callable[[], Any], required: bool):
+        self.name = name
+        self.func = func
+        self.required = required
+        self.state = PENDING
+        self.error = None
+        self.started_at = None
+        self.seconds = None
+        self.done = threading.Event()
+
+class WarmupManager:
+    """모델 준비 작업 실행기"""
+
+    def __init__(self, order: Optional[List[str]] = None):
+        """
+        준비 관리자 초기화
+
+        Args:
+            order: 작업 실행 순서 (기본값: 환경 변수 MODEL_WARMUP_ORDER)
+        """
+        self.order = list(order if order is not None else MODEL_WARMUP_ORDER)
+        self._tasks: Dict[str, _Task] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._started_at = None
+        self._finished_at = None
+
+    def register(self, name: str, func: Callable[[], Any], required: bool = True):
+        """
+        준비 작업 등록
+
+        Args:
+            name: 작업 이름 (whisper, tts 등 - 준비 상태 응답의 키)
+            func: 준비 함수 (모델 로드, 초기 추론 등)
+            required: False면 준비 상태(ready) 판정에서 제외
+        """
+        with self._lock:
+            self._tasks[name] = _Task(name, func, required)
+
+    def start(self, background: bool = True):
+        """
+        등록된 작업을 우선순위 순서대로 실행
+
+        Args:
+            background: True면 백그라운드 스레드에서 실행하고 바로 반환
+        """
+        with self._lock:
+            if self._started_at is not None:
+                return
+            self._started_at = time.time()
+
+        if not background:
+            self._run()
+            return
+        self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+        self._thread.start()
+
+    def state(self, name: str) -> Optional[str]:
+        """작업 상태 (등록되지 않은 작업이면 None)"""
+        task = self._tasks.get(name)
+        return task.state if task else None
+
+    def is_ready(self, name: str) -> bool:
+        """작업이 끝나 모델을 바로 사용할 수 있는지 여부 (등록되지 않은 작업은 준비된 것으로 간주)"""
+        task = self._tasks.get(name)
+        return task is None or task.state == READY
+
+    def wait(self, names: Iterable[str], timeout: Optional[float] = None) -> bool:
+        """
+        작업이 끝날 때까지 대기 (성공/실패 무관)
+
+        Args:
+            names: 작업 이름 목록
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 시간 안에 모든 작업이 끝났으면 True
+        """
+        deadline = time.monotonic() + (timeout if timeout is not None else WARMUP_REQUEST_WAIT_SECONDS)
+        for name in names:
+            task = self._tasks.get(name)
+            if task is None:
+                continue
+            if not task.done.wait(max(0.0, deadline - time.monotonic())):
+                return False
+        return True
+
+    def readiness(self) -> Dict[str, Any]:
+        """준비 상태 (필수 작업이 모두 성공했으면 ready, 하나라도 실패했으면 failed 목록에 표시)"""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        required = [task for task in tasks if task.required]
+        models = {
+            task.name: {
+                "state": task.state,
+                "required": task.required,
+                "seconds": round(task.seconds, 2) if task.seconds is not None else None,
+                "error": task.error
+            }
+            for task in tasks
+        }
+        return {
+            "ready": self._started_at is not None and all(task.state == READY for task in required),
+            "failed": [task.name for task in required if task.state == FAILED],
+            "startup_mode": AI_SERVER_STARTUP_MODE,
+            "uptime_seconds": round(time.time() - self._started_at, 1) if self._started_at else 0.0,
+            "warmup_seconds": round(self._finished_at - self._started_at, 2) if self._finished_at else None,
+            "models": models
+        }
+
+    def _ordered_tasks(self) -> List[_Task]:
+        with self._lock:
+            tasks = list(self._tasks.values())
+        rank = {name: index for index, name in enumerate(self.order)}
+        # 순서 목록에 있는 작업 먼저, 나머지는 등록 순서 유지
+        return sorted(tasks, key=lambda task: rank.get(task.name, len(rank)))
+
+    def _run(self):
+        """작업 순차 실행 (한 작업이 실패해도 다음 작업 계속)"""
+        for task in self._ordered_tasks():
+            task.state = WARMING
+            task.started_at = time.time()
+            logger.info(f"모델 준비 시작: {task.name}")
+            try:
+                task.func()
+                task.state = READY
+            except Exception as e:
+                task.state = FAILED
+                task.error = str(e)
+                logger.error(f"모델 준비 실패: {task.name} - {str(e)}")
+            task.seconds = time.time() - task.started_at
+            task.done.set()
+            logger.info(f"모델 준비 {task.state}: {task.name} ({task.seconds:.1f}초)")
+        self._finished_at = time.time()
+        logger.info(f"모델 준비 완료 - 소요 시간: {self._finished_at - self._started_at:.1f}초")
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+def get_warmup_manager() -> WarmupManager:
+    """
+    프로세스 공용 준비 관리자 반환 (최초 호출 시 생성)
+
+    Returns:
+        WarmupManager: 공용 준비 관리자
+    """
+    global _default_manager
+
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = WarmupManager()
+    return _default_manager
+
+def requires_warm(*names: str, wait: Optional[float] = None, degrade: bool = False):
+    """
+    필요한 모델이 준비될 때까지 요청을 대기시키는 엔드포인트 데코레이터
+
+    Args:
+        names: 필요한 준비 작업 이름
+        wait: 최대 대기 시간 (초, 기본값: 환경 변수 WARMUP_REQUEST_WAIT_SECONDS)
+        degrade: True면 시간 안에 준비되지 않아도 엔드포인트를 실행 (엔드포인트의 대체 응답 사용),
+                 False면 503 응답
+
+    Returns:
+        Callable: 데코레이터
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            manager = get_warmup_manager()
+            if manager.wait(names, wait) or degrade:
+                return view(*args, **kwargs)
+
+            readiness = manager.readiness()
+            response = jsonify({
+                "error": "AI 모델을 준비하는 중입니다. 잠시 후 다시 시도해주세요.",
+                "models": {name: readiness["models"].get(name) for name in names}
+            })
+            response.status_code = 503
+            response.headers["Retry-After"] = "5"
+            return response
+        return wrapper
+    return decorator
+
+def setup_readiness_routes(app, manager: Optional[WarmupManager] = None):
+    """
+    준비 상태 라우트 등록
+
+    - GET /ai/live: 프로세스 생존 여부 (항상 200)
+    - GET /ai/ready: 모델별 준비 상태 (필수 모델이 모두 준비되면 200, 준비 중이거나 실패했으면 503)
+
+    Args:
+        app: Flask 앱
+        manager: 준비 관리자 (기본값: 공용 준비 관리자)
+    """
+    manager = manager or get_warmup_manager()
+
+    @app.route('/ai/live', methods=['GET'])
+    def liveness():
+        return jsonify({"status": "alive"})
+
+    @app.route('/ai/ready', methods=['GET'])
+    def readiness():
+        state = manager.readiness()
+        return jsonify(state), (200 if state["ready"] else 503)
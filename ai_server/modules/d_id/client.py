@@ -11,7 +11,10 @@ import time
 import os
 import logging
 import base64
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from modules.common.http_utils import create_pooled_session, poll_delays
+from modules.common.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,11 @@ class DIDClient:
             'Accept': 'application/json'
         }
         
+        # 상태 확인/다운로드 요청마다 연결을 새로 맺지 않도록 연결 풀 세션 사용
+        self.session = create_pooled_session(self.headers)
+        # 결과 영상은 서명된 URL이라 인증 헤더 없이 다운로드
+        self.download_session = create_pooled_session()
+        
         # 기본 아바타 이미지 URLs - D-ID에서 제공하는 샘플 이미지 사용
         self.default_avatars = {
             # 'interviewer_male': 'https://d-id-public-bucket.s3.us-west-2.amazonaws.com/alice.jpg',
@@ -66,9 +74,8 @@ class DIDClient:
         """API 연결 테스트"""
         try:
             logger.info("D-ID API 연결 테스트 시작")
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/talks",
-                headers=self.headers,
                 timeout=10
             )
             
@@ -95,6 +102,7 @@ class DIDClient:
         
         return False
     
+    @traced("avatar_render")
     def create_avatar_video(
         self,
         script: str,
@@ -102,7 +110,7 @@ class DIDClient:
         custom_avatar_url: Optional[str] = None
     ) -> Optional[str]:
         """
-        아바타 영상 생성
+        아바타 영상 생성 (완료될 때까지 대기)
         
         Args:
             script: 읽을 텍스트 (한국어)
@@ -112,6 +120,39 @@ class DIDClient:
         Returns:
             생성된 영상의 다운로드 URL 또는 None
         """
+        talk_id = self.start_render(script, avatar_type, custom_avatar_url)
+        if not talk_id:
+            return None
+        
+        # 영상 생성 완료 대기
+        video_url = self._wait_for_video_completion(talk_id)
+        
+        if video_url:
+            logger.info(f"D-ID 영상 생성 완료: {video_url[:50]}...")
+            return video_url
+        else:
+            logger.error(f"D-ID 영상 생성 실패: talk_id={talk_id}")
+            return None
+    
+    def start_render(
+        self,
+        script: str,
+        avatar_type: str = 'interviewer_male',
+        custom_avatar_url: Optional[str] = None,
+        webhook_url: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        아바타 영상 생성 요청만 보내고 바로 반환 (완료 여부는 check_render로 확인)
+        
+        Args:
+            script: 읽을 텍스트 (한국어)
+            avatar_type: 아바타 유형 (interviewer_male, interviewer_female, debater_male, debater_female)
+            custom_avatar_url: 커스텀 아바타 이미지 URL
+            webhook_url: 생성 완료 시 D-ID가 호출할 URL
+            
+        Returns:
+            D-ID talk ID 또는 None
+        """
         try:
             # 텍스트 길이 검증
             if not script or len(script.strip()) < 10:
@@ -149,6 +190,8 @@ class DIDClient:
                     "result_format": "mp4"
                 }
             }
+            if webhook_url:
+                data["webhook"] = webhook_url
             
             logger.info(f"🎬 D-ID 영상 생성 시작")
             logger.info(f"   📝 스크립트: {script[:50]}{'...' if len(script) > 50 else ''}")
@@ -157,9 +200,8 @@ class DIDClient:
             logger.info(f"   📄 텍스트 길이: {len(script)} 글자")
             
             # 영상 생성 요청
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/talks",
-                headers=self.headers,
                 json=data,
                 timeout=30
             )
@@ -176,16 +218,7 @@ class DIDClient:
                     return None
                 
                 logger.info(f"D-ID 영상 생성 작업 시작: talk_id={talk_id}")
-                
-                # 영상 생성 완료 대기
-                video_url = self._wait_for_video_completion(talk_id)
-                
-                if video_url:
-                    logger.info(f"D-ID 영상 생성 완료: {video_url[:50]}...")
-                    return video_url
-                else:
-                    logger.error(f"D-ID 영상 생성 실패: talk_id={talk_id}")
-                    return None
+                return talk_id
                     
             elif response.status_code == 401:
                 logger.error("D-ID API 인증 실패 (401)")
@@ -218,9 +251,92 @@ class DIDClient:
             logger.error(f"D-ID 영상 생성 중 오류: {str(e)}")
             return None
     
+    def check_render(self, talk_id: str) -> Tuple[str, Optional[str]]:
+        """
+        영상 생성 상태 한 번 확인
+        
+        Args:
+            talk_id: D-ID talk ID
+            
+        Returns:
+            (상태, 값) - ('done', 영상 URL), ('failed', 오류 메시지), ('pending', D-ID 상태)
+        """
+        response = self.session.get(
+            f"{self.base_url}/talks/{talk_id}",
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            logger.warning(f"⚠️ 영상 상태 확인 실패: {response.status_code}")
+            # 존재하지 않거나 권한이 없는 작업은 다시 확인해도 소용없음
+            if response.status_code in (401, 403, 404):
+                return 'failed', f"상태 확인 실패: HTTP {response.status_code}"
+            return 'pending', None
+        
+        result = response.json()
+        status = result.get('status')
+        
+        if status == 'done':
+            video_url = result.get('result_url')
+            duration = result.get('duration', 0)
+            
+            logger.info(f"D-ID 영상 생성 완료!")
+            logger.info(f"   ⏱영상 길이: {duration}초")
+            
+            # 영상 길이가 0인 경우 상세 로그
+            if duration == 0:
+                logger.error("⚠️ 영상 길이가 0초입니다!")
+                logger.error(f"결과 세부사항: {json.dumps(result, ensure_ascii=False, indent=2)}")
+                
+                # 메타데이터 확인
+                metadata = result.get('metadata', {})
+                logger.error(f"메타데이터:")
+                logger.error(f"   - 프레임 수: {metadata.get('num_frames', 'N/A')}")
+                logger.error(f"   - 해상도: {metadata.get('resolution', 'N/A')}")
+                logger.error(f"   - 파일 크기: {metadata.get('size_kib', 'N/A')} KB")
+                
+                # 가능한 원인 분석
+                if metadata.get('num_frames', 0) == 0:
+                    logger.error("프레임이 생성되지 않음 - 텍스트나 음성 처리 실패")
+                elif metadata.get('size_kib', 0) < 10:
+                    logger.error("파일 크기가 너무 작음 - 처리 실패")
+                
+            if video_url:
+                return 'done', video_url
+            else:
+                logger.error("완료된 영상의 URL을 찾을 수 없음")
+                return 'failed', "완료된 영상의 URL을 찾을 수 없음"
+                
+        elif status in ('error', 'rejected'):
+            error_details = result.get('error', {})
+            error_msg = error_details.get('description', 'Unknown error')
+            error_type = error_details.get('kind', 'Unknown type')
+            
+            logger.error(f"D-ID 영상 생성 오류: {error_type}")
+            logger.error(f"   오류 메시지: {error_msg}")
+            logger.error(f"   전체 응답: {json.dumps(result, ensure_ascii=False, indent=2)}")
+            
+            # 특정 에러 타입별 안내
+            if 'credit' in error_msg.lower():
+                logger.error("해결방법: D-ID 계정에서 크레딧을 충전하세요")
+            elif 'quota' in error_msg.lower():
+                logger.error("해결방법: 요청 한도를 확인하고 잠시 후 재시도하세요")
+            elif 'voice' in error_msg.lower():
+                logger.error(f"해결방법: voice_id '{self.korean_voices}' 확인 필요")
+            elif 'source' in error_msg.lower():
+                logger.error("해결방법: 아바타 이미지 URL을 확인하세요")
+            
+            return 'failed', f"{error_type}: {error_msg}"
+            
+        elif status not in ['created', 'started']:
+            logger.warning(f"⚠️ 알 수 없는 상태: {status}")
+        
+        # 아직 진행 중
+        return 'pending', status
+    
     def _wait_for_video_completion(self, talk_id: str, max_wait_time: int = 300) -> Optional[str]:
         """
-        영상 생성 완료 대기
+        영상 생성 완료 대기 (확인 간격을 점점 늘리는 지수 백오프)
         
         Args:
             talk_id: D-ID talk ID
@@ -230,97 +346,29 @@ class DIDClient:
             완성된 영상의 다운로드 URL 또는 None
         """
         start_time = time.time()
-        check_interval = 5  # 5초마다 확인
         
         logger.info(f"D-ID 영상 생성 대기 중...")
         
-        while time.time() - start_time < max_wait_time:
+        for delay in poll_delays():
+            remaining = max_wait_time - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            
             try:
-                response = requests.get(
-                    f"{self.base_url}/talks/{talk_id}",
-                    headers=self.headers,
-                    timeout=10
-                )
-                
-                if response.status_code != 200:
-                    logger.warning(f"⚠️ 영상 상태 확인 실패: {response.status_code}")
-                    time.sleep(check_interval)
-                    continue
-                
-                result = response.json()
-                status = result.get('status')
-                elapsed_time = int(time.time() - start_time)
-                
-                logger.info(f"D-ID 영상 생성 상태: {status} (경과: {elapsed_time}초)")
-                
-                if status == 'done':
-                    video_url = result.get('result_url')
-                    duration = result.get('duration', 0)
-                    
-                    logger.info(f"D-ID 영상 생성 완료!")
-                    logger.info(f"   ⏱영상 길이: {duration}초")
-                    logger.info(f"   생성 시간: {elapsed_time}초")
-                    
-                    # 영상 길이가 0인 경우 상세 로그
-                    if duration == 0:
-                        logger.error("⚠️ 영상 길이가 0초입니다!")
-                        logger.error(f"결과 세부사항: {json.dumps(result, ensure_ascii=False, indent=2)}")
-                        
-                        # 메타데이터 확인
-                        metadata = result.get('metadata', {})
-                        logger.error(f"메타데이터:")
-                        logger.error(f"   - 프레임 수: {metadata.get('num_frames', 'N/A')}")
-                        logger.error(f"   - 해상도: {metadata.get('resolution', 'N/A')}")
-                        logger.error(f"   - 파일 크기: {metadata.get('size_kib', 'N/A')} KB")
-                        
-                        # 가능한 원인 분석
-                        if metadata.get('num_frames', 0) == 0:
-                            logger.error("프레임이 생성되지 않음 - 텍스트나 음성 처리 실패")
-                        elif metadata.get('size_kib', 0) < 10:
-                            logger.error("파일 크기가 너무 작음 - 처리 실패")
-                        
-                    if video_url:
-                        return video_url
-                    else:
-                        logger.error("완료된 영상의 URL을 찾을 수 없음")
-                        return None
-                        
-                elif status == 'error':
-                    error_details = result.get('error', {})
-                    error_msg = error_details.get('description', 'Unknown error')
-                    error_type = error_details.get('kind', 'Unknown type')
-                    
-                    logger.error(f"D-ID 영상 생성 오류: {error_type}")
-                    logger.error(f"   오류 메시지: {error_msg}")
-                    logger.error(f"   전체 응답: {json.dumps(result, ensure_ascii=False, indent=2)}")
-                    
-                    # 특정 에러 타입별 안내
-                    if 'credit' in error_msg.lower():
-                        logger.error("해결방법: D-ID 계정에서 크레딧을 충전하세요")
-                    elif 'quota' in error_msg.lower():
-                        logger.error("해결방법: 요청 한도를 확인하고 잠시 후 재시도하세요")
-                    elif 'voice' in error_msg.lower():
-                        logger.error(f"해결방법: voice_id '{self.korean_voices}' 확인 필요")
-                    elif 'source' in error_msg.lower():
-                        logger.error("해결방법: 아바타 이미지 URL을 확인하세요")
-                    
-                    return None
-                    
-                elif status in ['created', 'started']:
-                    # 아직 진행 중
-                    if status == 'started':
-                        logger.info("영상 처리 중...")
-                    time.sleep(check_interval)
-                    continue
-                else:
-                    logger.warning(f"⚠️ 알 수 없는 상태: {status}")
-                    time.sleep(check_interval)
-                    continue
-                    
+                state, value = self.check_render(talk_id)
             except Exception as e:
                 logger.error(f"영상 상태 확인 중 오류: {str(e)}")
-                time.sleep(check_interval)
                 continue
+            
+            elapsed_time = int(time.time() - start_time)
+            if state == 'done':
+                logger.info(f"   생성 시간: {elapsed_time}초")
+                return value
+            elif state == 'failed':
+                return None
+            
+            logger.info(f"D-ID 영상 생성 상태: {value} (경과: {elapsed_time}초)")
         
         logger.error(f"영상 생성 시간 초과: {max_wait_time}초")
         logger.error("해결방법:")
@@ -344,7 +392,7 @@ class DIDClient:
         try:
             logger.info(f"영상 다운로드 시작: {save_path}")
             
-            response = requests.get(video_url, timeout=120)  # 다운로드 시간 증가
+            response = self.download_session.get(video_url, timeout=120)  # 다운로드 시간 증가
             
             if response.status_code == 200:
                 # 디렉토리 생성
@@ -11,7 +11,10 @@ import json
 import time
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
+
+from modules.common.single_flight import SingleFlight
+from modules.common.cache_keys import video_cache_key
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -23,6 +26,9 @@ d_id_routes = Blueprint('d_id_routes', __name__)
 d_id_client = None
 video_manager = None
 
+# 같은 스크립트/음성에 대한 동시 렌더링 요청을 하나로 합침 (작업자 프로세스 간 포함)
+render_flight = SingleFlight("d_id")
+
 def init_d_id_routes(client, manager):
     """D-ID 라우트 초기화"""
     global d_id_client, video_manager
@@ -30,6 +36,39 @@ def init_d_id_routes(client, manager):
     video_manager = manager
     logger.info("D-ID 라우트 초기화 완료")
 
+def render_video_once(render: Callable[[], Optional[str]], script: str, video_type: str,
+                      use_cache: bool = True, **params) -> Optional[str]:
+    """
+    동시 요청 중 하나만 D-ID 렌더링을 실행하고 나머지는 그 결과를 공유
+
+    Args:
+        render: 실제 렌더링 함수 (영상 경로 반환)
+        script: 영상 스크립트
+        video_type: 영상 유형 (interview, debate)
+        use_cache: 렌더링 결과를 캐시에 저장하고, 다른 프로세스가 만든 결과를 캐시에서 조회할지 여부
+        **params: 영상 내용을 결정하는 값 (gender, phase 등)
+
+    Returns:
+        Optional[str]: 영상 파일 경로 (실패 시 None)
+    """
+    cache_key = video_cache_key("d_id", script, video_type, **params)
+    use_cache = use_cache and video_manager is not None
+
+    def render_and_cache():
+        video_path = render()
+        if use_cache and video_path and os.path.exists(video_path):
+            video_manager.cache_video(cache_key, video_path, content=script,
+                                      video_type=video_type, params=params)
+        return video_path
+
+    def cached():
+        return video_manager.get_cached_video(script, video_type, **params) if use_cache else None
+
+    video_path, shared = render_flight.do(cache_key, render_and_cache, check=cached)
+    if shared:
+        logger.info(f"진행 중이던 영상 생성 결과 공유: {video_path}")
+    return video_path
+
 # ==================== 개인면접 AI 아바타 영상 ====================
 
 @d_id_routes.route('/ai/interview/next-question-video', methods=['POST'])
@@ -53,9 +92,14 @@ def generate_interview_question_video():
         # 면접관 성별 (기본: 여성)
         interviewer_gender = data.get('interviewer_gender', 'female')
         
-        # 캐시 확인
-        cache_key = f"interview_{question_type}_{hash(question_text)}"
-        cached_video = video_manager.get_cached_video(cache_key) if video_manager else None
+        # 면접관 톤으로 스크립트 조정
+        script = format_interview_script(question_text, question_type)
+        
+        # 캐시 확인 (실제 렌더링되는 스크립트 기준 - 질문 유형별 인사말이 달라 원본 질문으로는 구분되지 않음,
+        # 인사말이 붙지 않는 질문만 같은 문구를 렌더링하는 사전 렌더링 영상과 키가 일치)
+        cached_video = video_manager.get_cached_video(
+            script, 'interview', gender=interviewer_gender, phase='question'
+        ) if video_manager else None
         
         if cached_video and os.path.exists(cached_video):
             logger.info(f"캐시된 영상 사용: {cached_video}")
@@ -69,20 +113,16 @@ def generate_interview_question_video():
         # D-ID 클라이언트로 영상 생성
         if d_id_client:
             try:
-                # 면접관 톤으로 스크립트 조정
-                script = format_interview_script(question_text, question_type)
-                
-                # 영상 생성
-                video_path = d_id_client.generate_interview_video(
-                    question_text=script,
-                    interviewer_gender=interviewer_gender
+                # 영상 생성 및 캐시 저장 (같은 질문의 동시 요청은 한 번만 생성)
+                video_path = render_video_once(
+                    lambda: d_id_client.generate_interview_video(
+                        question_text=script,
+                        interviewer_gender=interviewer_gender
+                    ),
+                    script, 'interview', gender=interviewer_gender, phase='question'
                 )
                 
                 if video_path and os.path.exists(video_path):
-                    # 캐시 저장
-                    if video_manager:
-                        video_manager.cache_video(cache_key, video_path)
-                    
                     logger.info(f"면접 질문 영상 생성 성공: {video_path}")
                     
                     return send_file(
@@ -137,9 +177,12 @@ def generate_interview_feedback_video():
         # D-ID 클라이언트로 영상 생성
         if d_id_client:
             try:
-                video_path = d_id_client.generate_interview_video(
-                    question_text=script,
-                    interviewer_gender='female'
+                video_path = render_video_once(
+                    lambda: d_id_client.generate_interview_video(
+                        question_text=script,
+                        interviewer_gender='female'
+                    ),
+                    script, 'interview', use_cache=False, gender='female', phase='feedback'
                 )
                 
                 if video_path and os.path.exists(video_path):
@@ -191,9 +234,13 @@ def generate_debate_opening_video():
             # 기본 입론 생성
             opening_text = generate_default_opening(topic, position)
         
-        # 캐시 확인
-        cache_key = f"debate_opening_{position}_{hash(opening_text)}"
-        cached_video = video_manager.get_cached_video(cache_key) if video_manager else None
+        # 토론자 성별 (찬성: 남성, 반대: 여성)
+        debater_gender = 'male' if position == 'PRO' else 'female'
+        
+        # 캐시 확인 (실제 렌더링되는 스크립트와 음성 기준)
+        cached_video = video_manager.get_cached_video(
+            opening_text, 'debate', gender=debater_gender, phase='opening'
+        ) if video_manager else None
         
         if cached_video and os.path.exists(cached_video):
             logger.info(f"캐시된 영상 사용: {cached_video}")
@@ -207,20 +254,16 @@ def generate_debate_opening_video():
         # D-ID 클라이언트로 영상 생성
         if d_id_client:
             try:
-                # 토론자 성별 (찬성: 남성, 반대: 여성)
-                debater_gender = 'male' if position == 'PRO' else 'female'
-                
-                video_path = d_id_client.generate_debate_video(
-                    debate_text=opening_text,
-                    debater_gender=debater_gender,
-                    debate_phase='opening'
+                video_path = render_video_once(
+                    lambda: d_id_client.generate_debate_video(
+                        debate_text=opening_text,
+                        debater_gender=debater_gender,
+                        debate_phase='opening'
+                    ),
+                    opening_text, 'debate', gender=debater_gender, phase='opening'
                 )
                 
                 if video_path and os.path.exists(video_path):
-                    # 캐시 저장
-                    if video_manager:
-                        video_manager.cache_video(cache_key, video_path)
-                    
                     logger.info(f"AI 입론 영상 생성 성공: {video_path}")
                     
                     return send_file(
@@ -290,10 +333,13 @@ def generate_debate_video_generic(phase: str):
             try:
                 debater_gender = 'male' if position == 'PRO' else 'female'
                 
-                video_path = d_id_client.generate_debate_video(
-                    debate_text=debate_text,
-                    debater_gender=debater_gender,
-                    debate_phase=phase
+                video_path = render_video_once(
+                    lambda: d_id_client.generate_debate_video(
+                        debate_text=debate_text,
+                        debater_gender=debater_gender,
+                        debate_phase=phase
+                    ),
+                    debate_text, 'debate', use_cache=False, gender=debater_gender, phase=phase
                 )
                 
                 if video_path and os.path.exists(video_path):
@@ -452,6 +498,9 @@ def check_d_id_status():
                 "cached_videos": len(list(Path(video_manager.cache_dir).glob('*.mp4')))
             }
         
+        # 동시 렌더링 합침 통계
+        status["render_single_flight"] = render_flight.stats()
+        
         return jsonify(status)
         
     except Exception as e:
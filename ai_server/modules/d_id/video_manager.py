@@ -2,44 +2,28 @@
 # -*- coding: utf-8 -*-
 """
 D-ID 영상 관리 모듈
-캐싱 및 파일 관리
+캐싱 및 파일 관리 (캐시 메타데이터는 SQLite 저장소에 보관)
 """
 
 import os
-import json
-import hashlib
+import time
+import shutil
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
+from .video_store import VideoCacheStore
+from modules.common.media_cache import MediaCache
+from modules.common.cache_keys import video_cache_key
+
 logger = logging.getLogger(__name__)
 
+# 캐시 유효 기간 (일)
+CACHE_TTL_DAYS = 7
+
 class VideoManager:
     """D-ID 영상 캐싱 및 관리 클래스"""
     
-    def get_cached_video(self, cache_key: str) -> Optional[str]:
-        """간단한 캐시 조회 메서드 (라우트와 호환)"""
-        # 메타데이터에서 캐시 키 조회
-        if cache_key in self.metadata:
-            video_info = self.metadata[cache_key]
-            file_path = video_info.get('file_path')
-            
-            # 파일 존재 확인
-            if file_path and os.path.exists(file_path):
-                return file_path
-        
-        return None
-    
-    def cache_video(self, cache_key: str, video_path: str):
-        """간단한 캐시 저장 메서드 (라우트와 호환)"""
-        if os.path.exists(video_path):
-            self.metadata[cache_key] = {
-                'file_path': video_path,
-                'created_at': datetime.now().isoformat(),
-                'file_size': os.path.getsize(video_path)
-            }
-            self._save_metadata()
-    
     def __init__(self, base_dir: str = 'videos'):
         """
         영상 관리자 초기화
@@ -52,47 +36,40 @@ class VideoManager:
         self.interviews_dir = os.path.join(base_dir, 'interviews')
         self.debates_dir = os.path.join(base_dir, 'debates')
         self.metadata_file = os.path.join(base_dir, 'video_metadata.json')
+        self.db_path = os.path.join(base_dir, 'video_cache.db')
+        self.cache_ttl = timedelta(days=CACHE_TTL_DAYS)
         
         # 디렉토리 생성
         for directory in [self.cache_dir, self.interviews_dir, self.debates_dir]:
             os.makedirs(directory, exist_ok=True)
         
-        # 메타데이터 로드
-        self.metadata = self._load_metadata()
+        # 메타데이터 저장소 (기존 JSON 메타데이터가 있으면 한 번만 이전)
+        self.store = VideoCacheStore(self.db_path)
+        self.store.import_json_metadata(self.metadata_file, self.cache_ttl.total_seconds())
+        
+        # 영상 파일 용량/기간 제한 (파일이 제거되면 메타데이터도 삭제)
+        self.video_cache = MediaCache(
+            "d_id_videos",
+            directory=base_dir,
+            max_bytes=5 * 1024 * 1024 * 1024,
+            max_age_seconds=self.cache_ttl.total_seconds(),
+            pattern=["cache/*.mp4", "interviews/*.mp4", "debates/*.mp4"],
+            recursive=True,
+            on_evict=lambda key, path: self.store.delete_by_path(path)
+        )
         
         logger.info(f"D-ID 영상 관리자 초기화: {base_dir}")
     
-    def _load_metadata(self) -> Dict[str, Any]:
-        """메타데이터 파일 로드"""
-        try:
-            if os.path.exists(self.metadata_file):
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            logger.error(f"메타데이터 로드 실패: {str(e)}")
-            return {}
-    
-    def _save_metadata(self):
-        """메타데이터 파일 저장"""
-        try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"메타데이터 저장 실패: {str(e)}")
-    
-    def _generate_cache_key(self, content: str, params: Dict[str, Any]) -> str:
-        """캐시 키 생성"""
-        # 텍스트와 매개변수를 조합해서 고유 키 생성
-        combined = content + json.dumps(params, sort_keys=True)
-        return hashlib.md5(combined.encode('utf-8')).hexdigest()
+    def _generate_cache_key(self, content: str, video_type: Optional[str], params: Dict[str, Any]) -> str:
+        """캐시 키 생성 (프로세스와 무관하게 같은 내용이면 같은 키)"""
+        return video_cache_key("d_id", content, video_type, **params)
     
-    def get_cached_video(self, content: str, video_type: str, **params) -> Optional[str]:
+    def get_cached_video(self, content: str, video_type: Optional[str] = None, **params) -> Optional[str]:
         """
         캐시된 영상 조회
         
         Args:
-            content: 영상 내용 (질문 텍스트 등)
+            content: 영상 내용 (질문 텍스트 등), video_type이 없으면 캐시 키로 사용 (라우트 호환)
             video_type: 영상 유형 ('interview' 또는 'debate')
             **params: 추가 매개변수 (성별, 단계 등)
             
@@ -100,32 +77,65 @@ class VideoManager:
             캐시된 영상 파일 경로 또는 None
         """
         try:
-            cache_key = self._generate_cache_key(content, params)
+            cache_key = content if video_type is None else self._generate_cache_key(content, video_type, params)
             
-            if cache_key in self.metadata:
-                video_info = self.metadata[cache_key]
-                file_path = video_info.get('file_path')
-                
-                # 파일 존재 확인
-                if file_path and os.path.exists(file_path):
-                    # 캐시 만료 확인 (7일)
-                    created_time = datetime.fromisoformat(video_info.get('created_at'))
-                    if datetime.now() - created_time < timedelta(days=7):
-                        logger.info(f"캐시된 영상 반환: {file_path}")
-                        return file_path
-                    else:
-                        logger.info(f"캐시 만료된 영상 삭제: {file_path}")
-                        self._remove_cached_video(cache_key)
-                else:
-                    # 파일이 없으면 메타데이터에서 삭제
-                    self._remove_cached_video(cache_key)
+            entry = self.store.get(cache_key)
+            if entry is None:
+                return None
             
-            return None
+            file_path = entry.get('file_path')
+            
+            # 파일 존재 확인
+            if not file_path or not os.path.exists(file_path):
+                # 파일이 없으면 메타데이터에서 삭제
+                self.store.delete(cache_key)
+                return None
+            
+            # 캐시 만료 확인
+            expires_at = entry.get('expires_at')
+            if expires_at is not None and expires_at <= time.time():
+                logger.info(f"캐시 만료된 영상 삭제: {file_path}")
+                self._remove_cached_video(cache_key)
+                return None
+            
+            # 용량 정리 시 최근 사용 순서에 반영
+            cache_file_key = self.video_cache.key_for(file_path)
+            if cache_file_key:
+                self.video_cache.touch(cache_file_key)
+            
+            logger.info(f"캐시된 영상 반환: {file_path}")
+            return file_path
             
         except Exception as e:
             logger.error(f"캐시 조회 중 오류: {str(e)}")
             return None
     
+    def cache_video(self, cache_key: str, video_path: str, content: Optional[str] = None,
+                    video_type: Optional[str] = None, params: Optional[Dict[str, Any]] = None):
+        """
+        이미 저장된 영상 파일을 캐시에 등록 (파일 복사 없음)
+        
+        Args:
+            cache_key: 캐시 키
+            video_path: 영상 파일 경로
+            content: 영상 내용 (키 규칙 변경 시 재색인에 사용)
+            video_type: 영상 유형
+            params: 추가 매개변수
+        """
+        if os.path.exists(video_path):
+            self.store.upsert(
+                cache_key,
+                os.path.abspath(video_path),
+                video_type=video_type,
+                content=content,
+                params=params,
+                file_size=os.path.getsize(video_path),
+                ttl_seconds=self.cache_ttl.total_seconds()
+            )
+            cache_file_key = self.video_cache.key_for(video_path)
+            if cache_file_key:
+                self.video_cache.put(cache_file_key)
+    
     def save_video(self, video_path: str, content: str, video_type: str, **params) -> str:
         """
         영상 저장 및 캐시 등록
@@ -148,9 +158,10 @@ class VideoManager:
             else:
                 target_dir = self.cache_dir
             
-            # 파일명 생성
+            # 파일명 생성 (동시 생성 시 이름 충돌 방지를 위해 캐시 키 포함)
+            cache_key = self._generate_cache_key(content, video_type, params)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{video_type}_{timestamp}.mp4"
+            filename = f"{video_type}_{timestamp}_{cache_key[:8]}.mp4"
             # os.path.join을 사용하여 플랫폼에 맞는 경로 생성
             final_path = os.path.join(target_dir, filename)
             # 경로를 절대 경로로 변환
@@ -161,21 +172,22 @@ class VideoManager:
             
             # 파일 복사 또는 이동
             if os.path.exists(video_path):
-                import shutil
                 shutil.copy2(video_path, final_path)
                 
-                # 캐시 키 생성 및 메타데이터 저장
-                cache_key = self._generate_cache_key(content, params)
-                self.metadata[cache_key] = {
-                    'file_path': final_path,
-                    'content': content,
-                    'video_type': video_type,
-                    'params': params,
-                    'created_at': datetime.now().isoformat(),
-                    'file_size': os.path.getsize(final_path)
-                }
+                # 캐시 항목 등록 (같은 키의 이전 파일은 더 이상 참조되지 않으므로 삭제)
+                replaced_path = self.store.upsert(
+                    cache_key,
+                    final_path,
+                    video_type=video_type,
+                    content=content,
+                    params=params,
+                    file_size=os.path.getsize(final_path),
+                    ttl_seconds=self.cache_ttl.total_seconds()
+                )
+                if replaced_path:
+                    self._delete_file(replaced_path)
+                self.video_cache.put(self.video_cache.key_for(final_path))
                 
-                self._save_metadata()
                 logger.info(f"영상 저장 완료: {final_path}")
                 
                 return final_path
@@ -187,42 +199,36 @@ class VideoManager:
             logger.error(f"영상 저장 중 오류: {str(e)}")
             return video_path
     
+    def _delete_file(self, file_path: Optional[str]):
+        """캐시 영상 파일 삭제"""
+        cache_file_key = self.video_cache.key_for(file_path) if file_path else None
+        if cache_file_key:
+            self.video_cache.discard(cache_file_key)
+        if file_path and os.path.exists(file_path):
+            os.remove(file_path)
+            logger.info(f"캐시 파일 삭제: {file_path}")
+    
     def _remove_cached_video(self, cache_key: str):
         """캐시된 영상 삭제"""
         try:
-            if cache_key in self.metadata:
-                video_info = self.metadata[cache_key]
-                file_path = video_info.get('file_path')
-                
-                # 파일 삭제
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"캐시 파일 삭제: {file_path}")
-                
-                # 메타데이터에서 삭제
-                del self.metadata[cache_key]
-                self._save_metadata()
-                
+            self._delete_file(self.store.delete(cache_key))
         except Exception as e:
             logger.error(f"캐시 영상 삭제 중 오류: {str(e)}")
     
     def cleanup_old_videos(self, days: int = 7):
         """오래된 영상 파일 정리"""
         try:
-            current_time = datetime.now()
-            removed_count = 0
+            created_before = (datetime.now() - timedelta(days=days)).timestamp()
+            removed = self.store.pop_older_than(created_before) + self.store.pop_expired()
             
-            for cache_key, video_info in list(self.metadata.items()):
+            for entry in removed:
                 try:
-                    created_time = datetime.fromisoformat(video_info.get('created_at'))
-                    if current_time - created_time > timedelta(days=days):
-                        self._remove_cached_video(cache_key)
-                        removed_count += 1
+                    self._delete_file(entry.get('file_path'))
                 except Exception as e:
-                    logger.warning(f"영상 정리 중 오류 (키: {cache_key}): {str(e)}")
+                    logger.warning(f"영상 정리 중 오류 (키: {entry.get('cache_key')}): {str(e)}")
                     continue
             
-            logger.info(f"오래된 영상 {removed_count}개 정리 완료")
+            logger.info(f"오래된 영상 {len(removed)}개 정리 완료")
             
         except Exception as e:
             logger.error(f"영상 정리 중 오류: {str(e)}")
@@ -230,22 +236,12 @@ class VideoManager:
     def get_storage_info(self) -> Dict[str, Any]:
         """저장소 정보 조회"""
         try:
-            total_files = len(self.metadata)
-            total_size = sum(info.get('file_size', 0) for info in self.metadata.values())
-            
-            # 타입별 통계
-            type_stats = {}
-            for video_info in self.metadata.values():
-                video_type = video_info.get('video_type', 'unknown')
-                if video_type not in type_stats:
-                    type_stats[video_type] = {'count': 0, 'size': 0}
-                type_stats[video_type]['count'] += 1
-                type_stats[video_type]['size'] += video_info.get('file_size', 0)
+            stats = self.store.stats()
             
             return {
-                'total_files': total_files,
-                'total_size_mb': round(total_size / (1024 * 1024), 2),
-                'type_stats': type_stats,
+                'total_files': stats['total_files'],
+                'total_size_mb': round(stats['total_size'] / (1024 * 1024), 2),
+                'type_stats': stats['type_stats'],
                 'base_dir': self.base_dir
             }
             
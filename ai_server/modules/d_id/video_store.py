@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D-ID 영상 캐시 저장소
+videos/ 디렉토리를 공유하는 여러 프로세스가 함께 쓰는 SQLite(WAL 모드) 기반 캐시 메타데이터 저장소
+
+- 캐시 항목 1건 추가/삭제는 행 단위 원자적 upsert/delete (전체 파일 재작성 없음)
+- 만료 시각, 파일 크기, 최근 사용 시각 인덱스로 만료/용량 정리를 SQL 조회로 처리
+- 스레드마다 별도 연결을 사용하고, 쓰기 잠금 대기는 busy_timeout으로 처리
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 잠금 대기 시간 (밀리초)
+BUSY_TIMEOUT_MS = int(os.environ.get("VIDEO_CACHE_BUSY_TIMEOUT_MS", 5000))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_cache (
+    cache_key TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    video_type TEXT,
+    content TEXT,
+    params TEXT,
+    file_size INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_video_cache_expires_at ON video_cache (expires_at);
+CREATE INDEX IF NOT EXISTS idx_video_cache_file_size ON video_cache (file_size);
+CREATE INDEX IF NOT EXISTS idx_video_cache_last_accessed ON video_cache (last_accessed);
+CREATE INDEX IF NOT EXISTS idx_video_cache_video_type ON video_cache (video_type);
+"""
+
+_COLUMNS = ("cache_key", "file_path", "video_type", "content", "params",
+            "file_size", "created_at", "expires_at", "last_accessed")
+
+class VideoCacheStore:
+    """SQLite 기반 영상 캐시 메타데이터 저장소"""
+
+    def __init__(self, db_path: str):
+        """
+        저장소 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # IF NOT EXISTS 구문이라 여러 프로세스가 동시에 실행해도 안전
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (최초 호출 시 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 트랜잭션은 _transaction()에서 직접 관리
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 시작하여 다른 프로세스와의 갱신 충돌 방지)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """DB 행을 캐시 항목 딕셔너리로 변환"""
+        entry = dict(row)
+        entry["params"] = json.loads(entry["params"]) if entry.get("params") else {}
+        return entry
+
+    def get(self, cache_key: str, touch: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회
+
+        Args:
+            cache_key: 캐시 키
+            touch: 최근 사용 시각 갱신 여부
+
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 항목 (없으면 None)
+        """
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM video_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+        if row is None:
+            return None
+        if touch:
+            conn.execute("UPDATE video_cache SET last_accessed = ? WHERE cache_key = ?", (time.time(), cache_key))
+        return self._to_entry(row)
+
+    def upsert(self, cache_key: str, file_path: str, video_type: Optional[str] = None,
+               content: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+               file_size: int = 0, ttl_seconds: Optional[float] = None,
+               created_at: Optional[float] = None) -> Optional[str]:
+        """
+        캐시 항목 추가 또는 교체 (원자적)
+
+        Args:
+            cache_key: 캐시 키
+            file_path: 영상 파일 경로
+            video_type: 영상 유형
+            content: 영상 내용 (스크립트)
+            params: 추가 매개변수
+            file_size: 파일 크기 (바이트)
+            ttl_seconds: 유효 기간 (None이면 만료 없음)
+            created_at: 생성 시각 (기본값: 현재 시각)
+
+        Returns:
+            Optional[str]: 교체되어 더 이상 참조되지 않는 이전 파일 경로 (없으면 None)
+        """
+        now = time.time()
+        created_at = created_at or now
+        expires_at = created_at + ttl_seconds if ttl_seconds else None
+
+        with self._transaction() as conn:
+            previous = conn.execute("SELECT file_path FROM video_cache WHERE cache_key = ?",
+                                    (cache_key,)).fetchone()
+            conn.execute(
+                """
+                INSERT INTO video_cache (cache_key, file_path, video_type, content, params,
+                                         file_size, created_at, expires_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    video_type = excluded.video_type,
+                    content = excluded.content,
+                    params = excluded.params,
+                    file_size = excluded.file_size,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at,
+                    last_accessed = excluded.last_accessed
+                """,
+                (cache_key, file_path, video_type, content,
+                 json.dumps(params or {}, ensure_ascii=False, sort_keys=True, default=str),
+                 int(file_size), created_at, expires_at, now)
+            )
+
+        if previous and previous["file_path"] != file_path:
+            return previous["file_path"]
+        return None
+
+    def delete(self, cache_key: str) -> Optional[str]:
+        """
+        캐시 항목 삭제
+
+        Args:
+            cache_key: 캐시 키
+
+        Returns:
+            Optional[str]: 삭제된 항목의 파일 경로 (없으면 None)
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT file_path FROM video_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM video_cache WHERE cache_key = ?", (cache_key,))
+        return row["file_path"]
+
+    def delete_by_path(self, file_path: Optional[str]) -> int:
+        """
+        파일 경로를 참조하는 항목 삭제 (파일이 캐시 정리로 삭제된 경우)
+
+        Args:
+            file_path: 영상 파일 경로
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        if not file_path:
+            return 0
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM video_cache WHERE file_path = ?", (os.path.abspath(file_path),))
+        return cursor.rowcount
+
+    def pop_expired(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        만료된 항목을 삭제하고 반환 (expires_at 인덱스 사용)
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            List[Dict[str, Any]]: 삭제된 항목 목록
+        """
+        now = now or time.time()
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT * FROM video_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                                (now,)).fetchall()
+            conn.execute("DELETE FROM video_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        return [self._to_entry(row) for row in rows]
+
+    def pop_older_than(self, created_before: float) -> List[Dict[str, Any]]:
+        """
+        지정 시각 이전에 생성된 항목을 삭제하고 반환
+
+        Args:
+            created_before: 기준 생성 시각 (epoch 초)
+
+        Returns:
+            List[Dict[str, Any]]: 삭제된 항목 목록
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT * FROM video_cache WHERE created_at < ?", (created_before,)).fetchall()
+            conn.execute("DELETE FROM video_cache WHERE created_at < ?", (created_before,))
+        return [self._to_entry(row) for row in rows]
+
+    def least_recently_used(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        최근 사용 시각이 오래된 순서로 항목 조회 (용량 정리용)
+
+        Args:
+            limit: 최대 항목 수
+
+        Returns:
+            List[Dict[str, Any]]: 캐시 항목 목록
+        """
+        rows = self._connect().execute(
+            "SELECT * FROM video_cache ORDER BY last_accessed ASC LIMIT ?", (limit,)
+        ).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def largest(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        파일 크기가 큰 순서로 항목 조회
+
+        Args:
+            limit: 최대 항목 수
+
+        Returns:
+            List[Dict[str, Any]]: 캐시 항목 목록
+        """
+        rows = self._connect().execute(
+            "SELECT * FROM video_cache ORDER BY file_size DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        전체 캐시 항목 조회 (캐시 키 재색인용)
+
+        Returns:
+            List[Dict[str, Any]]: 캐시 항목 목록
+        """
+        rows = self._connect().execute("SELECT * FROM video_cache ORDER BY created_at").fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def rekey(self, old_key: str, new_key: str) -> Optional[str]:
+        """
+        캐시 항목의 키 변경 (원자적)
+        새 키 항목이 이미 있으면 그 항목을 유지하고 이전 키 항목을 삭제
+
+        Args:
+            old_key: 기존 캐시 키
+            new_key: 새 캐시 키
+
+        Returns:
+            Optional[str]: 더 이상 참조되지 않는 파일 경로 (없으면 None)
+        """
+        if old_key == new_key:
+            return None
+        with self._transaction() as conn:
+            old = conn.execute("SELECT file_path FROM video_cache WHERE cache_key = ?", (old_key,)).fetchone()
+            if old is None:
+                return None
+            existing = conn.execute("SELECT file_path FROM video_cache WHERE cache_key = ?",
+                                    (new_key,)).fetchone()
+            if existing is None:
+                conn.execute("UPDATE video_cache SET cache_key = ? WHERE cache_key = ?", (new_key, old_key))
+                return None
+            conn.execute("DELETE FROM video_cache WHERE cache_key = ?", (old_key,))
+        if old["file_path"] != existing["file_path"]:
+            return old["file_path"]
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        전체/유형별 항목 수와 용량
+
+        Returns:
+            Dict[str, Any]: total_files, total_size, type_stats
+        """
+        conn = self._connect()
+        total = conn.execute("SELECT COUNT(*) AS count, COALESCE(SUM(file_size), 0) AS size FROM video_cache").fetchone()
+        type_stats = {
+            (row["video_type"] or "unknown"): {"count": row["count"], "size": row["size"]}
+            for row in conn.execute(
+                "SELECT video_type, COUNT(*) AS count, COALESCE(SUM(file_size), 0) AS size "
+                "FROM video_cache GROUP BY video_type"
+            )
+        }
+        return {"total_files": total["count"], "total_size": total["size"], "type_stats": type_stats}
+
+    def import_json_metadata(self, metadata_file: str, ttl_seconds: Optional[float] = None) -> int:
+        """
+        기존 video_metadata.json 항목을 가져오고 원본 파일은 .migrated로 이름 변경
+
+        여러 프로세스가 동시에 시작해도 쓰기 트랜잭션 안에서 INSERT OR IGNORE로
+        가져오므로 한 번만 반영됨
+
+        Args:
+            metadata_file: 기존 JSON 메타데이터 파일 경로
+            ttl_seconds: 가져온 항목에 적용할 유효 기간
+
+        Returns:
+            int: 가져온 항목 수
+        """
+        if not os.path.exists(metadata_file):
+            return 0
+
+        try:
+            with open(metadata_file, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"기존 메타데이터 읽기 실패: {str(e)}")
+            return 0
+
+        imported = 0
+        with self._transaction() as conn:
+            for cache_key, info in metadata.items():
+                file_path = info.get("file_path")
+                if not file_path:
+                    continue
+                try:
+                    created_at = time.mktime(time.strptime(info["created_at"][:19], "%Y-%m-%dT%H:%M:%S"))
+                except (KeyError, ValueError):
+                    created_at = time.time()
+                cursor = conn.execute(
+                    f"INSERT OR IGNORE INTO video_cache ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (cache_key, file_path, info.get("video_type"), info.get("content"),
+                     json.dumps(info.get("params") or {}, ensure_ascii=False, sort_keys=True, default=str),
+                     int(info.get("file_size", 0)), created_at,
+                     created_at + ttl_seconds if ttl_seconds else None, created_at)
+                )
+                imported += cursor.rowcount
+
+        try:
+            os.replace(metadata_file, f"{metadata_file}.migrated")
+        except OSError:
+            # 다른 프로세스가 먼저 이름을 바꾼 경우
+            pass
+
+        logger.info(f"기존 영상 메타데이터 {imported}개 항목을 SQLite 저장소로 이전")
+        return imported
+
+    def close(self):
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
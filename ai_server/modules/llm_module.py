@@ -6,9 +6,12 @@ OpenAI GPT, Claude 등의 LLM을 사용한 토론 및 면접 응답 생성
 """
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Generator
 import json
 
+from modules.common.llm_stream import stream_openai, stream_anthropic, stream_ollama
+from modules.common.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 class LLMModule:
@@ -46,6 +49,10 @@ class LLMModule:
                 # Anthropic API 키 설정이 필요합니다
                 # self.client = anthropic.Anthropic(api_key="your-api-key-here")
                 self.client = anthropic
+            elif self.provider.lower() == "ollama":
+                # Ollama는 로컬 HTTP API 사용 (별도 클라이언트 불필요)
+                import requests
+                self.client = requests.Session()
             else:
                 raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
                 
@@ -191,9 +198,35 @@ class LLMModule:
             logger.error(f"면접 답변 분석 오류: {str(e)}")
             return {"error": f"답변 분석 실패: {str(e)}"}
     
+    def stream_response(self, prompt: str, max_tokens: int = 500) -> Generator[str, None, None]:
+        """
+        LLM 응답 스트리밍 - 제공자 스트리밍 API에서 받은 텍스트 조각을 즉시 반환
+        
+        Args:
+            prompt: 프롬프트
+            max_tokens: 최대 토큰 수
+            
+        Yields:
+            str: 생성된 텍스트 조각
+        """
+        messages = [{"role": "user", "content": prompt}]
+        
+        if self.provider.lower() == "openai":
+            yield from stream_openai(self.client, self.model, messages, max_tokens=max_tokens)
+        elif self.provider.lower() == "anthropic":
+            yield from stream_anthropic(self.client, self.model, messages, max_tokens=max_tokens)
+        elif self.provider.lower() == "ollama":
+            yield from stream_ollama(prompt, self.model, max_tokens=max_tokens, session=self.client)
+        else:
+            raise ValueError(f"지원하지 않는 LLM 제공자: {self.provider}")
+    
+    @traced("llm")
     def _generate_response(self, prompt: str) -> str:
         """LLM 응답 생성"""
         try:
+            if self.provider.lower() == "ollama":
+                return "".join(self.stream_response(prompt)).strip()
+            
             if self.provider.lower() == "openai":
                 response = self.client.ChatCompletion.create(
                     model=self.model,
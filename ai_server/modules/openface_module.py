@@ -9,12 +9,23 @@ import os
 import subprocess
 import tempfile
 import time
-import csv
+import shutil
 from typing import Dict, Any, Optional, List
 import numpy as np
 
+from modules.common.frame_sampling import OPENFACE_FEATURE_FLAGS, resolve_openface_input
+from modules.common.tracing import traced
+from modules.common.openface_csv import (
+    load_openface_csv, frame_count, column, successful_frames, au_intensity_columns, mean_frame_change
+)
+
 logger = logging.getLogger(__name__)
 
+# 요약 통계에 사용하는 OpenFace 열
+HEAD_POSE_COLUMNS = ["pose_Rx", "pose_Ry", "pose_Rz"]
+LEFT_GAZE_COLUMNS = ["gaze_0_x", "gaze_0_y", "gaze_0_z"]
+RIGHT_GAZE_COLUMNS = ["gaze_1_x", "gaze_1_y", "gaze_1_z"]
+
 class OpenFaceModule:
     def __init__(self, openface_path: str = None):
         """
@@ -78,6 +89,7 @@ class OpenFaceModule:
         """OpenFace 모듈 사용 가능 여부 확인"""
         return self.available
     
+    @traced("facial")
     def analyze_video(self, video_path: str, output_dir: str = None) -> Dict[str, Any]:
         """
         비디오 파일의 얼굴 분석
@@ -116,7 +128,7 @@ class OpenFaceModule:
                     "success": True,
                     "video_path": video_path,
                     "analysis_summary": summary,
-                    "detailed_data": facial_data[:10],  # 처음 10프레임만 포함
+                    "detailed_data": self._extract_frame_features(facial_data, limit=10),  # 처음 10프레임만 포함
                     "output_directory": output_dir,
                     "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
                 }
@@ -165,7 +177,7 @@ class OpenFaceModule:
                     "success": True,
                     "image_path": image_path,
                     "analysis_summary": summary,
-                    "facial_landmarks": facial_data[0] if facial_data else {},
+                    "facial_landmarks": (self._extract_frame_features(facial_data, limit=1) or [{}])[0],
                     "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
                 }
             else:
@@ -181,37 +193,36 @@ class OpenFaceModule:
     def _run_openface_analysis(self, input_path: str, output_dir: str, image_mode: bool = False) -> Dict[str, Any]:
         """OpenFace 분석 실행"""
         try:
-            # OpenFace 명령어 구성
+            # 비디오는 설정된 샘플링 모드로 프레임을 미리 솎아서 전달
+            frames_dir = None
+            if image_mode:
+                input_flag = "-fdir"
+            else:
+                frames_dir = f"{output_dir.rstrip(os.sep)}_frames"
+                input_flag, input_path = resolve_openface_input(input_path, frames_dir)
+            
+            # OpenFace 명령어 구성 (요약에 사용하는 AU/시선/자세만 계산)
             cmd = [
                 self.openface_path,
-                "-f" if not image_mode else "-fdir",
+                input_flag,
                 input_path,
                 "-out_dir", output_dir,
-                "-aus",  # Action Units 추출
-                "-pose",  # Head pose 추출
-                "-gaze",  # Gaze direction 추출
-                "-2Dfp",  # 2D facial landmarks
-                "-3Dfp",  # 3D facial landmarks
-            ]
-            
-            # 비디오 분석의 경우 추가 옵션
-            if not image_mode:
-                cmd.extend([
-                    "-format_aligned",  # 정렬된 얼굴 이미지 저장
-                    "-simscale", "0.7",  # 유사성 스케일
-                    "-simsize", "112"    # 출력 이미지 크기
-                ])
+            ] + OPENFACE_FEATURE_FLAGS
             
             logger.info(f"OpenFace 실행: {' '.join(cmd)}")
             
             # OpenFace 실행
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5분 타임아웃
-                cwd=os.path.dirname(self.openface_path)
-            )
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=300,  # 5분 타임아웃
+                    cwd=os.path.dirname(self.openface_path)
+                )
+            finally:
+                if frames_dir:
+                    shutil.rmtree(frames_dir, ignore_errors=True)
             
             if result.returncode == 0:
                 return {"success": True, "stdout": result.stdout}
@@ -229,91 +240,59 @@ class OpenFaceModule:
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
     
-    def _parse_openface_output(self, output_dir: str) -> List[Dict[str, Any]]:
-        """OpenFace 출력 결과 파싱"""
-        facial_data = []
-        
+    def _parse_openface_output(self, output_dir: str) -> Dict[str, np.ndarray]:
+        """OpenFace 출력 결과 파싱 (열 이름 → float32 배열)"""
         try:
             # CSV 파일 찾기
             csv_files = [f for f in os.listdir(output_dir) if f.endswith('.csv')]
             
             if not csv_files:
                 logger.warning(f"OpenFace 출력 CSV 파일을 찾을 수 없습니다: {output_dir}")
-                return facial_data
+                return {}
             
             # 첫 번째 CSV 파일 읽기
             csv_path = os.path.join(output_dir, csv_files[0])
+            facial_data = load_openface_csv(csv_path)
             
-            with open(csv_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                for row in reader:
-                    frame_data = self._extract_frame_features(row)
-                    facial_data.append(frame_data)
-            
-            logger.info(f"OpenFace 데이터 파싱 완료: {len(facial_data)} 프레임")
+            logger.info(f"OpenFace 데이터 파싱 완료: {frame_count(facial_data)} 프레임")
+            return facial_data
             
         except Exception as e:
             logger.error(f"OpenFace 출력 파싱 오류: {str(e)}")
-        
-        return facial_data
+            return {}
     
-    def _extract_frame_features(self, row: Dict[str, str]) -> Dict[str, Any]:
-        """프레임별 특징 추출"""
-        try:
-            # 기본 정보
-            frame_data = {
-                "frame": int(row.get("frame", 0)),
-                "timestamp": float(row.get("timestamp", 0.0)),
-                "confidence": float(row.get("confidence", 0.0)),
-                "success": int(row.get("success", 0)) == 1
-            }
-            
-            # Head pose (머리 자세)
-            frame_data["head_pose"] = {
-                "pose_Rx": float(row.get("pose_Rx", 0.0)),
-                "pose_Ry": float(row.get("pose_Ry", 0.0)),
-                "pose_Rz": float(row.get("pose_Rz", 0.0))
-            }
-            
-            # Gaze direction (시선 방향)
-            frame_data["gaze"] = {
-                "gaze_0_x": float(row.get("gaze_0_x", 0.0)),
-                "gaze_0_y": float(row.get("gaze_0_y", 0.0)),
-                "gaze_0_z": float(row.get("gaze_0_z", 0.0)),
-                "gaze_1_x": float(row.get("gaze_1_x", 0.0)),
-                "gaze_1_y": float(row.get("gaze_1_y", 0.0)),
-                "gaze_1_z": float(row.get("gaze_1_z", 0.0))
-            }
-            
-            # Action Units (표정 움직임)
-            frame_data["action_units"] = {}
-            for key, value in row.items():
-                if key.startswith("AU") and "_r" in key:  # AU intensity values
-                    au_name = key.replace("_r", "")
-                    frame_data["action_units"][au_name] = float(value)
-            
-            return frame_data
-            
-        except Exception as e:
-            logger.error(f"프레임 특징 추출 오류: {str(e)}")
-            return {"frame": 0, "confidence": 0.0, "success": False}
+    def _extract_frame_features(self, facial_data: Dict[str, np.ndarray], limit: int = 10) -> List[Dict[str, Any]]:
+        """앞쪽 프레임들의 특징을 프레임별 딕셔너리로 변환 (응답 상세 데이터용)"""
+        frames = []
+        au_columns = au_intensity_columns(facial_data)
+        
+        for i in range(min(limit, frame_count(facial_data))):
+            frames.append({
+                "frame": int(column(facial_data, "frame")[i]),
+                "timestamp": float(column(facial_data, "timestamp")[i]),
+                "confidence": float(column(facial_data, "confidence")[i]),
+                "success": bool(column(facial_data, "success")[i] >= 1.0),
+                "head_pose": {name: float(column(facial_data, name)[i]) for name in HEAD_POSE_COLUMNS},
+                "gaze": {name: float(column(facial_data, name)[i]) for name in LEFT_GAZE_COLUMNS + RIGHT_GAZE_COLUMNS},
+                "action_units": {name[:-2]: float(facial_data[name][i]) for name in au_columns}
+            })
+        
+        return frames
     
-    def _create_analysis_summary(self, facial_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_analysis_summary(self, facial_data: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """얼굴 분석 데이터의 종합 요약 생성"""
-        if not facial_data:
+        if not frame_count(facial_data):
             return self._get_default_summary()
         
         try:
             # 성공적으로 분석된 프레임만 필터링
-            valid_frames = [frame for frame in facial_data if frame.get("success", False)]
+            valid_frames = successful_frames(facial_data)
             
-            if not valid_frames:
+            if not frame_count(valid_frames):
                 return self._get_default_summary()
             
             # 신뢰도 계산
-            confidences = [frame["confidence"] for frame in valid_frames]
-            avg_confidence = np.mean(confidences) if confidences else 0.0
+            avg_confidence = float(column(valid_frames, "confidence").mean())
             
             # 머리 자세 안정성 계산
             head_stability = self._calculate_head_stability(valid_frames)
@@ -328,8 +307,8 @@ class OpenFaceModule:
             behavior_assessment = self._assess_behavior(valid_frames)
             
             summary = {
-                "total_frames": len(facial_data),
-                "valid_frames": len(valid_frames),
+                "total_frames": frame_count(facial_data),
+                "valid_frames": frame_count(valid_frames),
                 "average_confidence": round(avg_confidence, 3),
                 "head_stability": round(head_stability, 3),
                 "gaze_stability": round(gaze_stability, 3),
@@ -349,27 +328,17 @@ class OpenFaceModule:
             logger.error(f"분석 요약 생성 오류: {str(e)}")
             return self._get_default_summary()
     
-    def _calculate_head_stability(self, frames: List[Dict[str, Any]]) -> float:
+    def _calculate_head_stability(self, frames: Dict[str, np.ndarray]) -> float:
         """머리 자세 안정성 계산"""
         try:
-            if len(frames) < 2:
+            if frame_count(frames) < 2:
                 return 0.5
             
-            # 머리 회전 각도 변화량 계산
-            pose_changes = []
-            for i in range(1, len(frames)):
-                prev_pose = frames[i-1]["head_pose"]
-                curr_pose = frames[i]["head_pose"]
-                
-                rx_change = abs(curr_pose["pose_Rx"] - prev_pose["pose_Rx"])
-                ry_change = abs(curr_pose["pose_Ry"] - prev_pose["pose_Ry"])
-                rz_change = abs(curr_pose["pose_Rz"] - prev_pose["pose_Rz"])
-                
-                total_change = (rx_change + ry_change + rz_change) / 3
-                pose_changes.append(total_change)
+            # 머리 회전 각도 변화량 (Rx, Ry, Rz 변화량 절대값의 평균)
+            poses = np.stack([column(frames, name) for name in HEAD_POSE_COLUMNS])
+            avg_change = float(np.abs(np.diff(poses, axis=1)).mean())
             
             # 변화량의 평균을 기반으로 안정성 점수 계산
-            avg_change = np.mean(pose_changes)
             stability = max(0.0, min(1.0, 1.0 - (avg_change / 30.0)))  # 30도 이상 변경시 불안정
             
             return stability
@@ -378,36 +347,17 @@ class OpenFaceModule:
             logger.error(f"머리 안정성 계산 오류: {str(e)}")
             return 0.5
     
-    def _calculate_gaze_stability(self, frames: List[Dict[str, Any]]) -> float:
+    def _calculate_gaze_stability(self, frames: Dict[str, np.ndarray]) -> float:
         """시선 안정성 계산"""
         try:
-            if len(frames) < 2:
+            if frame_count(frames) < 2:
                 return 0.5
             
-            # 시선 방향 변화량 계산
-            gaze_changes = []
-            for i in range(1, len(frames)):
-                prev_gaze = frames[i-1]["gaze"]
-                curr_gaze = frames[i]["gaze"]
-                
-                # 양쪽 눈의 시선 변화 평균
-                left_change = np.sqrt(
-                    (curr_gaze["gaze_0_x"] - prev_gaze["gaze_0_x"])**2 +
-                    (curr_gaze["gaze_0_y"] - prev_gaze["gaze_0_y"])**2 +
-                    (curr_gaze["gaze_0_z"] - prev_gaze["gaze_0_z"])**2
-                )
-                
-                right_change = np.sqrt(
-                    (curr_gaze["gaze_1_x"] - prev_gaze["gaze_1_x"])**2 +
-                    (curr_gaze["gaze_1_y"] - prev_gaze["gaze_1_y"])**2 +
-                    (curr_gaze["gaze_1_z"] - prev_gaze["gaze_1_z"])**2
-                )
-                
-                avg_change = (left_change + right_change) / 2
-                gaze_changes.append(avg_change)
+            # 양쪽 눈의 시선 벡터 변화량 평균
+            avg_change = (mean_frame_change(frames, LEFT_GAZE_COLUMNS) +
+                          mean_frame_change(frames, RIGHT_GAZE_COLUMNS)) / 2
             
             # 안정성 점수 계산
-            avg_change = np.mean(gaze_changes)
             stability = max(0.0, min(1.0, 1.0 - (avg_change / 0.5)))  # 0.5 단위 이상 변경시 불안정
             
             return stability
@@ -416,25 +366,14 @@ class OpenFaceModule:
             logger.error(f"시선 안정성 계산 오류: {str(e)}")
             return 0.5
     
-    def _analyze_emotions(self, frames: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_emotions(self, frames: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Action Units 기반 감정 분석"""
         try:
-            if not frames:
+            if not frame_count(frames):
                 return {"dominant_emotion": "중립", "confidence": 0.5, "intensity": 0.3}
             
-            # Action Units 평균값 계산
-            au_averages = {}
-            for frame in frames:
-                action_units = frame.get("action_units", {})
-                for au, value in action_units.items():
-                    if au not in au_averages:
-                        au_averages[au] = []
-                    au_averages[au].append(value)
-            
-            # 각 AU의 평균 계산
-            au_means = {}
-            for au, values in au_averages.items():
-                au_means[au] = np.mean(values)
+            # 각 AU의 평균 계산 (AU01_r -> AU01)
+            au_means = {name[:-2]: float(frames[name].mean()) for name in au_intensity_columns(frames)}
             
             # 감정 매핑 (간단한 버전)
             emotion_scores = {
@@ -455,7 +394,7 @@ class OpenFaceModule:
             return {
                 "dominant_emotion": dominant_emotion,
                 "confidence": round(confidence, 3),
-                "intensity": round(min(1.0, intensity), 3),
+                "intensity": round(min(1.0, float(intensity)), 3),
                 "emotion_scores": emotion_scores
             }
             
@@ -530,14 +469,14 @@ class OpenFaceModule:
         
         return min(1.0, neutral_score + 0.3)  # 기본 중립 점수 추가
     
-    def _assess_behavior(self, frames: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_behavior(self, frames: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """전반적인 행동 평가"""
         try:
-            if not frames:
+            if not frame_count(frames):
                 return {"score": 0.5, "notes": ["분석 데이터 부족"]}
             
             # 신뢰도 기반 점수
-            avg_confidence = np.mean([f["confidence"] for f in frames])
+            avg_confidence = float(column(frames, "confidence").mean())
             confidence_score = min(1.0, avg_confidence)
             
             # 안정성 점수들 가중 평균
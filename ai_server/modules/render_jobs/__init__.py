@@ -0,0 +1,9 @@
+"""
+아바타 영상 렌더링 작업 모듈
+D-ID/AIStudios 렌더링을 비동기 작업으로 관리 (작업 ID 즉시 반환, 상태 조회)
+"""
+
+from .manager import RenderJob, RenderJobManager, RenderSpec, get_render_job_manager
+from .routes import setup_render_job_routes
+
+__all__ = ['RenderJob', 'RenderJobManager', 'RenderSpec', 'get_render_job_manager', 'setup_render_job_routes']
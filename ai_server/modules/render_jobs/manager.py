@@ -0,0 +1,299 @@
+"""
+아바타 영상 렌더링 작업 관리자
+외부 API(D-ID, AIStudios) 렌더링을 요청 스레드에서 기다리지 않고 작업 ID를 바로 반환한 뒤,
+백그라운드 asyncio 루프 하나가 진행 중인 모든 작업의 상태를 지수 백오프로 확인
+
+- 대기(asyncio.sleep)는 루프에서 처리하고, 짧은 HTTP 호출만 작은 스레드 풀에서 실행
+  → 적은 스레드로 수백 개의 렌더링 작업 추적 가능
+- 제공자가 완료 콜백(webhook)을 호출하면 다음 확인 시각을 기다리지 않고 바로 상태 확인
+- 같은 키의 작업이 진행 중이면 새로 요청하지 않고 기존 작업 ID 반환
+"""
+import os
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from modules.common.http_utils import poll_delays
+from modules.common.tracing import get_metrics_registry, record_span
+
+logger = logging.getLogger(__name__)
+
+# 작업 설정 (환경 변수로 조정 가능)
+RENDER_JOB_TIMEOUT_SECONDS = float(os.environ.get("RENDER_JOB_TIMEOUT_SECONDS", 300))
+RENDER_JOB_RETENTION_SECONDS = float(os.environ.get("RENDER_JOB_RETENTION_SECONDS", 3600))
+RENDER_JOB_IO_WORKERS = int(os.environ.get("RENDER_JOB_IO_WORKERS", 8))
+# 외부에서 접근 가능한 서버 주소 (설정 시 제공자에게 완료 콜백 URL 전달)
+RENDER_WEBHOOK_BASE_URL = os.environ.get("RENDER_WEBHOOK_BASE_URL", "").rstrip("/")
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RENDERING = "rendering"
+JOB_DOWNLOADING = "downloading"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+class RenderSpec:
+    """제공자별 렌더링 단계 (모두 블로킹 함수이며 스레드 풀에서 실행)"""
+
+    def __init__(self, start: Callable[[Optional[str]], Optional[str]],
+                 check: Callable[[str], Tuple[str, Any]],
+                 finish: Callable[[Any], Optional[str]],
+                 lookup: Optional[Callable[[], Optional[str]]] = None):
+        """
+        Args:
+            start: 렌더링 요청 (완료 콜백 URL 또는 None) → 제공자 작업 ID
+            check: 제공자 작업 ID → ('done', 결과) / ('failed', 오류) / ('pending', 상태)
+            finish: 완료 결과(영상 URL) → 저장된 영상 경로
+            lookup: 캐시 조회 → 이미 있는 영상 경로 (없으면 None)
+        """
+        self.start = start
+        self.check = check
+        self.finish = finish
+        self.lookup = lookup
+
+class RenderJob:
+    """렌더링 작업 상태"""
+
+    def __init__(self, provider: str, kind: Optional[str] = None, key: Optional[str] = None):
+        self.job_id = uuid.uuid4().hex
+        self.provider = provider
+        self.kind = kind
+        self.key = key
+        self.status = JOB_QUEUED
+        self.remote_id = None
+        self.remote_status = None
+        self.video_path = None
+        self.error = None
+        self.polls = 0
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finished_at = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 응답용 딕셔너리"""
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "provider": self.provider,
+            "kind": self.kind,
+            "status": self.status,
+            "remote_id": self.remote_id,
+            "remote_status": self.remote_status,
+            "error": self.error,
+            "polls": self.polls,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "elapsed_seconds": round(end - self.created_at, 2),
+            "video_ready": self.status == JOB_DONE
+        }
+
+class RenderJobManager:
+    """백그라운드 asyncio 루프 기반 렌더링 작업 관리자"""
+
+    def __init__(self, timeout: Optional[float] = None, retention: Optional[float] = None,
+                 io_workers: Optional[int] = None):
+        """
+        작업 관리자 초기화
+
+        Args:
+            timeout: 작업별 최대 렌더링 시간 (초)
+            retention: 끝난 작업 상태를 보관하는 시간 (초)
+            io_workers: HTTP 호출용 스레드 수
+        """
+        self.timeout = timeout or RENDER_JOB_TIMEOUT_SECONDS
+        self.retention = retention or RENDER_JOB_RETENTION_SECONDS
+        self.executor = ThreadPoolExecutor(max_workers=io_workers or RENDER_JOB_IO_WORKERS,
+                                           thread_name_prefix="render-io")
+
+        self._jobs: Dict[str, RenderJob] = {}
+        self._active_keys: Dict[str, str] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._lock = threading.Lock()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="render-jobs", daemon=True)
+        self._thread.start()
+
+    def submit(self, provider: str, spec: RenderSpec, kind: Optional[str] = None,
+               key: Optional[str] = None) -> RenderJob:
+        """
+        렌더링 작업 등록 (바로 반환)
+
+        Args:
+            provider: 제공자 이름 (d_id, aistudios)
+            spec: 렌더링 단계
+            kind: 작업 종류 (상태 응답 표시용)
+            key: 중복 방지 키 (같은 키의 작업이 진행 중이면 그 작업 반환)
+
+        Returns:
+            RenderJob: 등록된(또는 진행 중인) 작업
+        """
+        with self._lock:
+            if key and key in self._active_keys:
+                job = self._jobs.get(self._active_keys[key])
+                if job is not None and not job.finished:
+                    logger.info(f"진행 중인 렌더링 작업 재사용: {job.job_id}")
+                    return job
+
+            job = RenderJob(provider, kind=kind, key=key)
+            self._jobs[job.job_id] = job
+            if key:
+                self._active_keys[key] = job.job_id
+
+        asyncio.run_coroutine_threadsafe(self._run_job(job, spec), self._loop)
+        logger.info(f"렌더링 작업 등록: {job.job_id} ({provider}, {kind})")
+        return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        """작업 조회"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def notify(self, job_id: str) -> bool:
+        """
+        제공자 완료 콜백 수신 시 호출 - 다음 확인 시각을 기다리지 않고 바로 상태 확인
+
+        Returns:
+            bool: 진행 중인 작업이 있었는지 여부
+        """
+        with self._lock:
+            event = self._wakeups.get(job_id)
+        if event is None:
+            return False
+        self._loop.call_soon_threadsafe(event.set)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """상태별 작업 수"""
+        with self._lock:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {"jobs": len(self._jobs), "by_status": counts, "active": len(self._wakeups)}
+
+    def shutdown(self):
+        """루프와 스레드 풀 종료"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self.executor.shutdown(wait=False)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _call(self, fn, *args):
+        """블로킹 함수를 HTTP 스레드 풀에서 실행"""
+        return await self._loop.run_in_executor(self.executor, fn, *args)
+
+    def _update(self, job: RenderJob, **fields):
+        for name, value in fields.items():
+            setattr(job, name, value)
+        job.updated_at = time.time()
+
+    async def _run_job(self, job: RenderJob, spec: RenderSpec):
+        """작업 하나의 전체 흐름 (캐시 확인 → 요청 → 상태 확인 → 다운로드)"""
+        wakeup = asyncio.Event()
+        with self._lock:
+            self._wakeups[job.job_id] = wakeup
+        render_started = None
+
+        try:
+            if spec.lookup:
+                cached = await self._call(spec.lookup)
+                if cached:
+                    self._update(job, status=JOB_DONE, video_path=cached, remote_status="cached")
+                    return
+
+            render_started = time.perf_counter()
+            callback_url = None
+            if RENDER_WEBHOOK_BASE_URL:
+                callback_url = f"{RENDER_WEBHOOK_BASE_URL}/ai/render-jobs/{job.job_id}/callback"
+            remote_id = await self._call(spec.start, callback_url)
+            if not remote_id:
+                raise RuntimeError("렌더링 요청 실패")
+            self._update(job, status=JOB_RENDERING, remote_id=remote_id)
+
+            deadline = time.time() + self.timeout
+            for delay in poll_delays():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"렌더링 시간 초과: {self.timeout:.0f}초")
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=min(delay, remaining))
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+
+                try:
+                    state, value = await self._call(spec.check, remote_id)
+                except Exception as e:
+                    # 일시적인 네트워크 오류는 다음 확인에서 다시 시도
+                    logger.warning(f"렌더링 상태 확인 실패 ({job.job_id}): {str(e)}")
+                    continue
+
+                job.polls += 1
+                if state == "done":
+                    self._update(job, status=JOB_DOWNLOADING, remote_status=state)
+                    video_path = await self._call(spec.finish, value)
+                    if not video_path:
+                        raise RuntimeError("영상 다운로드 실패")
+                    self._update(job, status=JOB_DONE, video_path=video_path)
+                    record_span("avatar_render", time.perf_counter() - render_started)
+                    logger.info(f"렌더링 작업 완료: {job.job_id} ({job.polls}회 확인)")
+                    return
+                if state == "failed":
+                    raise RuntimeError(value or "렌더링 실패")
+                self._update(job, remote_status=value)
+
+        except Exception as e:
+            logger.error(f"렌더링 작업 실패: {job.job_id} - {str(e)}")
+            self._update(job, status=JOB_FAILED, error=str(e))
+            if render_started is not None:
+                record_span("avatar_render", time.perf_counter() - render_started, error=True)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._wakeups.pop(job.job_id, None)
+                if job.key and self._active_keys.get(job.key) == job.job_id:
+                    del self._active_keys[job.key]
+                self._prune()
+
+    def _prune(self):
+        """보관 시간이 지난 끝난 작업 삭제 (잠금 상태에서 호출)"""
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+def get_render_job_manager() -> RenderJobManager:
+    """
+    프로세스 공용 렌더링 작업 관리자 반환 (처음 호출 시 생성)
+
+    Returns:
+        RenderJobManager: 공용 작업 관리자
+    """
+    global _default_manager
+
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = RenderJobManager()
+                get_metrics_registry().register_collector(_collect_render_job_metrics)
+    return _default_manager
+
+def _collect_render_job_metrics():
+    """진행 중인 렌더링 작업 수 (/ai/metrics)"""
+    return [("ai_queue_depth", "gauge", "대기 중인 작업 수", {"queue": "avatar_render"},
+             _default_manager.stats()["active"])]
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 작업 라우트 모듈
+아바타 영상 생성을 비동기 작업으로 등록하고 작업 상태/결과 영상을 조회
+"""
+
+from flask import Blueprint, jsonify, request, send_file
+import os
+import tempfile
+import logging
+from typing import Optional, Tuple
+
+from modules.common.cache_keys import video_cache_key
+from .manager import RenderSpec, get_render_job_manager, JOB_DONE
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# Blueprint 생성
+render_job_routes = Blueprint('render_job_routes', __name__)
+
+# 전역 변수
+d_id_client = None
+d_id_video_manager = None
+aistudios_client = None
+
+def init_render_job_routes(did_client=None, did_video_manager=None, studio_client=None):
+    """렌더링 작업 라우트 초기화 (사용 가능한 제공자 클라이언트 등록)"""
+    global d_id_client, d_id_video_manager, aistudios_client
+    d_id_client = did_client
+    d_id_video_manager = did_video_manager
+    aistudios_client = studio_client
+    logger.info("렌더링 작업 라우트 초기화 완료")
+
+def build_d_id_spec(kind: str, text: str, gender: str, phase: str) -> Tuple[RenderSpec, str]:
+    """D-ID 렌더링 단계와 캐시 키 구성 (결과는 D-ID 영상 관리자 캐시에 저장)"""
+    avatar_type = f"{'interviewer' if kind == 'interview' else 'debater'}_{gender}"
+    params = {"gender": gender, "phase": phase}
+
+    def lookup():
+        if not d_id_video_manager:
+            return None
+        return d_id_video_manager.get_cached_video(text, kind, **params)
+
+    def finish(video_url):
+        fd, temp_path = tempfile.mkstemp(suffix=".mp4")
+        os.close(fd)
+        try:
+            if not d_id_client.download_video(video_url, temp_path):
+                return None
+            if d_id_video_manager:
+                return d_id_video_manager.save_video(temp_path, text, kind, **params)
+            # 영상 관리자가 없으면 임시 파일을 그대로 결과로 사용
+            kept_path, temp_path = temp_path, None
+            return kept_path
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    spec = RenderSpec(
+        start=lambda callback_url: d_id_client.start_render(text, avatar_type, webhook_url=callback_url),
+        check=d_id_client.check_render,
+        finish=finish,
+        lookup=lookup
+    )
+    return spec, video_cache_key("d_id", text, kind, **params)
+
+def build_aistudios_spec(text: str, avatar_id: Optional[str]) -> Tuple[RenderSpec, str]:
+    """AIStudios 렌더링 단계와 캐시 키 구성 (결과는 AIStudios 캐시에 저장)"""
+    avatar_id = avatar_id or aistudios_client.default_avatar_id
+    cache_key = aistudios_client._generate_cache_key(text, avatar_id)
+
+    spec = RenderSpec(
+        start=lambda callback_url: aistudios_client.start_render(text, avatar_id, callback_url=callback_url),
+        check=aistudios_client.check_render,
+        finish=lambda video_url: aistudios_client.download_render(
+            video_url, cache_key, {"text": text, "avatar_id": avatar_id}),
+        lookup=lambda: aistudios_client._get_cached_video(cache_key)
+    )
+    return spec, cache_key
+
+def job_response(job, status_code=200):
+    """작업 상태 응답 (상태/영상 조회 URL 포함)"""
+    payload = job.to_dict()
+    payload["status_url"] = f"/ai/render-jobs/{job.job_id}"
+    if job.status == JOB_DONE:
+        payload["video_url"] = f"/ai/render-jobs/{job.job_id}/video"
+    return jsonify(payload), status_code
+
+@render_job_routes.route('/ai/render-jobs', methods=['POST'])
+def submit_render_job():
+    """
+    아바타 영상 렌더링 작업 등록 - 작업 ID를 바로 반환 (202)
+    요청: {"provider": "d_id"|"aistudios", "kind": "interview"|"debate", "text": ...,
+          "gender": "male"|"female", "phase": "opening"..., "avatar_id": ...}
+    """
+    try:
+        data = request.json or {}
+        text = (data.get('text') or '').strip()
+        kind = data.get('kind', 'interview')
+        gender = data.get('gender', 'female')
+        # 면접 영상 단계는 사전 렌더링/실시간 경로와 같은 'question'으로 맞춰 캐시 공유
+        phase = data.get('phase', 'opening') if kind == 'debate' else 'question'
+        provider = data.get('provider') or ('d_id' if d_id_client else 'aistudios')
+
+        if not text:
+            return jsonify({"error": "text는 필수입니다."}), 400
+        if kind not in ('interview', 'debate'):
+            return jsonify({"error": f"지원하지 않는 kind: {kind}"}), 400
+
+        if provider == 'd_id' and d_id_client:
+            spec, key = build_d_id_spec(kind, text, gender, phase)
+        elif provider == 'aistudios' and aistudios_client:
+            spec, key = build_aistudios_spec(text, data.get('avatar_id'))
+        else:
+            return jsonify({"error": f"사용할 수 없는 제공자: {provider}"}), 503
+
+        job = get_render_job_manager().submit(provider, spec, kind=kind, key=key)
+        return job_response(job, 202)
+
+    except Exception as e:
+        logger.error(f"렌더링 작업 등록 중 오류: {str(e)}")
+        return jsonify({"error": f"렌더링 작업 등록 실패: {str(e)}"}), 500
+
+@render_job_routes.route('/ai/render-jobs', methods=['GET'])
+def render_job_stats():
+    """렌더링 작업 통계"""
+    return jsonify(get_render_job_manager().stats())
+
+@render_job_routes.route('/ai/render-jobs/<job_id>', methods=['GET'])
+def get_render_job(job_id):
+    """렌더링 작업 상태 조회"""
+    job = get_render_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return job_response(job)
+
+@render_job_routes.route('/ai/render-jobs/<job_id>/video', methods=['GET'])
+def get_render_job_video(job_id):
+    """완료된 렌더링 작업의 영상 반환"""
+    job = get_render_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    if job.status != JOB_DONE or not job.video_path or not os.path.exists(job.video_path):
+        return job_response(job, 409)
+
+    return send_file(
+        job.video_path,
+        mimetype='video/mp4',
+        as_attachment=True,
+        download_name=f'{job.kind or "avatar"}_{job.job_id[:8]}.mp4'
+    )
+
+@render_job_routes.route('/ai/render-jobs/<job_id>/callback', methods=['POST'])
+def render_job_callback(job_id):
+    """
+    제공자 완료 콜백 (webhook)
+    콜백 내용은 신뢰하지 않고, 해당 작업의 상태 확인만 앞당김
+    """
+    if not get_render_job_manager().notify(job_id):
+        return jsonify({"accepted": False}), 404
+    return jsonify({"accepted": True})
+
+# 라우트 설정 함수
+def setup_render_job_routes(app, did_client=None, did_video_manager=None, studio_client=None):
+    """Flask 앱에 렌더링 작업 라우트 추가"""
+    init_render_job_routes(did_client, did_video_manager, studio_client)
+    app.register_blueprint(render_job_routes)
+    logger.info("렌더링 작업 라우트 등록 완료")
@@ -4,3 +4,4 @@ TTS (Text-to-Speech) 모듈 패키지
 """
 
 from .tts_module import TTSModule, TTSEngine
+from .pipeline import TTSPipeline, synthesize_wav_bytes
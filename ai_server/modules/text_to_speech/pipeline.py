@@ -0,0 +1,135 @@
+"""
+문장 단위 TTS 파이프라인
+LLM 토큰 스트리밍과 음성 합성을 분리하여, 앞 문장을 합성하는 동안에도
+토큰 생성이 계속 진행되도록 하는 전용 작업자 스레드 기반 파이프라인
+
+- 합성은 모든 파이프라인이 공유하는 프로세스 전역 작업자 스레드 1개에서 순서대로 실행
+  (TTS 모델은 스레드 안전하지 않으므로 동시에 여러 SSE 스트림이 있어도 모델 호출은 한 번에 하나)
+- 파이프라인 밖에서 모델을 직접 호출하는 코드는 TTS_MODEL_LOCK으로 직렬화
+- 완료된 오디오는 제출 순서대로만 반환
+- 합성 결과는 메모리 버퍼(WAV)로 생성하여 임시 파일을 사용하지 않음
+"""
+import io
+import wave
+import base64
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generator, Optional, Tuple
+
+from modules.common.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# 모델에서 샘플링 레이트를 알 수 없을 때 사용하는 기본값 (Coqui TTS 기본 출력)
+DEFAULT_TTS_SAMPLE_RATE = 22050
+
+# TTS 모델 호출 직렬화용 잠금 (tts(), tts_to_file() 등 모델을 직접 호출하는 모든 경로에서 사용)
+TTS_MODEL_LOCK = threading.Lock()
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_tts_executor() -> ThreadPoolExecutor:
+    """모든 TTS 파이프라인이 공유하는 합성 작업자 (프로세스 내에서 하나, 스레드 1개)"""
+    global _default_executor
+    with _executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        return _default_executor
+
+@traced("tts")
+def synthesize_wav_bytes(tts_model, text: str) -> bytes:
+    """
+    Coqui TTS 모델로 텍스트를 합성하여 메모리 상의 WAV 바이트로 반환
+
+    Args:
+        tts_model: TTS.api.TTS 인스턴스
+        text: 합성할 텍스트
+
+    Returns:
+        bytes: 16비트 PCM WAV 데이터
+    """
+    import numpy as np
+
+    with TTS_MODEL_LOCK:
+        samples = np.asarray(tts_model.tts(text=text), dtype=np.float32)
+    synthesizer = getattr(tts_model, "synthesizer", None)
+    sample_rate = getattr(synthesizer, "output_sample_rate", None) or DEFAULT_TTS_SAMPLE_RATE
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(int(sample_rate))
+        wav_file.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+class TTSPipeline:
+    """문장 단위 TTS 파이프라인 (프로세스 공용 작업자 스레드 1개)"""
+
+    def __init__(self, synthesize: Callable[[str], bytes]):
+        """
+        파이프라인 초기화
+
+        Args:
+            synthesize: 텍스트를 받아 오디오 바이트를 반환하는 합성 함수
+        """
+        self.synthesize = synthesize
+        self.executor = get_tts_executor()
+        self.pending = deque()
+        self.submitted = 0
+
+    def submit(self, text: str) -> int:
+        """
+        문장 합성 요청 (즉시 반환)
+
+        Args:
+            text: 합성할 문장
+
+        Returns:
+            int: 문장 순번
+        """
+        index = self.submitted
+        self.pending.append((index, self.executor.submit(self._synthesize_base64, text)))
+        self.submitted += 1
+        return index
+
+    def ready(self) -> Generator[Tuple[int, Optional[str]], None, None]:
+        """
+        이미 완료된 오디오를 제출 순서대로 반환 (대기하지 않음)
+
+        Yields:
+            Tuple[int, Optional[str]]: (문장 순번, base64 인코딩된 WAV 또는 실패 시 None)
+        """
+        while self.pending and self.pending[0][1].done():
+            index, future = self.pending.popleft()
+            yield index, future.result()
+
+    def drain(self) -> Generator[Tuple[int, Optional[str]], None, None]:
+        """
+        남은 오디오를 모두 제출 순서대로 반환 (완료될 때까지 대기)
+
+        Yields:
+            Tuple[int, Optional[str]]: (문장 순번, base64 인코딩된 WAV 또는 실패 시 None)
+        """
+        while self.pending:
+            index, future = self.pending.popleft()
+            yield index, future.result()
+
+    def close(self):
+        """파이프라인 종료 (아직 시작하지 않은 합성은 취소, 공용 작업자는 유지)"""
+        for _, future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+    def _synthesize_base64(self, text: str) -> Optional[str]:
+        """합성 후 base64 인코딩 (작업자 스레드에서 실행)"""
+        try:
+            return base64.b64encode(self.synthesize(text)).decode("utf-8")
+        except Exception as e:
+            logger.error(f"TTS 처리 오류: {str(e)}")
+            return None
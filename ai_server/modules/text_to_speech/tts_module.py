@@ -17,6 +17,8 @@ import base64
 from enum import Enum
 from typing import Optional, Generator, Union, Dict, Any, List, BinaryIO
 
+from modules.common.media_cache import MediaCache
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,15 @@ class TTSModule:
         # 캐시 디렉토리 생성
         os.makedirs(self.cache_dir, exist_ok=True)
         
+        # 합성 결과 캐시 (용량/기간 제한, 백그라운드 정리)
+        self.audio_cache = MediaCache(
+            "tts",
+            directory=self.cache_dir,
+            max_bytes=512 * 1024 * 1024,
+            max_age_seconds=7 * 86400,
+            pattern="tts_*"
+        )
+        
         # 엔진별 초기화
         self._initialize_engine()
         
@@ -174,8 +185,8 @@ class TTSModule:
         cache_key = self._generate_cache_key(text)
         cache_path = os.path.join(self.cache_dir, cache_key)
         
-        # 캐시 확인
-        if use_cache and os.path.exists(cache_path):
+        # 캐시 확인 (만료된 파일은 삭제됨)
+        if use_cache and self.audio_cache.get(cache_key):
             logger.info(f"캐시된 TTS 결과 사용: {cache_path}")
             if output_path:
                 # 캐시 파일 복사
@@ -200,6 +211,7 @@ class TTSModule:
                     # 캐시 저장
                     if use_cache:
                         tts.save(cache_path)
+                        self.audio_cache.put(cache_key)
                         
                     return output_path
                 else:
@@ -212,6 +224,7 @@ class TTSModule:
                     if use_cache:
                         with open(cache_path, 'wb') as f:
                             f.write(audio_data)
+                        self.audio_cache.put(cache_key)
                             
                     return audio_data
                     
@@ -233,6 +246,7 @@ class TTSModule:
                     if use_cache:
                         import shutil
                         shutil.copy2(temp_path, cache_path)
+                        self.audio_cache.put(cache_key)
                         
                     return output_path
                 else:
@@ -246,6 +260,7 @@ class TTSModule:
                     if use_cache:
                         with open(cache_path, 'wb') as f:
                             f.write(audio_data)
+                        self.audio_cache.put(cache_key)
                             
                     return audio_data
                     
@@ -266,6 +281,7 @@ class TTSModule:
                     if use_cache:
                         import shutil
                         shutil.copy2(temp_path, cache_path)
+                        self.audio_cache.put(cache_key)
                         
                     return output_path
                 else:
@@ -279,6 +295,7 @@ class TTSModule:
                     if use_cache:
                         with open(cache_path, 'wb') as f:
                             f.write(audio_data)
+                        self.audio_cache.put(cache_key)
                             
                     return audio_data
                     
@@ -383,6 +400,7 @@ class TTSModule:
             "language": self.language,
             "is_available": self.is_available,
             "cache_dir": self.cache_dir,
+            "cache": self.audio_cache.metrics(),
             "content_type": self.get_content_type()
         }
     
@@ -396,34 +414,7 @@ class TTSModule:
         Returns:
             삭제된 파일 수
         """
-        if not os.path.exists(self.cache_dir):
-            return 0
-            
-        count = 0
-        max_age_seconds = max_age_days * 86400  # 일 -> 초 변환
-        current_time = time.time()
+        count = self.audio_cache.clear(older_than=max_age_days * 86400)
         
-        for filename in os.listdir(self.cache_dir):
-            file_path = os.path.join(self.cache_dir, filename)
-            
-            # 파일인지 확인
-            if not os.path.isfile(file_path):
-                continue
-                
-            # TTS 캐시 파일인지 확인
-            if not filename.startswith("tts_"):
-                continue
-                
-            # 파일 수정 시간 확인
-            file_age = current_time - os.path.getmtime(file_path)
-            
-            # 오래된 파일 삭제
-            if file_age > max_age_seconds:
-                try:
-                    os.remove(file_path)
-                    count += 1
-                except Exception as e:
-                    logger.warning(f"캐시 파일 삭제 실패: {file_path} - {e}")
-                    
         logger.info(f"오래된 캐시 파일 {count}개 삭제됨 (최대 보관 기간: {max_age_days}일)")
         return count
@@ -9,8 +9,8 @@ import random
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from modules.tfidf_posting_index import PostingIndex
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,14 +29,10 @@ class TFIDFJobRecommendationModule:
             "MM": "미디어/방송"
         }
         
-        # TF-IDF 벡터라이저 초기화
-        self.vectorizer = TfidfVectorizer(
-            analyzer='word',
-            token_pattern=r'\b[a-zA-Z가-힣]+\b',
-            ngram_range=(1, 2),
-            max_features=5000,
-            min_df=1
-        )
+        # TF-IDF 증분 인덱스 (디스크에 저장된 이전 버전이 있으면 메모리 매핑으로 로드)
+        self.posting_index = PostingIndex(self._build_job_document)
+        # 백엔드 연결 실패 시 사용하는 샘플 공고 인덱스 (메모리 전용, 백엔드 데이터와 섞지 않음)
+        self.sample_index = None
         
         # 희소 기술 정보 (희소도가 0.7 이상인 기술)
         self.rare_skills = {
@@ -55,10 +51,10 @@ class TFIDFJobRecommendationModule:
         # 캐시 초기화
         self.job_posting_cache = []
         self.cache_last_updated = None
-        self.tfidf_matrix = None
-        self.job_features = None
+        if self.posting_index.load():
+            self.job_posting_cache = self.posting_index.live_postings()
         
-        # 캐시 업데이트
+        # 캐시 업데이트 (인덱스가 있으면 변경분만 반영)
         self._update_job_posting_cache()
         
         logger.info("TF-IDF 기반 공고추천 모듈 초기화 완료")
@@ -71,7 +67,9 @@ class TFIDFJobRecommendationModule:
             "backend_url": self.backend_url,
             "cache_status": {
                 "last_updated": self.cache_last_updated,
-                "cache_size": len(self.job_posting_cache)
+                "cache_size": len(self.job_posting_cache),
+                "index_version": self.posting_index.version,
+                "vocabulary_size": len(self.posting_index.terms)
             },
             "rare_skills": list(self.rare_skills.keys()),
             "functions": [
@@ -84,47 +82,77 @@ class TFIDFJobRecommendationModule:
         }
 
     def _update_job_posting_cache(self) -> bool:
-        """백엔드에서 최신 채용공고 데이터 가져오기"""
+        """백엔드에서 변경된 채용공고만 가져와 인덱스에 반영"""
         try:
-            logger.info("백엔드에서 채용공고 데이터 가져오는 중...")
-            
-            # 먼저 백엔드에 CSV 데이터가 있는지 확인하고 없으면 임포트
+            logger.info("백엔드에서 채용공고 변경분 가져오는 중...")
+            
+            # 인덱스가 비어 있을 때만 백엔드 CSV 임포트 시도
+            if not self.posting_index.size:
+                try:
+                    import_response = requests.post(f"{self.backend_url}/api/job-postings/import", timeout=30)
+                    if import_response.status_code == 200:
+                        logger.info("백엔드 CSV 데이터 임포트 완료")
+                except Exception as e:
+                    logger.warning(f"백엔드 CSV 임포트 시도 실패: {str(e)}")
+            
+            # 1. 증분 API: 커서 이후 추가/수정/삭제된 공고만 조회
+            cursor = None
             try:
-                import_response = requests.post(f"{self.backend_url}/api/job-postings/import", timeout=30)
-                if import_response.status_code == 200:
-                    logger.info("백엔드 CSV 데이터 임포트 완료")
+                params = {"since": self.posting_index.cursor} if self.posting_index.cursor else {}
+                response = requests.get(f"{self.backend_url}/api/job-postings/changes", params=params, timeout=10)
+                if response.status_code == 200:
+                    changes = response.json()
+                    stats = self.posting_index.apply_changes(
+                        changes.get("upserts", []), changes.get("deletedIds", [])
+                    )
+                    cursor = changes.get("cursor") or datetime.now().isoformat()
+                else:
+                    stats = None
             except Exception as e:
-                logger.warning(f"백엔드 CSV 임포트 시도 실패: {str(e)}")
+                logger.warning(f"채용공고 증분 조회 실패: {str(e)}")
+                stats = None
             
-            # 백엔드 API 호출 - 임시로 샘플 데이터 생성
-            response = requests.get(f"{self.backend_url}/api/job-postings/all", timeout=10)
-            
-            if response.status_code == 200:
-                job_postings = response.json()
+            # 2. 증분 API가 없으면 전체 목록과 비교하여 변경분만 반영
+            if stats is None:
+                response = requests.get(f"{self.backend_url}/api/job-postings/all", timeout=10)
                 
-                if isinstance(job_postings, list) and len(job_postings) > 0:
-                    self.job_posting_cache = job_postings
-                    self.cache_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # TF-IDF 행렬 업데이트
-                    self._update_tfidf_matrix()
-                    
-                    logger.info(f"채용공고 캐시 업데이트 완료: {len(job_postings)}개 공고")
-                    return True
-                else:
+                if response.status_code != 200:
+                    logger.error(f"백엔드 API 호출 실패: {response.status_code}")
+                    return self._use_fallback_postings()
+                
+                job_postings = response.json()
+                if not isinstance(job_postings, list) or len(job_postings) == 0:
                     logger.warning("백엔드에서 받은 채용공고 데이터가 없습니다. 샘플 데이터 사용")
-                    self._generate_sample_job_postings()
-                    return False
-            else:
-                logger.error(f"백엔드 API 호출 실패: {response.status_code}")
-                self._generate_sample_job_postings()
-                return False
+                    return self._use_fallback_postings()
+                
+                stats = self.posting_index.sync_snapshot(job_postings)
             
+            if stats["added"] or stats["updated"] or stats["deleted"] or (cursor and cursor != self.posting_index.cursor):
+                self.posting_index.save(cursor)
+            
+            # 백엔드 공고를 받았으면 샘플 공고는 더 이상 사용하지 않음
+            if self.posting_index.size:
+                self.sample_index = None
+            self.job_posting_cache = self._search_index().live_postings()
+            self.cache_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            logger.info(f"채용공고 캐시 업데이트 완료: {len(self.job_posting_cache)}개 공고 (변경: {stats})")
+            return True
                 
         except Exception as e:
             logger.error(f"채용공고 캐시 업데이트 오류: {str(e)}")
+            return self._use_fallback_postings()
+
+    def _use_fallback_postings(self) -> bool:
+        """백엔드 연결 실패 시 저장된 인덱스를 유지하고, 인덱스도 없으면 샘플 데이터 사용"""
+        if self.posting_index.size:
+            self.job_posting_cache = self.posting_index.live_postings()
+            logger.info(f"저장된 TF-IDF 인덱스 사용: {len(self.job_posting_cache)}개 공고")
+        elif self.sample_index is not None:
+            self.job_posting_cache = self.sample_index.live_postings()
+        else:
             self._generate_sample_job_postings()
-            return False
+        return False
 
     def _generate_sample_job_postings(self) -> None:
         """샘플 채용공고 데이터 생성 (백엔드 연결 실패 시)"""
@@ -167,75 +195,61 @@ class TFIDFJobRecommendationModule:
             
             sample_postings.append(job_posting)
         
-        self.job_posting_cache = sample_postings
+        # 샘플 데이터는 별도 메모리 인덱스에만 반영 (디스크 인덱스와 증분 커서에 섞이지 않음)
+        self.sample_index = PostingIndex(self._build_job_document)
+        self.sample_index.sync_snapshot(sample_postings)
+        self.job_posting_cache = self.sample_index.live_postings()
         self.cache_last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # TF-IDF 행렬 업데이트
-        self._update_tfidf_matrix()
-        
         logger.info(f"샘플 채용공고 데이터 생성 완료: {len(sample_postings)}개 공고")
 
-    def _update_tfidf_matrix(self) -> None:
-        """채용공고 데이터로 TF-IDF 행렬 생성"""
-        try:
-            if not self.job_posting_cache:
-                logger.warning("채용공고 캐시가 비어있어 TF-IDF 행렬을 생성할 수 없습니다.")
-                return
-            
-            # 각 채용공고의 특성을 추출하여 문서 생성
-            job_features = []
-            
-            for job in self.job_posting_cache:
-                # 기술 스택, 자격증, 전공 등을 하나의 문서로 결합
-                features = []
-                
-                # 기술 스택 추가
-                tech_stacks = job.get("techStacks", [])
-                if tech_stacks:
-                    features.extend(tech_stacks)
-                
-                # 자격증 추가
-                certificates = job.get("certificateList", [])
-                if certificates:
-                    features.extend(certificates)
-                
-                # 전공 추가
-                majors = job.get("majorList", [])
-                if majors:
-                    features.extend(majors)
-                
-                # 경력 추가
-                career_year = job.get("careerYear")
-                if career_year is not None:
-                    features.append(f"경력{career_year}년")
-                
-                # 학력 추가
-                education = job.get("educationLevel")
-                if education:
-                    features.append(education)
-                
-                # 카테고리 추가
-                category = job.get("category")
-                if category:
-                    features.append(category)
-                
-                # 문서로 결합
-                job_features.append(" ".join(features))
-            
-            # TF-IDF 벡터라이저 적합 및 변환
-            self.job_features = job_features
-            tfidf_matrix = self.vectorizer.fit_transform(job_features)
-            self.tfidf_matrix = tfidf_matrix
-            
-            logger.info(f"TF-IDF 행렬 생성 완료: {tfidf_matrix.shape}")
-            
-        except Exception as e:
-            logger.error(f"TF-IDF 행렬 생성 오류: {str(e)}")
+    def _search_index(self) -> PostingIndex:
+        """추천에 사용할 인덱스 (백엔드 공고가 없고 샘플 공고가 있으면 샘플 인덱스)"""
+        if not self.posting_index.size and self.sample_index is not None:
+            return self.sample_index
+        return self.posting_index
+
+    def _build_job_document(self, job: Dict[str, Any]) -> str:
+        """채용공고의 특성을 TF-IDF 문서로 결합"""
+        # 기술 스택, 자격증, 전공 등을 하나의 문서로 결합
+        features = []
+        
+        # 기술 스택 추가
+        tech_stacks = job.get("techStacks", [])
+        if tech_stacks:
+            features.extend(tech_stacks)
+        
+        # 자격증 추가
+        certificates = job.get("certificateList", [])
+        if certificates:
+            features.extend(certificates)
+        
+        # 전공 추가
+        majors = job.get("majorList", [])
+        if majors:
+            features.extend(majors)
+        
+        # 경력 추가
+        career_year = job.get("careerYear")
+        if career_year is not None:
+            features.append(f"경력{career_year}년")
+        
+        # 학력 추가
+        education = job.get("educationLevel")
+        if education:
+            features.append(education)
+        
+        # 카테고리 추가
+        category = job.get("category")
+        if category:
+            features.append(category)
+        
+        return " ".join(features)
 
     def get_recommendations_by_skills(self, skills: List[str], limit: int = 10) -> Dict[str, Any]:
         """기술 스택 기반 공고 추천"""
         try:
-            if not self.tfidf_matrix or not self.job_posting_cache:
+            if not self.job_posting_cache:
                 self._update_job_posting_cache()
                 
             if not skills:
@@ -246,13 +260,12 @@ class TFIDFJobRecommendationModule:
             
             # 사용자 기술 스택을 TF-IDF 벡터로 변환
             user_features = " ".join(skills)
-            user_vector = self.vectorizer.transform([user_features])
             
             # 코사인 유사도 계산
-            similarities = cosine_similarity(user_vector, self.tfidf_matrix).flatten()
+            job_postings, similarities = self._search_index().similarities(user_features)
             
             # 희소 기술에 보너스 점수 부여
-            for i, job in enumerate(self.job_posting_cache):
+            for i, job in enumerate(job_postings):
                 tech_stacks = job.get("techStacks", [])
                 for tech in tech_stacks:
                     if tech.lower() in self.rare_skills and self.rare_skills[tech.lower()] > 0.7:
@@ -266,7 +279,7 @@ class TFIDFJobRecommendationModule:
             # 추천 결과 생성
             recommendations = []
             for idx in job_indices:
-                job = self.job_posting_cache[idx]
+                job = job_postings[idx]
                 
                 # 희소 기술 표시
                 rare_techs = []
@@ -311,7 +324,7 @@ class TFIDFJobRecommendationModule:
     def get_recommendations_by_profile(self, profile: Dict[str, Any], limit: int = 10) -> Dict[str, Any]:
         """사용자 프로필 기반 공고 추천 (백엔드 RecruitmentRequest/Response 형식 지원)"""
         try:
-            if not self.tfidf_matrix or not self.job_posting_cache:
+            if not self.job_posting_cache:
                 self._update_job_posting_cache()
             
             # 프로필에서 특성 추출
@@ -351,13 +364,12 @@ class TFIDFJobRecommendationModule:
             
             # 사용자 특성을 TF-IDF 벡터로 변환
             user_features = " ".join(features)
-            user_vector = self.vectorizer.transform([user_features])
             
             # 코사인 유사도 계산
-            similarities = cosine_similarity(user_vector, self.tfidf_matrix).flatten()
+            job_postings, similarities = self._search_index().similarities(user_features)
             
             # 희소 기술에 보너스 점수 부여
-            for i, job in enumerate(self.job_posting_cache):
+            for i, job in enumerate(job_postings):
                 tech_stacks = job.get("techStacks", [])
                 for tech in tech_stacks:
                     if tech.lower() in self.rare_skills and self.rare_skills[tech.lower()] > 0.7:
@@ -371,7 +383,7 @@ class TFIDFJobRecommendationModule:
             # 추천 결과 생성 (백엔드 Response 형식)
             recommendations = []
             for idx in job_indices:
-                job = self.job_posting_cache[idx]
+                job = job_postings[idx]
                 
                 # 희소 기술 표시
                 rare_techs = []
@@ -0,0 +1,387 @@
+"""
+채용공고 TF-IDF 증분 인덱스
+공고별 단어 빈도(CSR 행렬)와 문서 빈도, 어휘를 디스크에 버전별로 저장하고
+시작 시 메모리 매핑으로 불러온 뒤, 변경된 공고만 추가/수정/삭제하여 갱신
+
+- 가중치는 TfidfVectorizer 기본 설정과 동일 (원시 빈도 × smooth idf, 행 단위 L2 정규화)
+- idf는 문서 빈도 벡터로 조회 시점에 계산하므로 전체 재학습이 필요 없음
+- 삭제/수정된 행은 비활성 표시 후, 비활성 비율이 높아지면 저장 시 압축
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 저장 경로
+DEFAULT_INDEX_DIR = os.environ.get(
+    "TFIDF_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "tfidf_index")
+)
+
+# 비활성 행 비율이 이 값을 넘으면 저장 시 압축
+COMPACT_RATIO = 0.25
+
+_CURRENT_FILE = "CURRENT"
+_ARRAY_FILES = ("counts_data", "counts_indices", "counts_indptr", "doc_freq", "live")
+
+def posting_id(posting: Dict[str, Any]) -> Any:
+    """공고 ID (백엔드 형식에 따라 id 또는 jobPostingId)"""
+    return posting.get("id", posting.get("jobPostingId"))
+
+def posting_signature(posting: Dict[str, Any]) -> str:
+    """공고 변경 감지용 서명 (updatedAt이 없으면 내용 해시)"""
+    updated_at = posting.get("updatedAt") or posting.get("updated_at")
+    if updated_at:
+        return str(updated_at)
+    payload = json.dumps(posting, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+class PostingIndex:
+    """채용공고 TF-IDF 증분 인덱스"""
+
+    def __init__(self, document_builder: Callable[[Dict[str, Any]], str],
+                 index_dir: Optional[str] = None):
+        """
+        인덱스 초기화
+
+        Args:
+            document_builder: 공고를 TF-IDF 문서 문자열로 변환하는 함수
+            index_dir: 인덱스 저장 디렉토리 (기본값: 환경 변수 TFIDF_INDEX_DIR)
+        """
+        self.document_builder = document_builder
+        self.index_dir = index_dir or DEFAULT_INDEX_DIR
+
+        self.version = 0
+        self.cursor = None
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.counts = sp.csr_matrix((0, 0), dtype=np.float32)
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.live = np.zeros(0, dtype=bool)
+        self.row_ids: List[Any] = []
+        self.rows: Dict[Any, int] = {}
+        self.postings: Dict[Any, Dict[str, Any]] = {}
+        self.signatures: Dict[Any, str] = {}
+
+        self._weighted = None
+        self._analyzer = None
+        self._lock = threading.RLock()
+
+    @property
+    def analyzer(self) -> Callable[[str], List[str]]:
+        """공고추천 모듈의 기존 TfidfVectorizer와 동일한 토큰화 규칙 (scikit-learn은 첫 사용 시 임포트)"""
+        if self._analyzer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self._analyzer = TfidfVectorizer(
+                analyzer='word',
+                token_pattern=r'\b[a-zA-Z가-힣]+\b',
+                ngram_range=(1, 2)
+            ).build_analyzer()
+        return self._analyzer
+
+    # ---------- 조회 ----------
+
+    @property
+    def size(self) -> int:
+        """활성 공고 수"""
+        return len(self.rows)
+
+    def live_postings(self) -> List[Dict[str, Any]]:
+        """활성 공고 목록 (행 순서)"""
+        with self._lock:
+            return [self.postings[self.row_ids[row]] for row in np.flatnonzero(self.live)]
+
+    def similarities(self, text: str) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """
+        질의 문서와 활성 공고 간 코사인 유사도
+
+        Args:
+            text: 질의 문서 (기술 스택 등을 공백으로 결합한 문자열)
+
+        Returns:
+            Tuple[List[Dict], np.ndarray]: (활성 공고 목록, 공고별 유사도)
+        """
+        with self._lock:
+            live_rows = np.flatnonzero(self.live)
+            postings = [self.postings[self.row_ids[row]] for row in live_rows]
+            if not postings:
+                return [], np.zeros(0)
+
+            idf = self._idf()
+            term_counts = Counter(t for t in self.analyzer(text) if t in self.vocabulary)
+            query = np.zeros(len(self.terms), dtype=np.float32)
+            for term, count in term_counts.items():
+                col = self.vocabulary[term]
+                # 삭제로 더 이상 어떤 공고에도 없는 단어는 제외 (전체 재학습 결과와 동일하게)
+                if self.doc_freq[col] > 0:
+                    query[col] = count * idf[col]
+            norm = np.linalg.norm(query)
+            if norm == 0:
+                return postings, np.zeros(len(postings))
+
+            scores = self._weighted_matrix(idf) @ (query / norm)
+            # JSON 응답에 그대로 쓸 수 있도록 float64 (np.float32는 직렬화 불가)
+            return postings, np.asarray(scores, dtype=np.float64)[live_rows]
+
+    # ---------- 갱신 ----------
+
+    def apply_changes(self, upserts: Iterable[Dict[str, Any]], deleted_ids: Iterable[Any] = ()) -> Dict[str, int]:
+        """
+        변경분 반영 (추가/수정/삭제)
+
+        Args:
+            upserts: 추가 또는 수정된 공고 목록
+            deleted_ids: 삭제된 공고 ID 목록
+
+        Returns:
+            Dict[str, int]: added, updated, deleted, unchanged 건수
+        """
+        stats = {"added": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+        with self._lock:
+            for job_id in deleted_ids:
+                if self._remove(job_id):
+                    stats["deleted"] += 1
+
+            new_rows = []
+            for posting in upserts:
+                job_id = posting_id(posting)
+                if job_id is None:
+                    continue
+
+                signature = posting_signature(posting)
+                if self.signatures.get(job_id) == signature:
+                    stats["unchanged"] += 1
+                    continue
+
+                stats["updated" if self._remove(job_id) else "added"] += 1
+                new_rows.append((job_id, posting, signature))
+
+            if new_rows:
+                self._append(new_rows)
+
+            if stats["added"] or stats["updated"] or stats["deleted"]:
+                self._weighted = None
+
+        logger.info(f"TF-IDF 인덱스 변경 반영: {stats}, 활성 공고: {self.size}개")
+        return stats
+
+    def sync_snapshot(self, postings: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        전체 공고 목록과 비교하여 변경분만 반영 (증분 API가 없을 때 사용)
+
+        Args:
+            postings: 백엔드의 전체 공고 목록
+
+        Returns:
+            Dict[str, int]: added, updated, deleted, unchanged 건수
+        """
+        current_ids = {posting_id(p) for p in postings}
+        with self._lock:
+            deleted_ids = [job_id for job_id in self.rows if job_id not in current_ids]
+        return self.apply_changes(postings, deleted_ids)
+
+    def _remove(self, job_id: Any) -> bool:
+        """공고 행 비활성화 및 문서 빈도 감소"""
+        row = self.rows.pop(job_id, None)
+        if row is None:
+            return False
+
+        start, end = self.counts.indptr[row], self.counts.indptr[row + 1]
+        self.doc_freq[self.counts.indices[start:end]] -= 1
+        self.live[row] = False
+        self.postings.pop(job_id, None)
+        self.signatures.pop(job_id, None)
+        return True
+
+    def _append(self, new_rows: List[Tuple[Any, Dict[str, Any], str]]):
+        """새 공고 행 추가 (새 단어는 어휘 끝에 추가)"""
+        data, indices, indptr = [], [], [0]
+        for job_id, posting, signature in new_rows:
+            term_counts = Counter(self.analyzer(self.document_builder(posting)))
+            for term, count in term_counts.items():
+                col = self.vocabulary.get(term)
+                if col is None:
+                    col = len(self.terms)
+                    self.vocabulary[term] = col
+                    self.terms.append(term)
+                indices.append(col)
+                data.append(count)
+            indptr.append(len(indices))
+
+            self.rows[job_id] = len(self.row_ids)
+            self.row_ids.append(job_id)
+            self.postings[job_id] = posting
+            self.signatures[job_id] = signature
+
+        n_terms = len(self.terms)
+        appended = sp.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(new_rows), n_terms)
+        )
+        existing = sp.csr_matrix(
+            (self.counts.data, self.counts.indices, self.counts.indptr),
+            shape=(self.counts.shape[0], n_terms)
+        )
+        self.counts = sp.vstack([existing, appended], format="csr")
+
+        doc_freq = np.zeros(n_terms, dtype=np.int64)
+        doc_freq[:len(self.doc_freq)] = self.doc_freq
+        np.add.at(doc_freq, appended.indices, 1)
+        self.doc_freq = doc_freq
+        self.live = np.concatenate([self.live, np.ones(len(new_rows), dtype=bool)])
+
+    def _idf(self) -> np.ndarray:
+        """smooth idf (TfidfVectorizer 기본값과 동일)"""
+        n_docs = self.size
+        return (np.log((1.0 + n_docs) / (1.0 + self.doc_freq)) + 1.0).astype(np.float32)
+
+    def _weighted_matrix(self, idf: np.ndarray) -> sp.csr_matrix:
+        """idf 가중 및 L2 정규화된 행렬 (변경 전까지 재사용)"""
+        if self._weighted is None:
+            weighted = self.counts.multiply(idf.reshape(1, -1)).tocsr()
+            norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+            norms[norms == 0] = 1.0
+            self._weighted = sp.diags(1.0 / norms) @ weighted
+        return self._weighted
+
+    def _compact(self):
+        """비활성 행 제거 (사용되지 않는 어휘는 유지)"""
+        live_rows = np.flatnonzero(self.live)
+        self.counts = self.counts[live_rows]
+        self.row_ids = [self.row_ids[row] for row in live_rows]
+        self.rows = {job_id: row for row, job_id in enumerate(self.row_ids)}
+        self.live = np.ones(len(self.row_ids), dtype=bool)
+        self._weighted = None
+
+    # ---------- 저장/로드 ----------
+
+    def save(self, cursor: Optional[str] = None) -> Optional[str]:
+        """
+        현재 인덱스를 새 버전 디렉토리에 저장하고 CURRENT 포인터 교체
+
+        Args:
+            cursor: 다음 증분 요청에 사용할 백엔드 커서
+
+        Returns:
+            Optional[str]: 저장된 버전 디렉토리 (실패 시 None)
+        """
+        with self._lock:
+            if cursor is not None:
+                self.cursor = cursor
+            if len(self.row_ids) and (1.0 - self.size / len(self.row_ids)) > COMPACT_RATIO:
+                self._compact()
+
+            version = self.version + 1
+            version_name = f"v{version:06d}"
+            version_dir = os.path.join(self.index_dir, version_name)
+
+            try:
+                shutil.rmtree(version_dir, ignore_errors=True)
+                os.makedirs(version_dir)
+
+                arrays = {
+                    "counts_data": self.counts.data.astype(np.float32, copy=False),
+                    "counts_indices": self.counts.indices.astype(np.int32, copy=False),
+                    "counts_indptr": self.counts.indptr.astype(np.int64, copy=False),
+                    "doc_freq": self.doc_freq,
+                    "live": self.live
+                }
+                for name, array in arrays.items():
+                    np.save(os.path.join(version_dir, f"{name}.npy"), array)
+
+                with open(os.path.join(version_dir, "vocabulary.json"), "w", encoding="utf-8") as f:
+                    json.dump(self.terms, f, ensure_ascii=False)
+                with open(os.path.join(version_dir, "postings.json"), "w", encoding="utf-8") as f:
+                    json.dump([[job_id, self.signatures.get(job_id), self.postings.get(job_id)]
+                               for job_id in self.row_ids], f, ensure_ascii=False, default=str)
+                with open(os.path.join(version_dir, "manifest.json"), "w", encoding="utf-8") as f:
+                    json.dump({
+                        "version": version,
+                        "cursor": self.cursor,
+                        "shape": list(self.counts.shape),
+                        "live_postings": self.size,
+                        "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    }, f, ensure_ascii=False)
+
+                # 포인터 파일을 원자적으로 교체
+                pointer_tmp = os.path.join(self.index_dir, f"{_CURRENT_FILE}.tmp")
+                with open(pointer_tmp, "w") as f:
+                    f.write(version_name)
+                os.replace(pointer_tmp, os.path.join(self.index_dir, _CURRENT_FILE))
+
+                self.version = version
+                self._remove_old_versions(keep=(version_name, f"v{version - 1:06d}"))
+                logger.info(f"TF-IDF 인덱스 저장 완료: {version_dir} ({self.size}개 공고)")
+                return version_dir
+
+            except Exception as e:
+                logger.error(f"TF-IDF 인덱스 저장 실패: {str(e)}")
+                shutil.rmtree(version_dir, ignore_errors=True)
+                return None
+
+    def load(self) -> bool:
+        """
+        최신 버전 인덱스 로드 (배열은 메모리 매핑)
+
+        Returns:
+            bool: 로드 성공 여부
+        """
+        pointer = os.path.join(self.index_dir, _CURRENT_FILE)
+        if not os.path.exists(pointer):
+            return False
+
+        try:
+            with open(pointer) as f:
+                version_dir = os.path.join(self.index_dir, f.read().strip())
+
+            arrays = {name: np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode="r")
+                      for name in _ARRAY_FILES}
+            with open(os.path.join(version_dir, "vocabulary.json"), encoding="utf-8") as f:
+                terms = json.load(f)
+            with open(os.path.join(version_dir, "postings.json"), encoding="utf-8") as f:
+                rows = json.load(f)
+            with open(os.path.join(version_dir, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            with self._lock:
+                self.terms = terms
+                self.vocabulary = {term: col for col, term in enumerate(terms)}
+                self.counts = sp.csr_matrix(
+                    (arrays["counts_data"], arrays["counts_indices"], arrays["counts_indptr"]),
+                    shape=tuple(manifest["shape"])
+                )
+                # 갱신 대상 배열은 메모리로 복사
+                self.doc_freq = np.array(arrays["doc_freq"])
+                self.live = np.array(arrays["live"])
+                self.row_ids = [job_id for job_id, _, _ in rows]
+                self.rows = {job_id: row for row, (job_id, _, _) in enumerate(rows) if self.live[row]}
+                self.postings = {job_id: posting for job_id, _, posting in rows if job_id in self.rows}
+                self.signatures = {job_id: signature for job_id, signature, _ in rows if job_id in self.rows}
+                self.version = manifest["version"]
+                self.cursor = manifest.get("cursor")
+                self._weighted = None
+
+            logger.info(f"TF-IDF 인덱스 로드 완료: v{self.version}, {self.size}개 공고, 어휘 {len(self.terms)}개")
+            return True
+
+        except Exception as e:
+            logger.error(f"TF-IDF 인덱스 로드 실패: {str(e)}")
+            return False
+
+    def _remove_old_versions(self, keep: Tuple[str, ...]):
+        """이전 버전 디렉토리 정리 (현재와 직전 버전만 유지)"""
+        for name in os.listdir(self.index_dir):
+            path = os.path.join(self.index_dir, name)
+            if name.startswith("v") and name not in keep and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,231 @@
+"""
+아바타 영상 사전 렌더링 모듈
+고정 질문 은행과 토론 템플릿(주제만 바뀌는 고정 문구)의 모든 조합을 미리 렌더링하여 영상 캐시를 채움
+→ 알려진 문구에 대한 실시간 요청은 외부 렌더링(30~300초)을 기다리지 않음
+
+- 문구 목록: modules/fixed_responses, test_features/*/fixed_responses_module.py, resources/debate_topic.txt
+- 렌더링: D-ID(영상 관리자 캐시) 또는 AIStudios(클라이언트 캐시), 동시 렌더링 수 제한
+"""
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from modules.fixed_responses.response_generator import get_debate_response, get_interview_response
+
+logger = logging.getLogger(__name__)
+
+# 기본 토론 주제 파일
+DEBATE_TOPICS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "debate_topic.txt"
+)
+
+# 고정 문구 조합
+INTERVIEW_QUESTION_TYPES = ["INTRO", "FIT", "PERSONALITY", "TECH", "FOLLOWUP"]
+INTERVIEW_JOB_CATEGORIES = ["ICT", "BM", "GENERAL"]
+DEBATE_PHASES = ["opening", "rebuttal", "counter_rebuttal", "closing"]
+GENDERS = ["male", "female"]
+
+# D-ID 영상 생성 시 스크립트 최대 길이 (실시간 경로와 동일해야 같은 영상이 됨)
+D_ID_MAX_SCRIPT_LENGTH = 500
+
+def load_debate_topics(topics_file: Optional[str] = None) -> List[str]:
+    """
+    토론 주제 목록 로드
+
+    Args:
+        topics_file: 주제 파일 경로 (한 줄에 한 주제, 기본값: resources/debate_topic.txt)
+
+    Returns:
+        List[str]: 주제 목록
+    """
+    path = topics_file or DEBATE_TOPICS_FILE
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+def enumerate_prerender_items(topics: List[str], kinds: Optional[List[str]] = None) -> List[Dict[str, str]]:
+    """
+    사전 렌더링할 (영상 유형, 단계, 스크립트) 목록 생성 (성별 조합은 렌더링 시 적용)
+
+    Args:
+        topics: 토론 주제 목록
+        kinds: 포함할 영상 유형 ("interview", "debate", 기본값: 모두)
+
+    Returns:
+        List[Dict[str, str]]: 중복이 제거된 항목 목록
+    """
+    kinds = kinds or ["interview", "debate"]
+    items = []
+
+    if "interview" in kinds:
+        for category in INTERVIEW_JOB_CATEGORIES:
+            for question_type in INTERVIEW_QUESTION_TYPES:
+                question = get_interview_response(question_type, category)["question_text"]
+                items.append({"video_type": "interview", "phase": "question", "script": question,
+                              "source": f"fixed_responses:{category}/{question_type}"})
+
+        try:
+            from test_features.personal_interview.fixed_responses_module import PersonalInterviewFixedResponsesModule
+            for question_type, questions in PersonalInterviewFixedResponsesModule().interview_questions.items():
+                for question in questions:
+                    items.append({"video_type": "interview", "phase": "question", "script": question,
+                                  "source": f"personal_interview:{question_type}"})
+        except ImportError as e:
+            logger.warning(f"개인면접 고정 응답 모듈 로드 실패: {e}")
+
+    if "debate" in kinds:
+        debate_module = None
+        try:
+            from test_features.debate.fixed_responses_module import FixedResponsesModule
+            debate_module = FixedResponsesModule()
+        except ImportError as e:
+            logger.warning(f"토론 고정 응답 모듈 로드 실패: {e}")
+
+        for topic in topics:
+            for phase in DEBATE_PHASES:
+                text = get_debate_response(phase, topic)["text"]
+                items.append({"video_type": "debate", "phase": phase, "script": text,
+                              "source": f"fixed_responses:{phase}"})
+
+                if debate_module is None:
+                    continue
+                # FixedResponsesModule.get_debate_response와 같은 규칙으로 주제 문구를 붙임
+                for response in debate_module.debate_responses.get(phase, []):
+                    if "인공지능" not in response:
+                        response = f"'{topic}' 주제와 관련하여, " + response
+                    items.append({"video_type": "debate", "phase": phase, "script": response,
+                                  "source": f"debate_module:{phase}"})
+
+    # 주제와 무관한 문구는 주제마다 반복되므로 중복 제거
+    unique = {}
+    for item in items:
+        unique.setdefault((item["video_type"], item["phase"], item["script"]), item)
+    return list(unique.values())
+
+def prepare_d_id_script(script: str, tts_manager=None) -> str:
+    """
+    D-ID로 보낼 스크립트 정리 (길이 제한 + 음성 합성용 변환)
+    실시간 경로와 사전 렌더링이 같은 함수를 써야 같은 영상이 캐시됨
+
+    Args:
+        script: 원본 스크립트
+        tts_manager: TTS 관리자 (없으면 변환 생략)
+
+    Returns:
+        str: 정리된 스크립트
+    """
+    if len(script) > D_ID_MAX_SCRIPT_LENGTH:
+        script = script[:D_ID_MAX_SCRIPT_LENGTH - 3] + "..."
+    if tts_manager:
+        optimized = tts_manager.optimize_script_for_speech(script)
+        if len(optimized.strip()) > 0:
+            script = optimized
+    return script
+
+def d_id_prerenderer(client, video_manager, tts_manager=None):
+    """
+    D-ID 사전 렌더링 함수 쌍 (캐시 확인, 렌더링)
+    결과는 원본 스크립트 + (영상 유형, 성별, 단계)를 키로 D-ID 영상 관리자에 저장
+
+    Returns:
+        Tuple[Callable, Callable]: (is_cached(item, gender), render(item, gender) → 경로)
+    """
+    def is_cached(item, gender):
+        return video_manager.get_cached_video(item["script"], item["video_type"],
+                                              gender=gender, phase=item["phase"]) is not None
+
+    def render(item, gender):
+        script = prepare_d_id_script(item["script"], tts_manager)
+        if item["video_type"] == "interview":
+            video_path = client.generate_interview_video(script, gender)
+        else:
+            video_path = client.generate_debate_video(script, gender, item["phase"])
+
+        if not video_path or not os.path.exists(video_path) or os.path.getsize(video_path) <= 1000:
+            return None
+
+        final_path = video_manager.save_video(video_path, item["script"], item["video_type"],
+                                              gender=gender, phase=item["phase"])
+        if os.path.abspath(final_path) != os.path.abspath(video_path):
+            os.remove(video_path)
+        return final_path
+
+    return is_cached, render
+
+def aistudios_prerenderer(client, avatar_id: Optional[str] = None):
+    """
+    AIStudios 사전 렌더링 함수 쌍 (캐시 확인, 렌더링)
+    AIStudios 아바타는 성별 구분이 없어 성별과 무관하게 같은 영상을 사용
+
+    Returns:
+        Tuple[Callable, Callable]: (is_cached(item, gender), render(item, gender) → 경로)
+    """
+    avatar_id = avatar_id or client.default_avatar_id
+
+    def is_cached(item, gender):
+        return client._get_cached_video(client._generate_cache_key(item["script"], avatar_id)) is not None
+
+    def render(item, gender):
+        cache_key = client._generate_cache_key(item["script"], avatar_id)
+        return client._render_avatar_video(item["script"], avatar_id, cache_key)
+
+    return is_cached, render
+
+def prerender_videos(items: List[Dict[str, str]],
+                     is_cached: Callable[[Dict[str, str], str], bool],
+                     render: Callable[[Dict[str, str], str], Optional[str]],
+                     genders: Optional[List[str]] = None,
+                     concurrency: int = 2,
+                     dry_run: bool = False) -> Dict[str, Any]:
+    """
+    (항목 × 성별) 조합을 동시 렌더링 수 제한 하에 렌더링
+
+    Args:
+        items: enumerate_prerender_items 결과
+        is_cached: 캐시 확인 함수
+        render: 렌더링 함수 (실패 시 None 또는 예외)
+        genders: 렌더링할 성별 목록 (기본값: 남/여)
+        concurrency: 동시에 진행할 외부 렌더링 수
+        dry_run: True면 캐시 확인만 하고 렌더링하지 않음
+
+    Returns:
+        Dict[str, Any]: 결과 요약 (전체/캐시됨/렌더링/실패 수, 실패 목록)
+    """
+    genders = genders or GENDERS
+    jobs = [(item, gender) for item in items for gender in genders]
+    summary = {"total": len(jobs), "cached": 0, "rendered": 0, "failed": 0, "pending": 0, "failures": []}
+
+    todo = []
+    for item, gender in jobs:
+        if is_cached(item, gender):
+            summary["cached"] += 1
+        else:
+            todo.append((item, gender))
+
+    if dry_run:
+        summary["pending"] = len(todo)
+        return summary
+
+    start_time = time.time()
+    logger.info(f"사전 렌더링 시작: {len(todo)}개 (캐시됨 {summary['cached']}개, 동시 {concurrency}개)")
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="prerender") as executor:
+        futures = {executor.submit(render, item, gender): (item, gender) for item, gender in todo}
+        for done, future in enumerate(as_completed(futures), 1):
+            item, gender = futures[future]
+            try:
+                video_path = future.result()
+            except Exception as e:
+                video_path = None
+                logger.error(f"사전 렌더링 오류: {item['script'][:30]}... - {str(e)}")
+
+            if video_path:
+                summary["rendered"] += 1
+            else:
+                summary["failed"] += 1
+                summary["failures"].append({**item, "gender": gender})
+            logger.info(f"사전 렌더링 진행: {done}/{len(todo)} (실패 {summary['failed']}개)")
+
+    summary["elapsed_seconds"] = round(time.time() - start_time, 1)
+    return summary
@@ -0,0 +1,337 @@
+"""
+Whisper 마이크로 배치 추론 모듈
+동시에 들어온 여러 요청의 30초 멜 스펙트로그램 구간을 짧은 대기 시간 동안 모아
+인코더/디코더를 한 번에 배치로 실행하고, 디코딩 결과를 각 요청에 되돌려 줌
+
+- 멜 스펙트로그램 계산은 요청 스레드에서, 모델 실행은 배치 전용 스레드 하나에서만 수행
+- 최대 배치 크기(WHISPER_BATCH_MAX_SIZE)가 차거나 첫 구간 도착 후 대기 시간(WHISPER_BATCH_MAX_WAIT_MS)이 지나면 실행
+- 결과 형식은 model.transcribe()와 같음 (text, language, segments)
+- 오디오를 고정 30초 구간으로 나누므로 단어 단위 타임스탬프와 이전 구간 텍스트 프롬프트는 사용하지 않음
+"""
+import os
+import math
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import torch
+    import whisper
+    from whisper.audio import N_SAMPLES, SAMPLE_RATE
+    from whisper.tokenizer import get_tokenizer
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+from modules.common.model_registry import WHISPER, get_model_registry, unwrap_model
+
+logger = logging.getLogger(__name__)
+
+# 배치 설정 (환경 변수로 조정 가능)
+WHISPER_BATCHING_ENABLED = os.environ.get("WHISPER_BATCHING", "true").lower() in ("1", "true", "yes")
+WHISPER_BATCH_MAX_SIZE = int(os.environ.get("WHISPER_BATCH_MAX_SIZE", 8))
+WHISPER_BATCH_MAX_WAIT_MS = float(os.environ.get("WHISPER_BATCH_MAX_WAIT_MS", 30))
+WHISPER_BATCH_TIMEOUT_SECONDS = float(os.environ.get("WHISPER_BATCH_TIMEOUT_SECONDS", 300))
+
+# model.transcribe()와 같은 품질 기준 (기준 미달 구간은 높은 온도로 한 번 더 디코딩)
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+FALLBACK_TEMPERATURE = 0.4
+
+# 타임스탬프 토큰 1개당 시간 (초)
+TIME_PRECISION = 0.02
+
+class _Request:
+    """전사 요청 1건 (구간별 결과를 모아 완료 시 future에 전달)"""
+    __slots__ = ("future", "language", "results", "remaining", "lock")
+
+    def __init__(self, window_count: int, language: Optional[str]):
+        self.future = Future()
+        self.language = language
+        self.results: List[Optional[Dict[str, Any]]] = [None] * window_count
+        self.remaining = window_count
+        self.lock = threading.Lock()
+
+class _Window:
+    """30초 멜 스펙트로그램 구간"""
+    __slots__ = ("request", "index", "mel", "offset", "duration", "temperature")
+
+    def __init__(self, request: _Request, index: int, mel, offset: float, duration: float):
+        self.request = request
+        self.index = index
+        self.mel = mel
+        self.offset = offset
+        self.duration = duration
+        self.temperature = 0.0
+
+class WhisperBatcher:
+    """Whisper 모델 앞단의 마이크로 배치 추론 서버"""
+
+    def __init__(self, model, max_batch: Optional[int] = None, max_wait_ms: Optional[float] = None):
+        """
+        배치 추론 서버 초기화 (배치 전용 스레드 시작)
+
+        Args:
+            model: openai-whisper 모델
+            max_batch: 한 번에 실행할 최대 구간 수
+            max_wait_ms: 첫 구간 도착 후 배치를 모으는 최대 대기 시간 (밀리초)
+        """
+        if not WHISPER_AVAILABLE:
+            raise RuntimeError("Whisper 라이브러리가 설치되지 않았습니다.")
+
+        self.model = model
+        self.max_batch = max(1, max_batch or WHISPER_BATCH_MAX_SIZE)
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else WHISPER_BATCH_MAX_WAIT_MS) / 1000
+        self.fp16 = getattr(model.device, "type", "cpu") == "cuda"
+        self.n_mels = getattr(model.dims, "n_mels", 80)
+        self.tokenizer = self._create_tokenizer(model)
+
+        self._queue: "queue.Queue[_Window]" = queue.Queue()
+        self._stop = threading.Event()
+        self._retired = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "windows": 0, "decoded_windows": 0, "batches": 0, "fallbacks": 0,
+                       "max_batch_seen": 0}
+
+        self._thread = threading.Thread(target=self._run, name="whisper-batcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Whisper 배치 추론 시작 - 최대 배치 {self.max_batch}, 대기 {self.max_wait * 1000:.0f}ms")
+
+    @staticmethod
+    def _create_tokenizer(model):
+        """타임스탬프/텍스트 토큰 해석용 토크나이저"""
+        try:
+            return get_tokenizer(model.is_multilingual, num_languages=model.num_languages, task="transcribe")
+        except TypeError:
+            # num_languages 인자가 없는 이전 버전
+            return get_tokenizer(model.is_multilingual, task="transcribe")
+
+    def transcribe(self, audio, language: Optional[str] = "ko", timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        오디오 전사 (다른 요청과 함께 배치로 실행될 때까지 대기)
+
+        Args:
+            audio: 오디오 파일 경로 또는 16kHz float32 PCM 버퍼
+            language: 언어 코드 (None 또는 "auto"면 구간별 자동 감지)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Dict[str, Any]: model.transcribe()와 같은 형식의 결과 (text, language, segments)
+        """
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio)
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        language = None if language == "auto" else language
+
+        window_count = max(1, math.ceil(len(audio) / N_SAMPLES))
+        request = _Request(window_count, language)
+
+        # 멜 스펙트로그램은 요청 스레드에서 계산하여 배치 스레드는 모델 실행만 담당
+        windows = []
+        for index in range(window_count):
+            chunk = audio[index * N_SAMPLES:(index + 1) * N_SAMPLES]
+            mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(chunk), n_mels=self.n_mels)
+            windows.append(_Window(request, index, mel.to(self.model.device),
+                                   offset=index * N_SAMPLES / SAMPLE_RATE, duration=len(chunk) / SAMPLE_RATE))
+
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            self._stats["windows"] += window_count
+        for window in windows:
+            self._queue.put(window)
+
+        return request.future.result(timeout=timeout or WHISPER_BATCH_TIMEOUT_SECONDS)
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 실행 통계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_batch_size"] = round(stats["decoded_windows"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["queued_windows"] = self._queue.qsize()
+        stats["max_batch"] = self.max_batch
+        stats["max_wait_ms"] = self.max_wait * 1000
+        return stats
+
+    def shutdown(self):
+        """배치 스레드 종료"""
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def retire(self):
+        """대기 중인 구간을 모두 처리한 뒤 배치 스레드 종료 (모델 해제 시)"""
+        self._retired.set()
+
+    def _run(self):
+        """배치 스레드: 구간을 모아 배치 실행"""
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._retired.is_set():
+                    break
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # 디코딩 옵션(언어, 온도)이 같은 구간끼리만 한 배치로 실행
+            groups: Dict[Any, List[_Window]] = {}
+            for window in batch:
+                groups.setdefault((window.request.language, window.temperature), []).append(window)
+            for (language, temperature), windows in groups.items():
+                self._decode(windows, language, temperature)
+
+    def _decode(self, windows: List[_Window], language: Optional[str], temperature: float):
+        """구간 배치 디코딩 후 결과를 각 요청에 전달"""
+        try:
+            options = whisper.DecodingOptions(task="transcribe", language=language, temperature=temperature,
+                                              fp16=self.fp16, without_timestamps=False)
+            with torch.no_grad():
+                results = self.model.decode(torch.stack([window.mel for window in windows]), options)
+        except Exception as e:
+            logger.error(f"Whisper 배치 디코딩 오류: {str(e)}")
+            for window in windows:
+                if not window.request.future.done():
+                    window.request.future.set_exception(e)
+            return
+
+        with self._stats_lock:
+            self._stats["batches"] += 1
+            self._stats["decoded_windows"] += len(windows)
+            self._stats["max_batch_seen"] = max(self._stats["max_batch_seen"], len(windows))
+
+        for window, result in zip(windows, results):
+            if window.temperature == 0.0 and self._needs_fallback(result):
+                # 반복/저확률 결과는 transcribe()처럼 높은 온도로 다시 디코딩
+                window.temperature = FALLBACK_TEMPERATURE
+                with self._stats_lock:
+                    self._stats["fallbacks"] += 1
+                self._queue.put(window)
+                continue
+            self._complete(window, result)
+
+    @staticmethod
+    def _is_silence(result) -> bool:
+        return result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD
+
+    def _needs_fallback(self, result) -> bool:
+        if self._is_silence(result):
+            return False
+        return result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or result.avg_logprob < LOGPROB_THRESHOLD
+
+    def _complete(self, window: _Window, result):
+        """구간 결과 저장 (요청의 마지막 구간이면 전체 결과 조립)"""
+        segments = [] if self._is_silence(result) else self._split_segments(window, result)
+        request = window.request
+        with request.lock:
+            request.results[window.index] = {"language": result.language, "segments": segments}
+            request.remaining -= 1
+            finished = request.remaining == 0
+        if not finished or request.future.done():
+            return
+
+        segments = []
+        language = request.language
+        for window_result in request.results:
+            if window_result["segments"] and language is None:
+                language = window_result["language"]
+            for segment in window_result["segments"]:
+                segment["id"] = len(segments)
+                segments.append(segment)
+
+        request.future.set_result({
+            "text": "".join(segment["text"] for segment in segments),
+            "language": language or request.results[0]["language"],
+            "segments": segments
+        })
+
+    def _split_segments(self, window: _Window, result) -> List[Dict[str, Any]]:
+        """타임스탬프 토큰 기준으로 디코딩 결과를 세그먼트로 분리"""
+        timestamp_begin = self.tokenizer.timestamp_begin
+        eot = self.tokenizer.eot
+        segments = []
+        start = None
+        text_tokens: List[int] = []
+
+        def add_segment(end: float):
+            segments.append({
+                "start": round(window.offset + (start or 0.0), 2),
+                "end": round(window.offset + min(end, window.duration), 2),
+                "text": self.tokenizer.decode(text_tokens),
+                "tokens": list(text_tokens),
+                "temperature": window.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob
+            })
+
+        for token in result.tokens:
+            if token >= timestamp_begin:
+                position = (token - timestamp_begin) * TIME_PRECISION
+                if start is not None and text_tokens:
+                    add_segment(position)
+                    text_tokens = []
+                    start = None
+                else:
+                    start = position
+            elif token < eot:
+                text_tokens.append(token)
+
+        if text_tokens:
+            add_segment(window.duration)
+        return segments
+
+_batchers: Dict[int, WhisperBatcher] = {}
+_batchers_lock = threading.Lock()
+
+def get_whisper_batcher(model) -> Optional[WhisperBatcher]:
+    """
+    모델별 배치 추론 서버 반환 (프로세스 내에서 모델마다 하나)
+
+    Args:
+        model: openai-whisper 모델 또는 모델 레지스트리 핸들
+
+    Returns:
+        Optional[WhisperBatcher]: 배치 비활성화 또는 사용 불가 시 None
+    """
+    if not WHISPER_BATCHING_ENABLED or not WHISPER_AVAILABLE or model is None:
+        return None
+    model = unwrap_model(model)
+    if not hasattr(model, "decode"):
+        return None
+    with _batchers_lock:
+        batcher = _batchers.get(id(model))
+        if batcher is None:
+            batcher = _batchers[id(model)] = WhisperBatcher(model)
+        return batcher
+
+def _retire_batcher(key, model):
+    """레지스트리에서 Whisper 모델이 해제되면 해당 배치 서버도 정리 (모델 참조 해제)"""
+    if key[0] != WHISPER:
+        return
+    with _batchers_lock:
+        batcher = _batchers.pop(id(model), None)
+    if batcher is not None:
+        batcher.retire()
+
+get_model_registry().add_unload_listener(_retire_batcher)
+
+def get_batching_stats() -> Dict[str, Dict[str, Any]]:
+    """모델별 배치 실행 통계"""
+    with _batchers_lock:
+        batchers = list(_batchers.values())
+    return {f"{type(b.model).__name__}#{i}": b.stats() for i, b in enumerate(batchers)}
@@ -2,28 +2,37 @@
 # -*- coding: utf-8 -*-
 """
 Whisper 모듈 - 음성 인식 및 전사
-OpenAI Whisper를 사용한 고품질 음성-텍스트 변환
+OpenAI Whisper를 사용한 고품질 음성-텍스트 변환 (엔진은 ASR 백엔드로 선택: openai-whisper, whisper-int8, faster-whisper)
 """
 import logging
 import time
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 import numpy as np
 
+from modules.asr_backend import create_asr_backend, is_asr_backend_available
+from modules.whisper_batcher import WHISPER_BATCH_MAX_SIZE
+from modules.common.audio_utils import decode_audio_from_video
+from modules.common.vad import VAD_TRIM_ENABLED, SpeechTimeline, trim_silence
+
 logger = logging.getLogger(__name__)
 
 class WhisperModule:
-    def __init__(self, model_size: str = "base", language: str = "ko"):
+    def __init__(self, model_size: str = "base", language: str = "ko", backend: Optional[str] = None):
         """
         Whisper 모듈 초기화
         
         Args:
             model_size: 모델 크기 (tiny, base, small, medium, large)
             language: 주 언어 (ko, en, auto 등)
+            backend: 음성 인식 백엔드 (기본값: 환경 변수 ASR_BACKEND)
         """
         self.model_size = model_size
         self.language = language
+        self.backend_name = backend
+        self.backend = None
         self.model = None
         self.available = False
         
@@ -38,15 +47,16 @@ class WhisperModule:
     def _initialize_whisper(self):
         """Whisper 모델 초기화"""
         try:
-            import whisper
-            self.whisper = whisper
+            if not is_asr_backend_available(self.backend_name):
+                raise ImportError(self.backend_name)
             
-            # 모델 로드
-            self.model = whisper.load_model(self.model_size)
-            logger.info(f"Whisper {self.model_size} 모델 로드 완료")
+            # 공용 모델 레지스트리 핸들 (같은 크기의 모델은 프로세스에서 한 번만 로드)
+            self.backend = create_asr_backend(self.model_size, self.backend_name)
+            self.model = self.backend.model
+            logger.info(f"Whisper {self.model_size} 모델 준비 완료 (백엔드: {self.backend.name})")
             
         except ImportError:
-            raise ImportError("Whisper 라이브러리가 설치되지 않았습니다. 'pip install openai-whisper' 실행해주세요.")
+            raise ImportError("Whisper 라이브러리가 설치되지 않았습니다. 'pip install openai-whisper' (또는 faster-whisper 백엔드는 'pip install faster-whisper') 실행해주세요.")
         except Exception as e:
             raise RuntimeError(f"Whisper 모델 로드 실패: {str(e)}")
     
@@ -79,37 +89,22 @@ class WhisperModule:
             if target_language == "auto":
                 target_language = None  # Whisper가 자동 감지
             
-            # Whisper 실행
+            # Whisper 실행 (무음을 잘라낸 오디오만 인식)
             start_time = time.time()
+            audio, timeline = self._prepare_audio(audio_path)
             
-            result = self.model.transcribe(
-                audio_path,
+            result = self.backend.transcribe(
+                audio,
                 language=target_language,
                 verbose=False,
-                word_timestamps=with_timestamps
+                word_timestamps=with_timestamps,
+                # 단어 단위 타임스탬프가 필요 없으면 동시 요청과 함께 배치 디코딩
+                batched=not with_timestamps
             )
             
             processing_time = time.time() - start_time
             
-            # 결과 분석 및 구조화
-            transcription_result = {
-                "success": True,
-                "text": result["text"].strip(),
-                "language": result["language"],
-                "processing_time": round(processing_time, 2),
-                "confidence": self._calculate_confidence(result),
-                "word_count": len(result["text"].split()),
-                "duration": self._get_audio_duration(result),
-                "segments": self._process_segments(result.get("segments", [])),
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "quality_metrics": self._analyze_transcription_quality(result)
-            }
-            
-            # 추가 분석
-            if with_timestamps and result.get("segments"):
-                transcription_result["speaking_analysis"] = self._analyze_speaking_pattern(result["segments"])
-            
-            return transcription_result
+            return self._build_transcription_result(result, processing_time, with_timestamps, timeline)
             
         except Exception as e:
             logger.error(f"음성 인식 오류: {str(e)}")
@@ -119,6 +114,51 @@ class WhisperModule:
                 "audio_path": audio_path
             }
     
+    def _prepare_audio(self, audio_path: str):
+        """
+        인식 입력 준비 - 디코딩 후 VAD로 무음 제거
+        
+        Returns:
+            Tuple: (Whisper 입력, 변환표) - 무음 제거를 하지 않으면 (파일 경로, None)
+        """
+        if not VAD_TRIM_ENABLED:
+            return audio_path, None
+        
+        audio = decode_audio_from_video(audio_path)
+        if audio is None or len(audio) == 0:
+            return audio_path, None
+        
+        voiced = trim_silence(audio)
+        if voiced is None:
+            return audio, None
+        return voiced.view(np.ndarray), voiced.timeline
+    
+    def _build_transcription_result(self, result: Dict[str, Any], processing_time: float,
+                                    with_timestamps: bool = True,
+                                    timeline: Optional[SpeechTimeline] = None) -> Dict[str, Any]:
+        """Whisper 결과 분석 및 구조화 (변환표가 있으면 세그먼트 시각을 원본 기준으로 변환)"""
+        if timeline is not None:
+            timeline.remap_segments(result.get("segments"))
+        
+        transcription_result = {
+            "success": True,
+            "text": result["text"].strip(),
+            "language": result["language"],
+            "processing_time": round(processing_time, 2),
+            "confidence": self._calculate_confidence(result),
+            "word_count": len(result["text"].split()),
+            "duration": self._get_audio_duration(result),
+            "segments": self._process_segments(result.get("segments", [])),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "quality_metrics": self._analyze_transcription_quality(result)
+        }
+        
+        # 추가 분석
+        if with_timestamps and result.get("segments"):
+            transcription_result["speaking_analysis"] = self._analyze_speaking_pattern(result["segments"], timeline)
+        
+        return transcription_result
+    
     def transcribe_video(self, video_path: str, extract_audio: bool = True, 
                         language: str = None) -> Dict[str, Any]:
         """
@@ -188,6 +228,16 @@ class WhisperModule:
         if not self.available:
             return [{"error": "Whisper 모듈을 사용할 수 없습니다."}] * len(file_paths)
         
+        # 배치 추론 서버가 있으면 모든 파일의 30초 구간을 함께 배치로 실행
+        batcher = self.backend.batcher()
+        if batcher is not None and len(file_paths) > 1:
+            workers = min(len(file_paths), WHISPER_BATCH_MAX_SIZE * 2)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper-batch") as executor:
+                return list(executor.map(
+                    lambda item: self._transcribe_batched_file(batcher, item[0], item[1], language),
+                    enumerate(file_paths)
+                ))
+        
         results = []
         
         for i, file_path in enumerate(file_paths):
@@ -213,6 +263,39 @@ class WhisperModule:
         
         return results
     
+    def _transcribe_batched_file(self, batcher, index: int, file_path: str, language: str = None) -> Dict[str, Any]:
+        """배치 추론 서버를 통한 파일 1건 전사 (단어 단위 타임스탬프 없음)"""
+        logger.info(f"배치 처리 제출: {index+1} - {file_path}")
+        audio_path = None
+        try:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"파일이 존재하지 않습니다: {file_path}")
+            
+            if file_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm')):
+                audio_path = self._extract_audio_from_video(file_path)
+                if not audio_path:
+                    raise RuntimeError("비디오에서 오디오 추출 실패")
+            
+            start_time = time.time()
+            audio, timeline = self._prepare_audio(audio_path or file_path)
+            result = batcher.transcribe(audio, language=language or self.language)
+            transcription_result = self._build_transcription_result(result, time.time() - start_time,
+                                                                    timeline=timeline)
+            transcription_result["batch_index"] = index
+            return transcription_result
+            
+        except Exception as e:
+            logger.error(f"배치 처리 오류 - {file_path}: {str(e)}")
+            return {
+                "success": False,
+                "error": f"처리 실패: {str(e)}",
+                "file_path": file_path,
+                "batch_index": index
+            }
+        finally:
+            if audio_path and os.path.exists(audio_path):
+                os.remove(audio_path)
+    
     def _extract_audio_from_video(self, video_path: str) -> Optional[str]:
         """비디오에서 오디오 추출"""
         try:
@@ -382,8 +465,9 @@ class WhisperModule:
         
         return ". ".join(analysis_parts) + "."
     
-    def _analyze_speaking_pattern(self, segments: List[Dict]) -> Dict[str, Any]:
-        """발화 패턴 분석"""
+    def _analyze_speaking_pattern(self, segments: List[Dict],
+                                  timeline: Optional[SpeechTimeline] = None) -> Dict[str, Any]:
+        """발화 패턴 분석 (변환표가 있으면 무음 통계는 VAD 발화 구간에서 계산)"""
         try:
             if not segments:
                 return {"analysis": "분석할 세그먼트가 없습니다"}
@@ -417,6 +501,14 @@ class WhisperModule:
             # 무음 비율
             pause_ratio = pause_count / len(segments) if segments else 0
             
+            # VAD 발화 구간 기반 무음 통계 (세그먼트 간격보다 정확, 추가 연산 없음)
+            pause_stats = None
+            if timeline is not None and timeline.speech_intervals:
+                pause_stats = timeline.pause_stats()
+                pause_count = pause_stats["pause_count"]
+                long_pauses = pause_stats["long_pause_count"]
+                pause_ratio = pause_count / len(timeline.speech_intervals)
+            
             # 패턴 분석
             pattern_analysis = {
                 "speaking_rate_wpm": round(speaking_rate, 1),
@@ -427,6 +519,13 @@ class WhisperModule:
                 "pause_ratio": round(pause_ratio, 3),
                 "fluency_assessment": self._assess_fluency(speaking_rate, pause_ratio, long_pauses)
             }
+            if pause_stats is not None:
+                pattern_analysis.update({
+                    "speech_ratio": pause_stats["speech_ratio"],
+                    "avg_pause_length": pause_stats["avg_pause_length"],
+                    "max_pause_length": pause_stats["max_pause_length"],
+                    "pause_source": "vad"
+                })
             
             return pattern_analysis
             
@@ -480,12 +579,15 @@ class WhisperModule:
     
     def get_model_info(self) -> Dict[str, Any]:
         """모델 정보 반환"""
+        batcher = self.backend.batcher() if self.backend else None
         return {
             "model_size": self.model_size,
+            "backend": self.backend.info() if self.backend else None,
             "default_language": self.language,
             "available": self.available,
             "supported_languages": self.get_supported_languages(),
-            "model_parameters": self._get_model_parameters()
+            "model_parameters": self._get_model_parameters(),
+            "batching": batcher.stats() if batcher else None
         }
     
     def _get_model_parameters(self) -> Dict[str, Any]:
@@ -501,9 +603,9 @@ class WhisperModule:
         return model_specs.get(self.model_size, {"parameters": "알 수 없음", "speed": "알 수 없음", "accuracy": "알 수 없음"})
 
 # 편의를 위한 함수들
-def create_whisper_module(model_size: str = "base", language: str = "ko") -> WhisperModule:
+def create_whisper_module(model_size: str = "base", language: str = "ko", backend: Optional[str] = None) -> WhisperModule:
     """Whisper 모듈 생성 팩토리 함수"""
-    return WhisperModule(model_size, language)
+    return WhisperModule(model_size, language, backend)
 
 def is_whisper_available() -> bool:
     """Whisper 모듈 사용 가능 여부 확인"""
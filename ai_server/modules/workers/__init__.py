@@ -0,0 +1,7 @@
+"""
+AI 모델 작업자 패키지
+Whisper/OpenFace를 한 번만 로드하는 작업자 프로세스 풀과 작업 큐 API 제공
+"""
+
+from .worker_pool import AnalysisWorkerPool, JobQueueFullError, start_worker_pool, get_worker_pool
+from .routes import setup_job_routes
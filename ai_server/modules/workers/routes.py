@@ -0,0 +1,139 @@
+"""
+작업 큐 API 라우트
+POST /ai/jobs 로 분석 작업을 제출하고 GET /ai/jobs/<job_id> 로 상태를 조회
+GET /ai/jobs/<job_id>/events 는 상태 변경을 SSE로 전달
+"""
+import os
+import json
+import tempfile
+import logging
+from flask import jsonify, request, Response, stream_with_context
+
+from .worker_pool import (
+    get_worker_pool, JobQueueFullError, JOB_TYPES, JOB_TYPE_ANALYZE_ANSWER, FINISHED_STATUSES
+)
+
+logger = logging.getLogger(__name__)
+
+# 큐가 가득 찼을 때 클라이언트에게 제안하는 재시도 대기 시간 (초)
+RETRY_AFTER_SECONDS = int(os.environ.get("AI_JOB_RETRY_AFTER", 5))
+
+def setup_job_routes(app):
+    """작업 큐 관련 라우트 설정"""
+
+    @app.route('/ai/jobs', methods=['POST'])
+    def submit_job():
+        """분석 작업 제출 엔드포인트"""
+        pool = get_worker_pool()
+        if pool is None:
+            return jsonify({"error": "작업자 풀이 실행 중이 아닙니다."}), 503
+
+        if 'file' not in request.files and 'video' not in request.files:
+            return jsonify({"error": "영상 파일이 필요합니다."}), 400
+
+        job_type = request.form.get('job_type', JOB_TYPE_ANALYZE_ANSWER)
+        if job_type not in JOB_TYPES:
+            return jsonify({"error": f"지원하지 않는 작업 유형입니다: {job_type}", "job_types": list(JOB_TYPES)}), 400
+
+        # 큐가 가득 찼으면 업로드를 저장하기 전에 거절
+        if pool.get_stats()["queued_jobs"] >= pool.max_queue_size:
+            return _queue_full_response(pool)
+
+        file = request.files.get('file') or request.files.get('video')
+        suffix = os.path.splitext(file.filename or "")[1] or ".mp4"
+        fd, video_path = tempfile.mkstemp(prefix="job_", suffix=suffix)
+        os.close(fd)
+        file.save(video_path)
+
+        payload = {
+            "video_path": video_path,
+            "language": request.form.get('language', 'ko')
+        }
+
+        try:
+            job_id = pool.submit(job_type, payload, cleanup_paths=[video_path])
+        except JobQueueFullError:
+            os.remove(video_path)
+            return _queue_full_response(pool)
+        except Exception as e:
+            os.remove(video_path)
+            logger.error(f"작업 제출 실패: {str(e)}")
+            return jsonify({"error": f"작업 제출 실패: {str(e)}"}), 500
+
+        return jsonify({
+            "job_id": job_id,
+            "job_type": job_type,
+            "status": "queued",
+            "status_url": f"/ai/jobs/{job_id}",
+            "events_url": f"/ai/jobs/{job_id}/events"
+        }), 202
+
+    @app.route('/ai/jobs/<string:job_id>', methods=['GET'])
+    def get_job(job_id):
+        """작업 상태 및 결과 조회 엔드포인트"""
+        pool = get_worker_pool()
+        if pool is None:
+            return jsonify({"error": "작업자 풀이 실행 중이 아닙니다."}), 503
+
+        job = pool.get_job(job_id)
+        if job is None:
+            return jsonify({"error": "존재하지 않는 작업입니다.", "job_id": job_id}), 404
+        return jsonify(job)
+
+    @app.route('/ai/jobs/<string:job_id>/events', methods=['GET'])
+    def stream_job_events(job_id):
+        """작업 상태 변경 SSE 스트림"""
+        pool = get_worker_pool()
+        if pool is None:
+            return jsonify({"error": "작업자 풀이 실행 중이 아닙니다."}), 503
+
+        job = pool.get_job(job_id)
+        if job is None:
+            return jsonify({"error": "존재하지 않는 작업입니다.", "job_id": job_id}), 404
+
+        def generate():
+            current = job
+            while True:
+                yield f"data: {json.dumps({'type': 'status', 'data': current})}\n\n"
+                if current["status"] in FINISHED_STATUSES:
+                    break
+
+                updated = pool.wait_for_update(job_id, current["version"])
+                if updated is None:
+                    yield f"data: {json.dumps({'type': 'error', 'message': '작업 정보가 만료되었습니다.'})}\n\n"
+                    break
+                if updated["version"] == current["version"]:
+                    # 연결 유지용 주석 이벤트
+                    yield ": keep-alive\n\n"
+                    continue
+                current = updated
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="text/event-stream",
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+
+    @app.route('/ai/jobs/workers/status', methods=['GET'])
+    def get_worker_status():
+        """작업자 풀 상태 조회 엔드포인트"""
+        pool = get_worker_pool()
+        if pool is None:
+            return jsonify({"running": False})
+        return jsonify(pool.get_stats())
+
+    logger.info("작업 큐 라우트 설정 완료")
+
+def _queue_full_response(pool):
+    """HTTP 429 (작업 큐 포화) 응답"""
+    response = jsonify({
+        "error": "작업 큐가 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+        "max_queue_size": pool.max_queue_size,
+        "retry_after": RETRY_AFTER_SECONDS
+    })
+    response.status_code = 429
+    response.headers['Retry-After'] = str(RETRY_AFTER_SECONDS)
+    return response
@@ -0,0 +1,402 @@
+"""
+AI 모델 작업자 프로세스 풀
+N개의 작업자 프로세스가 각각 Whisper 모델과 OpenFace 모듈을 한 번만 로드하고,
+제한된 크기의 작업 큐에서 답변 영상 분석 작업을 가져와 처리
+
+- Flask 요청 스레드에서 모델을 직접 호출하지 않으므로 GIL 경합 없이 모든 코어 사용
+- 대기 중인 작업 수가 상한에 도달하면 JobQueueFullError 발생 (HTTP 429로 변환)
+- 작업 상태는 부모 프로세스의 작업 테이블에서 관리하며 완료된 작업은 일정 시간 후 정리
+"""
+import os
+import time
+import uuid
+import queue
+import logging
+import threading
+import multiprocessing as mp
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 작업 유형
+JOB_TYPE_TRANSCRIBE = "transcribe"
+JOB_TYPE_ANALYZE_ANSWER = "analyze_answer"
+JOB_TYPES = (JOB_TYPE_TRANSCRIBE, JOB_TYPE_ANALYZE_ANSWER)
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+class JobQueueFullError(Exception):
+    """작업 큐가 가득 찬 경우 발생"""
+    pass
+
+def _run_job(job_type: str, payload: Dict[str, Any], whisper_model, openface) -> Dict[str, Any]:
+    """작업자 프로세스 안에서 작업 1건 실행"""
+    from modules.analysis import get_orchestrator
+    from modules.common.audio_utils import (
+        decode_audio_from_video, process_audio_with_librosa, calculate_transcription_confidence
+    )
+
+    video_path = payload["video_path"]
+    language = payload.get("language", "ko")
+
+    def transcribe(audio):
+        if whisper_model is None:
+            return {"error": "Whisper 모델을 사용할 수 없습니다."}
+        result = whisper_model.transcribe(audio, language=language, batched=True)
+        return {
+            "text": result["text"].strip(),
+            "language": result.get("language", language),
+            "segments": [
+                {"start": s["start"], "end": s["end"], "text": s["text"]}
+                for s in result.get("segments", [])
+            ],
+            "confidence": calculate_transcription_confidence(result)
+        }
+
+    if job_type == JOB_TYPE_TRANSCRIBE:
+        audio = decode_audio_from_video(video_path)
+        if audio is None:
+            raise RuntimeError("오디오를 디코딩할 수 없습니다.")
+        return {"transcription": transcribe(audio)}
+
+    if job_type == JOB_TYPE_ANALYZE_ANSWER:
+        analysis = get_orchestrator().analyze(
+            video_path,
+            extract_audio=decode_audio_from_video,
+            transcribe=transcribe,
+            analyze_audio=process_audio_with_librosa,
+            analyze_face=openface.analyze_video if openface and openface.is_available else None
+        )
+        return {
+            "transcription": analysis["transcription"],
+            "audio": analysis["audio"],
+            "facial": analysis["facial"],
+            "timings": analysis["timings"],
+            "status": analysis["status"]
+        }
+
+    raise ValueError(f"지원하지 않는 작업 유형: {job_type}")
+
+def _worker_main(worker_id: int, model_size: str, task_queue, event_queue):
+    """작업자 프로세스 진입점 - 모델을 한 번 로드한 뒤 작업 큐를 처리"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    worker_logger = logging.getLogger(f"{__name__}.worker{worker_id}")
+
+    whisper_model = None
+    try:
+        from modules.asr_backend import create_asr_backend
+        from modules.common.model_registry import get_model_registry
+        # 작업자 프로세스는 요청을 기다리는 동안에도 모델을 유지 (유휴 해제 없음)
+        get_model_registry().idle_unload_seconds = 0
+        whisper_model = create_asr_backend(model_size)
+        whisper_model.load()  # 준비 완료를 알리기 전에 미리 로드
+        worker_logger.info(f"작업자 {worker_id}: Whisper 모델 로드 완료 ({model_size})")
+    except Exception as e:
+        worker_logger.warning(f"작업자 {worker_id}: Whisper 모델 로드 실패 - {str(e)}")
+
+    openface = None
+    try:
+        from interview_features.debate.openface_integration import OpenFaceDebateIntegration
+        openface = OpenFaceDebateIntegration()
+    except Exception as e:
+        worker_logger.warning(f"작업자 {worker_id}: OpenFace 모듈 로드 실패 - {str(e)}")
+
+    event_queue.put(("ready", worker_id, os.getpid()))
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        job_id, job_type, payload = task
+        event_queue.put(("started", job_id, worker_id))
+        try:
+            result = _run_job(job_type, payload, whisper_model, openface)
+            event_queue.put(("done", job_id, result))
+        except Exception as e:
+            worker_logger.error(f"작업 {job_id} 처리 실패: {str(e)}")
+            event_queue.put(("failed", job_id, str(e)))
+
+class AnalysisWorkerPool:
+    """AI 모델 작업자 프로세스 풀과 작업 테이블"""
+
+    def __init__(self, num_workers: Optional[int] = None, max_queue_size: Optional[int] = None,
+                 model_size: Optional[str] = None, job_ttl_seconds: int = 3600):
+        """
+        작업자 풀 초기화
+
+        Args:
+            num_workers: 작업자 프로세스 수 (기본값: 환경 변수 AI_WORKER_PROCESSES 또는 2)
+            max_queue_size: 대기 작업 최대 수 (기본값: 환경 변수 AI_JOB_QUEUE_SIZE 또는 20)
+            model_size: Whisper 모델 크기 (기본값: 환경 변수 WHISPER_MODEL_SIZE 또는 base)
+            job_ttl_seconds: 완료된 작업 결과 보관 시간 (초)
+        """
+        self.num_workers = num_workers or int(os.environ.get("AI_WORKER_PROCESSES", 2))
+        self.max_queue_size = max_queue_size or int(os.environ.get("AI_JOB_QUEUE_SIZE", 20))
+        self.model_size = model_size or os.environ.get("WHISPER_MODEL_SIZE", "base")
+        self.job_ttl_seconds = job_ttl_seconds
+
+        # 작업자 프로세스는 spawn 방식으로 생성 (torch/스레드 상태를 복제하지 않음, Windows 호환)
+        self._ctx = mp.get_context("spawn")
+        self._task_queue = None
+        self._event_queue = None
+        self._workers: Dict[int, Any] = {}
+        self._ready_workers = set()
+        self._running_by_worker: Dict[int, str] = {}
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._queued_count = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._collector = None
+        self._running = False
+
+    def start(self):
+        """작업자 프로세스와 결과 수집 스레드 시작"""
+        if self._running:
+            return
+
+        # 대기 작업 수는 submit()에서 직접 제한하므로 큐 자체는 여유 있게 생성
+        self._task_queue = self._ctx.Queue(self.max_queue_size + self.num_workers)
+        self._event_queue = self._ctx.Queue()
+        self._running = True
+
+        for worker_id in range(self.num_workers):
+            self._spawn_worker(worker_id)
+
+        self._collector = threading.Thread(target=self._collect_events, name="job-collector", daemon=True)
+        self._collector.start()
+        logger.info(f"작업자 풀 시작 - 프로세스: {self.num_workers}, 큐 크기: {self.max_queue_size}")
+
+    def stop(self, timeout: float = 5.0):
+        """작업자 프로세스 종료"""
+        if not self._running:
+            return
+
+        self._running = False
+        for _ in self._workers:
+            try:
+                self._task_queue.put_nowait(None)
+            except queue.Full:
+                pass
+
+        for process in self._workers.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+        self._workers.clear()
+        self._ready_workers.clear()
+        logger.info("작업자 풀 종료")
+
+    def submit(self, job_type: str, payload: Dict[str, Any], cleanup_paths: Optional[List[str]] = None) -> str:
+        """
+        작업 제출
+
+        Args:
+            job_type: 작업 유형 (transcribe, analyze_answer)
+            payload: 작업 입력 (video_path 필수)
+            cleanup_paths: 작업 완료 후 삭제할 파일 목록
+
+        Returns:
+            str: 작업 ID
+
+        Raises:
+            JobQueueFullError: 대기 작업 수가 상한에 도달한 경우
+        """
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"지원하지 않는 작업 유형: {job_type}")
+        if not self._running:
+            raise RuntimeError("작업자 풀이 실행 중이 아닙니다.")
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            if self._queued_count >= self.max_queue_size:
+                raise JobQueueFullError(f"작업 큐가 가득 찼습니다 ({self.max_queue_size})")
+
+            self._queued_count += 1
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "job_type": job_type,
+                "status": STATUS_QUEUED,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None,
+                "version": 0,
+                "cleanup_paths": list(cleanup_paths or [])
+            }
+
+        self._task_queue.put((job_id, job_type, payload))
+        logger.info(f"작업 제출 - ID: {job_id}, 유형: {job_type}")
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (없으면 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._public_view(job) if job else None
+
+    def wait_for_update(self, job_id: str, last_version: int, timeout: float = 15.0) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태가 last_version 이후로 변경될 때까지 대기
+
+        Returns:
+            Optional[Dict[str, Any]]: 최신 작업 상태 (작업이 없으면 None)
+        """
+        deadline = time.time() + timeout
+        with self._changed:
+            while True:
+                job = self._jobs.get(job_id)
+                if job is None or job["version"] != last_version:
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return self._public_view(job) if job else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업자 풀 상태 요약"""
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job["status"] == STATUS_RUNNING)
+            return {
+                "running": self._running,
+                "workers": len(self._workers),
+                "ready_workers": len(self._ready_workers),
+                "queued_jobs": self._queued_count,
+                "running_jobs": running,
+                "max_queue_size": self.max_queue_size,
+                "tracked_jobs": len(self._jobs)
+            }
+
+    def _spawn_worker(self, worker_id: int):
+        """작업자 프로세스 1개 생성"""
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.model_size, self._task_queue, self._event_queue),
+            name=f"ai-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self._workers[worker_id] = process
+
+    def _collect_events(self):
+        """작업자 이벤트 수집 스레드"""
+        last_cleanup = time.time()
+
+        while self._running:
+            try:
+                event, key, value = self._event_queue.get(timeout=1.0)
+                self._handle_event(event, key, value)
+            except queue.Empty:
+                pass
+            except Exception as e:
+                logger.error(f"작업자 이벤트 처리 오류: {str(e)}")
+
+            self._check_workers()
+
+            if time.time() - last_cleanup > 60:
+                self._cleanup_expired_jobs()
+                last_cleanup = time.time()
+
+    def _handle_event(self, event: str, key, value):
+        """작업자 이벤트 반영"""
+        if event == "ready":
+            self._ready_workers.add(key)
+            logger.info(f"작업자 {key} 준비 완료 (pid={value})")
+            return
+
+        cleanup_paths = []
+        with self._changed:
+            job = self._jobs.get(key)
+            if job is None:
+                return
+
+            if event == "started":
+                job["status"] = STATUS_RUNNING
+                job["started_at"] = time.time()
+                self._queued_count = max(0, self._queued_count - 1)
+                self._running_by_worker[value] = key
+            elif event in ("done", "failed"):
+                job["status"] = STATUS_DONE if event == "done" else STATUS_FAILED
+                job["finished_at"] = time.time()
+                if event == "done":
+                    job["result"] = value
+                else:
+                    job["error"] = value
+                cleanup_paths = job.pop("cleanup_paths", [])
+                for worker_id, job_id in list(self._running_by_worker.items()):
+                    if job_id == key:
+                        del self._running_by_worker[worker_id]
+
+            job["version"] += 1
+            self._changed.notify_all()
+
+        self._remove_files(cleanup_paths)
+
+    def _check_workers(self):
+        """종료된 작업자 프로세스 감지 및 재시작"""
+        for worker_id, process in list(self._workers.items()):
+            if process.is_alive() or not self._running:
+                continue
+
+            logger.error(f"작업자 {worker_id} 비정상 종료 (exitcode={process.exitcode}) - 재시작")
+            self._ready_workers.discard(worker_id)
+            job_id = self._running_by_worker.pop(worker_id, None)
+            if job_id:
+                self._handle_event("failed", job_id, "작업자 프로세스가 비정상 종료되었습니다.")
+            self._spawn_worker(worker_id)
+
+    def _cleanup_expired_jobs(self):
+        """보관 시간이 지난 완료 작업 정리"""
+        now = time.time()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job["status"] in FINISHED_STATUSES and now - job["finished_at"] > self.job_ttl_seconds
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        if expired:
+            logger.info(f"만료된 작업 {len(expired)}건 정리")
+
+    def _remove_files(self, file_paths: List[str]):
+        """작업 입력 파일 삭제"""
+        for file_path in file_paths:
+            if file_path and os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except Exception as e:
+                    logger.warning(f"작업 파일 삭제 실패: {file_path} - {str(e)}")
+
+    @staticmethod
+    def _public_view(job: Dict[str, Any]) -> Dict[str, Any]:
+        """외부 응답용 작업 정보"""
+        return {k: v for k, v in job.items() if k != "cleanup_paths"}
+
+_worker_pool = None
+
+def start_worker_pool(**kwargs) -> AnalysisWorkerPool:
+    """
+    프로세스 공용 작업자 풀 시작
+
+    Returns:
+        AnalysisWorkerPool: 시작된 작업자 풀
+    """
+    global _worker_pool
+
+    if _worker_pool is None:
+        _worker_pool = AnalysisWorkerPool(**kwargs)
+        _worker_pool.start()
+    return _worker_pool
+
+def get_worker_pool() -> Optional[AnalysisWorkerPool]:
+    """공용 작업자 풀 반환 (시작되지 않았으면 None)"""
+    return _worker_pool
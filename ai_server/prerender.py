@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VeriView AI 아바타 영상 사전 렌더링 스크립트
+고정 질문/토론 템플릿 × 토론 주제 × 성별 조합을 미리 렌더링하여 영상 캐시를 채움
+
+사용 예:
+    python prerender.py --dry-run                      # 렌더링할 조합 수만 확인
+    python prerender.py --kinds interview --concurrency 3
+    python prerender.py --provider aistudios --topic-limit 5
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+from modules.video_prerender import (
+    GENDERS, load_debate_topics, enumerate_prerender_items, prerender_videos,
+    d_id_prerenderer, aistudios_prerenderer
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_d_id_prerenderer():
+    """D-ID 클라이언트/영상 관리자 생성 (run_windows.py와 같은 환경 변수 사용)"""
+    from modules.d_id.client import DIDClient
+    from modules.d_id.video_manager import VideoManager
+    from modules.d_id.tts_manager import TTSManager
+
+    api_key = os.environ.get('D_ID_API_KEY')
+    if not api_key or api_key == 'your_actual_d_id_api_key_here':
+        raise RuntimeError("D_ID_API_KEY가 올바르게 설정되지 않았습니다")
+
+    client = DIDClient(api_key=api_key, base_url=os.environ.get('D_ID_API_URL', 'https://api.d-id.com'))
+    videos_dir = os.environ.get('D_ID_CACHE_DIR', './videos')
+    os.makedirs(videos_dir, exist_ok=True)
+    return d_id_prerenderer(client, VideoManager(base_dir=videos_dir), TTSManager())
+
+def create_aistudios_prerenderer(avatar_id=None):
+    """AIStudios 클라이언트 생성"""
+    from modules.aistudios.client import AIStudiosClient
+
+    client = AIStudiosClient()
+    if not client.api_key:
+        raise RuntimeError("AIStudios API 키가 설정되지 않았습니다")
+    return aistudios_prerenderer(client, avatar_id)
+
+def main():
+    parser = argparse.ArgumentParser(description="VeriView 아바타 영상 사전 렌더링")
+    parser.add_argument("--provider", choices=["d_id", "aistudios"], default="d_id", help="영상 생성 제공자")
+    parser.add_argument("--kinds", nargs="+", choices=["interview", "debate"], default=["interview", "debate"],
+                        help="렌더링할 영상 유형")
+    parser.add_argument("--genders", nargs="+", choices=GENDERS, default=GENDERS, help="렌더링할 음성 성별 (D-ID)")
+    parser.add_argument("--topics-file", default=None, help="토론 주제 파일 (기본값: resources/debate_topic.txt)")
+    parser.add_argument("--topic-limit", type=int, default=None, help="앞에서부터 사용할 주제 수")
+    parser.add_argument("--avatar-id", default=None, help="AIStudios 아바타 ID")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시에 진행할 외부 렌더링 수")
+    parser.add_argument("--dry-run", action="store_true", help="캐시 확인만 하고 렌더링하지 않음")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("VeriView 아바타 영상 사전 렌더링")
+    print("=" * 60)
+
+    topics = load_debate_topics(args.topics_file)
+    if args.topic_limit is not None:
+        topics = topics[:args.topic_limit]
+    items = enumerate_prerender_items(topics, kinds=args.kinds)
+
+    try:
+        if args.provider == "d_id":
+            is_cached, render = create_d_id_prerenderer()
+            genders = args.genders
+        else:
+            is_cached, render = create_aistudios_prerenderer(args.avatar_id)
+            # AIStudios 아바타는 성별 구분 없이 한 번만 렌더링
+            genders = [GENDERS[0]]
+    except Exception as e:
+        print(f"❌ 제공자 초기화 실패: {e}")
+        return 1
+
+    print(f"주제 {len(topics)}개, 고유 문구 {len(items)}개, 성별 {len(genders)}개")
+
+    summary = prerender_videos(items, is_cached, render, genders=genders,
+                               concurrency=args.concurrency, dry_run=args.dry_run)
+
+    print("\n" + json.dumps({k: v for k, v in summary.items() if k != "failures"}, ensure_ascii=False, indent=2))
+    for failure in summary["failures"]:
+        print(f"❌ 실패: [{failure['video_type']}/{failure['phase']}/{failure['gender']}] {failure['script'][:40]}")
+
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
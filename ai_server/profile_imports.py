@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VeriView AI 서버 임포트 시간 측정 스크립트
+`python -X importtime`으로 서버 모듈을 새 프로세스에서 임포트하여 임포트 시간이 큰 모듈을 보고
+(서버 모듈 임포트에 무거운 모델 라이브러리가 다시 끼어들었는지 확인하는 용도)
+
+사용 예:
+    python profile_imports.py                                 # main_server 임포트 상위 25개 모듈
+    python profile_imports.py --module veriview_main_server --top 40
+    python profile_imports.py --json > import_profile.json    # 기준값 저장
+    python profile_imports.py --baseline import_profile.json --max-regression 0.2   # 기준값 대비 20% 넘게 느려지면 실패
+    python profile_imports.py --max-total-ms 3000             # 전체 임포트가 3초를 넘으면 실패
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from typing import Any, Dict, List
+
+# 서버 시작 시점에 임포트되면 안 되는 모델 라이브러리 (지연 임포트 대상)
+HEAVY_MODULES = ["torch", "whisper", "librosa", "TTS", "transformers", "numba", "sklearn", "cv2"]
+
+def run_importtime(module: str, python: str = sys.executable) -> List[Dict[str, Any]]:
+    """
+    새 프로세스에서 모듈을 임포트하고 -X importtime 결과 파싱
+
+    Args:
+        module: 임포트할 모듈 이름
+        python: 파이썬 실행 파일
+
+    Returns:
+        List[Dict[str, Any]]: 모듈별 임포트 시간 (self_us, cumulative_us, module, depth)
+    """
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"{module} 임포트 실패:\n{tail[-2000:]}")
+
+    records = []
+    for line in proc.stderr.splitlines():
+        # 형식: "import time:      self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        records.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1])
+        })
+    return records
+
+def summarize(module: str, records: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    """임포트 시간 요약 (전체 시간, 누적 시간 상위 모듈, 임포트된 무거운 라이브러리)"""
+    top_level = [r for r in records if r["depth"] == 0]
+    total_us = sum(r["cumulative_us"] for r in top_level)
+    imported = {r["module"] for r in records}
+    return {
+        "module": module,
+        "total_ms": round(total_us / 1000, 1),
+        "module_count": len(records),
+        "heavy_modules": [name for name in HEAVY_MODULES if name in imported],
+        "top": [
+            {"module": r["module"], "cumulative_ms": round(r["cumulative_us"] / 1000, 1),
+             "self_ms": round(r["self_us"] / 1000, 1)}
+            for r in sorted(records, key=lambda r: r["cumulative_us"], reverse=True)[:top]
+        ]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="VeriView AI 서버 임포트 시간 측정")
+    parser.add_argument("--module", default="main_server", help="측정할 모듈 (기본값: main_server)")
+    parser.add_argument("--top", type=int, default=25, help="출력할 상위 모듈 수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 파일 (--json 출력)")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="기준값 대비 허용 증가율 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--max-total-ms", type=float, default=None, help="전체 임포트 시간 상한 (ms)")
+    args = parser.parse_args()
+
+    try:
+        summary = summarize(args.module, run_importtime(args.module), args.top)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    failures = []
+    if args.max_total_ms is not None and summary["total_ms"] > args.max_total_ms:
+        failures.append(f"전체 임포트 시간 {summary['total_ms']}ms > 상한 {args.max_total_ms}ms")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        limit = baseline["total_ms"] * (1 + args.max_regression)
+        summary["baseline_total_ms"] = baseline["total_ms"]
+        if summary["total_ms"] > limit:
+            failures.append(f"전체 임포트 시간 {summary['total_ms']}ms > 기준값 {baseline['total_ms']}ms "
+                            f"+ {args.max_regression:.0%}")
+        new_heavy = sorted(set(summary["heavy_modules"]) - set(baseline.get("heavy_modules", [])))
+        if new_heavy:
+            failures.append(f"시작 시점에 새로 임포트된 무거운 라이브러리: {', '.join(new_heavy)}")
+    summary["failures"] = failures
+
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print("=" * 60)
+        print(f"{args.module} 임포트 시간: {summary['total_ms']}ms (모듈 {summary['module_count']}개)")
+        print(f"무거운 라이브러리: {', '.join(summary['heavy_modules']) or '없음'}")
+        print("=" * 60)
+        print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+        for item in summary["top"]:
+            print(f"{item['cumulative_ms']:>10.1f} {item['self_ms']:>10.1f}  {item['module']}")
+        for failure in failures:
+            print(f"❌ {failure}")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
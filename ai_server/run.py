@@ -117,7 +117,7 @@ def main():
     try:
         if args.mode == 'main':
             # 메인 모드: 완전 통합 서버 실행
-            from veriview_main_server import app, initialize_d_id, initialize_analyzers, initialize_ai_systems
+            from veriview_main_server import app, initialize_d_id, initialize_analyzers, initialize_ai_systems, start_model_warmup
         else:
             # 테스트/디버그 모드: 기존 서버 실행
             from server_runner_d_id import app, initialize_d_id, initialize_analyzers
@@ -135,14 +135,17 @@ def main():
             if initialize_d_id():
                 print("테스트 모드: D-ID 모듈 초기화 성공")
         
-        # 분석기 초기화
-        initialize_analyzers()
-        print("분석기 초기화 완료")
-        
-        # 메인 모드에서는 AI 시스템도 초기화
-        if args.mode == 'main' and 'initialize_ai_systems' in globals():
+        if args.mode == 'main':
+            # 메인 모드: AI 시스템 초기화 후 분석기/모델은 준비 단계에서 로드
+            # (AI_SERVER_STARTUP_MODE=background면 서버가 먼저 포트를 열고, 상태는 /ai/ready로 확인)
             initialize_ai_systems()
             print("AI 시스템 초기화 완료 (LLM, OpenFace 등)")
+            start_model_warmup()
+            print(f"모델 준비 시작 (방식: {os.environ.get('AI_SERVER_STARTUP_MODE', 'background')})")
+        else:
+            # 분석기 초기화
+            initialize_analyzers()
+            print("분석기 초기화 완료")
         
         print()
         
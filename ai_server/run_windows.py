@@ -31,11 +31,18 @@ import subprocess
 import base64
 import argparse # argparse 모듈 추가
 
+from modules.common.media_cache import MediaCache, get_media_cache_metrics
+from modules.video_prerender import prepare_d_id_script
+from modules.asr_backend import create_asr_backend, is_asr_backend_available
+from modules.common.model_registry import TTS_MODEL, acquire_model
+from modules.common.lazy_import import is_module_available, lazy_import
+
 # D-ID 모듈 임포트
 try:
     from modules.d_id.client import DIDClient
     from modules.d_id.video_manager import VideoManager
     from modules.d_id.tts_manager import TTSManager
+    from modules.render_jobs import setup_render_job_routes
     D_ID_AVAILABLE = True
     print("D-ID 모듈 로드 성공")
 except ImportError as e:
@@ -80,31 +87,20 @@ except ImportError as e:
     job_recommendation_module = None
     tfidf_recommendation_module = None
 
-# 개별 모듈 임포트
-try:
-    import whisper
-    import librosa
-    import soundfile as sf
-    WHISPER_AVAILABLE = True
-    LIBROSA_AVAILABLE = True
-    print("Whisper 및 Librosa 모듈 로드 성공")
-except ImportError as e:
-    print(f"음성 분석 모듈 일부 제한: {e}")
-    WHISPER_AVAILABLE = False
-    LIBROSA_AVAILABLE = False
-
-# TTS 모듈 임포트
-try:
-    from TTS.api import TTS
-    TTS_AVAILABLE = True
-    print("TTS 모듈 로드 성공")
-except ImportError as e:
-    print(f"TTS 모듈 로드 실패: {e}")
-    TTS_AVAILABLE = False
+# 개별 모듈 (설치 여부만 확인하고 실제 임포트는 첫 사용 시점에 수행)
+WHISPER_AVAILABLE = is_asr_backend_available()  # 음성 인식 엔진: 환경 변수 ASR_BACKEND
+LIBROSA_AVAILABLE = is_module_available("librosa") and is_module_available("soundfile")
+TTS_AVAILABLE = is_module_available("TTS")
+librosa = lazy_import("librosa")
+print(f"Whisper 설치 여부: {WHISPER_AVAILABLE}, Librosa: {LIBROSA_AVAILABLE}, TTS: {TTS_AVAILABLE}")
 
 app = Flask(__name__)
 CORS(app, resources={r"/ai/*": {"origins": "*"}})
 
+# 작업 큐 API (Whisper/OpenFace 작업자 프로세스 풀)
+from modules.workers import start_worker_pool, setup_job_routes
+setup_job_routes(app)
+
 # 정적 파일 제공 설정
 app.static_folder = os.path.abspath('videos')
 app.static_url_path = '/videos'
@@ -132,34 +128,26 @@ openface_integration = None
 whisper_model = None
 tts_model = None
 
-# 스레드 풀 및 큐 (비동기 처리용)
-executor = ThreadPoolExecutor(max_workers=10)
-video_generation_queue = queue.Queue(maxsize=100)
-
 # 캐시 시스템
 class ResponseCache:
-    """응답 캐싱 시스템"""
-    def __init__(self, ttl_seconds=3600):
-        self.cache = {}
+    """응답 캐싱 시스템 (공통 미디어 캐시 엔진 기반, 기간/항목 수 제한)"""
+    def __init__(self, ttl_seconds=3600, max_entries=1000):
+        self.cache = MediaCache(
+            "response",
+            max_age_seconds=ttl_seconds,
+            max_entries=max_entries,
+            sizeof=lambda path: os.path.getsize(path) if isinstance(path, str) and os.path.exists(path) else 1
+        )
         self.ttl_seconds = ttl_seconds
         
     def get(self, key):
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl_seconds:
-                return data
-            else:
-                del self.cache[key]
-        return None
+        return self.cache.get(key)
         
     def set(self, key, value):
-        self.cache[key] = (value, time.time())
+        self.cache.put(key, value)
         
     def clear_expired(self):
-        current_time = time.time()
-        expired_keys = [k for k, (_, t) in self.cache.items() if current_time - t >= self.ttl_seconds]
-        for key in expired_keys:
-            del self.cache[key]
+        self.cache.sweep()
 
 # 캐시 인스턴스 생성
 response_cache = ResponseCache(ttl_seconds=3600)  # 1시간 캐시
@@ -197,6 +185,9 @@ def initialize_d_id():
         # TTS 관리자 초기화
         tts_manager = TTSManager()
         
+        # 비동기 렌더링 작업 라우트 설정 (작업 ID 즉시 반환 + 상태 조회)
+        setup_render_job_routes(app, did_client=did_client, did_video_manager=did_video_manager)
+        
         did_initialized = True
         logger.info("D-ID 모듈 초기화 완료!")
         return True
@@ -249,12 +240,12 @@ def initialize_ai_systems():
         
         # Whisper 모델 초기화
         if WHISPER_AVAILABLE:
-            whisper_model = whisper.load_model("base")
+            whisper_model = create_asr_backend("base")
             logger.info("Whisper 모델 초기화 완료")
         
         # TTS 모델 초기화
         if TTS_AVAILABLE:
-            tts_model = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC")
+            tts_model = acquire_model(TTS_MODEL, "tts_models/en/ljspeech/tacotron2-DDC")
             logger.info("TTS 모델 초기화 완료")
             
     except Exception as e:
@@ -325,6 +316,14 @@ def generate_avatar_video_unified(script: str, video_type: str = 'interview',
             logger.info(f"캐시에서 영상 반환: {cached_path}")
             return cached_path
         
+        # 영구 캐시 확인 (사전 렌더링된 고정 문구 영상 포함, 원본 스크립트 기준)
+        original_script = script
+        if did_video_manager:
+            stored_path = did_video_manager.get_cached_video(original_script, video_type, gender=gender, phase=phase)
+            if stored_path:
+                response_cache.set(cache_key, stored_path)
+                return stored_path
+        
         # 텍스트 길이 검증
         if not script or len(script.strip()) < 10:
             logger.error(f"텍스트가 너무 짧습니다: '{script}'")
@@ -332,13 +331,9 @@ def generate_avatar_video_unified(script: str, video_type: str = 'interview',
         
         if len(script) > 500:
             logger.warning(f"텍스트가 길어서 잘라서 처리합니다: {len(script)} → 500글자")
-            script = script[:497] + "..."
         
-        # TTS 관리자를 통한 스크립트 최적화
-        if tts_manager:
-            optimized_script = tts_manager.optimize_script_for_speech(script)
-            if len(optimized_script.strip()) > 0:
-                script = optimized_script
+        # 길이 제한 및 TTS 관리자를 통한 스크립트 최적화 (사전 렌더링과 동일한 처리)
+        script = prepare_d_id_script(script, tts_manager)
         
         logger.info(f"D-ID 아바타 영상 생성 시작")
         logger.info(f"   스크립트: {script[:50]}{'...' if len(script) > 50 else ''}")
@@ -377,7 +372,14 @@ def generate_avatar_video_unified(script: str, video_type: str = 'interview',
                     logger.info(f"D-ID 영상 생성 성공: {video_path} ({file_size:,} bytes)")
                     
                     if file_size > 1000:
-                        # 캐시에 저장
+                        # 영구 캐시에 등록 후 메모리 캐시에 저장
+                        if did_video_manager and video_type in ('interview', 'debate'):
+                            stored_path = did_video_manager.save_video(
+                                video_path, original_script, video_type, gender=gender, phase=phase
+                            )
+                            if os.path.abspath(stored_path) != os.path.abspath(video_path):
+                                os.remove(video_path)
+                            video_path = stored_path
                         response_cache.set(cache_key, video_path)
                         return video_path
                     
@@ -758,6 +760,7 @@ def test_connection():
                 "희소기술 정보": "/ai/jobs/rare-skills"
             }
         },
+        "media_caches": get_media_cache_metrics(),
         "server_mode": "MAIN (프로덕션)"
     }
     
@@ -1159,7 +1162,7 @@ def generate_ai_opening(debate_id):
         if llm_module:
             try:
                 # DebateLLMModule의 generate_ai_opening 메서드 호출
-                ai_opening_text = llm_module.generate_ai_opening(topic, position, data).get("ai_response", "")
+                ai_opening_text = llm_module.generate_ai_opening(topic, position, data, session_id=debate_id).get("ai_response", "")
                 if not ai_opening_text.strip(): # LLM이 빈 응답을 줄 경우 폴백
                     ai_opening_text = generate_fallback_opening(topic, position)
             except Exception as e:
@@ -1416,7 +1419,7 @@ def process_debate_video_generic(debate_id, current_stage, next_ai_stage):
                 try:
                     # DebateLLMModule의 analyze_user_response_and_generate_rebuttal 메서드 호출
                     llm_result = llm_module.analyze_user_response_and_generate_rebuttal(
-                        user_text, facial_analysis, audio_analysis, next_ai_stage
+                        user_text, facial_analysis, audio_analysis, next_ai_stage, session_id=debate_id
                     )
                     ai_response = llm_result.get("ai_response", "")
                     if not ai_response.strip(): # LLM이 빈 응답을 줄 경우 폴백
@@ -1657,6 +1660,13 @@ if __name__ == "__main__":
         # AI 시스템 초기화
         initialize_ai_systems()
         
+        # 작업자 프로세스 풀 시작
+        try:
+            worker_pool = start_worker_pool()
+            print(f"작업자 풀 시작 - 프로세스: {worker_pool.num_workers}, 큐 크기: {worker_pool.max_queue_size}")
+        except Exception as e:
+            print(f"작업자 풀 시작 실패: {e}")
+        
         print("-" * 80)
         print("서버 주소: http://localhost:5000")
         print("테스트 엔드포인트: http://localhost:5000/ai/test")
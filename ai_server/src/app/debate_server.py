@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 import threading
 import queue
 import requests
@@ -15,6 +15,7 @@ import tempfile
 from .realtime_speech_to_text import RealtimeSpeechToText
 from .realtime_facial_analysis import RealtimeFacialAnalysis
 import jwt
+from modules.common.llm_stream import stream_ollama
 
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -162,6 +163,49 @@ class DebateServer:
         self.cleanup_videos(debate_id)
         return evaluation
 
+    def build_round_prompt(self, session, round_num):
+        name = session["ai_name"]
+        style = session["ai_style"]
+        stance = session["ai_stance"]
+        if round_num == 1:
+            prompt = (
+                f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
+                f"당신의 입장은 '{stance}'입니다. "
+                f"KILL 토론 주제는 '{session['topic']}'입니다. 현재 [입론] 단계이므로 자신을 소개한 후, 당신의 입장을 명확히 제시하세요. 2~4 문장으로 작성하세요."
+                f"줄바꿈 없이 문장을 이어서 작성하세요."
+            )
+        elif round_num == 2:
+            prompt = (
+                f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
+                f"당신의 입장은 '{stance}'입니다. "
+                f"토론 주제는 '{session['topic']}'입니다. 현재 [반론] 단계이므로 이전 발언자 의견에 대해 논리적으로 반박하세요. 2~4 문장으로 작성하세요."
+                f"줄바꿈 없이 문장을 이어서 작성하세요."
+            )
+        elif round_num == 3:
+            prompt = (
+                f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
+                f"당신의 입장은 '{stance}'입니다. "
+                f"토론 주제는 '{session['topic']}'입니다. 현재 [재반론] 단계이므로 이전 반박에 대해 추가 논쟁을 펼치세요. 2~4 문장으로 작성하세요."
+                f"줄바꿈 없이 문장을 이어서 작성하세요."
+            )
+        elif round_num == 4:
+            prompt = (
+                f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
+                f"당신의 입장은 '{stance}'입니다. "
+                f"토론 주제는 '{session['topic']}'입니다. 현재 [최종 변론] 단계이므로 토론을 결론짓고 당신의 입장을 요약하세요. 2~4 문장으로 작성하세요."
+                f"줄바꿈 없이 문장을 이어서 작성하세요."
+            )
+        if session["last_speakers"]:
+            last_speaker = session["last_speakers"][-1]
+            last_speaker_name = last_speaker["name"]
+            last_speaker_text = last_speaker["text"]
+            prompt += (
+                f" 이전 발언자('{last_speaker_name}')의 발언: '{last_speaker_text}'을 참조하세요. "
+                f"단, 상대방의 이름을 반복적으로 호출하지 말고, 자연스럽게 발언을 이어가세요."
+            )
+
+        return prompt
+
     def process_round(self, debate_id, round_num, speaker):
         session = self.sessions[debate_id]
         round_titles = ["입론", "반론", "재반론", "최종 변론"]
@@ -169,45 +213,7 @@ class DebateServer:
             return {"status": "waiting", "round": round_titles[round_num-1], "speaker": speaker}
         else:
             name = session["ai_name"]
-            style = session["ai_style"]
-            stance = session["ai_stance"]
-            if round_num == 1:
-                prompt = (
-                    f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
-                    f"당신의 입장은 '{stance}'입니다. "
-                    f"KILL 토론 주제는 '{session['topic']}'입니다. 현재 [입론] 단계이므로 자신을 소개한 후, 당신의 입장을 명확히 제시하세요. 2~4 문장으로 작성하세요."
-                    f"줄바꿈 없이 문장을 이어서 작성하세요."
-                )
-            elif round_num == 2:
-                prompt = (
-                    f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
-                    f"당신의 입장은 '{stance}'입니다. "
-                    f"토론 주제는 '{session['topic']}'입니다. 현재 [반론] 단계이므로 이전 발언자 의견에 대해 논리적으로 반박하세요. 2~4 문장으로 작성하세요."
-                    f"줄바꿈 없이 문장을 이어서 작성하세요."
-                )
-            elif round_num == 3:
-                prompt = (
-                    f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
-                    f"당신의 입장은 '{stance}'입니다. "
-                    f"토론 주제는 '{session['topic']}'입니다. 현재 [재반론] 단계이므로 이전 반박에 대해 추가 논쟁을 펼치세요. 2~4 문장으로 작성하세요."
-                    f"줄바꿈 없이 문장을 이어서 작성하세요."
-                )
-            elif round_num == 4:
-                prompt = (
-                    f"당신은 '{name}'입니다. 토론 스타일은 '{style}'입니다. "
-                    f"당신의 입장은 '{stance}'입니다. "
-                    f"토론 주제는 '{session['topic']}'입니다. 현재 [최종 변론] 단계이므로 토론을 결론짓고 당신의 입장을 요약하세요. 2~4 문장으로 작성하세요."
-                    f"줄바꿈 없이 문장을 이어서 작성하세요."
-                )
-            if session["last_speakers"]:
-                last_speaker = session["last_speakers"][-1]
-                last_speaker_name = last_speaker["name"]
-                last_speaker_text = last_speaker["text"]
-                prompt += (
-                    f" 이전 발언자('{last_speaker_name}')의 발언: '{last_speaker_text}'을 참조하세요. "
-                    f"단, 상대방의 이름을 반복적으로 호출하지 말고, 자연스럽게 발언을 이어가세요."
-                )
-
+            prompt = self.build_round_prompt(session, round_num)
             response = self.call_ollama(prompt)
             if response:
                 session["last_speakers"].append({"name": name, "text": response})
@@ -217,6 +223,26 @@ class DebateServer:
                 session["last_speakers"].append({"name": name, "text": response})
                 return {"status": "success", "round": round_titles[round_num-1], "speaker": name, "speech": response}
 
+    def stream_round(self, debate_id, round_num):
+        # AI 발언 토큰 조각을 생성되는 즉시 반환하고, 끝나면 전체 발언을 세션에 기록
+        session = self.sessions[debate_id]
+        name = session["ai_name"]
+        prompt = self.build_round_prompt(session, round_num)
+        full_text = ""
+        try:
+            for token in stream_ollama(prompt, model="gemma3:12b-it-q8_0", max_tokens=4096,
+                                       options={"top_k": 40, "top_p": 0.9}):
+                full_text += token
+                yield token
+        except Exception as e:
+            logger.error(f"Ollama 스트리밍 실패: {str(e)}")
+            # 첫 토큰 전에 실패한 경우에만 일반 호출로 대체
+            if not full_text:
+                full_text = self.call_ollama(prompt) or f"{name}의 기본 입장입니다."
+                yield full_text
+        text = " ".join(full_text.split()) or f"{name}의 기본 입장입니다."
+        session["last_speakers"].append({"name": name, "text": text})
+
     def process_video(self, video_file, phase, debate_id, topic, position):
         video_path = os.path.join(self.video_dir, f"{debate_id}_{phase}.mp4")
         video_file.save(video_path)
@@ -507,6 +533,38 @@ def ai_response(debate_id):
         })
     return jsonify({"error": f"AI {phase} 생성 실패"}), 500
 
+@app.route('/ai/debate/<int:debate_id>/ai-response-stream', methods=['POST'])
+def ai_response_stream(debate_id):
+    server = app.config['server']
+    if debate_id not in server.sessions:
+        return jsonify({"error": "유효하지 않은 debate_id입니다."}), 404
+    data = request.json or {}
+    stage = data.get("stage", "opening")
+    round_num = {"opening": 1, "rebuttal": 2, "counter_rebuttal": 3, "closing": 4}.get(stage)
+    if round_num is None:
+        return jsonify({"error": f"지원하지 않는 단계입니다: {stage}"}), 400
+
+    def generate():
+        # Ollama 스트리밍 응답의 토큰 조각을 SSE 이벤트로 즉시 전달
+        full_text = ""
+        try:
+            for token in server.stream_round(debate_id, round_num):
+                full_text += token
+                yield f"data: {json.dumps({'type': 'token', 'data': token})}\n\n"
+            yield f"data: {json.dumps({'type': 'complete', 'full_text': ' '.join(full_text.split())})}\n\n"
+        except Exception as e:
+            logger.error(f"스트리밍 생성 중 오류: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
 @app.route('/api/debate/<int:debate_id>/feedback', methods=['GET'])
 def feedback(debate_id):
     if debate_id not in app.config['server'].sessions:
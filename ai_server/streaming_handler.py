@@ -8,11 +8,19 @@ import json
 import time
 import logging
 import os
-import base64
 from typing import Generator, Dict, Any, Optional
 
+from modules.analysis import get_orchestrator
+from modules.common.audio_utils import AUDIO_SAMPLE_RATE, decode_audio_from_video, load_audio
+from modules.common.llm_stream import pop_sentences
+from modules.text_to_speech.pipeline import TTSPipeline, synthesize_wav_bytes
+from modules.common.vad import detect_speech_intervals, group_into_windows
+
 logger = logging.getLogger(__name__)
 
+# 부분 음성 인식 윈도우 최대 길이 (초) - 짧을수록 첫 자막이 빨리 도착
+STREAMING_WINDOW_SECONDS = float(os.environ.get("STREAMING_WINDOW_SECONDS", 10))
+
 class StreamingHandler:
     """스트리밍 응답 처리 클래스"""
     
@@ -26,55 +34,51 @@ class StreamingHandler:
                                 position: str, user_text: str) -> Response:
         """스트리밍 응답 생성"""
         def generate():
+            # 문장 단위 TTS는 별도 작업자에서 합성 (토큰 스트리밍은 멈추지 않음)
+            tts_pipeline = TTSPipeline(self._synthesize_audio) if self.tts_available else None
+            
+            def send_sentence(sentence):
+                index = tts_pipeline.submit(sentence) if tts_pipeline else None
+                # 자막용 텍스트는 합성을 기다리지 않고 즉시 전송
+                yield f"data: {json.dumps({'type': 'text', 'data': sentence, 'index': index})}\n\n"
+            
+            def send_ready_audio(audio_chunks):
+                for index, audio_data in audio_chunks:
+                    if audio_data:
+                        yield f"data: {json.dumps({'type': 'audio', 'data': audio_data, 'index': index})}\n\n"
+            
             try:
                 sentence_buffer = ""
                 full_text = ""
                 
-                # LLM 사용 가능한 경우
+                # LLM 사용 가능한 경우 제공자 스트리밍 API의 토큰 조각을 그대로 전달,
+                # 아니면 고정 응답을 단어 단위로 전달
                 if self.llm_available:
-                    for token in self._generate_llm_tokens(stage, topic, position, user_text):
-                        sentence_buffer += token
-                        full_text += token
-                        
-                        # 문장 완성 시 처리
-                        if any(punct in token for punct in '.!?'):
-                            # TTS 처리
-                            audio_data = self._process_tts(sentence_buffer, debate_id)
-                            if audio_data:
-                                yield f"data: {json.dumps({'type': 'audio', 'data': audio_data})}\n\n"
-                            
-                            # 텍스트 전송
-                            yield f"data: {json.dumps({'type': 'text', 'data': sentence_buffer})}\n\n"
-                            sentence_buffer = ""
-                
+                    tokens = self._generate_llm_tokens(stage, topic, position, user_text)
                 else:
-                    # 폴백 모드 (고정 응답)
-                    fallback_response = self._get_fallback_response(stage, topic, position, user_text)
+                    tokens = self._generate_fallback_tokens(stage, topic, position, user_text)
+                
+                for token in tokens:
+                    sentence_buffer += token
+                    full_text += token
+                    yield f"data: {json.dumps({'type': 'token', 'data': token})}\n\n"
+                    
+                    # 문장 완성 시 합성 요청
+                    sentences, sentence_buffer = pop_sentences(sentence_buffer)
+                    for sentence in sentences:
+                        yield from send_sentence(sentence)
                     
-                    # 단어 단위로 스트리밍
-                    words = fallback_response.split()
-                    for i, word in enumerate(words):
-                        if i > 0:
-                            word = " " + word
-                        sentence_buffer += word
-                        full_text += word
-                        
-                        # 문장 완성 체크
-                        if any(punct in word for punct in '.!?'):
-                            # TTS 처리
-                            audio_data = self._process_tts(sentence_buffer, debate_id)
-                            if audio_data:
-                                yield f"data: {json.dumps({'type': 'audio', 'data': audio_data})}\n\n"
-                            
-                            # 텍스트 전송
-                            yield f"data: {json.dumps({'type': 'text', 'data': sentence_buffer})}\n\n"
-                            sentence_buffer = ""
-                        
-                        time.sleep(0.05)  # 자연스러운 속도
+                    # 합성이 끝난 오디오는 순서대로 전송
+                    if tts_pipeline:
+                        yield from send_ready_audio(tts_pipeline.ready())
+                
+                # 남은 텍스트 처리 (마지막 문장은 뒤따르는 공백 없이 끝남)
+                if sentence_buffer.strip():
+                    yield from send_sentence(sentence_buffer)
                 
-                # 남은 텍스트 처리
-                if sentence_buffer:
-                    yield f"data: {json.dumps({'type': 'text', 'data': sentence_buffer})}\n\n"
+                # 남은 오디오가 모두 합성될 때까지 대기
+                if tts_pipeline:
+                    yield from send_ready_audio(tts_pipeline.drain())
                 
                 # 완료 신호
                 yield f"data: {json.dumps({'type': 'complete', 'full_text': full_text})}\n\n"
@@ -82,6 +86,9 @@ class StreamingHandler:
             except Exception as e:
                 logger.error(f"스트리밍 생성 중 오류: {str(e)}")
                 yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            finally:
+                if tts_pipeline:
+                    tts_pipeline.close()
         
         return Response(
             stream_with_context(generate()),
@@ -94,48 +101,34 @@ class StreamingHandler:
     
     def _generate_llm_tokens(self, stage: str, topic: str, position: str, 
                            user_text: str) -> Generator[str, None, None]:
-        """LLM 토큰 생성"""
+        """LLM 토큰 생성 (제공자 스트리밍 API의 delta를 도착 즉시 반환)"""
         if not self.llm_available:
             return
         
+        prompt = self._create_prompt(stage, topic, position, user_text)
+        received = False
         try:
-            # 실제 LLM 모듈의 스트리밍 메서드 호출
-            prompt = self._create_prompt(stage, topic, position, user_text)
-            
-            # 여기서는 예시로 단어 단위 생성
-            # 실제로는 LLM 모듈의 스트리밍 API를 사용해야 함
-            response = self._get_llm_response(stage, topic, position, user_text)
-            for word in response.split():
-                yield word + " "
+            for delta in self.llm_module.stream_response(prompt):
+                received = True
+                yield delta
                 
         except Exception as e:
             logger.error(f"LLM 토큰 생성 오류: {str(e)}")
+            # 첫 토큰 전에 실패한 경우에만 폴백 응답 사용 (이미 보낸 내용과 섞이지 않도록)
+            if not received:
+                yield self._get_fallback_response(stage, topic, position, user_text)
     
-    def _process_tts(self, text: str, debate_id: int) -> Optional[str]:
-        """TTS 처리 및 base64 인코딩"""
-        if not self.tts_available or not text.strip():
-            return None
-        
-        try:
-            # 임시 파일 경로
-            temp_audio = f"temp_stream_{debate_id}_{int(time.time())}.wav"
-            
-            # TTS 변환
-            self.tts_model.tts_to_file(text=text, file_path=temp_audio)
-            
-            # 파일을 base64로 인코딩
-            with open(temp_audio, 'rb') as audio_file:
-                audio_base64 = base64.b64encode(audio_file.read()).decode('utf-8')
-            
-            # 임시 파일 삭제
-            if os.path.exists(temp_audio):
-                os.remove(temp_audio)
-            
-            return audio_base64
-            
-        except Exception as e:
-            logger.error(f"TTS 처리 오류: {str(e)}")
-            return None
+    def _generate_fallback_tokens(self, stage: str, topic: str, position: str,
+                                user_text: str) -> Generator[str, None, None]:
+        """폴백 응답을 단어 단위로 생성"""
+        words = self._get_fallback_response(stage, topic, position, user_text).split()
+        for i, word in enumerate(words):
+            yield word if i == 0 else " " + word
+            time.sleep(0.05)  # 자연스러운 속도
+    
+    def _synthesize_audio(self, text: str) -> bytes:
+        """TTS 합성 (메모리 상의 WAV 바이트 반환, TTS 작업자 스레드에서 실행)"""
+        return synthesize_wav_bytes(self.tts_model, text)
     
     def _create_prompt(self, stage: str, topic: str, position: str, user_text: str) -> str:
         """프롬프트 생성"""
@@ -147,11 +140,6 @@ class StreamingHandler:
         }
         return prompts.get(stage, prompts["opening"])
     
-    def _get_llm_response(self, stage: str, topic: str, position: str, user_text: str) -> str:
-        """LLM 응답 생성 (실제 구현 필요)"""
-        # 실제로는 LLM 모듈을 사용해야 함
-        return self._get_fallback_response(stage, topic, position, user_text)
-    
     def _get_fallback_response(self, stage: str, topic: str, position: str, user_text: str) -> str:
         """폴백 응답"""
         responses = {
@@ -177,32 +165,54 @@ class InterviewStreamingHandler:
         self.librosa_available = librosa_available
     
     def create_streaming_response(self, interview_id: int, video_path: str) -> Response:
-        """면접 영상 실시간 분석 스트리밍"""
+        """면접 영상 실시간 분석 스트리밍
+        
+        음성 인식은 VAD로 나눈 윈도우 단위로 실행하여 세그먼트마다
+        transcript_partial 이벤트를 바로 전송하고, 음성/얼굴 분석은 그 동안 병렬로 진행
+        """
         def generate():
+            transcription = None
+            audio_analysis = None
+            facial_analysis = None
+            
             try:
                 # 1. 처리 시작 알림
                 yield f"data: {json.dumps({'type': 'status', 'message': '영상 분석을 시작합니다...'})}\n\n"
                 
-                # 2. 음성 추출
-                audio_path = self._extract_audio(video_path)
-                if audio_path:
+                executor = get_orchestrator().executor
+                
+                # 얼굴 분석은 비디오만 필요하므로 바로 병렬 시작
+                facial_future = executor.submit(self._analyze_facial, video_path) if self.openface_module else None
+                
+                # 2. 음성 추출 (PCM 버퍼로 한 번만 디코딩)
+                audio = self._extract_audio(video_path)
+                if audio is not None:
                     yield f"data: {json.dumps({'type': 'status', 'message': '음성 추출 완료'})}\n\n"
                 
-                # 3. 음성 인식
-                if self.whisper_model and audio_path:
-                    transcription = self._transcribe_audio(audio_path)
-                    if transcription:
-                        yield f"data: {json.dumps({'type': 'transcription', 'data': transcription})}\n\n"
+                # 음성 분석도 음성 인식과 병렬로 진행
+                audio_future = None
+                if self.librosa_available and audio is not None:
+                    audio_future = executor.submit(self._analyze_audio, audio)
+                
+                # 3. 음성 인식 - 윈도우별 부분 결과 스트리밍
+                if self.whisper_model and audio is not None:
+                    texts = []
+                    for segment in self._transcribe_audio_partial(audio):
+                        texts.append(segment["text"])
+                        yield f"data: {json.dumps({'type': 'transcript_partial', 'data': segment})}\n\n"
+                    
+                    transcription = " ".join(t for t in texts if t).strip()
+                    yield f"data: {json.dumps({'type': 'transcription', 'data': transcription})}\n\n"
                 
                 # 4. 음성 분석
-                if self.librosa_available and audio_path:
-                    audio_analysis = self._analyze_audio(audio_path)
+                if audio_future:
+                    audio_analysis = audio_future.result()
                     if audio_analysis:
                         yield f"data: {json.dumps({'type': 'audio_analysis', 'data': audio_analysis})}\n\n"
                 
                 # 5. 얼굴 분석
-                if self.openface_module:
-                    facial_analysis = self._analyze_facial(video_path)
+                if facial_future:
+                    facial_analysis = facial_future.result()
                     if facial_analysis:
                         yield f"data: {json.dumps({'type': 'facial_analysis', 'data': facial_analysis})}\n\n"
                 
@@ -217,10 +227,6 @@ class InterviewStreamingHandler:
                 # 8. 완료
                 yield f"data: {json.dumps({'type': 'complete'})}\n\n"
                 
-                # 임시 파일 정리
-                if audio_path and os.path.exists(audio_path):
-                    os.remove(audio_path)
-                
             except Exception as e:
                 logger.error(f"면접 스트리밍 처리 오류: {str(e)}")
                 yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
@@ -234,40 +240,45 @@ class InterviewStreamingHandler:
             }
         )
     
-    def _extract_audio(self, video_path: str) -> Optional[str]:
-        """비디오에서 오디오 추출"""
-        try:
-            import subprocess
-            audio_path = video_path.replace('.mp4', '_audio.wav').replace('.webm', '_audio.wav')
-            
-            command = [
-                'ffmpeg', '-i', video_path, '-acodec', 'pcm_s16le', 
-                '-ac', '1', '-ar', '16000', audio_path, '-y'
-            ]
-            
-            subprocess.run(command, check=True, capture_output=True)
-            
-            if os.path.exists(audio_path):
-                return audio_path
-            return None
-        except Exception as e:
-            logger.error(f"오디오 추출 오류: {str(e)}")
-            return None
+    def _extract_audio(self, video_path: str):
+        """비디오에서 오디오를 16kHz float32 PCM 버퍼로 디코딩 (임시 WAV 없음)"""
+        return decode_audio_from_video(video_path)
     
-    def _transcribe_audio(self, audio_path: str) -> Optional[str]:
-        """음성 인식"""
-        try:
-            result = self.whisper_model.transcribe(audio_path, language="ko")
-            return result.get("text", "")
-        except Exception as e:
-            logger.error(f"음성 인식 오류: {str(e)}")
-            return None
+    def _transcribe_audio_partial(self, audio) -> Generator[Dict[str, Any], None, None]:
+        """VAD 윈도우 단위 음성 인식 - 세그먼트를 원본 타임스탬프로 변환하여 순서대로 반환"""
+        windows = group_into_windows(
+            detect_speech_intervals(audio, AUDIO_SAMPLE_RATE),
+            max_window_seconds=STREAMING_WINDOW_SECONDS
+        )
+        previous_text = ""
+        
+        for window_index, (window_start, window_end) in enumerate(windows):
+            chunk = audio[int(window_start * AUDIO_SAMPLE_RATE):int(window_end * AUDIO_SAMPLE_RATE)]
+            try:
+                # 이전 윈도우의 끝부분을 프롬프트로 전달하여 문맥 유지
+                result = self.whisper_model.transcribe(
+                    chunk, language="ko", initial_prompt=previous_text[-200:] or None
+                )
+            except Exception as e:
+                logger.error(f"윈도우 {window_index} 음성 인식 오류: {str(e)}")
+                continue
+            
+            for segment in result.get("segments", []):
+                text = segment.get("text", "").strip()
+                if not text:
+                    continue
+                previous_text += " " + text
+                yield {
+                    "window_index": window_index,
+                    "start": round(window_start + segment["start"], 2),
+                    "end": round(window_start + segment["end"], 2),
+                    "text": text
+                }
     
-    def _analyze_audio(self, audio_path: str) -> Optional[Dict[str, Any]]:
+    def _analyze_audio(self, audio) -> Optional[Dict[str, Any]]:
         """오디오 분석"""
         try:
-            import librosa
-            y, sr = librosa.load(audio_path)
+            y, sr = load_audio(audio)
             
             # 기본 분석
             return {
@@ -63,6 +63,27 @@ class LibrosaTestModule:
             logger.error(f"오디오 분석 오류: {str(e)}")
             return self._get_default_result()
 
+    def analyze_audio_data(self, y, sr=None):
+        """디코딩된 PCM 버퍼 분석 (파일을 다시 읽거나 리샘플링하지 않음)"""
+        if not self.is_available:
+            logger.warning("Librosa 사용 불가 - 고정값 반환")
+            return self._get_default_result()
+        
+        try:
+            sr = sr or self.sample_rate
+            if y is None or len(y) == 0:
+                logger.warning("분석할 오디오 데이터가 없습니다")
+                return self._get_default_result()
+            
+            analysis_result = self._extract_audio_features(y, sr)
+            logger.info("오디오 데이터 분석 완료")
+            
+            return analysis_result
+            
+        except Exception as e:
+            logger.error(f"오디오 데이터 분석 오류: {str(e)}")
+            return self._get_default_result()
+
     def analyze_video_audio(self, video_path):
         """비디오에서 오디오 추출 후 분석"""
         if not self.is_available:
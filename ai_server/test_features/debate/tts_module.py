@@ -15,6 +15,12 @@ except ImportError:
     TTS_AVAILABLE = False
     print("TTS 패키지를 찾을 수 없습니다. 음성 합성 기능이 제한됩니다.")
 
+# 프로세스 공용 모델 레지스트리 (AI 서버 모듈 경로에서 실행될 때만 사용)
+try:
+    from modules.common.model_registry import TTS_MODEL, acquire_model, list_tts_models
+except ImportError:
+    acquire_model = None
+
 logger = logging.getLogger(__name__)
 
 class TTSTestModule:
@@ -42,8 +48,11 @@ class TTSTestModule:
         
         try:
             # 사용 가능한 모델 목록 확인
-            tts = TTS()
-            available_models = tts.list_models()
+            if acquire_model is not None:
+                # 모델 목록은 프로세스에서 한 번만 조회
+                available_models = list_tts_models()
+            else:
+                available_models = TTS().list_models()
             logger.info(f"사용 가능한 TTS 모델 수: {len(available_models)}")
             
             # 한국어 지원 모델 우선 선택
@@ -70,7 +79,10 @@ class TTSTestModule:
             
             # 선택된 모델로 TTS 객체 생성
             if self.model_name:
-                self.tts_model = TTS(self.model_name)
+                if acquire_model is not None:
+                    self.tts_model = acquire_model(TTS_MODEL, self.model_name)
+                else:
+                    self.tts_model = TTS(self.model_name)
                 logger.info("TTS 모델 로드 완료")
             else:
                 logger.error("사용 가능한 TTS 모델이 없습니다")
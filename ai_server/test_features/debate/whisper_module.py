@@ -20,6 +20,12 @@ except ImportError as e:
     print(f"Whisper 관련 패키지 로드 실패: {e}")
     print("음성 인식 기능이 제한됩니다.")
 
+# 음성 인식 백엔드 - 공용 모델 레지스트리 사용 (AI 서버 모듈 경로에서 실행될 때만 사용)
+try:
+    from modules.asr_backend import create_asr_backend
+except ImportError:
+    create_asr_backend = None
+
 logger = logging.getLogger(__name__)
 
 class WhisperTestModule:
@@ -32,7 +38,11 @@ class WhisperTestModule:
         
         if self.is_available:
             try:
-                self.model = whisper.load_model(model_size)
+                if create_asr_backend is not None:
+                    # 같은 크기의 모델은 프로세스에서 한 번만 로드하여 공유 (엔진: 환경 변수 ASR_BACKEND)
+                    self.model = create_asr_backend(model_size)
+                else:
+                    self.model = whisper.load_model(model_size)
                 logger.info(f"Whisper 모델 로드 성공: {model_size}")
             except Exception as e:
                 logger.error(f"Whisper 모델 로드 실패: {str(e)}")
@@ -53,6 +63,12 @@ class WhisperTestModule:
         except Exception as e:
             return {"status": "error", "message": f"Whisper 실행 오류: {str(e)}"}
 
+    def _transcribe(self, audio, language):
+        """Whisper 전사 (동시에 들어온 요청은 배치 추론 서버에서 한 번에 실행)"""
+        if create_asr_backend is not None:
+            return self.model.transcribe(audio, language=language, batched=True)
+        return self.model.transcribe(audio, language=language)
+
     def transcribe_audio_file(self, audio_path, language="ko"):
         """오디오 파일 음성 인식"""
         if not self.is_available or self.model is None:
@@ -67,7 +83,7 @@ class WhisperTestModule:
             logger.info(f"오디오 파일 음성 인식 시작: {audio_path}")
             
             # Whisper로 음성 인식
-            result = self.model.transcribe(audio_path, language=language)
+            result = self._transcribe(audio_path, language)
             text = result["text"].strip()
             
             logger.info(f"음성 인식 완료 - 텍스트 길이: {len(text)}")
@@ -109,7 +125,7 @@ class WhisperTestModule:
                 logger.info("비디오에서 오디오 추출 완료")
                 
                 # Whisper로 음성 인식
-                result = self.model.transcribe(temp_audio_path, language=language)
+                result = self._transcribe(temp_audio_path, language)
                 text = result["text"].strip()
                 
                 # 임시 파일 삭제
@@ -146,7 +162,7 @@ class WhisperTestModule:
                 audio_array = np.array(audio_data, dtype=np.float32)
             
             # Whisper로 음성 인식
-            result = self.model.transcribe(audio_array, language=language)
+            result = self._transcribe(audio_array, language)
             text = result["text"].strip()
             
             logger.info(f"오디오 데이터 음성 인식 완료 - 텍스트 길이: {len(text)}")
@@ -14,6 +14,12 @@ except ImportError:
     TTS_AVAILABLE = False
     print("TTS 패키지를 찾을 수 없습니다. 음성 합성 기능이 제한됩니다.")
 
+# 프로세스 공용 모델 레지스트리 (AI 서버 모듈 경로에서 실행될 때만 사용)
+try:
+    from modules.common.model_registry import TTS_MODEL, acquire_model, list_tts_models
+except ImportError:
+    acquire_model = None
+
 logger = logging.getLogger(__name__)
 
 class PersonalInterviewTTSModule:
@@ -40,8 +46,11 @@ class PersonalInterviewTTSModule:
             return
         
         try:
-            tts = TTS()
-            available_models = tts.list_models()
+            if acquire_model is not None:
+                # 모델 목록은 프로세스에서 한 번만 조회
+                available_models = list_tts_models()
+            else:
+                available_models = TTS().list_models()
             logger.info(f"사용 가능한 TTS 모델 수: {len(available_models)}")
             
             # 면접용으로 적합한 모델 선택 (자연스러운 음성)
@@ -60,7 +69,10 @@ class PersonalInterviewTTSModule:
                     logger.info(f"기본 모델 선택: {self.model_name}")
             
             if self.model_name:
-                self.tts_model = TTS(self.model_name)
+                if acquire_model is not None:
+                    self.tts_model = acquire_model(TTS_MODEL, self.model_name)
+                else:
+                    self.tts_model = TTS(self.model_name)
                 logger.info("면접용 TTS 모델 로드 완료")
             else:
                 logger.error("사용 가능한 TTS 모델이 없습니다")
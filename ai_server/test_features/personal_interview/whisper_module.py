@@ -18,6 +18,12 @@ except ImportError as e:
     WHISPER_AVAILABLE = False
     print(f"Whisper 관련 패키지 로드 실패: {e}")
 
+# 음성 인식 백엔드 - 공용 모델 레지스트리 사용 (AI 서버 모듈 경로에서 실행될 때만 사용)
+try:
+    from modules.asr_backend import create_asr_backend
+except ImportError:
+    create_asr_backend = None
+
 logger = logging.getLogger(__name__)
 
 class PersonalInterviewWhisperModule:
@@ -30,7 +36,11 @@ class PersonalInterviewWhisperModule:
         
         if self.is_available:
             try:
-                self.model = whisper.load_model(model_size)
+                if create_asr_backend is not None:
+                    # 같은 크기의 모델은 프로세스에서 한 번만 로드하여 공유 (엔진: 환경 변수 ASR_BACKEND)
+                    self.model = create_asr_backend(model_size)
+                else:
+                    self.model = whisper.load_model(model_size)
                 logger.info(f"면접용 Whisper 모델 로드 성공: {model_size}")
             except Exception as e:
                 logger.error(f"Whisper 모델 로드 실패: {str(e)}")
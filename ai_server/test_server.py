@@ -14,7 +14,13 @@ import logging
 import time
 import json
 from typing import Dict, Any, Optional
-import torch
+
+from modules.asr_backend import create_asr_backend, is_asr_backend_available
+from modules.common.model_registry import TTS_MODEL, acquire_model
+from modules.common.lazy_import import is_module_available, lazy_import
+
+# torch는 Gemma 모델 로드 시점에 임포트
+torch = lazy_import("torch")
 
 # Gemma 모델 관련 임포트
 try:
@@ -48,27 +54,12 @@ except ImportError as e:
     JOB_RECOMMENDATION_AVAILABLE = False
     job_recommendation_module = None
 
-# 개별 모듈 임포트 (LLM 제외)
-try:
-    import whisper
-    import librosa
-    import soundfile as sf
-    WHISPER_AVAILABLE = True
-    LIBROSA_AVAILABLE = True
-    print(" Whisper 및 Librosa 모듈 로드 성공")
-except ImportError as e:
-    print(f" 음성 분석 모듈 일부 제한: {e}")
-    WHISPER_AVAILABLE = False
-    LIBROSA_AVAILABLE = False
-
-# TTS 모듈 임포트
-try:
-    from TTS.api import TTS
-    TTS_AVAILABLE = True
-    print(" TTS 모듈 로드 성공")
-except ImportError as e:
-    print(f" TTS 모듈 로드 실패: {e}")
-    TTS_AVAILABLE = False
+# 개별 모듈 (설치 여부만 확인하고 실제 임포트는 첫 사용 시점에 수행)
+WHISPER_AVAILABLE = is_asr_backend_available()  # 음성 인식 엔진: 환경 변수 ASR_BACKEND
+LIBROSA_AVAILABLE = is_module_available("librosa") and is_module_available("soundfile")
+TTS_AVAILABLE = is_module_available("TTS")
+librosa = lazy_import("librosa")
+print(f" Whisper 설치 여부: {WHISPER_AVAILABLE}, Librosa: {LIBROSA_AVAILABLE}, TTS: {TTS_AVAILABLE}")
 
 # OpenFace 모듈 임포트 (실제 모듈 - LLM 제외)
 try:
@@ -120,12 +111,12 @@ def initialize_test_systems():
         
         # Whisper 모델 초기화
         if WHISPER_AVAILABLE:
-            whisper_model = whisper.load_model("base")
+            whisper_model = create_asr_backend("base")
             logger.info("Whisper 모델 초기화 완료")
         
         # TTS 모델 초기화
         if TTS_AVAILABLE:
-            tts_model = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC")
+            tts_model = acquire_model(TTS_MODEL, "tts_models/en/ljspeech/tacotron2-DDC")
             logger.info("TTS 모델 초기화 완료")
         
         # Gemma 모델 초기화
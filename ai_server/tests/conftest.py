@@ -0,0 +1,8 @@
+"""
+pytest 공통 설정
+ai_server 디렉토리를 import 경로에 추가하여 modules 패키지를 불러올 수 있게 함
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
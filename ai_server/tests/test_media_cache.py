@@ -0,0 +1,82 @@
+"""
+MediaCache 제거 정책 테스트
+- LRU: 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- TTL: 최대 보관 기간이 지난 항목은 조회/정리 시 만료
+"""
+import os
+
+from modules.common import media_cache
+from modules.common.media_cache import MediaCache
+
+class FakeClock:
+    """테스트용 시계 (media_cache 모듈의 time.time 대체)"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+def _use_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(media_cache.time, "time", clock.time)
+    return clock
+
+def test_lru_evicts_least_recently_used_entry(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    evicted = []
+    cache = MediaCache("test_lru", max_entries=2, on_evict=lambda key, path: evicted.append(key))
+
+    cache.put("a", "A")
+    clock.now += 1
+    cache.put("b", "B")
+    clock.now += 1
+    assert cache.get("a") == "A"  # a를 최근 사용 항목으로 갱신
+    clock.now += 1
+    cache.put("c", "C")
+
+    assert evicted == ["b"]
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+    assert cache.metrics()["evictions"] == 1
+
+def test_lru_respects_byte_limit_and_keeps_new_entry(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    cache = MediaCache("test_lru_bytes", max_bytes=10)
+
+    cache.put("old", "x", size=6)
+    clock.now += 1
+    cache.put("new", "y", size=8)
+
+    metrics = cache.metrics()
+    assert cache.get("old") is None
+    assert cache.get("new") == "y"
+    assert metrics["bytes"] == 8 and metrics["evicted_bytes"] == 6
+
+def test_ttl_expires_entry_on_get(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    cache = MediaCache("test_ttl", max_age_seconds=60)
+
+    cache.put("a", "A")
+    clock.now += 59
+    assert cache.get("a") == "A"
+    clock.now += 2
+    assert cache.get("a") is None
+
+    metrics = cache.metrics()
+    assert metrics["expirations"] == 1 and metrics["entries"] == 0
+
+def test_ttl_sweep_removes_expired_files(monkeypatch, tmp_path):
+    clock = _use_clock(monkeypatch)
+    cache = MediaCache("test_ttl_dir", directory=str(tmp_path), max_age_seconds=60)
+
+    for key in ("old.mp4", "new.mp4"):
+        with open(cache.path_for(key), "wb") as f:
+            f.write(b"0" * 16)
+        cache.put(key)
+        clock.now += 30
+
+    clock.now += 1  # old.mp4만 61초 경과
+    assert cache.sweep() == {"expired": 1, "evicted": 0}
+    assert not os.path.exists(cache.path_for("old.mp4"))
+    assert cache.get("new.mp4") == cache.path_for("new.mp4")
@@ -0,0 +1,66 @@
+"""
+SessionStore 다중 인스턴스 테스트
+같은 SQLite 파일을 공유하는 두 저장소(작업자 프로세스 대신)가 서로의 갱신을 버전 비교로 감지하는지 확인
+"""
+import threading
+
+import pytest
+
+from modules.common.session_store import SessionStore, SQLiteSessionBackend
+
+@pytest.fixture
+def stores(tmp_path):
+    db_path = str(tmp_path / "sessions.db")
+    return (SessionStore("debate", backend=SQLiteSessionBackend(db_path)),
+            SessionStore("debate", backend=SQLiteSessionBackend(db_path)))
+
+def test_reloads_session_updated_by_other_instance(stores):
+    first, second = stores
+
+    first.put(1, {"phase": "opening"})
+    assert second.get(1) == {"phase": "opening"}  # second 캐시에 적재
+
+    first.put(1, {"phase": "rebuttal"})
+    assert second.get(1) == {"phase": "rebuttal"}
+    assert second.stats()["loads"] == 2
+
+def test_delete_is_visible_to_other_instance(stores):
+    first, second = stores
+
+    first.put(1, {"phase": "opening"})
+    assert second.get(1) is not None
+    first.delete(1)
+    assert second.get(1) is None
+
+def test_update_applies_on_top_of_other_instance_write(stores):
+    first, second = stores
+    first.put(1, {"history": []})
+    stale = first.get(1)
+
+    second.update(1, lambda state: state["history"].append("second"))
+    first.update(1, lambda state: state["history"].append("first"))
+
+    assert second.get(1) == {"history": ["second", "first"]}
+    assert stale == {"history": []}  # 캐시된 이전 상태는 수정하지 않음
+
+def test_concurrent_updates_are_not_lost(stores):
+    def increment(store):
+        for _ in range(50):
+            store.update(1, lambda state: state.update(count=state["count"] + 1))
+
+    stores[0].put(1, {"count": 0})
+    workers = [threading.Thread(target=increment, args=(store,)) for store in stores * 2]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert stores[0].get(1) == {"count": 200}
+    assert stores[1].get(1) == {"count": 200}
+
+def test_update_creates_missing_session_with_default(stores):
+    first, second = stores
+
+    assert first.update(1, lambda state: state.update(count=1)) is None
+    first.update(1, lambda state: state.update(count=state["count"] + 1), default=lambda: {"count": 0})
+    assert second.get(1) == {"count": 1}
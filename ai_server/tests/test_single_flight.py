@@ -0,0 +1,62 @@
+"""
+SingleFlight 잠금 파일 테스트
+- 갱신이 멈춘 잠금 파일(리더 프로세스 비정상 종료)은 회수하고 작업을 실행
+- 살아 있는 잠금은 회수하지 않고, 해제되면 check로 다른 프로세스의 결과를 가져옴
+"""
+import os
+import time
+import threading
+
+import pytest
+
+from modules.common.single_flight import SingleFlight, flight_key
+
+def _write_lock(group: SingleFlight, key: str, age: float = 0.0) -> str:
+    """다른 프로세스가 잡은 것처럼 잠금 파일 생성 (age초 전에 마지막으로 갱신)"""
+    lock_path = os.path.join(group.lock_dir, f"{key}.lock")
+    with open(lock_path, "w") as f:
+        f.write("99999 0")
+    if age:
+        stamp = time.time() - age
+        os.utime(lock_path, (stamp, stamp))
+    return lock_path
+
+def test_stale_lock_is_reclaimed(tmp_path):
+    group = SingleFlight("reclaim", lock_dir=str(tmp_path), stale_seconds=1, poll_interval=0.01)
+    key = flight_key("script", "voice")
+    lock_path = _write_lock(group, key, age=10)
+
+    result, shared = group.do(key, lambda: "rendered", timeout=5)
+
+    assert (result, shared) == ("rendered", False)
+    assert group.stats()["leaders"] == 1
+    assert not os.path.exists(lock_path)
+
+def test_live_lock_is_not_reclaimed(tmp_path):
+    group = SingleFlight("live", lock_dir=str(tmp_path), stale_seconds=60, poll_interval=0.01)
+    key = flight_key("script")
+    lock_path = _write_lock(group, key)
+
+    with pytest.raises(TimeoutError):
+        group.do(key, lambda: "rendered", timeout=0.1)
+    assert os.path.exists(lock_path)
+    assert group.stats()["leaders"] == 0
+
+def test_released_lock_shares_remote_result(tmp_path):
+    group = SingleFlight("remote", lock_dir=str(tmp_path), stale_seconds=60, poll_interval=0.01)
+    key = flight_key("script")
+    lock_path = _write_lock(group, key)
+    calls = []
+
+    # 다른 프로세스가 결과를 저장하고 잠금을 푸는 상황
+    released = threading.Timer(0.05, os.remove, args=(lock_path,))
+    released.start()
+    try:
+        result, shared = group.do(key, lambda: calls.append(1) or "rendered",
+                                  check=lambda: None if os.path.exists(lock_path) else "cached", timeout=5)
+    finally:
+        released.cancel()
+
+    assert (result, shared) == ("cached", True)
+    assert calls == []
+    assert group.stats()["shared_remote"] == 1
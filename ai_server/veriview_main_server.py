@@ -30,6 +30,12 @@ from datetime import datetime, timedelta
 import subprocess
 import base64
 
+from modules.asr_backend import create_asr_backend, is_asr_backend_available
+from modules.common.model_registry import TTS_MODEL, acquire_model
+from modules.common.lazy_import import is_module_available, lazy_import
+from modules.common.warmup import AI_SERVER_STARTUP_MODE, get_warmup_manager, requires_warm, setup_readiness_routes
+from modules.common.tracing import setup_metrics_routes, traced
+
 # D-ID 모듈 임포트
 try:
     from modules.d_id.client import DIDClient
@@ -41,15 +47,10 @@ except ImportError as e:
     print(f"❌ D-ID 모듈 로드 실패: {e}")
     D_ID_AVAILABLE = False
 
-# 분석 모듈 임포트
-try:
-    from app.modules.realtime_facial_analysis import RealtimeFacialAnalysis
-    from app.modules.realtime_speech_to_text import RealtimeSpeechToText
-    ANALYSIS_AVAILABLE = True
-    print("✅ 분석 모듈 로드 성공: OpenFace, Whisper, Librosa")
-except ImportError as e:
-    print(f"⚠️ 분석 모듈 로드 부분 실패: {e}")
-    ANALYSIS_AVAILABLE = False
+# 분석 모듈 (Whisper/Librosa를 임포트하므로 initialize_analyzers()에서 임포트)
+ANALYSIS_AVAILABLE = (is_module_available("app.modules.realtime_facial_analysis")
+                      and is_module_available("app.modules.realtime_speech_to_text"))
+print(f"{'✅' if ANALYSIS_AVAILABLE else '⚠️'} 분석 모듈 설치 여부: {ANALYSIS_AVAILABLE}")
 
 # LLM 모듈 임포트 (Gemma3 사용)
 try:
@@ -66,40 +67,25 @@ except ImportError as e:
 # 공고추천 모듈 임포트
 try:
     from modules.job_recommendation_module import JobRecommendationModule
-    from modules.tfidf_job_recommendation_module import TFIDFJobRecommendationModule
     job_recommendation_module = JobRecommendationModule()
-    tfidf_recommendation_module = TFIDFJobRecommendationModule()
     JOB_RECOMMENDATION_AVAILABLE = True
-    TFIDF_RECOMMENDATION_AVAILABLE = True
     print("✅ 공고추천 모듈 로드 성공")
 except ImportError as e:
     print(f"⚠️ 공고추천 모듈 로드 실패: {e}")
     JOB_RECOMMENDATION_AVAILABLE = False
-    TFIDF_RECOMMENDATION_AVAILABLE = False
     job_recommendation_module = None
-    tfidf_recommendation_module = None
 
-# 개별 모듈 임포트
-try:
-    import whisper
-    import librosa
-    import soundfile as sf
-    WHISPER_AVAILABLE = True
-    LIBROSA_AVAILABLE = True
-    print("✅ Whisper 및 Librosa 모듈 로드 성공")
-except ImportError as e:
-    print(f"⚠️ 음성 분석 모듈 일부 제한: {e}")
-    WHISPER_AVAILABLE = False
-    LIBROSA_AVAILABLE = False
+# TF-IDF 공고추천 모듈 (scikit-learn 임포트와 백엔드 공고 동기화는 백그라운드 준비 단계에서 수행)
+TFIDF_RECOMMENDATION_AVAILABLE = is_module_available("sklearn") and is_module_available("scipy")
+tfidf_recommendation_module = None
 
-# TTS 모듈 임포트
-try:
-    from TTS.api import TTS
-    TTS_AVAILABLE = True
-    print("✅ TTS 모듈 로드 성공")
-except ImportError as e:
-    print(f"⚠️ TTS 모듈 로드 실패: {e}")
-    TTS_AVAILABLE = False
+# 개별 모듈 (설치 여부만 확인하고 실제 임포트는 첫 사용 또는 백그라운드 준비 시점에 수행)
+WHISPER_AVAILABLE = is_asr_backend_available()  # 음성 인식 엔진: 환경 변수 ASR_BACKEND
+LIBROSA_AVAILABLE = is_module_available("librosa") and is_module_available("soundfile")
+TTS_AVAILABLE = is_module_available("TTS")
+librosa = lazy_import("librosa")
+print(f"{'✅' if WHISPER_AVAILABLE else '⚠️'} Whisper 설치 여부: {WHISPER_AVAILABLE}, "
+      f"Librosa: {LIBROSA_AVAILABLE}, TTS: {TTS_AVAILABLE}")
 
 app = Flask(__name__)
 CORS(app, resources={r"/ai/*": {"origins": "*"}})
@@ -108,6 +94,12 @@ CORS(app, resources={r"/ai/*": {"origins": "*"}})
 app.static_folder = os.path.abspath('videos')
 app.static_url_path = '/videos'
 
+# 준비 상태 라우트 (/ai/live, /ai/ready)
+setup_readiness_routes(app)
+
+# 단계별 처리 시간 지표 라우트 (/ai/metrics)
+setup_metrics_routes(app)
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -214,6 +206,9 @@ def initialize_analyzers():
         return False
     
     try:
+        from app.modules.realtime_facial_analysis import RealtimeFacialAnalysis
+        from app.modules.realtime_speech_to_text import RealtimeSpeechToText
+        
         # 얼굴 분석기 초기화
         if facial_analyzer is None:
             facial_analyzer = RealtimeFacialAnalysis()
@@ -231,6 +226,43 @@ def initialize_analyzers():
         logger.error(f"❌ 분석기 초기화 실패: {str(e)}")
         return False
 
+def ensure_analyzers():
+    """요청 처리 전 분석기 준비 (준비 작업이 등록되어 있으면 준비 작업에 맡기고, 없으면 직접 초기화)"""
+    if get_warmup_manager().state("analyzers") is None:
+        initialize_analyzers()
+
+def initialize_tfidf_recommendation():
+    """TF-IDF 공고추천 모듈 초기화 (저장된 인덱스 로드 + 백엔드 변경분 동기화, 백그라운드 준비 단계에서 실행)"""
+    global tfidf_recommendation_module
+    
+    from modules.tfidf_job_recommendation_module import TFIDFJobRecommendationModule
+    tfidf_recommendation_module = TFIDFJobRecommendationModule()
+    # 시작 시 백엔드에 연결하지 못했어도 토큰화기(scikit-learn)는 미리 준비
+    tfidf_recommendation_module.posting_index.analyzer("")
+    logger.info("✅ TF-IDF 공고추천 모듈 초기화 완료")
+
+def start_model_warmup():
+    """
+    모델 준비 작업 등록 및 실행 (순서: 환경 변수 MODEL_WARMUP_ORDER)
+    AI_SERVER_STARTUP_MODE가 background면 백그라운드에서 실행하고 바로 반환 (서버가 먼저 포트를 염)
+    """
+    manager = get_warmup_manager()
+    if ANALYSIS_AVAILABLE:
+        def warm_up_analyzers():
+            if not initialize_analyzers():
+                raise RuntimeError("분석기 초기화 실패")
+        manager.register("analyzers", warm_up_analyzers)
+    if WHISPER_AVAILABLE and whisper_model is not None:
+        manager.register("whisper", lambda: whisper_model.transcribe(np.zeros(16000, dtype=np.float32), language="ko"))
+    if TTS_AVAILABLE and tts_model is not None:
+        manager.register("tts", tts_model.get)
+    if LIBROSA_AVAILABLE:
+        # 임포트 및 numba 컴파일
+        manager.register("librosa", lambda: librosa.feature.rms(y=np.zeros(16000, dtype=np.float32)), required=False)
+    if TFIDF_RECOMMENDATION_AVAILABLE:
+        manager.register("tfidf_recommendation", initialize_tfidf_recommendation, required=False)
+    manager.start(background=AI_SERVER_STARTUP_MODE != "eager")
+
 def initialize_ai_systems():
     """AI 시스템 초기화"""
     global llm_module, openface_integration, whisper_model, tts_model
@@ -248,12 +280,12 @@ def initialize_ai_systems():
         
         # Whisper 모델 초기화
         if WHISPER_AVAILABLE:
-            whisper_model = whisper.load_model("base")
+            whisper_model = create_asr_backend("base")
             logger.info("✅ Whisper 모델 초기화 완료")
         
         # TTS 모델 초기화
         if TTS_AVAILABLE:
-            tts_model = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC")
+            tts_model = acquire_model(TTS_MODEL, "tts_models/en/ljspeech/tacotron2-DDC")
             logger.info("✅ TTS 모델 초기화 완료")
             
     except Exception as e:
@@ -443,6 +475,7 @@ def generate_sample_video_fallback(video_type='general', phase='opening'):
 
 # ==================== 유틸리티 함수들 ====================
 
+@traced("decode")
 def extract_audio_from_video(video_path: str) -> Optional[str]:
     """비디오에서 오디오 추출"""
     try:
@@ -465,6 +498,7 @@ def extract_audio_from_video(video_path: str) -> Optional[str]:
         logger.error(f"오디오 추출 오류: {str(e)}")
         return None
 
+@traced("audio_features")
 def process_audio_with_librosa(audio_path: str) -> Dict[str, Any]:
     """Librosa를 사용한 오디오 분석"""
     if not LIBROSA_AVAILABLE:
@@ -608,7 +642,8 @@ def transcribe_with_whisper(audio_path: str) -> Dict[str, Any]:
         return {"text": "음성 인식을 사용할 수 없습니다.", "confidence": 0.5}
     
     try:
-        result = whisper_model.transcribe(audio_path, language="ko")
+        # 동시 요청은 배치 추론 서버에서 함께 디코딩
+        result = whisper_model.transcribe(audio_path, language="ko", batched=True)
         
         return {
             "text": result["text"],
@@ -713,6 +748,7 @@ def test_connection():
 # ==================== 채용 공고 추천 엔드포인트 ====================
 
 @app.route('/ai/recruitment/posting', methods=['POST'])
+@requires_warm("tfidf_recommendation", degrade=True)
 def recommend_job_postings():
     """채용 공고 추천 엔드포인트 (백엔드 연동)"""
     logger.info("채용 공고 추천 요청 받음: /ai/recruitment/posting")
@@ -874,9 +910,10 @@ def generate_ai_video():
         return Response(b'', mimetype='video/mp4', status=500)
 
 @app.route('/ai/interview/<int:interview_id>/genergate-followup-question', methods=['POST'])
+@requires_warm("analyzers", degrade=True)
 def generate_followup_question(interview_id):
     """꼬리질문 생성 엔드포인트"""
-    initialize_analyzers()
+    ensure_analyzers()
     logger.info(f"꼬리질문 생성 요청 받음: interview_id={interview_id}")
     
     if 'file' not in request.files:
@@ -942,9 +979,10 @@ def generate_followup_question(interview_id):
         })
 
 @app.route('/ai/interview/<int:interview_id>/<question_type>/answer-video', methods=['POST'])
+@requires_warm("analyzers", "whisper", degrade=True)
 def process_interview_answer(interview_id, question_type):
     """면접 답변 영상 처리 엔드포인트"""
-    initialize_analyzers()
+    ensure_analyzers()
     logger.info(f"면접 답변 영상 처리 요청: interview_id={interview_id}, type={question_type}")
     
     if 'file' not in request.files and 'video' not in request.files:
@@ -1097,7 +1135,7 @@ def generate_ai_opening(debate_id):
         if llm_module:
             try:
                 prompt = f"토론 주제: {topic}\n입장: {position}\n입론을 생성해주세요."
-                ai_opening_text = llm_module.generate_ai_opening(topic, position, data).get("ai_response", "")
+                ai_opening_text = llm_module.generate_ai_opening(topic, position, data, session_id=debate_id).get("ai_response", "")
             except Exception as e:
                 logger.warning(f"LLM 입론 생성 실패: {str(e)}")
                 ai_opening_text = generate_fallback_opening(topic, position)
@@ -1327,7 +1365,7 @@ def process_debate_video_generic(debate_id, current_stage, next_ai_stage):
             if llm_module:
                 try:
                     llm_result = llm_module.analyze_user_response_and_generate_rebuttal(
-                        user_text, facial_analysis, audio_analysis, next_ai_stage
+                        user_text, facial_analysis, audio_analysis, next_ai_stage, session_id=debate_id
                     )
                     ai_response = llm_result.get("ai_response", "")
                     result[f"ai_{next_ai_stage}_text"] = ai_response
@@ -1481,9 +1519,10 @@ def serve_video(filename):
         return Response(b'Error serving video', status=500)
 
 @app.route('/ai/jobs/recommend-tfidf', methods=['POST'])
+@requires_warm("tfidf_recommendation")
 def recommend_jobs_tfidf():
     """TF-IDF 기반 공고 추천 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -1510,9 +1549,10 @@ def recommend_jobs_tfidf():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/ai/jobs/rare-skills', methods=['GET'])
+@requires_warm("tfidf_recommendation")
 def get_rare_skills():
     """희소 기술 정보 조회 엔드포인트"""
-    if not TFIDF_RECOMMENDATION_AVAILABLE:
+    if not TFIDF_RECOMMENDATION_AVAILABLE or tfidf_recommendation_module is None:
         return jsonify({"error": "TF-IDF 공고추천 모듈을 사용할 수 없습니다."}), 500
     
     try:
@@ -1540,15 +1580,13 @@ if __name__ == "__main__":
     else:
         print("⚠️ D-ID 통합 실패 - 폴백 모드 사용")
     
-    # 분석기 초기화
-    if initialize_analyzers():
-        print("✅ 분석기 초기화 성공")
-    else:
-        print("⚠️ 분석기 초기화 부분 실패")
-    
-    # AI 시스템 초기화
+    # AI 시스템 초기화 (모델은 핸들만 만들고 실제 로드는 준비 단계에서 수행)
     initialize_ai_systems()
     
+    # 분석기/모델 준비 (background 모드에서는 서버가 포트를 연 뒤에도 계속 진행, 상태: /ai/ready)
+    start_model_warmup()
+    print(f"✅ 모델 준비 시작 (방식: {AI_SERVER_STARTUP_MODE}, 상태: /ai/ready)")
+    
     print("-" * 80)
     print("📍 서버 주소: http://localhost:5000")
     print("🔍 테스트 엔드포인트: http://localhost:5000/ai/test")